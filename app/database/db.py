@@ -4,3 +4,9 @@ client = AsyncIOMotorClient("mongodb://localhost:27017")
 users = client.hackathon.users
 history = client.hackathon.history
 reports = client.hackathon.reports
+corpus = client.hackathon.corpus
+fingerprint_df = client.hackathon.fingerprint_df
+jobs = client.hackathon.jobs
+texts = client.hackathon.texts
+extracted = client.hackathon.extracted
+avatars = client.hackathon.avatars
@@ -0,0 +1,34 @@
+import logging
+
+from pymongo.errors import PyMongoError
+
+from app.database.db import users, history, reports, jobs, texts, corpus, extracted, avatars
+
+logger = logging.getLogger("uvicorn.error")
+
+# (коллекция, ключи, параметры) - все индексы приложения, создаются один раз при старте
+INDEXES = [
+    (reports, "report_id", {"unique": True}),
+    (history, [("email", 1), ("timestamp", -1), ("_id", -1)], {}),
+    (users, "email", {"unique": True}),
+    (texts, "text_hash", {"unique": True}),
+    (extracted, "file_hash", {"unique": True}),
+    # Мультиключевой индекс по отпечаткам дает поиск без перебора всего архива
+    (corpus, "fingerprints", {}),
+    (corpus, "doc_hash", {"unique": True}),
+    (avatars, "avatar_id", {"unique": True}),
+    (avatars, "email", {}),
+    (jobs, "job_id", {"unique": True}),
+    (jobs, [("status", 1), ("created_at", 1)], {}),
+    (jobs, [("email", 1), ("created_at", -1)], {}),
+]
+
+
+async def ensure_indexes():
+    """Создает недостающие индексы при старте; create_index для существующего индекса ничего не делает."""
+    for collection, keys, options in INDEXES:
+        try:
+            await collection.create_index(keys, **options)
+        except PyMongoError as e:
+            # Например, дубликаты в старых данных мешают уникальному индексу - сервер все равно стартует
+            logger.warning("Index %s on %s was not created: %s", keys, collection.name, e)
@@ -4181,13 +4181,13 @@ No matching component was found for:
         .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(0,0,0,0.1); border-radius: 10px; }
         .dark .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.05); }
         ::selection { background: var(--foreground); color: var(--background); }
-      `})]})};function Mme(){var r;const t=N.useRef(),e=N.useRef(),n=N.useMemo(()=>{const o=new Float32Array(10125);let a=0;for(let l=0;l<15;l++)for(let u=0;u<15;u++)for(let c=0;c<15;c++)o[a++]=(l/15-.5)*3,o[a++]=(u/15-.5)*3,o[a++]=(c/15-.5)*3;return o},[]);return BS(i=>{const s=i.clock.getElapsedTime();t.current.rotation.y=s*.2,t.current.rotation.x=s*.1,e.current&&(e.current.position.y=Math.sin(s*1.5)*1.5)}),C.jsxs("group",{children:[C.jsx(LW,{ref:t,positions:n,stride:3,children:C.jsx(OW,{transparent:!0,color:"#3b82f6",size:.04,sizeAttenuation:!0,depthWrite:!1,blending:Im})}),C.jsxs("mesh",{ref:e,children:[C.jsx("boxGeometry",{args:[4,.02,4]}),C.jsx("meshBasicMaterial",{color:"#60a5fa",transparent:!0,opacity:.5})]}),C.jsxs("mesh",{"position-y":(r=e.current)==null?void 0:r.position.y,children:[C.jsx("boxGeometry",{args:[4.2,.1,4.2]}),C.jsx("meshBasicMaterial",{color:"#3b82f6",transparent:!0,opacity:.1})]})]})}function Eme(){return C.jsxs("div",{className:"fixed inset-0 z-[999] bg-white dark:bg-zinc-950 flex flex-col items-center justify-center overflow-hidden",children:[C.jsx("div",{className:"w-full h-[60vh]",children:C.jsxs(IW,{camera:{position:[0,2,8],fov:35},children:[C.jsx("ambientLight",{intensity:.5}),C.jsx(Mme,{})]})}),C.jsx("div",{className:"relative flex flex-col items-center -mt-20",children:C.jsxs("div",{className:"flex items-center gap-3 mb-2",children:[C.jsx("div",{className:"w-12 h-12 bg-black dark:bg-white rounded-2xl flex items-center justify-center shadow-2xl",children:C.jsx("span",{className:"text-white dark:text-black font-black text-xl italic",children:"Q"})}),C.jsxs("div",{className:"flex flex-col",children:[C.jsx("span",{className:"text-2xl font-bold tracking-tighter italic leading-none",children:"QazZerep"}),C.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.4em] text-blue-500 mt-1 opacity-80",children:"System Analysis"})]})]})})]})}function HF({options:t,activeValue:e,onChange:n,type:r="text",small:i=!1}){const s=t.findIndex(o=>o.value===e);return C.jsxs("div",{className:"relative flex bg-black/5 dark:bg-white/5 backdrop-blur-md border border-black/5 dark:border-white/5 p-1 rounded-2xl w-full select-none shadow-inner",children:[C.jsx("div",{className:"absolute top-1 bottom-1 bg-white dark:bg-zinc-800 shadow-md rounded-xl transition-all duration-500 ease-[cubic-bezier(0.23,1,0.32,1)] z-0",style:{width:`calc(${100/t.length}% - 4px)`,left:`calc(${s*100/t.length}% + 2px)`}}),t.map(o=>C.jsx("button",{onClick:()=>n(o.value),className:`relative z-10 flex-1 flex items-center justify-center transition-all duration-500 ${i?"py-1.5":"py-2.5"} ${e===o.value?"text-black dark:text-white":"text-muted-foreground opacity-60"}`,children:r==="icon"?o.icon:C.jsx("span",{className:`font-black tracking-widest uppercase leading-none ${i?"text-[8px]":"text-[10px]"}`,children:o.label})},o.value))]})}function my({active:t,icon:e,label:n,onClick:r}){return C.jsxs("button",{onClick:r,className:`flex items-center gap-3 px-5 py-3 rounded-2xl transition-all ${t?"bg-foreground/5 text-foreground font-bold shadow-sm":"text-muted-foreground hover:text-foreground opacity-70 hover:opacity-100"}`,children:[C.jsx("span",{className:t?"text-foreground":"opacity-40",children:e}),C.jsx("span",{className:"text-[13px] tracking-tight",children:n})]})}function Ame(){var P;const{theme:t,setTheme:e}=xse(),{t:n,i18n:r}=Tg(),[i,s]=N.useState([]),[o,a]=N.useState(null),[l,u]=N.useState(!1),[c,f]=N.useState("new"),[h,m]=N.useState([]),[g,x]=N.useState(!1),[y,v]=N.useState(!1),[S,w]=N.useState(null),[M,E]=N.useState(!0);N.useEffect(()=>{const R=setTimeout(()=>E(!1),2500);return()=>clearTimeout(R)},[]),N.useEffect(()=>{c==="history"&&T()},[c]);const T=async()=>{try{const R=await no.get("/documents/history");m(R.data)}catch{console.error("Archive error")}},I=async()=>{if(i.length<2)return;u(!0);const R=new FormData;i.forEach(V=>R.append("files",V));const k=no.post("/documents/compare-batch",R),U=new Promise(V=>setTimeout(V,2200));try{const[V]=await Promise.all([k,U]);a(V.data)}catch{console.error("Server error")}finally{u(!1)}},L=()=>{const R=`${window.location.origin}/verify/${S.report_id}`;navigator.clipboard.writeText(R),v(!0),setTimeout(()=>v(!1),2e3)};return M?C.jsx(Eme,{}):C.jsxs("div",{className:"flex flex-col md:flex-row h-screen bg-background text-foreground font-sans overflow-hidden transition-colors duration-500",children:[l&&C.jsx(_me,{t:n}),C.jsxs("aside",{className:"fixed bottom-0 left-0 w-full z-[100] md:relative md:w-64 md:h-full bg-card md:bg-background border-t md:border-t-0 md:border-r border-border flex md:flex-col",children:[C.jsxs("div",{className:"hidden md:flex p-8 items-center gap-3",children:[C.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg",children:C.jsx(Pa,{size:18,className:"text-background"})}),C.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]}),C.jsxs("nav",{className:"flex-1 flex md:flex-col justify-around md:justify-start p-3 gap-2",children:[C.jsx(my,{active:c==="new",icon:C.jsx(wQ,{size:18}),label:n("nav.check"),onClick:()=>f("new")}),C.jsx(my,{active:c==="history",icon:C.jsx(xQ,{size:18}),label:n("nav.history"),onClick:()=>f("history")}),C.jsx("div",{className:"hidden md:block my-4 border-t border-border/50 mx-4"}),C.jsx(my,{active:c==="roadmap",icon:C.jsx(mj,{size:18}),label:n("nav.roadmap")||"Roadmap",onClick:()=>f("roadmap")}),C.jsx(my,{active:g,icon:C.jsx(KP,{size:18}),label:n("nav.account"),onClick:()=>x(!0)}),C.jsxs("div",{className:"hidden md:flex flex-col mt-auto gap-6 p-5 border-t border-border/20 bg-black/[0.02] dark:bg-white/[0.02] rounded-t-3xl",children:[C.jsxs("div",{className:"space-y-3",children:[C.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.language")}),C.jsx(HF,{small:!0,activeValue:r.language,onChange:R=>r.changeLanguage(R),options:[{value:"rus",label:"RU"},{value:"kaz",label:"KZ"},{value:"eng",label:"EN"}]})]}),C.jsxs("div",{className:"space-y-3",children:[C.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.theme")}),C.jsx(HF,{small:!0,activeValue:t,onChange:R=>e(R),type:"icon",options:[{value:"light",icon:C.jsx(IQ,{size:12})},{value:"dark",icon:C.jsx(PQ,{size:12})},{value:"system",icon:C.jsx(CQ,{size:12})}]})]})]})]})]}),g&&C.jsx(bme,{onClose:()=>x(!1)}),C.jsxs("main",{className:"flex-1 flex flex-col relative overflow-y-auto custom-scrollbar",children:[C.jsxs("div",{className:"p-6 md:p-16 max-w-6xl mx-auto w-full flex-1",children:[c!=="roadmap"&&C.jsxs("header",{className:"mb-12 animate-in fade-in duration-500",children:[C.jsx("h1",{className:"text-3xl font-medium tracking-tight italic",children:n(c==="new"?"dash.title_new":"dash.title_history")}),C.jsx("p",{className:"text-muted-foreground text-sm mt-2 font-light opacity-60",children:n(c==="new"?"dash.subtitle_new":"dash.subtitle_history")})]}),c==="new"&&C.jsxs("div",{className:"space-y-8 animate-in fade-in slide-in-from-bottom-4 duration-700",children:[!o&&!l&&C.jsxs("div",{className:"relative group",children:[C.jsx("div",{className:"absolute -inset-1 bg-gradient-to-r from-blue-600 to-indigo-600 rounded-3xl blur opacity-10 group-hover:opacity-20 transition duration-1000"}),C.jsxs("div",{className:"relative bg-card border border-border rounded-3xl p-12 md:p-24 flex flex-col items-center border-dashed group-hover:border-foreground/20 transition-all",children:[C.jsx("input",{type:"file",multiple:!0,onChange:R=>s(Array.from(R.target.files)),className:"hidden",id:"file-up"}),C.jsxs("label",{htmlFor:"file-up",className:"cursor-pointer flex flex-col items-center text-center",children:[C.jsx("div",{className:"w-16 h-16 bg-foreground/5 rounded-2xl flex items-center justify-center mb-6",children:C.jsx(OQ,{size:28,className:"text-foreground"})}),C.jsx("h2",{className:"text-lg font-medium",children:n("upload.title")}),C.jsx("p",{className:"text-muted-foreground text-sm mt-2 opacity-50",children:n("upload.formats")})]}),i.length>0&&C.jsxs("div",{className:"mt-8 flex flex-col items-center",children:[C.jsxs("span",{className:"text-[10px] text-blue-500 mb-4 font-black uppercase tracking-widest",children:[n("upload.selected"),": ",i.length]}),C.jsx("button",{onClick:I,className:"px-12 py-4 bg-foreground text-background font-black text-[11px] uppercase tracking-widest rounded-full hover:opacity-90 transition-all active:scale-95 shadow-xl",children:n("upload.btn_start")})]})]})]}),o&&!l&&C.jsxs("div",{className:"grid grid-cols-1 gap-4",children:[o.comparisons.map((R,k)=>C.jsx(Tme,{item:R,onClick:()=>w(R)},k)),C.jsx("button",{onClick:()=>{a(null),s([])},className:"py-6 text-[10px] font-black uppercase tracking-[0.3em] text-muted-foreground hover:text-foreground transition-all",children:n("dash.btn_reset")})]})]}),c==="history"&&C.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6 animate-in fade-in duration-500",children:h.length>0?h.map((R,k)=>C.jsx(Cme,{session:R,onSelect:w},k)):C.jsx("div",{className:"col-span-full py-20 text-center opacity-30 italic",children:"No records found"})}),c==="roadmap"&&C.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:C.jsx(wme,{})})]}),C.jsx(Sme,{})]}),S&&C.jsxs("div",{className:"fixed inset-0 z-[110] bg-background flex flex-col animate-in slide-in-from-bottom duration-500",children:[C.jsxs("header",{className:"flex items-center justify-between px-8 py-6 border-b border-border bg-background/80 backdrop-blur-xl",children:[C.jsxs("div",{className:"flex items-center gap-6",children:[C.jsx("h2",{className:"text-2xl font-medium tracking-tighter italic text-foreground",children:n("report.title")}),C.jsxs("div",{className:`px-4 py-1 rounded-full text-[10px] font-black tracking-widest uppercase ${S.originality<50?"bg-red-500/10 text-red-500":"bg-emerald-500/10 text-emerald-500"}`,children:[S.originality,"% ",n("report.match_label")]})]}),C.jsx("button",{onClick:()=>w(null),className:"p-3 hover:bg-foreground/5 rounded-full text-foreground transition-colors",children:C.jsx(vj,{size:24})})]}),C.jsx("div",{className:"flex-1 overflow-y-auto p-6 md:p-12 custom-scrollbar bg-background",children:C.jsxs("div",{className:"max-w-7xl mx-auto space-y-10",children:[C.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-8",children:[C.jsx(WF,{doc:S.docA,title:n("report.source_a"),t:n}),C.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-8 flex flex-col items-center justify-center shadow-xl",children:[C.jsxs("div",{className:"relative mb-8 cursor-pointer group",onClick:L,children:[C.jsx("div",{className:"bg-white p-4 rounded-3xl shadow-lg transition-transform group-hover:scale-105",children:C.jsx(C2,{value:`${window.location.origin}/verify/${S.report_id}`,size:120,level:"H",fgColor:"#000"})}),y&&C.jsxs("div",{className:"absolute inset-0 bg-background/95 rounded-3xl flex flex-col items-center justify-center border border-border animate-in zoom-in duration-200",children:[C.jsx(qP,{size:32,className:"text-emerald-500 mb-2"}),C.jsx("span",{className:"text-[10px] font-black uppercase tracking-widest text-foreground",children:n("report.copied")})]})]}),C.jsxs("button",{onClick:L,className:"text-[9px] font-mono text-muted-foreground hover:text-foreground flex items-center gap-3 bg-foreground/5 px-5 py-2.5 rounded-full uppercase tracking-tighter transition-all",children:[C.jsx(dj,{size:12})," ",(P=S.report_id)==null?void 0:P.substring(0,16),"..."]})]}),C.jsx(WF,{doc:S.docB,title:n("report.target_b"),t:n})]}),C.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-10",children:[C.jsx(GF,{doc:S.docA}),C.jsx(GF,{doc:S.docB})]})]})})]}),C.jsx("style",{children:`
+      `})]})};function Mme(){var r;const t=N.useRef(),e=N.useRef(),n=N.useMemo(()=>{const o=new Float32Array(10125);let a=0;for(let l=0;l<15;l++)for(let u=0;u<15;u++)for(let c=0;c<15;c++)o[a++]=(l/15-.5)*3,o[a++]=(u/15-.5)*3,o[a++]=(c/15-.5)*3;return o},[]);return BS(i=>{const s=i.clock.getElapsedTime();t.current.rotation.y=s*.2,t.current.rotation.x=s*.1,e.current&&(e.current.position.y=Math.sin(s*1.5)*1.5)}),C.jsxs("group",{children:[C.jsx(LW,{ref:t,positions:n,stride:3,children:C.jsx(OW,{transparent:!0,color:"#3b82f6",size:.04,sizeAttenuation:!0,depthWrite:!1,blending:Im})}),C.jsxs("mesh",{ref:e,children:[C.jsx("boxGeometry",{args:[4,.02,4]}),C.jsx("meshBasicMaterial",{color:"#60a5fa",transparent:!0,opacity:.5})]}),C.jsxs("mesh",{"position-y":(r=e.current)==null?void 0:r.position.y,children:[C.jsx("boxGeometry",{args:[4.2,.1,4.2]}),C.jsx("meshBasicMaterial",{color:"#3b82f6",transparent:!0,opacity:.1})]})]})}function Eme(){return C.jsxs("div",{className:"fixed inset-0 z-[999] bg-white dark:bg-zinc-950 flex flex-col items-center justify-center overflow-hidden",children:[C.jsx("div",{className:"w-full h-[60vh]",children:C.jsxs(IW,{camera:{position:[0,2,8],fov:35},children:[C.jsx("ambientLight",{intensity:.5}),C.jsx(Mme,{})]})}),C.jsx("div",{className:"relative flex flex-col items-center -mt-20",children:C.jsxs("div",{className:"flex items-center gap-3 mb-2",children:[C.jsx("div",{className:"w-12 h-12 bg-black dark:bg-white rounded-2xl flex items-center justify-center shadow-2xl",children:C.jsx("span",{className:"text-white dark:text-black font-black text-xl italic",children:"Q"})}),C.jsxs("div",{className:"flex flex-col",children:[C.jsx("span",{className:"text-2xl font-bold tracking-tighter italic leading-none",children:"QazZerep"}),C.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.4em] text-blue-500 mt-1 opacity-80",children:"System Analysis"})]})]})})]})}function HF({options:t,activeValue:e,onChange:n,type:r="text",small:i=!1}){const s=t.findIndex(o=>o.value===e);return C.jsxs("div",{className:"relative flex bg-black/5 dark:bg-white/5 backdrop-blur-md border border-black/5 dark:border-white/5 p-1 rounded-2xl w-full select-none shadow-inner",children:[C.jsx("div",{className:"absolute top-1 bottom-1 bg-white dark:bg-zinc-800 shadow-md rounded-xl transition-all duration-500 ease-[cubic-bezier(0.23,1,0.32,1)] z-0",style:{width:`calc(${100/t.length}% - 4px)`,left:`calc(${s*100/t.length}% + 2px)`}}),t.map(o=>C.jsx("button",{onClick:()=>n(o.value),className:`relative z-10 flex-1 flex items-center justify-center transition-all duration-500 ${i?"py-1.5":"py-2.5"} ${e===o.value?"text-black dark:text-white":"text-muted-foreground opacity-60"}`,children:r==="icon"?o.icon:C.jsx("span",{className:`font-black tracking-widest uppercase leading-none ${i?"text-[8px]":"text-[10px]"}`,children:o.label})},o.value))]})}function my({active:t,icon:e,label:n,onClick:r}){return C.jsxs("button",{onClick:r,className:`flex items-center gap-3 px-5 py-3 rounded-2xl transition-all ${t?"bg-foreground/5 text-foreground font-bold shadow-sm":"text-muted-foreground hover:text-foreground opacity-70 hover:opacity-100"}`,children:[C.jsx("span",{className:t?"text-foreground":"opacity-40",children:e}),C.jsx("span",{className:"text-[13px] tracking-tight",children:n})]})}function Ame(){var P;const{theme:t,setTheme:e}=xse(),{t:n,i18n:r}=Tg(),[i,s]=N.useState([]),[o,a]=N.useState(null),[l,u]=N.useState(!1),[c,f]=N.useState("new"),[h,m]=N.useState([]),[g,x]=N.useState(!1),[y,v]=N.useState(!1),[S,w]=N.useState(null),[M,E]=N.useState(!0),[qzCur,qzSetCur]=N.useState(null),[qzMoreL,qzSetMoreL]=N.useState(!1),[qzErr,qzSetErr]=N.useState(null);N.useEffect(()=>{const R=setTimeout(()=>E(!1),2500);return()=>clearTimeout(R)},[]),N.useEffect(()=>{c==="history"&&T()},[c]);const T=async(R0=null)=>{try{const R=await no.get("/documents/history",{params:R0?{cursor:R0}:{}});m(V=>R0?[...V,...R.data.items]:R.data.items),qzSetCur(R.data.next_cursor)}catch{console.error("Archive error")}},qzMore=async()=>{if(!qzCur)return;qzSetMoreL(!0);try{await T(qzCur)}finally{qzSetMoreL(!1)}},qzSelect=async V=>{if(qzSetErr(null),V.docA&&V.docA.html!==void 0||!V.report_id){w(V);return}try{const P=await no.get(`/reports/${V.report_id}`);w({...V,docA:P.data.docA,docB:P.data.docB})}catch(P){console.error("Report error",P),qzSetErr(V.report_id)}},I=async()=>{if(i.length<2)return;u(!0);const R=new FormData;i.forEach(V=>R.append("files",V));const k=no.post("/documents/compare-batch",R),U=new Promise(V=>setTimeout(V,2200));try{const[V]=await Promise.all([k,U]);a(V.data)}catch{console.error("Server error")}finally{u(!1)}},L=()=>{const R=`${window.location.origin}/verify/${S.report_id}`;navigator.clipboard.writeText(R),v(!0),setTimeout(()=>v(!1),2e3)};return M?C.jsx(Eme,{}):C.jsxs("div",{className:"flex flex-col md:flex-row h-screen bg-background text-foreground font-sans overflow-hidden transition-colors duration-500",children:[l&&C.jsx(_me,{t:n}),C.jsxs("aside",{className:"fixed bottom-0 left-0 w-full z-[100] md:relative md:w-64 md:h-full bg-card md:bg-background border-t md:border-t-0 md:border-r border-border flex md:flex-col",children:[C.jsxs("div",{className:"hidden md:flex p-8 items-center gap-3",children:[C.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg",children:C.jsx(Pa,{size:18,className:"text-background"})}),C.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]}),C.jsxs("nav",{className:"flex-1 flex md:flex-col justify-around md:justify-start p-3 gap-2",children:[C.jsx(my,{active:c==="new",icon:C.jsx(wQ,{size:18}),label:n("nav.check"),onClick:()=>f("new")}),C.jsx(my,{active:c==="history",icon:C.jsx(xQ,{size:18}),label:n("nav.history"),onClick:()=>f("history")}),C.jsx("div",{className:"hidden md:block my-4 border-t border-border/50 mx-4"}),C.jsx(my,{active:c==="roadmap",icon:C.jsx(mj,{size:18}),label:n("nav.roadmap")||"Roadmap",onClick:()=>f("roadmap")}),C.jsx(my,{active:g,icon:C.jsx(KP,{size:18}),label:n("nav.account"),onClick:()=>x(!0)}),C.jsxs("div",{className:"hidden md:flex flex-col mt-auto gap-6 p-5 border-t border-border/20 bg-black/[0.02] dark:bg-white/[0.02] rounded-t-3xl",children:[C.jsxs("div",{className:"space-y-3",children:[C.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.language")}),C.jsx(HF,{small:!0,activeValue:r.language,onChange:R=>r.changeLanguage(R),options:[{value:"rus",label:"RU"},{value:"kaz",label:"KZ"},{value:"eng",label:"EN"}]})]}),C.jsxs("div",{className:"space-y-3",children:[C.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.theme")}),C.jsx(HF,{small:!0,activeValue:t,onChange:R=>e(R),type:"icon",options:[{value:"light",icon:C.jsx(IQ,{size:12})},{value:"dark",icon:C.jsx(PQ,{size:12})},{value:"system",icon:C.jsx(CQ,{size:12})}]})]})]})]})]}),g&&C.jsx(bme,{onClose:()=>x(!1)}),C.jsxs("main",{className:"flex-1 flex flex-col relative overflow-y-auto custom-scrollbar",children:[C.jsxs("div",{className:"p-6 md:p-16 max-w-6xl mx-auto w-full flex-1",children:[c!=="roadmap"&&C.jsxs("header",{className:"mb-12 animate-in fade-in duration-500",children:[C.jsx("h1",{className:"text-3xl font-medium tracking-tight italic",children:n(c==="new"?"dash.title_new":"dash.title_history")}),C.jsx("p",{className:"text-muted-foreground text-sm mt-2 font-light opacity-60",children:n(c==="new"?"dash.subtitle_new":"dash.subtitle_history")})]}),c==="new"&&C.jsxs("div",{className:"space-y-8 animate-in fade-in slide-in-from-bottom-4 duration-700",children:[!o&&!l&&C.jsxs("div",{className:"relative group",children:[C.jsx("div",{className:"absolute -inset-1 bg-gradient-to-r from-blue-600 to-indigo-600 rounded-3xl blur opacity-10 group-hover:opacity-20 transition duration-1000"}),C.jsxs("div",{className:"relative bg-card border border-border rounded-3xl p-12 md:p-24 flex flex-col items-center border-dashed group-hover:border-foreground/20 transition-all",children:[C.jsx("input",{type:"file",multiple:!0,onChange:R=>s(Array.from(R.target.files)),className:"hidden",id:"file-up"}),C.jsxs("label",{htmlFor:"file-up",className:"cursor-pointer flex flex-col items-center text-center",children:[C.jsx("div",{className:"w-16 h-16 bg-foreground/5 rounded-2xl flex items-center justify-center mb-6",children:C.jsx(OQ,{size:28,className:"text-foreground"})}),C.jsx("h2",{className:"text-lg font-medium",children:n("upload.title")}),C.jsx("p",{className:"text-muted-foreground text-sm mt-2 opacity-50",children:n("upload.formats")})]}),i.length>0&&C.jsxs("div",{className:"mt-8 flex flex-col items-center",children:[C.jsxs("span",{className:"text-[10px] text-blue-500 mb-4 font-black uppercase tracking-widest",children:[n("upload.selected"),": ",i.length]}),C.jsx("button",{onClick:I,className:"px-12 py-4 bg-foreground text-background font-black text-[11px] uppercase tracking-widest rounded-full hover:opacity-90 transition-all active:scale-95 shadow-xl",children:n("upload.btn_start")})]})]})]}),o&&!l&&C.jsxs("div",{className:"grid grid-cols-1 gap-4",children:[o.comparisons.map((R,k)=>C.jsx(Tme,{item:R,onClick:()=>w(R)},k)),C.jsx("button",{onClick:()=>{a(null),s([])},className:"py-6 text-[10px] font-black uppercase tracking-[0.3em] text-muted-foreground hover:text-foreground transition-all",children:n("dash.btn_reset")})]})]}),c==="history"&&C.jsxs("div",{className:"space-y-6 animate-in fade-in duration-500",children:[qzErr&&C.jsxs("div",{className:"px-6 py-4 rounded-3xl border border-red-500/30 bg-red-500/5 text-[11px] text-red-500 flex justify-between items-center gap-4",children:[C.jsxs("span",{children:[n("dash.report_unavailable")," (",qzErr,")"]}),C.jsx("button",{onClick:()=>qzSetErr(null),className:"text-[9px] font-black uppercase tracking-[0.25em] opacity-60 hover:opacity-100",children:"✕"})]}),C.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:h.length>0?h.map((R,k)=>C.jsx(Cme,{session:R,onSelect:qzSelect},R.id||k)):C.jsx("div",{className:"col-span-full py-20 text-center opacity-30 italic",children:"No records found"})}),qzCur&&C.jsx("button",{onClick:qzMore,disabled:qzMoreL,className:"w-full py-4 rounded-full border border-border text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground hover:text-foreground hover:border-foreground/40 transition-all disabled:opacity-40",children:n(qzMoreL?"dash.loading_more":"dash.load_more")})]}),c==="roadmap"&&C.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:C.jsx(wme,{})})]}),C.jsx(Sme,{})]}),S&&C.jsxs("div",{className:"fixed inset-0 z-[110] bg-background flex flex-col animate-in slide-in-from-bottom duration-500",children:[C.jsxs("header",{className:"flex items-center justify-between px-8 py-6 border-b border-border bg-background/80 backdrop-blur-xl",children:[C.jsxs("div",{className:"flex items-center gap-6",children:[C.jsx("h2",{className:"text-2xl font-medium tracking-tighter italic text-foreground",children:n("report.title")}),C.jsxs("div",{className:`px-4 py-1 rounded-full text-[10px] font-black tracking-widest uppercase ${S.originality<50?"bg-red-500/10 text-red-500":"bg-emerald-500/10 text-emerald-500"}`,children:[S.originality,"% ",n("report.match_label")]})]}),C.jsx("button",{onClick:()=>w(null),className:"p-3 hover:bg-foreground/5 rounded-full text-foreground transition-colors",children:C.jsx(vj,{size:24})})]}),C.jsx("div",{className:"flex-1 overflow-y-auto p-6 md:p-12 custom-scrollbar bg-background",children:C.jsxs("div",{className:"max-w-7xl mx-auto space-y-10",children:[C.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-8",children:[C.jsx(WF,{doc:S.docA,title:n("report.source_a"),t:n}),C.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-8 flex flex-col items-center justify-center shadow-xl",children:[C.jsxs("div",{className:"relative mb-8 cursor-pointer group",onClick:L,children:[C.jsx("div",{className:"bg-white p-4 rounded-3xl shadow-lg transition-transform group-hover:scale-105",children:C.jsx(C2,{value:`${window.location.origin}/verify/${S.report_id}`,size:120,level:"H",fgColor:"#000"})}),y&&C.jsxs("div",{className:"absolute inset-0 bg-background/95 rounded-3xl flex flex-col items-center justify-center border border-border animate-in zoom-in duration-200",children:[C.jsx(qP,{size:32,className:"text-emerald-500 mb-2"}),C.jsx("span",{className:"text-[10px] font-black uppercase tracking-widest text-foreground",children:n("report.copied")})]})]}),C.jsxs("button",{onClick:L,className:"text-[9px] font-mono text-muted-foreground hover:text-foreground flex items-center gap-3 bg-foreground/5 px-5 py-2.5 rounded-full uppercase tracking-tighter transition-all",children:[C.jsx(dj,{size:12})," ",(P=S.report_id)==null?void 0:P.substring(0,16),"..."]})]}),C.jsx(WF,{doc:S.docB,title:n("report.target_b"),t:n})]}),C.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-10",children:[C.jsx(GF,{doc:S.docA}),C.jsx(GF,{doc:S.docB})]})]})})]}),C.jsx("style",{children:`
                 .custom-scrollbar::-webkit-scrollbar { width: 4px; }
                 .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(0,0,0,0.1); border-radius: 10px; }
                 .dark .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.1); }
                 .diff-match { color: #ef4444; background: rgba(239, 68, 68, 0.08); }
                 ::selection { background: #3b82f6; color: #fff; }
-            `})]})}function Tme({item:t,onClick:e}){var n;return C.jsxs("div",{onClick:e,className:"p-6 bg-card border border-border rounded-[32px] flex items-center justify-between hover:border-foreground/20 transition-all cursor-pointer group shadow-sm",children:[C.jsxs("div",{className:"flex items-center gap-5",children:[C.jsx("div",{className:"w-12 h-12 rounded-2xl bg-foreground/5 border border-border flex items-center justify-center group-hover:scale-110 transition-transform",children:C.jsx(YP,{size:20,className:"text-muted-foreground"})}),C.jsxs("div",{children:[C.jsx("p",{className:"text-[15px] font-medium tracking-tight text-foreground",children:t.pair}),C.jsxs("p",{className:"text-[10px] text-muted-foreground font-mono opacity-60 mt-1 uppercase",children:["ID: ",(n=t.report_id)==null?void 0:n.substring(0,8)]})]})]}),C.jsxs("div",{className:"flex items-center gap-8",children:[C.jsxs("span",{className:`text-xl font-bold tracking-tighter ${t.originality<50?"text-red-500":"text-emerald-500"}`,children:[t.originality,"%"]}),C.jsx(fj,{className:"text-muted-foreground group-hover:text-foreground group-hover:translate-x-1 transition-all",size:20})]})]})}function Cme({session:t,onSelect:e}){return C.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-8 hover:border-foreground/20 transition-all group",children:[C.jsxs("div",{className:"flex items-center gap-3 mb-8 opacity-40 group-hover:opacity-100 transition-opacity",children:[C.jsx(gQ,{size:14,className:"text-foreground"}),C.jsx("span",{className:"text-[10px] font-black uppercase tracking-[0.2em] text-foreground",children:new Date(t.timestamp).toLocaleDateString()})]}),C.jsx("div",{className:"space-y-4",children:t.comparisons.map((n,r)=>C.jsxs("div",{onClick:()=>e(n),className:"flex justify-between items-center cursor-pointer border-b border-border/50 pb-3 last:border-0 hover:translate-x-1 transition-transform",children:[C.jsx("span",{className:"text-[13px] text-muted-foreground hover:text-foreground transition-colors truncate pr-6",children:n.pair}),C.jsxs("span",{className:`text-[13px] font-black ${n.originality<50?"text-red-500":"text-emerald-500"}`,children:[n.originality,"%"]})]},r))})]})}function WF({doc:t,title:e,t:n}){const r=t.ai.score>60;return C.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-10 shadow-xl transition-all hover:scale-[1.02]",children:[C.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-[0.4em] opacity-40 italic",children:e}),C.jsx("h3",{className:"text-xl font-medium mt-3 truncate text-foreground",children:t.name}),C.jsxs("div",{className:"mt-12",children:[C.jsxs("div",{className:"flex justify-between items-end mb-4",children:[C.jsx("span",{className:"text-[10px] text-muted-foreground font-black uppercase tracking-widest",children:n("report.ai_prob")}),C.jsxs("span",{className:`text-2xl font-black italic ${r?"text-red-500":"text-emerald-500"}`,children:[t.ai.score,"%"]})]}),C.jsx("div",{className:"h-1.5 w-full bg-foreground/5 rounded-full overflow-hidden",children:C.jsx("div",{className:`h-full transition-all duration-1000 ${r?"bg-red-500":"bg-emerald-500"}`,style:{width:`${t.ai.score}%`}})})]})]})}function GF({doc:t}){return C.jsxs("div",{className:"flex flex-col bg-card border border-border rounded-[40px] overflow-hidden shadow-xl",children:[C.jsxs("div",{className:"px-8 py-5 border-b border-border flex justify-between items-center bg-foreground/[0.02]",children:[C.jsx("span",{className:"text-[10px] font-black text-muted-foreground uppercase tracking-widest truncate max-w-[300px] italic opacity-60",children:t.name}),C.jsx(Ec,{size:14,className:"text-blue-500 animate-pulse"})]}),C.jsx("div",{className:"p-10 text-[15px] text-foreground/80 leading-[1.8] max-h-[600px] overflow-y-auto custom-scrollbar font-light tracking-tight",dangerouslySetInnerHTML:{__html:t.html}})]})}function Pme(){const[t,e]=N.useState([]),n=q1();N.useEffect(()=>{r()},[]);const r=async()=>{try{const s=await no.get("/documents/admin/all-docs");e(s.data.data)}catch{console.error("Admin access error")}},i=async s=>{window.confirm("Удалить этот объект из глобальной базы?")&&(await no.delete(`/documents/delete/${s}`),r())};return C.jsx("div",{className:"min-h-screen bg-[#050505] text-slate-400 p-8 font-sans",children:C.jsxs("div",{className:"max-w-6xl mx-auto",children:[C.jsxs("header",{className:"flex justify-between items-center mb-12",children:[C.jsxs("div",{className:"flex items-center gap-4",children:[C.jsx("button",{onClick:()=>n("/"),className:"p-3 bg-white/5 rounded-xl hover:bg-white/10 transition-all",children:C.jsx(cj,{className:"text-white"})}),C.jsxs("div",{children:[C.jsx("h1",{className:"text-2xl font-bold text-white tracking-tight",children:"Root Terminal"}),C.jsx("p",{className:"text-[10px] text-red-500 font-black uppercase tracking-[0.3em]",children:"Global System Administration"})]})]}),C.jsx("div",{className:"flex gap-4",children:C.jsxs("div",{className:"px-6 py-3 bg-red-500/10 border border-red-500/20 rounded-2xl flex items-center gap-3",children:[C.jsx(Ec,{className:"text-red-500 animate-pulse"}),C.jsx("span",{className:"text-[11px] font-bold text-red-500 uppercase tracking-widest",children:"Core Secured"})]})})]}),C.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-12",children:[{label:"Total Clusters",val:t.length,icon:C.jsx(hj,{})},{label:"System Load",val:"12%",icon:C.jsx(Ec,{})},{label:"Storage Ready",val:"Active",icon:C.jsx(bQ,{})}].map((s,o)=>C.jsxs("div",{className:"bg-white/[0.02] border border-white/5 p-6 rounded-3xl group hover:border-red-500/30 transition-all",children:[C.jsx("div",{className:"text-slate-600 mb-4 group-hover:text-red-500 transition-colors",children:s.icon}),C.jsx("p",{className:"text-3xl font-bold text-white mb-1",children:s.val}),C.jsx("p",{className:"text-[10px] uppercase font-black text-slate-700 tracking-widest",children:s.label})]},o))}),C.jsxs("div",{className:"space-y-4",children:[C.jsx("p",{className:"text-[10px] font-bold text-slate-600 uppercase tracking-[0.2em] mb-6 px-4",children:"Global Data Nodes"}),t.map(s=>C.jsxs("div",{className:"group flex items-center justify-between p-6 bg-[#0A0A0A] border border-white/5 rounded-3xl hover:bg-white/[0.02] transition-all",children:[C.jsxs("div",{className:"flex items-center gap-6",children:[C.jsx("div",{className:"w-12 h-12 rounded-2xl bg-white/5 flex items-center justify-center text-slate-500 group-hover:text-red-500 transition-colors",children:C.jsx(wg,{})}),C.jsxs("div",{children:[C.jsxs("p",{className:"text-sm font-mono text-slate-300",children:["NODE_",s.id.slice(-8).toUpperCase()]}),C.jsxs("p",{className:"text-[10px] text-slate-600 uppercase mt-1",children:["Owner: ",C.jsx("span",{className:"text-emerald-500",children:s.owner})]})]})]}),C.jsxs("div",{className:"flex items-center gap-12",children:[C.jsxs("div",{className:"text-right hidden sm:block",children:[C.jsx("p",{className:"text-white font-bold",children:s.hash_count}),C.jsx("p",{className:"text-[9px] text-slate-700 uppercase font-bold",children:"Signatures"})]}),C.jsx("button",{onClick:()=>i(s.id),className:"w-12 h-12 flex items-center justify-center bg-red-500/10 text-red-500 rounded-2xl hover:bg-red-500 hover:text-white transition-all shadow-lg hover:shadow-red-500/20",children:C.jsx(NQ,{})})]})]},s.id))]})]})})}const Rme=()=>{const{slug:t}=RV(),e=q1(),{t:n}=Tg(),i={documentation:{icon:C.jsx(gj,{size:24}),cat:"architecture",key:"doc",color:"blue"},"knowledge-base":{icon:C.jsx(hj,{size:24}),cat:"methodology",key:"base",color:"indigo"},privacy:{icon:C.jsx(dT,{size:24}),cat:"privacy",key:"priv",color:"emerald"},terms:{icon:C.jsx(YP,{size:24}),cat:"legal",key:"terms",color:"zinc"},cookie:{icon:C.jsx(Ec,{size:24}),cat:"technical",key:"cookie",color:"amber"},help:{icon:C.jsx(MQ,{size:24}),cat:"manual",key:"help",color:"sky"},contacts:{icon:C.jsx(SQ,{size:24}),cat:"channels",key:"contacts",color:"violet"}}[t]||{icon:C.jsx(hQ,{size:24}),cat:"error",key:"404"},s=n(`info.content.${i.key}.items`,{returnObjects:!0})||[];return C.jsxs("div",{className:"min-h-screen bg-background text-foreground font-sans selection:bg-white selection:text-black overflow-x-hidden",children:[C.jsxs("div",{className:"fixed top-0 left-1/2 -translate-x-1/2 w-full h-full -z-10 pointer-events-none overflow-hidden",children:[C.jsx("div",{className:"absolute top-[-10%] left-[-10%] w-[40%] h-[40%] bg-blue-500/10 blur-[120px] rounded-full animate-pulse"}),C.jsx("div",{className:"absolute bottom-[-10%] right-[-10%] w-[30%] h-[30%] bg-indigo-500/10 blur-[100px] rounded-full"})]}),C.jsx("nav",{className:"sticky top-0 z-[100] bg-background/50 backdrop-blur-2xl border-b border-white/5",children:C.jsxs("div",{className:"max-w-7xl mx-auto px-6 h-20 flex items-center justify-between",children:[C.jsxs("button",{onClick:()=>e(-1),className:"group flex items-center gap-3 text-[10px] font-black uppercase tracking-[0.2em] text-muted-foreground hover:text-foreground transition-all",children:[C.jsx("div",{className:"p-2 rounded-full bg-white/5 group-hover:bg-white/10 transition-colors",children:C.jsx(cj,{size:14})}),n("info.back")]}),C.jsxs("div",{className:"flex items-center gap-3",children:[C.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg shadow-white/5",children:C.jsx(Pa,{size:16,className:"text-background"})}),C.jsx("span",{className:"font-semibold text-lg tracking-tighter italic hidden sm:block",children:"QazZerep"})]}),C.jsxs("div",{className:"flex items-center gap-2",children:[C.jsx("div",{className:"w-2 h-2 rounded-full bg-emerald-500 animate-pulse shadow-[0_0_10px_rgba(16,185,129,0.5)]"}),C.jsx("span",{className:"text-[9px] font-black uppercase tracking-widest opacity-40",children:"System Live"})]})]})}),C.jsxs("main",{className:"max-w-5xl mx-auto px-6 pt-16 pb-32",children:[C.jsxs("header",{className:"mb-24 relative",children:[C.jsxs("div",{className:"inline-flex items-center gap-2 px-3 py-1 rounded-full bg-white/5 border border-white/10 mb-8 animate-in fade-in slide-in-from-bottom-2 duration-500",children:[C.jsx("span",{className:"w-1 h-1 rounded-full bg-blue-500"}),C.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-widest italic",children:n(`info.categories.${i.cat}`)})]}),C.jsxs("div",{className:"flex flex-col md:flex-row md:items-end justify-between gap-8",children:[C.jsxs("div",{className:"max-w-2xl animate-in fade-in slide-in-from-left-4 duration-700",children:[C.jsx("h1",{className:"text-5xl md:text-8xl font-medium tracking-[ -0.04em] italic uppercase leading-[0.9]",children:n(`info.pages.${i.key}.title`)}),C.jsx("p",{className:"mt-8 text-lg md:text-xl text-muted-foreground font-light leading-relaxed opacity-60",children:n("info.version_desc")})]}),C.jsx("div",{className:"hidden lg:block animate-in zoom-in duration-1000",children:C.jsxs("div",{className:"w-32 h-32 bg-white/[0.02] border border-white/5 rounded-[40px] flex items-center justify-center relative",children:[C.jsx("div",{className:"absolute inset-0 bg-gradient-to-tr from-blue-500/20 to-transparent blur-2xl opacity-50"}),C.jsx("div",{className:"relative text-foreground opacity-80",children:i.icon})]})})]})]}),C.jsx("div",{className:"grid grid-cols-1 gap-6",children:Array.isArray(s)&&s.map((o,a)=>C.jsxs("div",{className:"group relative p-[1px] rounded-[32px] overflow-hidden transition-all duration-500 hover:scale-[1.01]",children:[C.jsx("div",{className:"absolute inset-0 bg-gradient-to-r from-blue-500/0 via-white/10 to-indigo-500/0 opacity-0 group-hover:opacity-100 transition-opacity duration-500"}),C.jsxs("div",{className:"relative p-8 md:p-12 bg-[#0c0c0c]/80 backdrop-blur-md rounded-[31px] border border-white/5 flex flex-col md:flex-row gap-8 md:gap-20",children:[C.jsxs("div",{className:"md:w-1/3",children:[C.jsxs("div",{className:"flex items-center gap-3 mb-4",children:[C.jsxs("span",{className:"text-[10px] font-mono text-blue-500 font-bold tracking-tighter",children:["[",(a+1).toString().padStart(2,"0"),"]"]}),C.jsx("div",{className:"h-[1px] w-8 bg-blue-500/30"})]}),C.jsx("h3",{className:"text-xl font-medium tracking-tight text-foreground uppercase italic leading-tight",children:o.t})]}),C.jsxs("div",{className:"md:w-2/3 flex justify-between items-start group/text",children:[C.jsx("p",{className:"text-[16px] text-zinc-400 leading-relaxed font-light group-hover:text-zinc-200 transition-colors duration-300",children:o.d}),C.jsx(fj,{className:"shrink-0 mt-1 opacity-0 -translate-x-4 group-hover:opacity-10 group-hover:translate-x-0 transition-all duration-500",size:24})]})]})]},a))}),C.jsxs("footer",{className:"mt-32 pt-12 border-t border-white/5 flex flex-col md:flex-row justify-between items-center gap-8",children:[C.jsxs("div",{className:"flex flex-col gap-1",children:[C.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.5em] text-muted-foreground italic",children:n("info.copyright")}),C.jsx("span",{className:"text-[9px] font-medium text-muted-foreground/30 uppercase tracking-widest",children:"Platform Version 2.0.4-stable"})]}),C.jsxs("div",{className:"flex items-center gap-8",children:[C.jsx("div",{className:"flex -space-x-2",children:[wg,fT,dT].map((o,a)=>C.jsx("div",{className:"w-10 h-10 rounded-full bg-white/5 border border-white/10 flex items-center justify-center text-muted-foreground hover:text-foreground transition-colors cursor-help",children:C.jsx(o,{size:14})},a))}),C.jsx("button",{onClick:()=>window.scrollTo({top:0,behavior:"smooth"}),className:"w-12 h-12 rounded-full border border-white/5 flex items-center justify-center hover:bg-white/5 transition-all",children:C.jsx(Pa,{size:14,className:"rotate-180"})})]})]})]}),C.jsx("style",{children:`
+            `})]})}function Tme({item:t,onClick:e}){var n;return C.jsxs("div",{onClick:e,className:"p-6 bg-card border border-border rounded-[32px] flex items-center justify-between hover:border-foreground/20 transition-all cursor-pointer group shadow-sm",children:[C.jsxs("div",{className:"flex items-center gap-5",children:[C.jsx("div",{className:"w-12 h-12 rounded-2xl bg-foreground/5 border border-border flex items-center justify-center group-hover:scale-110 transition-transform",children:C.jsx(YP,{size:20,className:"text-muted-foreground"})}),C.jsxs("div",{children:[C.jsx("p",{className:"text-[15px] font-medium tracking-tight text-foreground",children:t.pair}),C.jsxs("p",{className:"text-[10px] text-muted-foreground font-mono opacity-60 mt-1 uppercase",children:["ID: ",(n=t.report_id)==null?void 0:n.substring(0,8)]})]})]}),C.jsxs("div",{className:"flex items-center gap-8",children:[C.jsxs("span",{className:`text-xl font-bold tracking-tighter ${t.originality<50?"text-red-500":"text-emerald-500"}`,children:[t.originality,"%"]}),C.jsx(fj,{className:"text-muted-foreground group-hover:text-foreground group-hover:translate-x-1 transition-all",size:20})]})]})}function Cme({session:t,onSelect:e}){return C.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-8 hover:border-foreground/20 transition-all group",children:[C.jsxs("div",{className:"flex items-center gap-3 mb-8 opacity-40 group-hover:opacity-100 transition-opacity",children:[C.jsx(gQ,{size:14,className:"text-foreground"}),C.jsx("span",{className:"text-[10px] font-black uppercase tracking-[0.2em] text-foreground",children:new Date(t.timestamp).toLocaleDateString()})]}),C.jsx("div",{className:"space-y-4",children:t.comparisons.map((n,r)=>C.jsxs("div",{onClick:()=>e(n),className:"flex justify-between items-center cursor-pointer border-b border-border/50 pb-3 last:border-0 hover:translate-x-1 transition-transform",children:[C.jsx("span",{className:"text-[13px] text-muted-foreground hover:text-foreground transition-colors truncate pr-6",children:n.pair}),C.jsxs("span",{className:`text-[13px] font-black ${n.originality<50?"text-red-500":"text-emerald-500"}`,children:[n.originality,"%"]})]},r))})]})}function WF({doc:t,title:e,t:n}){var qzS;const qzScore=(qzS=t==null?void 0:t.ai)!=null&&qzS.score!=null?qzS.score:0,r=qzScore>60;return C.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-10 shadow-xl transition-all hover:scale-[1.02]",children:[C.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-[0.4em] opacity-40 italic",children:e}),C.jsx("h3",{className:"text-xl font-medium mt-3 truncate text-foreground",children:t==null?void 0:t.name}),C.jsxs("div",{className:"mt-12",children:[C.jsxs("div",{className:"flex justify-between items-end mb-4",children:[C.jsx("span",{className:"text-[10px] text-muted-foreground font-black uppercase tracking-widest",children:n("report.ai_prob")}),C.jsxs("span",{className:`text-2xl font-black italic ${r?"text-red-500":"text-emerald-500"}`,children:[qzScore,"%"]})]}),C.jsx("div",{className:"h-1.5 w-full bg-foreground/5 rounded-full overflow-hidden",children:C.jsx("div",{className:`h-full transition-all duration-1000 ${r?"bg-red-500":"bg-emerald-500"}`,style:{width:`${qzScore}%`}})})]})]})}function GF({doc:t}){return C.jsxs("div",{className:"flex flex-col bg-card border border-border rounded-[40px] overflow-hidden shadow-xl",children:[C.jsxs("div",{className:"px-8 py-5 border-b border-border flex justify-between items-center bg-foreground/[0.02]",children:[C.jsx("span",{className:"text-[10px] font-black text-muted-foreground uppercase tracking-widest truncate max-w-[300px] italic opacity-60",children:t.name}),C.jsx(Ec,{size:14,className:"text-blue-500 animate-pulse"})]}),C.jsx("div",{className:"p-10 text-[15px] text-foreground/80 leading-[1.8] max-h-[600px] overflow-y-auto custom-scrollbar font-light tracking-tight",dangerouslySetInnerHTML:{__html:t.html}})]})}function Pme(){const[t,e]=N.useState([]),n=q1();N.useEffect(()=>{r()},[]);const r=async()=>{try{const s=await no.get("/documents/admin/all-docs");e(s.data.data)}catch{console.error("Admin access error")}},i=async s=>{window.confirm("Удалить этот объект из глобальной базы?")&&(await no.delete(`/documents/delete/${s}`),r())};return C.jsx("div",{className:"min-h-screen bg-[#050505] text-slate-400 p-8 font-sans",children:C.jsxs("div",{className:"max-w-6xl mx-auto",children:[C.jsxs("header",{className:"flex justify-between items-center mb-12",children:[C.jsxs("div",{className:"flex items-center gap-4",children:[C.jsx("button",{onClick:()=>n("/"),className:"p-3 bg-white/5 rounded-xl hover:bg-white/10 transition-all",children:C.jsx(cj,{className:"text-white"})}),C.jsxs("div",{children:[C.jsx("h1",{className:"text-2xl font-bold text-white tracking-tight",children:"Root Terminal"}),C.jsx("p",{className:"text-[10px] text-red-500 font-black uppercase tracking-[0.3em]",children:"Global System Administration"})]})]}),C.jsx("div",{className:"flex gap-4",children:C.jsxs("div",{className:"px-6 py-3 bg-red-500/10 border border-red-500/20 rounded-2xl flex items-center gap-3",children:[C.jsx(Ec,{className:"text-red-500 animate-pulse"}),C.jsx("span",{className:"text-[11px] font-bold text-red-500 uppercase tracking-widest",children:"Core Secured"})]})})]}),C.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-12",children:[{label:"Total Clusters",val:t.length,icon:C.jsx(hj,{})},{label:"System Load",val:"12%",icon:C.jsx(Ec,{})},{label:"Storage Ready",val:"Active",icon:C.jsx(bQ,{})}].map((s,o)=>C.jsxs("div",{className:"bg-white/[0.02] border border-white/5 p-6 rounded-3xl group hover:border-red-500/30 transition-all",children:[C.jsx("div",{className:"text-slate-600 mb-4 group-hover:text-red-500 transition-colors",children:s.icon}),C.jsx("p",{className:"text-3xl font-bold text-white mb-1",children:s.val}),C.jsx("p",{className:"text-[10px] uppercase font-black text-slate-700 tracking-widest",children:s.label})]},o))}),C.jsxs("div",{className:"space-y-4",children:[C.jsx("p",{className:"text-[10px] font-bold text-slate-600 uppercase tracking-[0.2em] mb-6 px-4",children:"Global Data Nodes"}),t.map(s=>C.jsxs("div",{className:"group flex items-center justify-between p-6 bg-[#0A0A0A] border border-white/5 rounded-3xl hover:bg-white/[0.02] transition-all",children:[C.jsxs("div",{className:"flex items-center gap-6",children:[C.jsx("div",{className:"w-12 h-12 rounded-2xl bg-white/5 flex items-center justify-center text-slate-500 group-hover:text-red-500 transition-colors",children:C.jsx(wg,{})}),C.jsxs("div",{children:[C.jsxs("p",{className:"text-sm font-mono text-slate-300",children:["NODE_",s.id.slice(-8).toUpperCase()]}),C.jsxs("p",{className:"text-[10px] text-slate-600 uppercase mt-1",children:["Owner: ",C.jsx("span",{className:"text-emerald-500",children:s.owner})]})]})]}),C.jsxs("div",{className:"flex items-center gap-12",children:[C.jsxs("div",{className:"text-right hidden sm:block",children:[C.jsx("p",{className:"text-white font-bold",children:s.hash_count}),C.jsx("p",{className:"text-[9px] text-slate-700 uppercase font-bold",children:"Signatures"})]}),C.jsx("button",{onClick:()=>i(s.id),className:"w-12 h-12 flex items-center justify-center bg-red-500/10 text-red-500 rounded-2xl hover:bg-red-500 hover:text-white transition-all shadow-lg hover:shadow-red-500/20",children:C.jsx(NQ,{})})]})]},s.id))]})]})})}const Rme=()=>{const{slug:t}=RV(),e=q1(),{t:n}=Tg(),i={documentation:{icon:C.jsx(gj,{size:24}),cat:"architecture",key:"doc",color:"blue"},"knowledge-base":{icon:C.jsx(hj,{size:24}),cat:"methodology",key:"base",color:"indigo"},privacy:{icon:C.jsx(dT,{size:24}),cat:"privacy",key:"priv",color:"emerald"},terms:{icon:C.jsx(YP,{size:24}),cat:"legal",key:"terms",color:"zinc"},cookie:{icon:C.jsx(Ec,{size:24}),cat:"technical",key:"cookie",color:"amber"},help:{icon:C.jsx(MQ,{size:24}),cat:"manual",key:"help",color:"sky"},contacts:{icon:C.jsx(SQ,{size:24}),cat:"channels",key:"contacts",color:"violet"}}[t]||{icon:C.jsx(hQ,{size:24}),cat:"error",key:"404"},s=n(`info.content.${i.key}.items`,{returnObjects:!0})||[];return C.jsxs("div",{className:"min-h-screen bg-background text-foreground font-sans selection:bg-white selection:text-black overflow-x-hidden",children:[C.jsxs("div",{className:"fixed top-0 left-1/2 -translate-x-1/2 w-full h-full -z-10 pointer-events-none overflow-hidden",children:[C.jsx("div",{className:"absolute top-[-10%] left-[-10%] w-[40%] h-[40%] bg-blue-500/10 blur-[120px] rounded-full animate-pulse"}),C.jsx("div",{className:"absolute bottom-[-10%] right-[-10%] w-[30%] h-[30%] bg-indigo-500/10 blur-[100px] rounded-full"})]}),C.jsx("nav",{className:"sticky top-0 z-[100] bg-background/50 backdrop-blur-2xl border-b border-white/5",children:C.jsxs("div",{className:"max-w-7xl mx-auto px-6 h-20 flex items-center justify-between",children:[C.jsxs("button",{onClick:()=>e(-1),className:"group flex items-center gap-3 text-[10px] font-black uppercase tracking-[0.2em] text-muted-foreground hover:text-foreground transition-all",children:[C.jsx("div",{className:"p-2 rounded-full bg-white/5 group-hover:bg-white/10 transition-colors",children:C.jsx(cj,{size:14})}),n("info.back")]}),C.jsxs("div",{className:"flex items-center gap-3",children:[C.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg shadow-white/5",children:C.jsx(Pa,{size:16,className:"text-background"})}),C.jsx("span",{className:"font-semibold text-lg tracking-tighter italic hidden sm:block",children:"QazZerep"})]}),C.jsxs("div",{className:"flex items-center gap-2",children:[C.jsx("div",{className:"w-2 h-2 rounded-full bg-emerald-500 animate-pulse shadow-[0_0_10px_rgba(16,185,129,0.5)]"}),C.jsx("span",{className:"text-[9px] font-black uppercase tracking-widest opacity-40",children:"System Live"})]})]})}),C.jsxs("main",{className:"max-w-5xl mx-auto px-6 pt-16 pb-32",children:[C.jsxs("header",{className:"mb-24 relative",children:[C.jsxs("div",{className:"inline-flex items-center gap-2 px-3 py-1 rounded-full bg-white/5 border border-white/10 mb-8 animate-in fade-in slide-in-from-bottom-2 duration-500",children:[C.jsx("span",{className:"w-1 h-1 rounded-full bg-blue-500"}),C.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-widest italic",children:n(`info.categories.${i.cat}`)})]}),C.jsxs("div",{className:"flex flex-col md:flex-row md:items-end justify-between gap-8",children:[C.jsxs("div",{className:"max-w-2xl animate-in fade-in slide-in-from-left-4 duration-700",children:[C.jsx("h1",{className:"text-5xl md:text-8xl font-medium tracking-[ -0.04em] italic uppercase leading-[0.9]",children:n(`info.pages.${i.key}.title`)}),C.jsx("p",{className:"mt-8 text-lg md:text-xl text-muted-foreground font-light leading-relaxed opacity-60",children:n("info.version_desc")})]}),C.jsx("div",{className:"hidden lg:block animate-in zoom-in duration-1000",children:C.jsxs("div",{className:"w-32 h-32 bg-white/[0.02] border border-white/5 rounded-[40px] flex items-center justify-center relative",children:[C.jsx("div",{className:"absolute inset-0 bg-gradient-to-tr from-blue-500/20 to-transparent blur-2xl opacity-50"}),C.jsx("div",{className:"relative text-foreground opacity-80",children:i.icon})]})})]})]}),C.jsx("div",{className:"grid grid-cols-1 gap-6",children:Array.isArray(s)&&s.map((o,a)=>C.jsxs("div",{className:"group relative p-[1px] rounded-[32px] overflow-hidden transition-all duration-500 hover:scale-[1.01]",children:[C.jsx("div",{className:"absolute inset-0 bg-gradient-to-r from-blue-500/0 via-white/10 to-indigo-500/0 opacity-0 group-hover:opacity-100 transition-opacity duration-500"}),C.jsxs("div",{className:"relative p-8 md:p-12 bg-[#0c0c0c]/80 backdrop-blur-md rounded-[31px] border border-white/5 flex flex-col md:flex-row gap-8 md:gap-20",children:[C.jsxs("div",{className:"md:w-1/3",children:[C.jsxs("div",{className:"flex items-center gap-3 mb-4",children:[C.jsxs("span",{className:"text-[10px] font-mono text-blue-500 font-bold tracking-tighter",children:["[",(a+1).toString().padStart(2,"0"),"]"]}),C.jsx("div",{className:"h-[1px] w-8 bg-blue-500/30"})]}),C.jsx("h3",{className:"text-xl font-medium tracking-tight text-foreground uppercase italic leading-tight",children:o.t})]}),C.jsxs("div",{className:"md:w-2/3 flex justify-between items-start group/text",children:[C.jsx("p",{className:"text-[16px] text-zinc-400 leading-relaxed font-light group-hover:text-zinc-200 transition-colors duration-300",children:o.d}),C.jsx(fj,{className:"shrink-0 mt-1 opacity-0 -translate-x-4 group-hover:opacity-10 group-hover:translate-x-0 transition-all duration-500",size:24})]})]})]},a))}),C.jsxs("footer",{className:"mt-32 pt-12 border-t border-white/5 flex flex-col md:flex-row justify-between items-center gap-8",children:[C.jsxs("div",{className:"flex flex-col gap-1",children:[C.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.5em] text-muted-foreground italic",children:n("info.copyright")}),C.jsx("span",{className:"text-[9px] font-medium text-muted-foreground/30 uppercase tracking-widest",children:"Platform Version 2.0.4-stable"})]}),C.jsxs("div",{className:"flex items-center gap-8",children:[C.jsx("div",{className:"flex -space-x-2",children:[wg,fT,dT].map((o,a)=>C.jsx("div",{className:"w-10 h-10 rounded-full bg-white/5 border border-white/10 flex items-center justify-center text-muted-foreground hover:text-foreground transition-colors cursor-help",children:C.jsx(o,{size:14})},a))}),C.jsx("button",{onClick:()=>window.scrollTo({top:0,behavior:"smooth"}),className:"w-12 h-12 rounded-full border border-white/5 flex items-center justify-center hover:bg-white/5 transition-all",children:C.jsx(Pa,{size:14,className:"rotate-180"})})]})]})]}),C.jsx("style",{children:`
         .custom-scrollbar::-webkit-scrollbar { width: 4px; }
         .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.1); border-radius: 10px; }
         
@@ -4274,4 +4274,4 @@ No matching component was found for:
                 main > div {
                     animation: fade-in-up 0.8s cubic-bezier(0.16, 1, 0.3, 1) forwards;
                 }
-            `})]})}function s4({label:t,icon:e,active:n=!1}){return C.jsxs("div",{className:`flex items-center gap-2 px-4 py-1.5 rounded-full border text-[9px] font-black uppercase tracking-widest transition-all ${n?"bg-blue-500/10 border-blue-500/20 text-blue-500":"bg-white/5 border-white/10 text-zinc-500"}`,children:[e,t]})}function o4({children:t,adminOnly:e=!1}){const{token:n,user:r}=aj();return n?e&&(r==null?void 0:r.sub)!=="admin@qazzerep.kz"?C.jsx(K3,{to:"/"}):t:C.jsx(K3,{to:"/login"})}function ZTe(){return C.jsx(sQ,{children:C.jsxs(xZ,{children:[C.jsx(Vf,{path:"/login",element:C.jsx(Aie,{})}),C.jsx(Vf,{path:"/:slug",element:C.jsx(Rme,{})}),C.jsx(Vf,{path:"/verify/:reportId",element:C.jsx(KTe,{})}),C.jsx(Vf,{path:"/",element:C.jsx(o4,{children:C.jsx(Ame,{})})}),C.jsx(Vf,{path:"/admin",element:C.jsx(o4,{adminOnly:!0,children:C.jsx(Pme,{})})})]})})}const{slice:JTe,forEach:QTe}=[];function eCe(t){return QTe.call(JTe.call(arguments,1),e=>{if(e)for(const n in e)t[n]===void 0&&(t[n]=e[n])}),t}function tCe(t){return typeof t!="string"?!1:[/<\s*script.*?>/i,/<\s*\/\s*script\s*>/i,/<\s*img.*?on\w+\s*=/i,/<\s*\w+\s*on\w+\s*=.*?>/i,/javascript\s*:/i,/vbscript\s*:/i,/expression\s*\(/i,/eval\s*\(/i,/alert\s*\(/i,/document\.cookie/i,/document\.write\s*\(/i,/window\.location/i,/innerHTML/i].some(n=>n.test(t))}const a4=/^[\u0009\u0020-\u007e\u0080-\u00ff]+$/,nCe=function(t,e){const r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{path:"/"},i=encodeURIComponent(e);let s=`${t}=${i}`;if(r.maxAge>0){const o=r.maxAge-0;if(Number.isNaN(o))throw new Error("maxAge should be a Number");s+=`; Max-Age=${Math.floor(o)}`}if(r.domain){if(!a4.test(r.domain))throw new TypeError("option domain is invalid");s+=`; Domain=${r.domain}`}if(r.path){if(!a4.test(r.path))throw new TypeError("option path is invalid");s+=`; Path=${r.path}`}if(r.expires){if(typeof r.expires.toUTCString!="function")throw new TypeError("option expires is invalid");s+=`; Expires=${r.expires.toUTCString()}`}if(r.httpOnly&&(s+="; HttpOnly"),r.secure&&(s+="; Secure"),r.sameSite)switch(typeof r.sameSite=="string"?r.sameSite.toLowerCase():r.sameSite){case!0:s+="; SameSite=Strict";break;case"lax":s+="; SameSite=Lax";break;case"strict":s+="; SameSite=Strict";break;case"none":s+="; SameSite=None";break;default:throw new TypeError("option sameSite is invalid")}return r.partitioned&&(s+="; Partitioned"),s},l4={create(t,e,n,r){let i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:{path:"/",sameSite:"strict"};n&&(i.expires=new Date,i.expires.setTime(i.expires.getTime()+n*60*1e3)),r&&(i.domain=r),document.cookie=nCe(t,e,i)},read(t){const e=`${t}=`,n=document.cookie.split(";");for(let r=0;r<n.length;r++){let i=n[r];for(;i.charAt(0)===" ";)i=i.substring(1,i.length);if(i.indexOf(e)===0)return i.substring(e.length,i.length)}return null},remove(t,e){this.create(t,"",-1,e)}};var rCe={name:"cookie",lookup(t){let{lookupCookie:e}=t;if(e&&typeof document<"u")return l4.read(e)||void 0},cacheUserLanguage(t,e){let{lookupCookie:n,cookieMinutes:r,cookieDomain:i,cookieOptions:s}=e;n&&typeof document<"u"&&l4.create(n,t,r,i,s)}},iCe={name:"querystring",lookup(t){var r;let{lookupQuerystring:e}=t,n;if(typeof window<"u"){let{search:i}=window.location;!window.location.search&&((r=window.location.hash)==null?void 0:r.indexOf("?"))>-1&&(i=window.location.hash.substring(window.location.hash.indexOf("?")));const o=i.substring(1).split("&");for(let a=0;a<o.length;a++){const l=o[a].indexOf("=");l>0&&o[a].substring(0,l)===e&&(n=o[a].substring(l+1))}}return n}},sCe={name:"hash",lookup(t){var i;let{lookupHash:e,lookupFromHashIndex:n}=t,r;if(typeof window<"u"){const{hash:s}=window.location;if(s&&s.length>2){const o=s.substring(1);if(e){const a=o.split("&");for(let l=0;l<a.length;l++){const u=a[l].indexOf("=");u>0&&a[l].substring(0,u)===e&&(r=a[l].substring(u+1))}}if(r)return r;if(!r&&n>-1){const a=s.match(/\/([a-zA-Z-]*)/g);return Array.isArray(a)?(i=a[typeof n=="number"?n:0])==null?void 0:i.replace("/",""):void 0}}}return r}};let zf=null;const u4=()=>{if(zf!==null)return zf;try{if(zf=typeof window<"u"&&window.localStorage!==null,!zf)return!1;const t="i18next.translate.boo";window.localStorage.setItem(t,"foo"),window.localStorage.removeItem(t)}catch{zf=!1}return zf};var oCe={name:"localStorage",lookup(t){let{lookupLocalStorage:e}=t;if(e&&u4())return window.localStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupLocalStorage:n}=e;n&&u4()&&window.localStorage.setItem(n,t)}};let Bf=null;const c4=()=>{if(Bf!==null)return Bf;try{if(Bf=typeof window<"u"&&window.sessionStorage!==null,!Bf)return!1;const t="i18next.translate.boo";window.sessionStorage.setItem(t,"foo"),window.sessionStorage.removeItem(t)}catch{Bf=!1}return Bf};var aCe={name:"sessionStorage",lookup(t){let{lookupSessionStorage:e}=t;if(e&&c4())return window.sessionStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupSessionStorage:n}=e;n&&c4()&&window.sessionStorage.setItem(n,t)}},lCe={name:"navigator",lookup(t){const e=[];if(typeof navigator<"u"){const{languages:n,userLanguage:r,language:i}=navigator;if(n)for(let s=0;s<n.length;s++)e.push(n[s]);r&&e.push(r),i&&e.push(i)}return e.length>0?e:void 0}},uCe={name:"htmlTag",lookup(t){let{htmlTag:e}=t,n;const r=e||(typeof document<"u"?document.documentElement:null);return r&&typeof r.getAttribute=="function"&&(n=r.getAttribute("lang")),n}},cCe={name:"path",lookup(t){var i;let{lookupFromPathIndex:e}=t;if(typeof window>"u")return;const n=window.location.pathname.match(/\/([a-zA-Z-]*)/g);return Array.isArray(n)?(i=n[typeof e=="number"?e:0])==null?void 0:i.replace("/",""):void 0}},fCe={name:"subdomain",lookup(t){var i,s;let{lookupFromSubdomainIndex:e}=t;const n=typeof e=="number"?e+1:1,r=typeof window<"u"&&((s=(i=window.location)==null?void 0:i.hostname)==null?void 0:s.match(/^(\w{2,5})\.(([a-z0-9-]{1,63}\.[a-z]{2,6})|localhost)/i));if(r)return r[n]}};let fX=!1;try{document.cookie,fX=!0}catch{}const dX=["querystring","cookie","localStorage","sessionStorage","navigator","htmlTag"];fX||dX.splice(1,1);const dCe=()=>({order:dX,lookupQuerystring:"lng",lookupCookie:"i18next",lookupLocalStorage:"i18nextLng",lookupSessionStorage:"i18nextLng",caches:["localStorage"],excludeCacheFor:["cimode"],convertDetectedLanguage:t=>t});class hX{constructor(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};this.type="languageDetector",this.detectors={},this.init(e,n)}init(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{languageUtils:{}},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};this.services=e,this.options=eCe(n,this.options||{},dCe()),typeof this.options.convertDetectedLanguage=="string"&&this.options.convertDetectedLanguage.indexOf("15897")>-1&&(this.options.convertDetectedLanguage=i=>i.replace("-","_")),this.options.lookupFromUrlIndex&&(this.options.lookupFromPathIndex=this.options.lookupFromUrlIndex),this.i18nOptions=r,this.addDetector(rCe),this.addDetector(iCe),this.addDetector(oCe),this.addDetector(aCe),this.addDetector(lCe),this.addDetector(uCe),this.addDetector(cCe),this.addDetector(fCe),this.addDetector(sCe)}addDetector(e){return this.detectors[e.name]=e,this}detect(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:this.options.order,n=[];return e.forEach(r=>{if(this.detectors[r]){let i=this.detectors[r].lookup(this.options);i&&typeof i=="string"&&(i=[i]),i&&(n=n.concat(i))}}),n=n.filter(r=>r!=null&&!tCe(r)).map(r=>this.options.convertDetectedLanguage(r)),this.services&&this.services.languageUtils&&this.services.languageUtils.getBestMatchFromCodes?n:n.length>0?n[0]:null}cacheUserLanguage(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:this.options.caches;n&&(this.options.excludeCacheFor&&this.options.excludeCacheFor.indexOf(e)>-1||n.forEach(r=>{this.detectors[r]&&this.detectors[r].cacheUserLanguage(e,this.options)}))}}hX.type="languageDetector";vi.use(hX).use(ise).init({resources:{rus:{translation:{roadmap:{title:"Планы развития",year:"2026",active_status:"В разработке",q1:{title:"Фундамент и AI Ядро",items:["Запуск нейронного ядра QazZerep v2.0","Интеграция с локальными базами данных","Обновление 3D-интерфейса"]},q2:{title:"Мультиформатный анализ",items:["Поддержка анализа видео и аудио","Расширение языковых моделей (KZ, RU, EN, TR)","API для корпоративных клиентов"]},q3:{title:"Глобальная связность",items:["Запуск мобильного приложения","Blockchain-верификация отчетов","Коллаборация с вузами РК"]},q4:{title:"Автономная экосистема",items:["Self-learning AI (дообучение)","Прогноз академических трендов","Глобальный поиск по архивам"]}},auth:{login_title:"Авторизация",login_btn:"Вход в систему",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Нет доступа?",create_id:"Создать ID узла",error_invalid:"ACCESS_DENIED: НЕВЕРНЫЕ ДАННЫЕ"},nav:{check:"Проверка",history:"История",account:"Аккаунт",roadmap:"Планы 2026"},settings:{language:"Язык системы",theme:"Тема оформления"},dash:{title_new:"Сверка документов",subtitle_new:"Интеллектуальный анализ сходства текстов",title_history:"Архив проверок",subtitle_history:"История ваших предыдущих анализов",btn_reset:"Сбросить и начать заново"},upload:{title:"Перетащите файлы сюда",formats:"Поддерживаются PDF, DOCX и TXT",selected:"Выбрано",btn_start:"Запустить анализ"},report:{title:"Отчет анализа",match_label:"Сходство",source_a:"Источник А",target_b:"Источник Б",ai_prob:"Вероятность ИИ",copied:"Скопировано"},profile:{title:"Настройки узла",save_btn:"Сохранить",syncing:"Синхронизация",config_synced:"КОНФИГ_СИНХРОНИЗИРОВАН",upload_failed:"ОШИБКА_ЗАГРУЗКИ",avatar_updated:"АВАТАР_ОБНОВЛЕН",public_name:"Публичное имя",contact_email:"Контактный Email",node_active:"Узел активен",cloud_sync:"Синхронизация с облачным ядром активна",detectors:"Детекторы заимствований",ignore_quotes:"Игнорировать цитаты",smart_quotes:"Умное распознавание цитат",change_pass:"Сменить пароль",logout:"Выйти из системы",rules:{gost:"Литература (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Таблицы и графики",titles:"Титульный лист"}},footer:{description:"Автоматизированная система интеллектуальной сверки протоколов и документации.",engine_name:"Движок Интеллект-Сверки",sections:{nav:{title:"Навигатор"},legal:{title:"Правовой узел"},support:{title:"Поддержка"}}},info:{back:"Назад",version_desc:"Подробные спецификации и регламенты работы платформы QazZerep версии 2.4.0.",copyright:"© 2026 Инфраструктура Ядра",categories:{architecture:"Системная Архитектура",methodology:"Методология Данных",privacy:"Конфиденциальность",legal:"Юридическая База",technical:"Техническая Сессия",manual:"Руководство",channels:"Прямые Каналы"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро использует высокопроизводительную библиотеку fitz для прямого доступа к бинарным структурам PDF. Текст извлекается в виде потока байтов, минуя сохранение на диск."},{t:"Динамический K-Shingling",d:"Алгоритм разбивает текст на пересекающиеся последовательности. Параметр k=3..9 позволяет системе находить не только прямое копирование, но и умный рерайт."},{t:"MD5 Fingerprinting",d:"Генерация 128-битных отпечатков сегментов. Позволяет сравнивать документы через сопоставление цифровых сигнатур в RAM."},{t:"Индекс Сходства Жаккара",d:"Математическая модель расчета пересечения множеств хешей, обеспечивающая эталонную точность вычисления уникальности."},{t:"Batch Cross-Check (O(n²))",d:"Пакетная сверка всех загруженных файлов между собой для выявления скрытых сетей передачи работ."},{t:"Asynchronous FastAPI Backend",d:"Асинхронность на базе Python asyncio поддерживает стабильный пинг даже при анализе тяжелых массивов данных."},{t:"Neural Highlight Engine",d:"Визуализация через CSS-движок: .diff-match подсвечивает плагиат, а .diff-rewrite отмечает зоны обфускации."},{t:"RAM-Only Processing",d:"Вычисления происходят в волатильной памяти. После сессии объекты уничтожаются, не оставляя следов на диске."}]},base:{items:[{t:"Локальный Архив ВУЗов",d:"Централизованная база всех загруженных работ студентов РК для выявления горизонтального плагиата."},{t:"Open Access Crawling",d:"Индексация репозиториев arXiv.org, Google Scholar и ResearchGate для поиска в научных публикациях."},{t:"KazNet Deep Index",d:"Собственный робот QazBot индексирует гос. порталы и архивы диссертаций на казахском и русском языках."},{t:"Cross-Language Mapping",d:"Технология перевода сегментов текста для поиска заимствований с английского языка на казахский/русский."},{t:"GitHub & Code Analysis",d:"Анализ программного кода (50+ языков) для проверки технических работ на плагиат из репозиториев."},{t:"AI Content Patterns",d:"Статистический анализ текстов на наличие признаков генерации нейросетями (GPT-4, Claude)."}]},priv:{items:[{t:"Суверенитет Данных РК",d:"Все серверные мощности расположены в сертифицированных дата-центрах на территории Республики Казахстан."},{t:"Шифрование AES-GCM-256",d:"Каналы передачи данных защищены военным стандартом шифрования. Ваши документы недоступны для перехвата."},{t:"Stateless Архитектура",d:"Система не сохраняет историю загрузок без требования пользователя. Каждый акт проверки эфемерный."},{t:"JWT-Авторизация",d:"Доступ защищен токенами с ограниченным временем жизни, что предотвращает угон сессий."},{t:"ISO 27001 Compliance",d:"Внутренние процессы управления данными соответствуют международным стандартам безопасности."},{t:"Право на Забвение",d:"Пользователь может в один клик удалить все свои следы, включая хешированные отпечатки работ."}]},terms:{items:[{t:"Акцепт Соглашения",d:"Использование сервиса означает принятие условий. Ответственность за интерпретацию результатов лежит на пользователе."},{t:"Интеллектуальная Собственность",d:"Алгоритмы принадлежат QazZerep. Пользователь сохраняет права на загружаемый контент."},{t:"Добросовестное Использование",d:"Запрещается использование ботов для обхода ограничений системы или проведения атак."},{t:"Ограничение Ответственности",d:"Система предоставляет вероятностную оценку. Мы не гарантируем 100% выявление всех форм нейро-обфускации."}]},cookie:{items:[{t:"Session Persistence",d:"Используем технические куки для JWT-авторизации, чтобы не вводить пароль при обновлении."},{t:"Security Tokens",d:"Анти-фрод файлы помогают идентифицировать подозрительную активность и защищать аккаунт."},{t:"Zero Third-Party Tracking",d:"Мы не используем маркетинговые куки. Ваша активность не передается рекламным сетям."},{t:"LocalStorage Usage",d:"Данные о прогрессе анализа могут временно храниться в браузере для восстановления сессии."}]},help:{items:[{t:"Инструкция по загрузке",d:"Рекомендуется PDF с текстовым слоем. Для сканов работает модуль Anti-OCR."},{t:"Интерпретация отчета",d:"80%+ — норма. Ниже 50% — критическая зона, требующая ручной проверки."},{t:"Технические лимиты",d:"Максимальный размер файла — 50MB. Для Big Data свяжитесь с отделом интеграции."}]},contacts:{items:[{t:"Telegram Support",d:"Оперативная связь: @brjxjxjd (Ответ в течение 5 минут)."},{t:"Phone Hotline",d:"Горячая линия для экстренных вопросов: +7 (777) 123-45-67 (24/7)."}]}}}}},kaz:{translation:{roadmap:{title:"Даму жоспары",year:"2026",active_status:"Әзірлеу үстінде",q1:{title:"Іргетас және AI Ядросы",items:["QazZerep v2.0 нейрондық ядросын іске қосу","Жергілікті деректер базаларымен интеграция","3D интерфейсін жаңарту"]},q2:{title:"Мультиформатты талдау",items:["Бейне және аудио талдауды қолдау","Тілдік модельдерді кеңейту (KZ, RU, EN, TR)","Корпоративтік клиенттерге арналған API"]},q3:{title:"Жаһандық байланыс",items:["Мобильді қолданбаны іске қосу","Есептерді Blockchain арқылы тексеру","ҚР жоғары оқу орындарымен ынтымақтастық"]},q4:{title:"Автономды экожүйе",items:["Self-learning AI (өзін-өзі оқыту)","Академиялық трендтерді болжау","Мұрағаттар бойынша жаһандық іздеу"]}},auth:{login_title:"Авторизация",login_btn:"Жүйеге кіру",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Кіру мүмкін емес пе?",create_id:"Түйін ID-ін жасау",error_invalid:"ACCESS_DENIED: ҚАТЕ ДЕРЕКТЕР"},nav:{check:"Тексеру",history:"Тарих",account:"Аккаунт",roadmap:"Даму жоспары"},settings:{language:"Жүйе тілі",theme:"Интерфейс тақырыбы"},dash:{title_new:"Құжаттарды салыстыру",subtitle_new:"Мәтіндердің ұқсастығын интеллектуалды талдау",title_history:"Тексерулер мұрағаты",subtitle_history:"Алдыңғы талдауларыңыздың тарихы",btn_reset:"Тазалау және қайта бастау"},upload:{title:"Файлдарды осы жерге сүйреңіз",formats:"PDF, DOCX және TXT қолданылады",selected:"Таңдалды",btn_start:"Талдауды бастау"},report:{title:"Талдау есебі",match_label:"Ұқсастық",source_a:"А дереккөзі",target_b:"Б дереккөзі",ai_prob:"ИИ ықтималдығы",copied:"Көшірілді"},profile:{title:"Түйін параметрлері",save_btn:"Сақтау",syncing:"Синхрондау",config_synced:"КОНФИГ_СИНХРОНДАЛДЫ",upload_failed:"ЖҮКТЕУ_ҚАТАСЫ",avatar_updated:"АВАТАР_ЖАҢАРТЫЛДЫ",public_name:"Жалпыға ортақ есім",contact_email:"Байланыс Email-ы",node_active:"Түйін белсенді",cloud_sync:"Бұлтты ядромен синхрондау белсенді",detectors:"Ұқсастық детекторы",ignore_quotes:"Дәйексөздерді елемеу",smart_quotes:"Дәйексөздерді ақылды тану",change_pass:"Құпия сөзді өзгерту",logout:"Жүйеден шығу",rules:{gost:"Әдебиет (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Кестелер",titles:"Титул парағы"}},footer:{description:"Хаттамалар мен құжаттарды интеллектуалды салыстырудың автоматтандырылған жүйесі.",engine_name:"Интеллект-Салыстыру Жүйесі",sections:{nav:{title:"Навигатор"},legal:{title:"Құқықтық орталық"},support:{title:"Қолдау"}}},info:{back:"Артқа",version_desc:"QazZerep 2.4.0 платформасының егжей-тегжейлі сипаттамалары мен жұмыс ережелері.",copyright:"© 2026 Ядролық Инфрақұрылым",categories:{architecture:"Жүйе Архитектурасы",methodology:"Деректер Әдістемесі",privacy:"Құпиялылық",legal:"Құқықтық Негіз",technical:"Техникалық Сессия",manual:"Нұсқаулық",channels:"Тікелей Арналар"},pages:{doc:{title:"Құжаттама"},base:{title:"Жалпы Индекс"},priv:{title:"Қауіпсіздік Хаттамасы"},terms:{title:"Пайдалану Шарттары"},cookie:{title:"Cookie Саясаты"},help:{title:"Көмек Орталығы"},contacts:{title:"Байланыс Түйіндері"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро PDF бинарлық құрылымдарына тікелей қол жеткізу үшін жоғары өнімді fitz кітапханасын пайдаланады. Мәтін байт ағыны түрінде алынады."},{t:"Динамикалық K-Shingling",d:"Алгоритм мәтінді ақылды рерайтты іздеу үшін қиылысатын тізбектерге бөледі."},{t:"MD5 Fingerprinting",d:"RAM-дағы сандық қолтаңбаларды салыстыру үшін сегменттердің 128 биттік таңбаларын жасау."},{t:"Жаккар ұқсастық индексі",d:"Бірегейлікті есептеудің эталондық дәлдігін қамтамасыз ететін хэш жиындарының қиылысуын есептеудің математикалық моделі."},{t:"Batch Cross-Check",d:"Жұмыстарды берудің жасырын желілерін анықтау үшін барлық жүктелген файлдарды өзара пакеттік салыстыру."},{t:"RAM-Only Processing",d:"Есептеулер тұрақсыз жадта жүреді. Сессиядан кейін нысандар ізсіз жойылады."}]},base:{items:[{t:"ЖОО-лардың жергілікті мұрағаты",d:"Көлденең плагиатты анықтау үшін ҚР студенттерінің барлық жүктелген жұмыстарының орталықтандырылған базасы."},{t:"Open Access Crawling",d:"Ғылыми жарияланымдардан іздеу үшін arXiv.org, Google Scholar және ResearchGate репозиторийлерін индекстеу."},{t:"KazNet Deep Index",d:"Жеке QazBot роботы мемлекеттік порталдарды және қазақ/орыс тілдеріндегі диссертациялар мұрағатын индекстейді."},{t:"Cross-Language Mapping",d:"Ағылшын тілінен қазақ/орыс тілдеріне аударылған мәтін үзінділерін іздеу технологиясы."}]}}}}},eng:{translation:{roadmap:{title:"Project Roadmap",year:"2026",active_status:"Active Development",q1:{title:"Foundation & AI Core",items:["QazZerep v2.0 Neural Core Launch","Local Database Integration","3D Interface Update"]},q2:{title:"Multi-Format Analysis",items:["Video & Audio Analysis Support","LLM Expansion (KZ, RU, EN, TR)","Enterprise API Access"]},q3:{title:"Global Connectivity",items:["Mobile App Launch (iOS/Android)","Blockchain Report Verification","University Partnerships in RK"]},q4:{title:"Autonomous Ecosystem",items:["Self-learning AI Implementation","Academic Trend Prediction","Global Archive Search"]}},auth:{login_title:"Authorization",login_btn:"Login to System",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"No access?",create_id:"Create Node ID",error_invalid:"ACCESS_DENIED: INVALID CREDENTIALS"},nav:{check:"Verification",history:"History",account:"Account",roadmap:"Roadmap"},settings:{language:"System Language",theme:"Visual Theme"},dash:{title_new:"Document Sync",subtitle_new:"Intelligent text similarity analysis",title_history:"Audit Archive",subtitle_history:"History of your previous scans",btn_reset:"Reset Core"},upload:{title:"Drop layers here",formats:"PDF, DOCX, TXT supported",selected:"Active",btn_start:"Execute Analysis"},report:{title:"Analysis Report",match_label:"Similarity",source_a:"Source A",target_b:"Source B",ai_prob:"AI Probability",copied:"Copied"},profile:{title:"Node Settings",save_btn:"Save Config",syncing:"Syncing",config_synced:"CONFIG_SYNCED",upload_failed:"UPLOAD_FAILED",avatar_updated:"AVATAR_UPDATED",public_name:"Public Name",contact_email:"Contact Email",node_active:"Node Active",cloud_sync:"Cloud Core Sync Active",detectors:"Detectors",ignore_quotes:"Ignore Quotes",smart_quotes:"Smart Quotes",change_pass:"Password",logout:"Logout",rules:{gost:"GOST Lit",apa:"APA/MLA",tables:"Tables",titles:"Titles"}},footer:{description:"Automated system for intelligent reconciliation of protocols and documentation.",engine_name:"Intellect-Sverka Engine",sections:{nav:{title:"Navigator"},legal:{title:"Legal Node"},support:{title:"Support"}}},info:{back:"Return",version_desc:"Detailed specifications and operational protocols for QazZerep v2.4.0.",copyright:"© 2026 Core Infrastructure",categories:{architecture:"System Architecture",methodology:"Data Methodology",privacy:"Data Privacy",legal:"Legal Framework",technical:"Technical Session",manual:"User Manual",channels:"Direct Channels"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Core uses high-performance fitz library for direct access to PDF binary structures. Text is extracted as byte stream."},{t:"Dynamic K-Shingling",d:"Algorithm splits text into overlapping sequences to detect smart rewriting."},{t:"MD5 Fingerprinting",d:"128-bit segment hashing for digital signature matching in RAM."},{t:"Jaccard Similarity Index",d:"Mathematical model for calculating hash set intersections, ensuring reference uniqueness accuracy."},{t:"Asynchronous FastAPI Backend",d:"Asynchrony based on Python asyncio supports stable ping even when analyzing heavy data arrays."},{t:"RAM-Only Processing",d:"Computations occur in volatile memory. Objects are destroyed post-session."}]},base:{items:[{t:"Local University Archive",d:"Centralized database of all uploaded works by RK students to detect horizontal plagiarism."},{t:"Open Access Crawling",d:"Indexing of arXiv.org, Google Scholar, and ResearchGate repositories for search in scientific publications."},{t:"KazNet Deep Index",d:"Proprietary QazBot robot indexes government portals and dissertation archives."},{t:"AI Content Patterns",d:"Statistical analysis of texts for signs of generation by neural networks (GPT-4, Claude)."}]}}}}}},fallbackLng:"rus",interpolation:{escapeValue:!1}});fA.createRoot(document.getElementById("root")).render(C.jsx(sn.StrictMode,{children:C.jsx(AZ,{children:C.jsx(ZTe,{})})}));
+            `})]})}function s4({label:t,icon:e,active:n=!1}){return C.jsxs("div",{className:`flex items-center gap-2 px-4 py-1.5 rounded-full border text-[9px] font-black uppercase tracking-widest transition-all ${n?"bg-blue-500/10 border-blue-500/20 text-blue-500":"bg-white/5 border-white/10 text-zinc-500"}`,children:[e,t]})}function o4({children:t,adminOnly:e=!1}){const{token:n,user:r}=aj();return n?e&&(r==null?void 0:r.sub)!=="admin@qazzerep.kz"?C.jsx(K3,{to:"/"}):t:C.jsx(K3,{to:"/login"})}function ZTe(){return C.jsx(sQ,{children:C.jsxs(xZ,{children:[C.jsx(Vf,{path:"/login",element:C.jsx(Aie,{})}),C.jsx(Vf,{path:"/:slug",element:C.jsx(Rme,{})}),C.jsx(Vf,{path:"/verify/:reportId",element:C.jsx(KTe,{})}),C.jsx(Vf,{path:"/",element:C.jsx(o4,{children:C.jsx(Ame,{})})}),C.jsx(Vf,{path:"/admin",element:C.jsx(o4,{adminOnly:!0,children:C.jsx(Pme,{})})})]})})}const{slice:JTe,forEach:QTe}=[];function eCe(t){return QTe.call(JTe.call(arguments,1),e=>{if(e)for(const n in e)t[n]===void 0&&(t[n]=e[n])}),t}function tCe(t){return typeof t!="string"?!1:[/<\s*script.*?>/i,/<\s*\/\s*script\s*>/i,/<\s*img.*?on\w+\s*=/i,/<\s*\w+\s*on\w+\s*=.*?>/i,/javascript\s*:/i,/vbscript\s*:/i,/expression\s*\(/i,/eval\s*\(/i,/alert\s*\(/i,/document\.cookie/i,/document\.write\s*\(/i,/window\.location/i,/innerHTML/i].some(n=>n.test(t))}const a4=/^[\u0009\u0020-\u007e\u0080-\u00ff]+$/,nCe=function(t,e){const r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{path:"/"},i=encodeURIComponent(e);let s=`${t}=${i}`;if(r.maxAge>0){const o=r.maxAge-0;if(Number.isNaN(o))throw new Error("maxAge should be a Number");s+=`; Max-Age=${Math.floor(o)}`}if(r.domain){if(!a4.test(r.domain))throw new TypeError("option domain is invalid");s+=`; Domain=${r.domain}`}if(r.path){if(!a4.test(r.path))throw new TypeError("option path is invalid");s+=`; Path=${r.path}`}if(r.expires){if(typeof r.expires.toUTCString!="function")throw new TypeError("option expires is invalid");s+=`; Expires=${r.expires.toUTCString()}`}if(r.httpOnly&&(s+="; HttpOnly"),r.secure&&(s+="; Secure"),r.sameSite)switch(typeof r.sameSite=="string"?r.sameSite.toLowerCase():r.sameSite){case!0:s+="; SameSite=Strict";break;case"lax":s+="; SameSite=Lax";break;case"strict":s+="; SameSite=Strict";break;case"none":s+="; SameSite=None";break;default:throw new TypeError("option sameSite is invalid")}return r.partitioned&&(s+="; Partitioned"),s},l4={create(t,e,n,r){let i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:{path:"/",sameSite:"strict"};n&&(i.expires=new Date,i.expires.setTime(i.expires.getTime()+n*60*1e3)),r&&(i.domain=r),document.cookie=nCe(t,e,i)},read(t){const e=`${t}=`,n=document.cookie.split(";");for(let r=0;r<n.length;r++){let i=n[r];for(;i.charAt(0)===" ";)i=i.substring(1,i.length);if(i.indexOf(e)===0)return i.substring(e.length,i.length)}return null},remove(t,e){this.create(t,"",-1,e)}};var rCe={name:"cookie",lookup(t){let{lookupCookie:e}=t;if(e&&typeof document<"u")return l4.read(e)||void 0},cacheUserLanguage(t,e){let{lookupCookie:n,cookieMinutes:r,cookieDomain:i,cookieOptions:s}=e;n&&typeof document<"u"&&l4.create(n,t,r,i,s)}},iCe={name:"querystring",lookup(t){var r;let{lookupQuerystring:e}=t,n;if(typeof window<"u"){let{search:i}=window.location;!window.location.search&&((r=window.location.hash)==null?void 0:r.indexOf("?"))>-1&&(i=window.location.hash.substring(window.location.hash.indexOf("?")));const o=i.substring(1).split("&");for(let a=0;a<o.length;a++){const l=o[a].indexOf("=");l>0&&o[a].substring(0,l)===e&&(n=o[a].substring(l+1))}}return n}},sCe={name:"hash",lookup(t){var i;let{lookupHash:e,lookupFromHashIndex:n}=t,r;if(typeof window<"u"){const{hash:s}=window.location;if(s&&s.length>2){const o=s.substring(1);if(e){const a=o.split("&");for(let l=0;l<a.length;l++){const u=a[l].indexOf("=");u>0&&a[l].substring(0,u)===e&&(r=a[l].substring(u+1))}}if(r)return r;if(!r&&n>-1){const a=s.match(/\/([a-zA-Z-]*)/g);return Array.isArray(a)?(i=a[typeof n=="number"?n:0])==null?void 0:i.replace("/",""):void 0}}}return r}};let zf=null;const u4=()=>{if(zf!==null)return zf;try{if(zf=typeof window<"u"&&window.localStorage!==null,!zf)return!1;const t="i18next.translate.boo";window.localStorage.setItem(t,"foo"),window.localStorage.removeItem(t)}catch{zf=!1}return zf};var oCe={name:"localStorage",lookup(t){let{lookupLocalStorage:e}=t;if(e&&u4())return window.localStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupLocalStorage:n}=e;n&&u4()&&window.localStorage.setItem(n,t)}};let Bf=null;const c4=()=>{if(Bf!==null)return Bf;try{if(Bf=typeof window<"u"&&window.sessionStorage!==null,!Bf)return!1;const t="i18next.translate.boo";window.sessionStorage.setItem(t,"foo"),window.sessionStorage.removeItem(t)}catch{Bf=!1}return Bf};var aCe={name:"sessionStorage",lookup(t){let{lookupSessionStorage:e}=t;if(e&&c4())return window.sessionStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupSessionStorage:n}=e;n&&c4()&&window.sessionStorage.setItem(n,t)}},lCe={name:"navigator",lookup(t){const e=[];if(typeof navigator<"u"){const{languages:n,userLanguage:r,language:i}=navigator;if(n)for(let s=0;s<n.length;s++)e.push(n[s]);r&&e.push(r),i&&e.push(i)}return e.length>0?e:void 0}},uCe={name:"htmlTag",lookup(t){let{htmlTag:e}=t,n;const r=e||(typeof document<"u"?document.documentElement:null);return r&&typeof r.getAttribute=="function"&&(n=r.getAttribute("lang")),n}},cCe={name:"path",lookup(t){var i;let{lookupFromPathIndex:e}=t;if(typeof window>"u")return;const n=window.location.pathname.match(/\/([a-zA-Z-]*)/g);return Array.isArray(n)?(i=n[typeof e=="number"?e:0])==null?void 0:i.replace("/",""):void 0}},fCe={name:"subdomain",lookup(t){var i,s;let{lookupFromSubdomainIndex:e}=t;const n=typeof e=="number"?e+1:1,r=typeof window<"u"&&((s=(i=window.location)==null?void 0:i.hostname)==null?void 0:s.match(/^(\w{2,5})\.(([a-z0-9-]{1,63}\.[a-z]{2,6})|localhost)/i));if(r)return r[n]}};let fX=!1;try{document.cookie,fX=!0}catch{}const dX=["querystring","cookie","localStorage","sessionStorage","navigator","htmlTag"];fX||dX.splice(1,1);const dCe=()=>({order:dX,lookupQuerystring:"lng",lookupCookie:"i18next",lookupLocalStorage:"i18nextLng",lookupSessionStorage:"i18nextLng",caches:["localStorage"],excludeCacheFor:["cimode"],convertDetectedLanguage:t=>t});class hX{constructor(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};this.type="languageDetector",this.detectors={},this.init(e,n)}init(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{languageUtils:{}},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};this.services=e,this.options=eCe(n,this.options||{},dCe()),typeof this.options.convertDetectedLanguage=="string"&&this.options.convertDetectedLanguage.indexOf("15897")>-1&&(this.options.convertDetectedLanguage=i=>i.replace("-","_")),this.options.lookupFromUrlIndex&&(this.options.lookupFromPathIndex=this.options.lookupFromUrlIndex),this.i18nOptions=r,this.addDetector(rCe),this.addDetector(iCe),this.addDetector(oCe),this.addDetector(aCe),this.addDetector(lCe),this.addDetector(uCe),this.addDetector(cCe),this.addDetector(fCe),this.addDetector(sCe)}addDetector(e){return this.detectors[e.name]=e,this}detect(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:this.options.order,n=[];return e.forEach(r=>{if(this.detectors[r]){let i=this.detectors[r].lookup(this.options);i&&typeof i=="string"&&(i=[i]),i&&(n=n.concat(i))}}),n=n.filter(r=>r!=null&&!tCe(r)).map(r=>this.options.convertDetectedLanguage(r)),this.services&&this.services.languageUtils&&this.services.languageUtils.getBestMatchFromCodes?n:n.length>0?n[0]:null}cacheUserLanguage(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:this.options.caches;n&&(this.options.excludeCacheFor&&this.options.excludeCacheFor.indexOf(e)>-1||n.forEach(r=>{this.detectors[r]&&this.detectors[r].cacheUserLanguage(e,this.options)}))}}hX.type="languageDetector";vi.use(hX).use(ise).init({resources:{rus:{translation:{roadmap:{title:"Планы развития",year:"2026",active_status:"В разработке",q1:{title:"Фундамент и AI Ядро",items:["Запуск нейронного ядра QazZerep v2.0","Интеграция с локальными базами данных","Обновление 3D-интерфейса"]},q2:{title:"Мультиформатный анализ",items:["Поддержка анализа видео и аудио","Расширение языковых моделей (KZ, RU, EN, TR)","API для корпоративных клиентов"]},q3:{title:"Глобальная связность",items:["Запуск мобильного приложения","Blockchain-верификация отчетов","Коллаборация с вузами РК"]},q4:{title:"Автономная экосистема",items:["Self-learning AI (дообучение)","Прогноз академических трендов","Глобальный поиск по архивам"]}},auth:{login_title:"Авторизация",login_btn:"Вход в систему",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Нет доступа?",create_id:"Создать ID узла",error_invalid:"ACCESS_DENIED: НЕВЕРНЫЕ ДАННЫЕ"},nav:{check:"Проверка",history:"История",account:"Аккаунт",roadmap:"Планы 2026"},settings:{language:"Язык системы",theme:"Тема оформления"},dash:{title_new:"Сверка документов",subtitle_new:"Интеллектуальный анализ сходства текстов",title_history:"Архив проверок",subtitle_history:"История ваших предыдущих анализов",btn_reset:"Сбросить и начать заново",load_more:"Показать еще",loading_more:"Загрузка...",report_unavailable:"Не удалось загрузить отчет, попробуйте позже"},upload:{title:"Перетащите файлы сюда",formats:"Поддерживаются PDF, DOCX и TXT",selected:"Выбрано",btn_start:"Запустить анализ"},report:{title:"Отчет анализа",match_label:"Сходство",source_a:"Источник А",target_b:"Источник Б",ai_prob:"Вероятность ИИ",copied:"Скопировано"},profile:{title:"Настройки узла",save_btn:"Сохранить",syncing:"Синхронизация",config_synced:"КОНФИГ_СИНХРОНИЗИРОВАН",upload_failed:"ОШИБКА_ЗАГРУЗКИ",avatar_updated:"АВАТАР_ОБНОВЛЕН",public_name:"Публичное имя",contact_email:"Контактный Email",node_active:"Узел активен",cloud_sync:"Синхронизация с облачным ядром активна",detectors:"Детекторы заимствований",ignore_quotes:"Игнорировать цитаты",smart_quotes:"Умное распознавание цитат",change_pass:"Сменить пароль",logout:"Выйти из системы",rules:{gost:"Литература (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Таблицы и графики",titles:"Титульный лист"}},footer:{description:"Автоматизированная система интеллектуальной сверки протоколов и документации.",engine_name:"Движок Интеллект-Сверки",sections:{nav:{title:"Навигатор"},legal:{title:"Правовой узел"},support:{title:"Поддержка"}}},info:{back:"Назад",version_desc:"Подробные спецификации и регламенты работы платформы QazZerep версии 2.4.0.",copyright:"© 2026 Инфраструктура Ядра",categories:{architecture:"Системная Архитектура",methodology:"Методология Данных",privacy:"Конфиденциальность",legal:"Юридическая База",technical:"Техническая Сессия",manual:"Руководство",channels:"Прямые Каналы"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро использует высокопроизводительную библиотеку fitz для прямого доступа к бинарным структурам PDF. Текст извлекается в виде потока байтов, минуя сохранение на диск."},{t:"Динамический K-Shingling",d:"Алгоритм разбивает текст на пересекающиеся последовательности. Параметр k=3..9 позволяет системе находить не только прямое копирование, но и умный рерайт."},{t:"MD5 Fingerprinting",d:"Генерация 128-битных отпечатков сегментов. Позволяет сравнивать документы через сопоставление цифровых сигнатур в RAM."},{t:"Индекс Сходства Жаккара",d:"Математическая модель расчета пересечения множеств хешей, обеспечивающая эталонную точность вычисления уникальности."},{t:"Batch Cross-Check (O(n²))",d:"Пакетная сверка всех загруженных файлов между собой для выявления скрытых сетей передачи работ."},{t:"Asynchronous FastAPI Backend",d:"Асинхронность на базе Python asyncio поддерживает стабильный пинг даже при анализе тяжелых массивов данных."},{t:"Neural Highlight Engine",d:"Визуализация через CSS-движок: .diff-match подсвечивает плагиат, а .diff-rewrite отмечает зоны обфускации."},{t:"RAM-Only Processing",d:"Вычисления происходят в волатильной памяти. После сессии объекты уничтожаются, не оставляя следов на диске."}]},base:{items:[{t:"Локальный Архив ВУЗов",d:"Централизованная база всех загруженных работ студентов РК для выявления горизонтального плагиата."},{t:"Open Access Crawling",d:"Индексация репозиториев arXiv.org, Google Scholar и ResearchGate для поиска в научных публикациях."},{t:"KazNet Deep Index",d:"Собственный робот QazBot индексирует гос. порталы и архивы диссертаций на казахском и русском языках."},{t:"Cross-Language Mapping",d:"Технология перевода сегментов текста для поиска заимствований с английского языка на казахский/русский."},{t:"GitHub & Code Analysis",d:"Анализ программного кода (50+ языков) для проверки технических работ на плагиат из репозиториев."},{t:"AI Content Patterns",d:"Статистический анализ текстов на наличие признаков генерации нейросетями (GPT-4, Claude)."}]},priv:{items:[{t:"Суверенитет Данных РК",d:"Все серверные мощности расположены в сертифицированных дата-центрах на территории Республики Казахстан."},{t:"Шифрование AES-GCM-256",d:"Каналы передачи данных защищены военным стандартом шифрования. Ваши документы недоступны для перехвата."},{t:"Stateless Архитектура",d:"Система не сохраняет историю загрузок без требования пользователя. Каждый акт проверки эфемерный."},{t:"JWT-Авторизация",d:"Доступ защищен токенами с ограниченным временем жизни, что предотвращает угон сессий."},{t:"ISO 27001 Compliance",d:"Внутренние процессы управления данными соответствуют международным стандартам безопасности."},{t:"Право на Забвение",d:"Пользователь может в один клик удалить все свои следы, включая хешированные отпечатки работ."}]},terms:{items:[{t:"Акцепт Соглашения",d:"Использование сервиса означает принятие условий. Ответственность за интерпретацию результатов лежит на пользователе."},{t:"Интеллектуальная Собственность",d:"Алгоритмы принадлежат QazZerep. Пользователь сохраняет права на загружаемый контент."},{t:"Добросовестное Использование",d:"Запрещается использование ботов для обхода ограничений системы или проведения атак."},{t:"Ограничение Ответственности",d:"Система предоставляет вероятностную оценку. Мы не гарантируем 100% выявление всех форм нейро-обфускации."}]},cookie:{items:[{t:"Session Persistence",d:"Используем технические куки для JWT-авторизации, чтобы не вводить пароль при обновлении."},{t:"Security Tokens",d:"Анти-фрод файлы помогают идентифицировать подозрительную активность и защищать аккаунт."},{t:"Zero Third-Party Tracking",d:"Мы не используем маркетинговые куки. Ваша активность не передается рекламным сетям."},{t:"LocalStorage Usage",d:"Данные о прогрессе анализа могут временно храниться в браузере для восстановления сессии."}]},help:{items:[{t:"Инструкция по загрузке",d:"Рекомендуется PDF с текстовым слоем. Для сканов работает модуль Anti-OCR."},{t:"Интерпретация отчета",d:"80%+ — норма. Ниже 50% — критическая зона, требующая ручной проверки."},{t:"Технические лимиты",d:"Максимальный размер файла — 50MB. Для Big Data свяжитесь с отделом интеграции."}]},contacts:{items:[{t:"Telegram Support",d:"Оперативная связь: @brjxjxjd (Ответ в течение 5 минут)."},{t:"Phone Hotline",d:"Горячая линия для экстренных вопросов: +7 (777) 123-45-67 (24/7)."}]}}}}},kaz:{translation:{roadmap:{title:"Даму жоспары",year:"2026",active_status:"Әзірлеу үстінде",q1:{title:"Іргетас және AI Ядросы",items:["QazZerep v2.0 нейрондық ядросын іске қосу","Жергілікті деректер базаларымен интеграция","3D интерфейсін жаңарту"]},q2:{title:"Мультиформатты талдау",items:["Бейне және аудио талдауды қолдау","Тілдік модельдерді кеңейту (KZ, RU, EN, TR)","Корпоративтік клиенттерге арналған API"]},q3:{title:"Жаһандық байланыс",items:["Мобильді қолданбаны іске қосу","Есептерді Blockchain арқылы тексеру","ҚР жоғары оқу орындарымен ынтымақтастық"]},q4:{title:"Автономды экожүйе",items:["Self-learning AI (өзін-өзі оқыту)","Академиялық трендтерді болжау","Мұрағаттар бойынша жаһандық іздеу"]}},auth:{login_title:"Авторизация",login_btn:"Жүйеге кіру",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Кіру мүмкін емес пе?",create_id:"Түйін ID-ін жасау",error_invalid:"ACCESS_DENIED: ҚАТЕ ДЕРЕКТЕР"},nav:{check:"Тексеру",history:"Тарих",account:"Аккаунт",roadmap:"Даму жоспары"},settings:{language:"Жүйе тілі",theme:"Интерфейс тақырыбы"},dash:{title_new:"Құжаттарды салыстыру",subtitle_new:"Мәтіндердің ұқсастығын интеллектуалды талдау",title_history:"Тексерулер мұрағаты",subtitle_history:"Алдыңғы талдауларыңыздың тарихы",btn_reset:"Тазалау және қайта бастау",load_more:"Тағы көрсету",loading_more:"Жүктелуде...",report_unavailable:"Есепті жүктеу мүмкін болмады, кейінірек қайталаңыз"},upload:{title:"Файлдарды осы жерге сүйреңіз",formats:"PDF, DOCX және TXT қолданылады",selected:"Таңдалды",btn_start:"Талдауды бастау"},report:{title:"Талдау есебі",match_label:"Ұқсастық",source_a:"А дереккөзі",target_b:"Б дереккөзі",ai_prob:"ИИ ықтималдығы",copied:"Көшірілді"},profile:{title:"Түйін параметрлері",save_btn:"Сақтау",syncing:"Синхрондау",config_synced:"КОНФИГ_СИНХРОНДАЛДЫ",upload_failed:"ЖҮКТЕУ_ҚАТАСЫ",avatar_updated:"АВАТАР_ЖАҢАРТЫЛДЫ",public_name:"Жалпыға ортақ есім",contact_email:"Байланыс Email-ы",node_active:"Түйін белсенді",cloud_sync:"Бұлтты ядромен синхрондау белсенді",detectors:"Ұқсастық детекторы",ignore_quotes:"Дәйексөздерді елемеу",smart_quotes:"Дәйексөздерді ақылды тану",change_pass:"Құпия сөзді өзгерту",logout:"Жүйеден шығу",rules:{gost:"Әдебиет (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Кестелер",titles:"Титул парағы"}},footer:{description:"Хаттамалар мен құжаттарды интеллектуалды салыстырудың автоматтандырылған жүйесі.",engine_name:"Интеллект-Салыстыру Жүйесі",sections:{nav:{title:"Навигатор"},legal:{title:"Құқықтық орталық"},support:{title:"Қолдау"}}},info:{back:"Артқа",version_desc:"QazZerep 2.4.0 платформасының егжей-тегжейлі сипаттамалары мен жұмыс ережелері.",copyright:"© 2026 Ядролық Инфрақұрылым",categories:{architecture:"Жүйе Архитектурасы",methodology:"Деректер Әдістемесі",privacy:"Құпиялылық",legal:"Құқықтық Негіз",technical:"Техникалық Сессия",manual:"Нұсқаулық",channels:"Тікелей Арналар"},pages:{doc:{title:"Құжаттама"},base:{title:"Жалпы Индекс"},priv:{title:"Қауіпсіздік Хаттамасы"},terms:{title:"Пайдалану Шарттары"},cookie:{title:"Cookie Саясаты"},help:{title:"Көмек Орталығы"},contacts:{title:"Байланыс Түйіндері"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро PDF бинарлық құрылымдарына тікелей қол жеткізу үшін жоғары өнімді fitz кітапханасын пайдаланады. Мәтін байт ағыны түрінде алынады."},{t:"Динамикалық K-Shingling",d:"Алгоритм мәтінді ақылды рерайтты іздеу үшін қиылысатын тізбектерге бөледі."},{t:"MD5 Fingerprinting",d:"RAM-дағы сандық қолтаңбаларды салыстыру үшін сегменттердің 128 биттік таңбаларын жасау."},{t:"Жаккар ұқсастық индексі",d:"Бірегейлікті есептеудің эталондық дәлдігін қамтамасыз ететін хэш жиындарының қиылысуын есептеудің математикалық моделі."},{t:"Batch Cross-Check",d:"Жұмыстарды берудің жасырын желілерін анықтау үшін барлық жүктелген файлдарды өзара пакеттік салыстыру."},{t:"RAM-Only Processing",d:"Есептеулер тұрақсыз жадта жүреді. Сессиядан кейін нысандар ізсіз жойылады."}]},base:{items:[{t:"ЖОО-лардың жергілікті мұрағаты",d:"Көлденең плагиатты анықтау үшін ҚР студенттерінің барлық жүктелген жұмыстарының орталықтандырылған базасы."},{t:"Open Access Crawling",d:"Ғылыми жарияланымдардан іздеу үшін arXiv.org, Google Scholar және ResearchGate репозиторийлерін индекстеу."},{t:"KazNet Deep Index",d:"Жеке QazBot роботы мемлекеттік порталдарды және қазақ/орыс тілдеріндегі диссертациялар мұрағатын индекстейді."},{t:"Cross-Language Mapping",d:"Ағылшын тілінен қазақ/орыс тілдеріне аударылған мәтін үзінділерін іздеу технологиясы."}]}}}}},eng:{translation:{roadmap:{title:"Project Roadmap",year:"2026",active_status:"Active Development",q1:{title:"Foundation & AI Core",items:["QazZerep v2.0 Neural Core Launch","Local Database Integration","3D Interface Update"]},q2:{title:"Multi-Format Analysis",items:["Video & Audio Analysis Support","LLM Expansion (KZ, RU, EN, TR)","Enterprise API Access"]},q3:{title:"Global Connectivity",items:["Mobile App Launch (iOS/Android)","Blockchain Report Verification","University Partnerships in RK"]},q4:{title:"Autonomous Ecosystem",items:["Self-learning AI Implementation","Academic Trend Prediction","Global Archive Search"]}},auth:{login_title:"Authorization",login_btn:"Login to System",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"No access?",create_id:"Create Node ID",error_invalid:"ACCESS_DENIED: INVALID CREDENTIALS"},nav:{check:"Verification",history:"History",account:"Account",roadmap:"Roadmap"},settings:{language:"System Language",theme:"Visual Theme"},dash:{title_new:"Document Sync",subtitle_new:"Intelligent text similarity analysis",title_history:"Audit Archive",subtitle_history:"History of your previous scans",btn_reset:"Reset Core",load_more:"Load more",loading_more:"Loading...",report_unavailable:"Could not load the report, please try again later"},upload:{title:"Drop layers here",formats:"PDF, DOCX, TXT supported",selected:"Active",btn_start:"Execute Analysis"},report:{title:"Analysis Report",match_label:"Similarity",source_a:"Source A",target_b:"Source B",ai_prob:"AI Probability",copied:"Copied"},profile:{title:"Node Settings",save_btn:"Save Config",syncing:"Syncing",config_synced:"CONFIG_SYNCED",upload_failed:"UPLOAD_FAILED",avatar_updated:"AVATAR_UPDATED",public_name:"Public Name",contact_email:"Contact Email",node_active:"Node Active",cloud_sync:"Cloud Core Sync Active",detectors:"Detectors",ignore_quotes:"Ignore Quotes",smart_quotes:"Smart Quotes",change_pass:"Password",logout:"Logout",rules:{gost:"GOST Lit",apa:"APA/MLA",tables:"Tables",titles:"Titles"}},footer:{description:"Automated system for intelligent reconciliation of protocols and documentation.",engine_name:"Intellect-Sverka Engine",sections:{nav:{title:"Navigator"},legal:{title:"Legal Node"},support:{title:"Support"}}},info:{back:"Return",version_desc:"Detailed specifications and operational protocols for QazZerep v2.4.0.",copyright:"© 2026 Core Infrastructure",categories:{architecture:"System Architecture",methodology:"Data Methodology",privacy:"Data Privacy",legal:"Legal Framework",technical:"Technical Session",manual:"User Manual",channels:"Direct Channels"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Core uses high-performance fitz library for direct access to PDF binary structures. Text is extracted as byte stream."},{t:"Dynamic K-Shingling",d:"Algorithm splits text into overlapping sequences to detect smart rewriting."},{t:"MD5 Fingerprinting",d:"128-bit segment hashing for digital signature matching in RAM."},{t:"Jaccard Similarity Index",d:"Mathematical model for calculating hash set intersections, ensuring reference uniqueness accuracy."},{t:"Asynchronous FastAPI Backend",d:"Asynchrony based on Python asyncio supports stable ping even when analyzing heavy data arrays."},{t:"RAM-Only Processing",d:"Computations occur in volatile memory. Objects are destroyed post-session."}]},base:{items:[{t:"Local University Archive",d:"Centralized database of all uploaded works by RK students to detect horizontal plagiarism."},{t:"Open Access Crawling",d:"Indexing of arXiv.org, Google Scholar, and ResearchGate repositories for search in scientific publications."},{t:"KazNet Deep Index",d:"Proprietary QazBot robot indexes government portals and dissertation archives."},{t:"AI Content Patterns",d:"Statistical analysis of texts for signs of generation by neural networks (GPT-4, Claude)."}]}}}}}},fallbackLng:"rus",interpolation:{escapeValue:!1}});fA.createRoot(document.getElementById("root")).render(C.jsx(sn.StrictMode,{children:C.jsx(AZ,{children:C.jsx(ZTe,{})})}));
@@ -1,24 +1,25 @@
 from app.database.db import users
-from fastapi import APIRouter, Body, Depends, UploadFile, File, status
+from fastapi import APIRouter, Body, Depends, UploadFile, File, Request, Response, status
 
 from fastapi.responses import JSONResponse
 
 from app.services.auth import create_session_token, jwt_auth_handler
+from app.services.avatars import AVATAR_TYPES, ORIGINAL, avatar_url, default_variant, save_avatar, load_avatar
+from app.services.users import current_user, invalidate_profile
 
+import config
 import datetime
-import base64
 router = APIRouter()
 
 @router.get("/me")
-async def get_me(user_data=Depends(jwt_auth_handler)):
-    user = await users.find_one({"email": user_data["sub"]})
+async def get_me(user=Depends(current_user)):
     if not user:
         return JSONResponse(content={"error": "User not found"}, status_code=404)
     
     return {
         "email": user["email"],
         "display_name": user.get("display_name", "Administrator"),
-        "avatar": user.get("avatar"),  # Отдаем строку Base64 или URL
+        "avatar": avatar_url(user.get("avatar_id")),  # URL картинки, сама она отдается через /auth/avatar
         "settings": user.get("settings", {
             "active_rules": ["gost"],
             "custom_regex": "",
@@ -29,23 +30,37 @@ async def get_me(user_data=Depends(jwt_auth_handler)):
 @router.post("/upload-avatar")
 async def upload_avatar(file: UploadFile = File(...), user_data=Depends(jwt_auth_handler)):
     # Проверка формата
-    if file.content_type not in ["image/jpeg", "image/png"]:
+    if file.content_type not in AVATAR_TYPES:
         return JSONResponse(content={"message": "Invalid file type"}, status_code=400)
 
-    # Читаем файл и конвертируем в Base64
-    contents = await file.read()
-    if len(contents) > 2 * 1024 * 1024:  # Лимит 2MB
+    # Читаем не больше лимита + 1 байт, чтобы не держать в памяти огромный файл
+    contents = await file.read(config.avatar_max_bytes + 1)
+    if len(contents) > config.avatar_max_bytes:
         return JSONResponse(content={"message": "File too large"}, status_code=400)
 
-    encoded_image = base64.b64encode(contents).decode("utf-8")
-    avatar_data = f"data:{file.content_type};base64,{encoded_image}"
+    try:
+        avatar_id = await save_avatar(user_data["sub"], contents, file.content_type)
+    except ValueError:
+        return JSONResponse(content={"message": "Invalid image"}, status_code=400)
+    invalidate_profile(user_data["sub"])
 
-    await users.update_one(
-        {"email": user_data["sub"]},
-        {"$set": {"avatar": avatar_data}}
-    )
-    
-    return {"avatar_url": avatar_data}
+    return {"avatar_url": avatar_url(avatar_id)}
+
+@router.get("/avatar/{avatar_id}")
+async def get_avatar(avatar_id: str, request: Request, size: str = None):
+    """Картинка аватара: size - одна из config.avatar_sizes или original."""
+    variant = size or default_variant()
+    if variant != ORIGINAL and variant not in {str(s) for s in config.avatar_sizes}:
+        return JSONResponse(content={"message": "Unknown avatar size"}, status_code=400)
+
+    avatar = await load_avatar(avatar_id, variant)
+    if not avatar:
+        return JSONResponse(content={"message": "Avatar not found"}, status_code=404)
+
+    headers = {"ETag": f'"{avatar["etag"]}"', "Cache-Control": "public, max-age=31536000, immutable"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=bytes(avatar["data"]), media_type=avatar["content_type"], headers=headers)
 
 @router.post("/update-settings")
 async def update_settings(payload: dict = Body(...), user_data=Depends(jwt_auth_handler)):
@@ -59,13 +74,14 @@ async def update_settings(payload: dict = Body(...), user_data=Depends(jwt_auth_
         {"email": user_data["sub"]},
         {"$set": update_data}
     )
+    invalidate_profile(user_data["sub"])
     return JSONResponse(content={"message": "Настройки обновлены"}, status_code=200)
 
 
 @router.post("/login")
 async def login(email: str = Body(...), password: str = Body(...)):
     if email and password:
-        if (await users.find_one({"email": email, "password": password})):
+        if (await users.find_one({"email": email, "password": password}, {"_id": 1})):
             jwt = await create_session_token(str(email))
             return JSONResponse(content={"message": "Login successfully", "token": jwt}, status_code=200)
         else:
@@ -85,10 +101,10 @@ async def change_password(
         return JSONResponse(content={"message": "Missing fields"}, status_code=400)
     
     # Ищем пользователя
-    user = await users.find_one({"email": user_data["sub"]})
+    user = await users.find_one({"email": user_data["sub"]}, {"password": 1})
     
     # Проверка старого пароля
-    if user.get("password") != old_password:
+    if not user or user.get("password") != old_password:
         return JSONResponse(content={"message": "Текущий пароль неверен"}, status_code=400)
     
     # Обновляем
@@ -96,6 +112,7 @@ async def change_password(
         {"email": user_data["sub"]},
         {"$set": {"password": new_password}}
     )
+    invalidate_profile(user_data["sub"])
     
     return {"message": "Пароль успешно изменен"}
 
@@ -111,7 +128,7 @@ async def register(
     if not email or not password or not fullName:
         return JSONResponse(content={"message": "Заполните обязательные поля"}, status_code=400)
 
-    if await users.find_one({"email": email}):
+    if await users.find_one({"email": email}, {"_id": 1}):
         return JSONResponse(content={"message": "Пользователь с таким Email уже существует"}, status_code=400)
 
     if role == "TEACHER" and schoolCode != "QAZ-2026-PRO":
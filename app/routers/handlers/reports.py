@@ -1,81 +1,120 @@
 from app.database.db import history
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse, Response
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import config
+from app.services.auth import decode_session_token
 from app.database.db import reports
+from app.services.diffstore import render_reports, load_words, unpack_runs, matched_fragments
+from app.services.metrics import REPORT_REQUESTS
+from app.services.report_pdf import pdf_cache, report_version, build_report_pdf, highlight_original
+from app.services.ingest import original_store
 
-import io
+import asyncio
 import re
 import html as html_lib
-import fitz
+from typing import Dict, List, Optional, Tuple
 
 router = APIRouter()
+# Публичные отчеты открываются без токена; он нужен только для исходного PDF
+optional_security = HTTPBearer(auto_error=False)
 
 @router.get("/{report_id}")
 async def get_public_report(report_id: str):
-    print(f"Searching for report_id: {report_id}") # ЛОГ В КОНСОЛЬ
-    report = await reports.find_one({"report_id": report_id})
-    
+    report = await reports.find_one({"report_id": report_id}, {"email": 0})
+    REPORT_REQUESTS.inc(format="json", found=str(report is not None).lower())
+
     if not report:
-        print("Not found in reports collection")
         raise HTTPException(status_code=404, detail="Report not found")
         
     report["_id"] = str(report["_id"])
+    # HTML собирается из сжатых отрезков только по запросу
+    report = (await render_reports([report]))[0]
     return report
 
 
+def _extract_matches_legacy(html_text: str) -> List[str]:
+    if not html_text:
+        return []
+    spans = re.findall(r"<span class='diff-match'>(.*?)</span>", html_text, flags=re.DOTALL)
+    cleaned = []
+    for chunk in spans:
+        text = re.sub(r'<[^>]+>', '', chunk)
+        text = html_lib.unescape(text).strip()
+        if text:
+            cleaned.append(text)
+    return cleaned
+
+
+async def _report_matches(report: Dict) -> Tuple[List[str], List[str]]:
+    doc_a, doc_b = report.get("docA", {}), report.get("docB", {})
+    if "spans" in doc_a:
+        # Компактный формат: совпадения берутся прямо из отрезков, без разбора HTML
+        words = await load_words([doc_a["text_hash"], doc_b["text_hash"]])
+        return (
+            matched_fragments(words.get(doc_a["text_hash"], []), unpack_runs(doc_a["spans"])),
+            matched_fragments(words.get(doc_b["text_hash"], []), unpack_runs(doc_b["spans"])),
+        )
+    return _extract_matches_legacy(doc_a.get("html", "")), _extract_matches_legacy(doc_b.get("html", ""))
+
+
 @router.get("/{report_id}/pdf")
-async def export_report_pdf(report_id: str):
-    """Экспорт отчета в PDF с подсветкой заимствований (фрагменты из diff-match)."""
+async def export_report_pdf(
+    report_id: str,
+    request: Request,
+    mode: str = "summary",
+    side: str = "a",
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    """Экспорт отчета в PDF: список совпавших фрагментов (mode=summary) или подсветка
+    прямо на страницах исходного PDF стороны side (mode=original).
+
+    Сводка публична, как и сам отчет. Исходный PDF включается настройкой original_pdf_enabled
+    и отдается только автору проверки: в нем есть все, что фильтры убрали из сравнения.
+    Готовый файл кэшируется по report_id и версии содержимого; повторные скачивания
+    (например, по QR-ссылке) отдаются из кэша, а при совпадении ETag - ответом 304.
+    """
+    if mode not in ("summary", "original") or side not in ("a", "b"):
+        raise HTTPException(status_code=400, detail="mode must be summary|original, side must be a|b")
+    if mode == "original" and not config.original_pdf_enabled:
+        raise HTTPException(status_code=404, detail="Original PDF export is disabled")
+
     report = await reports.find_one({"report_id": report_id})
+    REPORT_REQUESTS.inc(format="pdf", found=str(report is not None).lower())
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    def extract_matches(html_text: str):
-        if not html_text:
-            return []
-        spans = re.findall(r"<span class='diff-match'>(.*?)</span>", html_text, flags=re.DOTALL)
-        cleaned = []
-        for chunk in spans:
-            text = re.sub(r'<[^>]+>', '', chunk)
-            text = html_lib.unescape(text).strip()
-            if text:
-                cleaned.append(text)
-        return cleaned
-
-    matches_a = extract_matches(report.get("docA", {}).get("html", ""))
-    matches_b = extract_matches(report.get("docB", {}).get("html", ""))
-
-    pdf = fitz.open()
-    page = pdf.new_page()
-
-    text_lines = []
-    text_lines.append(f"Report ID: {report.get('report_id', '')}")
-    text_lines.append(f"Originality: {report.get('originality', 0)}%")
-    text_lines.append("")
-    text_lines.append("Document A matched fragments:")
-    if matches_a:
-        for idx, frag in enumerate(matches_a, 1):
-            text_lines.append(f"  [{idx}] {frag}")
-    else:
-        text_lines.append("  (no highlighted overlaps)")
-    text_lines.append("")
-    text_lines.append("Document B matched fragments:")
-    if matches_b:
-        for idx, frag in enumerate(matches_b, 1):
-            text_lines.append(f"  [{idx}] {frag}")
-    else:
-        text_lines.append("  (no highlighted overlaps)")
-
-    full_text = "\n".join(text_lines)
-    rect = fitz.Rect(40, 40, 550, 800)
-    page.insert_textbox(rect, full_text, fontsize=11, fontname="helv")
-
-    pdf_bytes = pdf.tobytes()
-    filename = f"qazzerep-report-{report_id}.pdf"
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        },
-    )
+    cache_control = "public, max-age=3600"
+    if mode == "original":
+        payload = await decode_session_token(credentials.credentials) if credentials else None
+        if payload is None:
+            raise HTTPException(status_code=401, detail="Invalid or expired JWT token",
+                                headers={"WWW-Authenticate": "Bearer"})
+        # Старые отчеты без владельца тоже закрыты
+        if report.get("email") != payload["sub"]:
+            raise HTTPException(status_code=403, detail="Original PDF is available only to the report owner")
+        cache_control = "private, max-age=3600"
+
+    version = report_version(report, mode, side)
+    headers = {"ETag": f'"{version}"', "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
+    pdf_bytes = pdf_cache.get(version)
+    if pdf_bytes is None:
+        matches_a, matches_b = await _report_matches(report)
+        if mode == "original":
+            doc = report.get("docA" if side == "a" else "docB", {})
+            original_path = original_store.get_path(doc["file_hash"]) if doc.get("file_hash") else None
+            if original_path is None:
+                raise HTTPException(status_code=404, detail="Original PDF is not available for this document")
+            pdf_bytes = await asyncio.to_thread(
+                highlight_original, original_path, matches_a if side == "a" else matches_b
+            )
+        else:
+            pdf_bytes = await asyncio.to_thread(build_report_pdf, report, matches_a, matches_b)
+        pdf_cache.put(version, pdf_bytes)
+
+    suffix = "" if mode == "summary" else f"-original-{side}"
+    headers["Content-Disposition"] = f"attachment; filename=qazzerep-report-{report_id}{suffix}.pdf"
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
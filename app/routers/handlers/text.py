@@ -1,228 +1,234 @@
 import asyncio
 import datetime
-import re
-import unicodedata
+import json
+import time
 import uuid
 from typing import List, Optional, Dict
-from difflib import SequenceMatcher
-from concurrent.futures import ThreadPoolExecutor
 
-import fitz 
 import numpy as np
-from fastapi import APIRouter, UploadFile, File, Depends, Body
-from fastapi.responses import JSONResponse
-from sentence_transformers import SentenceTransformer
-
-import io
-import zipfile
-from docx import Document
-
-try:
-    import rarfile  # type: ignore
-except ImportError:  # безопасный фолбэк, если rarfile не установлен
-    rarfile = None
-
-try:
-    import spacy  # type: ignore
-except ImportError:
-    spacy = None
-
-_nlp_kk = None
-if spacy is not None:
-    try:
-        # Пытаемся загрузить казахскую или мульти-языковую модель, если она установлена
-        for model_name in ["kk_core_news_sm", "kk_core_news_md", "xx_sent_ud_sm"]:
-            try:
-                _nlp_kk = spacy.load(model_name)
-                break
-            except Exception:
-                continue
-    except Exception:
-        _nlp_kk = None
+from bson import ObjectId
+from fastapi import APIRouter, UploadFile, File, Form, Depends, Body, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.services.auth import jwt_auth_handler
-from app.database.db import history, users, reports
-import zippy
+from app.services.users import current_user
+from app.services.minhash import select_pairs_for_diff
+from app.services.suspicious import (
+    estimate_similarity_matrix, select_suspicious_pairs, mutual_top_k_pairs, collusion_clusters, upper_triangle
+)
+from app.services.lexical import ENGINES as LEXICAL_ENGINES, get_diff_html, get_estimated_diff, diff_pairs, render_runs
+from app.services.diffstore import pack_runs, save_texts, render_reports
+from app.services.filters import filter_texts
+from app.services.extraction import ArchiveLimitError, spool_upload, remove_uploads
+from app.services.ingest import extract_uploads
+from app.services.workers import run_cpu_task, map_in_batches, chunked
+from app.services.models import model_registry, SEMANTIC_MODEL, semantic_cache_name
+from app.services.embeddings import embedding_cache
+from app.services.ai_detect import check_ai_batch
+from app.services.semantic import encode_chunked, similarity_matrix
+from app.services.alignment import (
+    split_sentences, encode_sentences, align_sentences, group_alignments, empty_alignment
+)
+from app.services.storage import BulkWriter
+from app.services.metrics import Trace, timed, DOCUMENTS, PAIRS, DOCUMENT_WORDS, BATCH_DOCUMENTS, BATCH_PAIRS
+from app.services.jobs import job_queue, load_job_uploads
+from app.services.corpus import winnow, text_digest, find_similar, index_documents, anonymize_matches
+from app.database.db import history, reports, jobs
+import config
 
 router = APIRouter()
-executor = ThreadPoolExecutor(max_workers=4)
-
-# Инициализация AI модели для семантического анализа (LaBSE)
-# При первом запуске скачается около 1.8 ГБ весов модели
-semantic_model = SentenceTransformer('sentence-transformers/LaBSE')
-
-FILTER_RULES = {
-    "gost": r'(?is)\n(Список литературы|Библиография|Пайдаланылған әдебиеттер).*$',
-    "apa": r'(?is)\n(References|Bibliography).*$',
-    "tables": r'(?i)(Таблица|Table|Кесте|Схема|Рисунок)\s+\d+.*?\n',
-    "titles": r'(?is)^.*?(Министерство|УДК|МРНТИ|Дипломная работа|Thesis|Work|Проект).*?\n\n',
-    "quotes": r'["«\'](.*?)["»\']'
-}
 
 # --- СЕРВИСНЫЕ ФУНКЦИИ ---
 
-async def check_ai(text):
-    detector = zippy.Zippy(zippy.CompressionEngine.BROTLI)
-    loop = asyncio.get_running_loop()
-    label, score = await loop.run_in_executor(None, detector.detector.score_text, text)
-    percent = round(score * 100, 2)
-    percent = min(max(percent, 0), 100)
-    return {
-        "label": "AI" if label == 'AI' else "Human",
-        "score": percent,
-        "isAI": label == 'AI'
-    }
+def get_semantic_matrix(texts: List[str]) -> np.ndarray:
+    """Матрица семантической близости документов по перекрывающимся чанкам (LaBSE)."""
+    embeddings, offsets = encode_chunked(
+        model_registry.get(SEMANTIC_MODEL), semantic_cache_name(), texts,
+        config.semantic_chunk_words, config.semantic_chunk_overlap, config.semantic_batch_size
+    )
+    return similarity_matrix(embeddings, offsets, config.semantic_block_bytes)
 
 def get_semantic_dna_score(text_a: str, text_b: str) -> float:
     """Вычисляет семантическую близость через векторные эмбеддинги."""
     if not text_a.strip() or not text_b.strip():
         return 0.0
-    
-    # Кодируем тексты в векторы
-    embeddings = semantic_model.encode([text_a, text_b])
-    
-    # Вычисляем косинусное сходство между векторами
-    norm_a = np.linalg.norm(embeddings[0])
-    norm_b = np.linalg.norm(embeddings[1])
-    
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-        
-    similarity = np.dot(embeddings[0], embeddings[1]) / (norm_a * norm_b)
-    return float(similarity)
-
-def apply_smart_filters(text: str, active_rules: List[str], custom_regex: Optional[str] = None) -> str:
-    text = unicodedata.normalize('NFKC', text)
-    for rule_key in active_rules:
-        pattern = FILTER_RULES.get(rule_key)
-        if pattern:
-            text = re.sub(pattern, '', text)
-    if custom_regex:
-        try:
-            lines = [line.split('//')[0].strip() for line in custom_regex.split('\n')]
-            for pattern in lines:
-                if pattern and len(pattern) > 1:
-                    text = re.sub(pattern, '', text)
-        except: pass
-    text = text.lower()
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    # Дополнительная лемматизация через spaCy (двуязычность KK/RU, если модель доступна)
-    if _nlp_kk is not None and text:
-        try:
-            doc = _nlp_kk(text)
-            text = " ".join(tok.lemma_ or tok.text for tok in doc)
-        except Exception:
-            pass
-    return text
-
-def get_diff_html(text_a: str, text_b: str) -> Dict:
-    words_a, words_b = text_a.split(), text_b.split()
-    s = SequenceMatcher(None, words_a, words_b)
-    html_a, html_b = [], []
-    for tag, i1, i2, j1, j2 in s.get_opcodes():
-        chunk_a, chunk_b = " ".join(words_a[i1:i2]), " ".join(words_b[j1:j2])
-        if tag == 'equal':
-            html_a.append(f"<span class='diff-match'>{chunk_a}</span>")
-            html_b.append(f"<span class='diff-match'>{chunk_b}</span>")
-        elif tag == 'replace':
-            html_a.append(f"<span class='diff-removed'>{chunk_a}</span>")
-            html_b.append(f"<span class='diff-changed'>{chunk_b}</span>")
-        elif tag == 'insert':
-            html_b.append(f"<span class='diff-added'>{chunk_b}</span>")
-        elif tag == 'delete':
-            html_a.append(f"<span class='diff-removed'>{chunk_a}</span>")
-    return {
-        "htmlA": " ".join(html_a), 
-        "htmlB": " ".join(html_b), 
-        "lexical_similarity": round(s.ratio() * 100, 2)
+    return float(get_semantic_matrix([text_a, text_b])[0, 1])
+
+async def get_sentence_alignments(docs: List[Dict]) -> Dict:
+    """Выравнивание предложений между документами батча (переводные заимствования RU/KK/EN).
+
+    LaBSE кодирует предложения всех документов пачками, поиск соседей - блочное
+    матричное умножение на CPU-пуле; результат сгруппирован по парам документов (i, j).
+    """
+    sentences, doc_ids = [], []
+    for idx, doc in enumerate(docs):
+        doc_sentences = split_sentences(doc["text"], config.align_min_words, config.align_max_words)
+        sentences.extend(doc_sentences)
+        doc_ids.extend([idx] * len(doc_sentences))
+    doc_ids = np.asarray(doc_ids, dtype=np.int64)
+    # Кодирование в потоке, как и чанки документов: event loop не блокируется
+    embeddings = await asyncio.to_thread(
+        encode_sentences, model_registry.get(SEMANTIC_MODEL), semantic_cache_name(), [s[0] for s in sentences],
+        config.semantic_batch_size
+    )
+    matches = await run_cpu_task(
+        align_sentences, embeddings, doc_ids, config.align_threshold, config.align_top_k, config.align_block_bytes
+    )
+    return group_alignments(matches, sentences, doc_ids, [len(doc["words"]) for doc in docs], config.align_max_pairs)
+
+def _load_filter_settings(current_user: Optional[Dict]):
+    u_settings = current_user.get("settings", {}) if current_user else {}
+    active_rules = u_settings.get("active_rules", [])
+    custom_regex = u_settings.get("custom_regex", "")
+
+    if u_settings.get("exclude_quotes") and "quotes" not in active_rules:
+        active_rules.append("quotes")
+    return u_settings, active_rules, custom_regex
+
+def _render_doc_side(doc: Dict, runs: List, diff_format: str) -> Dict:
+    side = {"name": doc["name"], "ai": doc["ai"]}
+    if diff_format == "spans":
+        # Компактный формат: отрезки [тег, начало, конец] в словах текста документа text_hash
+        side.update({"text_hash": doc["doc_hash"], "spans": [list(run) for run in runs]})
+    else:
+        side["html"] = render_runs(doc["words"], runs)
+    return side
+
+# Веса итогового балла пары: лексика и семантика
+LEXICAL_WEIGHT, SEMANTIC_WEIGHT = 0.7, 0.3
+
+def _build_pair_result(d1: Dict, d2: Dict, diff: Dict, semantic_percent: float, diff_format: str = "html",
+                       alignment: Optional[Dict] = None) -> Dict:
+    # Твоя новая формула весов
+    total_similarity = (diff["lexical_similarity"] * LEXICAL_WEIGHT) + (semantic_percent * SEMANTIC_WEIGHT)
+    total_similarity = round(min(max(total_similarity, 0), 100), 2)
+    total_originality = round(100 - total_similarity, 2)
+
+    result = {
+        "pair": f"{d1['name']} vs {d2['name']}",
+        "similarity": total_similarity,
+        "originality": total_originality,
+        "semantic_info": {
+            "dna_score": semantic_percent,
+            "lexical_score": diff["lexical_similarity"],
+            "lexical_estimated": diff.get("estimated", False)
+        },
+        "docA": _render_doc_side(d1, diff["runsA"], diff_format),
+        "docB": _render_doc_side(d2, diff["runsB"], diff_format),
+        "report_id": str(uuid.uuid4())[:12].upper()
+    }
+    if alignment is not None:
+        # Пары предложений: позиции [начало, конец] в словах отфильтрованных текстов A и B
+        result["sentence_alignment"] = alignment
+    return result
+
+def _pair_summary(res_entry: Dict) -> Dict:
+    """Сводка пары для истории: без HTML документов и списка пар предложений, они лежат в reports по report_id."""
+    summary = {
+        **res_entry,
+        "docA": {"name": res_entry["docA"]["name"], "ai": res_entry["docA"]["ai"]},
+        "docB": {"name": res_entry["docB"]["name"], "ai": res_entry["docB"]["ai"]},
     }
+    if "sentence_alignment" in res_entry:
+        summary["sentence_alignment"] = {k: v for k, v in res_entry["sentence_alignment"].items() if k != "pairs"}
+    return summary
+
+async def _hydrate_comparisons(comparisons: List[Dict]) -> List[Dict]:
+    """Подставляет HTML из reports в сводки истории (старые записи с HTML внутри не трогает)."""
+    missing = [c["report_id"] for c in comparisons if "html" not in c.get("docA", {}) and c.get("report_id")]
+    if not missing:
+        return comparisons
+    cursor = reports.find({"report_id": {"$in": missing}}, {"_id": 0, "report_id": 1, "docA": 1, "docB": 1})
+    rendered = await render_reports([report async for report in cursor])
+    html_by_id = {report["report_id"]: report for report in rendered}
+    hydrated = []
+    for comp in comparisons:
+        report = html_by_id.get(comp.get("report_id"))
+        if report:
+            comp = {
+                **comp,
+                "docA": {**comp["docA"], "html": report.get("docA", {}).get("html", "")},
+                "docB": {**comp["docB"], "html": report.get("docB", {}).get("html", "")},
+            }
+        hydrated.append(comp)
+    return hydrated
 
-def extract_text_from_file(content: bytes, filename: str) -> str:
-    if filename.lower().endswith('.pdf'):
-        try:
-            with fitz.open(stream=content, filetype="pdf") as doc:
-                return " ".join([page.get_text() for page in doc])
-        except: return ""
+# --- РОУТЫ ---
+
+# Сводка записи истории: без HTML и сведений о документах (в старых записях HTML лежит прямо в comparisons)
+HISTORY_SUMMARY_FIELDS = {
+    "timestamp": 1, "settings_used": 1,
+    "comparisons.pair": 1, "comparisons.similarity": 1, "comparisons.originality": 1, "comparisons.report_id": 1,
+}
+
+
+def _history_cursor(entry: Dict) -> str:
+    return f"{entry['timestamp'].isoformat()}_{entry['_id']}"
 
-    elif filename.lower().endswith('.docx'):
-        try:
-            doc = Document(io.BytesIO(content))
-            return " ".join([para.text for para in doc.paragraphs])
-        except Exception as e:
-            print(f"Docx error: {e}")
-            return ""
-        
-    elif filename.lower().endswith('.txt'):
-        try: return content.decode('utf-8')
-        except: return content.decode('cp1251', errors='ignore')
-    return ""
-
-
-def extract_from_archive(content: bytes, filename: str) -> List[Dict[str, str]]:
-    """Извлекает тексты из ZIP/RAR архива и возвращает список документов."""
-    docs: List[Dict[str, str]] = []
-    name_lower = filename.lower()
-
-    # ZIP
-    if name_lower.endswith('.zip'):
-        try:
-            with zipfile.ZipFile(io.BytesIO(content)) as zf:
-                for info in zf.infolist():
-                    if info.is_dir():
-                        continue
-                    inner_name = info.filename
-                    inner_lower = inner_name.lower()
-                    if not (inner_lower.endswith('.pdf') or inner_lower.endswith('.docx') or inner_lower.endswith('.txt')):
-                        continue
-                    with zf.open(info) as f:
-                        inner_bytes = f.read()
-                    text = extract_text_from_file(inner_bytes, inner_name)
-                    if text:
-                        docs.append({"name": f"{filename}::{inner_name}", "text": text})
-        except Exception:
-            return docs
 
-    # RAR (если поддерживается)
-    elif name_lower.endswith('.rar') and rarfile is not None:
+def _parse_history_cursor(cursor: str) -> Dict:
+    """Условие "строго после курсора" в порядке (timestamp, _id) по убыванию; ValueError для чужой строки."""
+    timestamp, _, entry_id = cursor.partition("_")
+    timestamp, entry_id = datetime.datetime.fromisoformat(timestamp), ObjectId(entry_id)
+    return {"$or": [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, "_id": {"$lt": entry_id}},
+    ]}
+
+
+@router.get("/history")
+async def get_history(
+    limit: int = Query(config.history_page_size, ge=1, le=config.history_page_max),
+    cursor: Optional[str] = None,
+    user=Depends(jwt_auth_handler)
+):
+    """Страница истории: сводки проверок от новых к старым; детали пар - GET /history/{id}."""
+    query = {"email": user["sub"]}
+    if cursor:
         try:
-            with rarfile.RarFile(io.BytesIO(content)) as rf:  # type: ignore[attr-defined]
-                for info in rf.infolist():
-                    if info.isdir():
-                        continue
-                    inner_name = info.filename
-                    inner_lower = inner_name.lower()
-                    if not (inner_lower.endswith('.pdf') or inner_lower.endswith('.docx') or inner_lower.endswith('.txt')):
-                        continue
-                    with rf.open(info) as f:  # type: ignore[call-arg]
-                        inner_bytes = f.read()
-                    text = extract_text_from_file(inner_bytes, inner_name)
-                    if text:
-                        docs.append({"name": f"{filename}::{inner_name}", "text": text})
+            query.update(_parse_history_cursor(cursor))
         except Exception:
-            return docs
+            return JSONResponse({"error": "Неверный курсор истории"}, 400)
+
+    entries = history.find(query, HISTORY_SUMMARY_FIELDS).sort([("timestamp", -1), ("_id", -1)]).limit(limit + 1)
+    entries = [entry async for entry in entries]
+    items = [{
+        "id": str(entry["_id"]),
+        "timestamp": entry["timestamp"].isoformat(),
+        "total_pairs": len(entry.get("comparisons", [])),
+        "comparisons": entry.get("comparisons", []),
+        "settings": entry.get("settings_used", {})
+    } for entry in entries[:limit]]
+    return {
+        "items": items,
+        "next_cursor": _history_cursor(entries[limit - 1]) if len(entries) > limit else None,
+    }
 
-    return docs
 
-async def run_cpu_task(func, *args):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(executor, func, *args)
+@router.get("/history/{entry_id}")
+async def get_history_entry(entry_id: str, user=Depends(jwt_auth_handler)):
+    """Полная запись истории: пары с подсветкой из reports и совпадения с архивом."""
+    if not ObjectId.is_valid(entry_id):
+        return JSONResponse({"error": "Запись истории не найдена"}, 404)
+    entry = await history.find_one({"_id": ObjectId(entry_id), "email": user["sub"]})
+    if not entry:
+        return JSONResponse({"error": "Запись истории не найдена"}, 404)
+    comparisons = entry.get("comparisons", [])
+    return {
+        "id": entry_id,
+        "timestamp": entry["timestamp"].isoformat(),
+        "total_pairs": len(comparisons),
+        "comparisons": await _hydrate_comparisons(comparisons),
+        "corpus_matches": anonymize_matches(entry.get("corpus_matches", [])),
+        "settings": entry.get("settings_used", {}),
+        **{key: entry[key] for key in ("mode", "clusters") if key in entry}
+    }
 
-# --- РОУТЫ ---
 
-@router.get("/history")
-async def get_history(user=Depends(jwt_auth_handler)):
-    cursor = history.find({"email": user["sub"]}).sort("timestamp", -1)
-    results = []
-    async for entry in cursor:
-        results.append({
-            "id": str(entry["_id"]),
-            "timestamp": entry["timestamp"].isoformat(),
-            "total_pairs": len(entry.get("comparisons", [])),
-            "comparisons": entry.get("comparisons", []),
-            "settings": entry.get("settings_used", {})
-        })
-    return results
+@router.get("/embedding-cache/stats")
+async def get_embedding_cache_stats(user=Depends(jwt_auth_handler)):
+    """Счетчики попаданий/промахов кэша эмбеддингов для подбора его размера."""
+    return embedding_cache.stats()
 
 
 @router.delete("/history")
@@ -235,7 +241,7 @@ async def clear_history(user=Depends(jwt_auth_handler)):
 @router.post("/recalculate")
 async def recalculate_from_text(
     payload: Dict = Body(...),
-    user=Depends(jwt_auth_handler)
+    profile=Depends(current_user)
 ):
     """Пересчет коэффициента уникальности по отредактированным текстам без повторной загрузки файлов."""
     text_a = (payload.get("text_a") or "").strip()
@@ -244,41 +250,32 @@ async def recalculate_from_text(
     if not text_a or not text_b:
         return JSONResponse({"error": "Передайте оба текста для сравнения"}, 400)
 
-    current_user = await users.find_one({"email": user["sub"]})
-    u_settings = current_user.get("settings", {}) if current_user else {}
-    active_rules = u_settings.get("active_rules", [])
-    custom_regex = u_settings.get("custom_regex", "")
+    engine = payload.get("engine")
+    if engine and engine not in LEXICAL_ENGINES:
+        return JSONResponse({"error": f"Неизвестный лексический движок: {engine}"}, 400)
 
-    if u_settings.get("exclude_quotes") and "quotes" not in active_rules:
-        active_rules.append("quotes")
+    u_settings, active_rules, custom_regex = _load_filter_settings(profile)
 
-    # Применяем те же фильтры, что и при загрузке файлов
-    filtered_a = apply_smart_filters(text_a, active_rules, custom_regex)
-    filtered_b = apply_smart_filters(text_b, active_rules, custom_regex)
+    # Применяем те же фильтры, что и при загрузке файлов (в пуле, а не на event loop)
+    filtered_a, filtered_b = await run_cpu_task(filter_texts, [text_a, text_b], active_rules, custom_regex)
 
     if not filtered_a or not filtered_b:
         return JSONResponse({"error": "После фильтрации тексты пусты"}, 400)
 
     # Лексика
-    diff = await run_cpu_task(get_diff_html, filtered_a, filtered_b)
-
-    # Семантика через LaBSE
-    embeddings = semantic_model.encode([filtered_a, filtered_b])
-    emb_a, emb_b = embeddings[0], embeddings[1]
-    norm_a, norm_b = float(np.linalg.norm(emb_a)), float(np.linalg.norm(emb_b))
-    if norm_a == 0 or norm_b == 0:
-        semantic_percent = 0.0
-    else:
-        semantic_percent = float(np.dot(emb_a, emb_b) / (norm_a * norm_b)) * 100.0
-    semantic_percent = round(max(min(semantic_percent, 100.0), 0.0), 2)
+    diff = await run_cpu_task(get_diff_html, filtered_a, filtered_b, engine)
+
+    # Семантика через LaBSE (по чанкам всего документа); модель грузится в потоке, если еще не загружена
+    await model_registry.aget(SEMANTIC_MODEL)
+    # Кодирование - в потоке: torch отпускает GIL, event loop продолжает обслуживать другие запросы
+    semantic_percent = round(await asyncio.to_thread(get_semantic_dna_score, filtered_a, filtered_b) * 100.0, 2)
 
-    total_similarity = (diff["lexical_similarity"] * 0.7) + (semantic_percent * 0.3)
+    total_similarity = (diff["lexical_similarity"] * LEXICAL_WEIGHT) + (semantic_percent * SEMANTIC_WEIGHT)
     total_similarity = round(min(max(total_similarity, 0), 100), 2)
     total_originality = round(100 - total_similarity, 2)
 
-    # Оценка AI для каждого текста
-    ai_a = await check_ai(filtered_a)
-    ai_b = await check_ai(filtered_b)
+    # Оценка AI для каждого текста (неизмененные тексты берутся из кэша)
+    ai_a, ai_b = await check_ai_batch([filtered_a, filtered_b])
 
     return {
         "similarity": total_similarity,
@@ -290,113 +287,448 @@ async def recalculate_from_text(
         "docA": {"name": payload.get("name_a", "Manual A"), "html": diff["htmlA"], "ai": ai_a},
         "docB": {"name": payload.get("name_b", "Manual B"), "html": diff["htmlB"], "ai": ai_b},
     }
-@router.post("/compare-batch")
-async def compare_batch(
-    files: List[UploadFile] = File(...), 
-    user=Depends(jwt_auth_handler)
-):
-    current_user = await users.find_one({"email": user["sub"]})
-    u_settings = current_user.get("settings", {})
-    active_rules = u_settings.get("active_rules", [])
-    custom_regex = u_settings.get("custom_regex", "")
-    
-    if u_settings.get("exclude_quotes") and "quotes" not in active_rules:
-        active_rules.append("quotes")
 
-    if len(files) < 2:
-        return JSONResponse({"error": "Загрузите хотя бы 2 файла"}, 400)
+async def compare_batch_events(uploads, engine: Optional[str], email: str, u_settings: Dict,
+                               active_rules: List[str], custom_regex: str, diff_format: str = "html",
+                               sentence_align: bool = False, threshold: Optional[float] = None,
+                               top_k: Optional[int] = None):
+    """Конвейер compare-batch в виде потока событий: document, ai, pair, summary (или error).
+
+    Пары отдаются по мере готовности диффов, поэтому этим же генератором пользуются
+    и обычный JSON-эндпоинт, и потоковый NDJSON. В формате "spans" вместо HTML пар
+    отдаются отрезки подсветки, а текст каждого документа - один раз в событии document.
+    С sentence_align каждая пара дополнительно получает выровненные пары предложений.
+
+    С threshold и/или top_k (режим больших пакетов) дифф, отчет и событие pair
+    получают только подозрительные пары, отобранные по оценке балла до диффа;
+    summary дополняется компактной матрицей оценок и кластерами сговора.
+    """
+    trace = Trace("compare_batch")
 
     # --- ЭТАП 1: Быстрая подготовка текстов (поддержка ZIP/RAR) ---
-    processed_docs = []
-    for file in files:
-        content = await file.read()
-
-        # Если загружен архив, раскрываем его содержимое
-        if file.filename.lower().endswith(('.zip', '.rar')):
-            inner_docs = await run_cpu_task(extract_from_archive, content, file.filename)
-            for doc in inner_docs:
-                filtered = apply_smart_filters(doc["text"], active_rules, custom_regex)
-                if filtered:
-                    processed_docs.append({
-                        "name": doc["name"],
-                        "text": filtered
-                    })
-        else:
-            raw_text = await run_cpu_task(extract_text_from_file, content, file.filename)
-            filtered = apply_smart_filters(raw_text, active_rules, custom_regex)
-            if filtered:
-                processed_docs.append({
-                    "name": file.filename,
-                    "text": filtered
-                })
+    # Загрузки уже лежат во временных файлах; архивы раскладываются на отдельные элементы,
+    # извлечение идет параллельно, уже встречавшиеся файлы берутся из кэша текстов по хэшу
+    try:
+        with trace.stage("extract"):
+            raw_docs = await extract_uploads(uploads)
+    except ArchiveLimitError as e:
+        trace.finish("rejected")
+        yield {"type": "error", "error": f"Архив превышает ограничения: {e}"}
+        return
+    with trace.stage("filter"):
+        filtered_texts = await map_in_batches(
+            filter_texts, [doc["text"] for doc in raw_docs], config.cpu_batch_size, active_rules, custom_regex
+        )
+    processed_docs = [
+        {"name": doc["name"], "text": filtered, "words": filtered.split(), "doc_hash": text_digest(filtered),
+         "file_hash": doc["file_hash"], "page_count": len(doc["pages"])}
+        for doc, filtered in zip(raw_docs, filtered_texts) if filtered
+    ]
 
     if not processed_docs:
-        return JSONResponse({"error": "Файлы пусты или не распознаны"}, 400)
+        trace.finish("empty")
+        yield {"type": "error", "error": "Файлы пусты или не распознаны"}
+        return
+
+    DOCUMENTS.inc(len(processed_docs))
+    BATCH_DOCUMENTS.observe(len(processed_docs))
+    for doc in processed_docs:
+        DOCUMENT_WORDS.observe(len(doc["words"]))
+
+    # Тексты хранятся один раз; отчеты ссылаются на них по хэшу и хранят только отрезки подсветки
+    with trace.stage("mongo_texts"):
+        await save_texts(processed_docs)
+
+    for doc in processed_docs:
+        event = {"type": "document", "name": doc["name"], "words": len(doc["words"]), "pages": doc["page_count"],
+                 "text_hash": doc["doc_hash"]}
+        if diff_format == "spans":
+            event["text"] = doc["text"]
+        yield event
 
     # --- ЭТАП 2: Оптимизация AI (LaBSE запускается один раз для всех) ---
-    # Кодируем все тексты в векторы ОДНИМ батчем - это КЛЮЧ к скорости
+    # Кодируем чанки всех текстов и считаем матрицу близости всех пар одним умножением
+    # (уже встречавшиеся чанки берутся из кэша эмбеддингов и не кодируются повторно)
     all_texts = [doc["text"] for doc in processed_docs]
-    all_embeddings = semantic_model.encode(all_texts, batch_size=len(all_texts))
+    with trace.stage("model_load"):
+        await model_registry.aget(SEMANTIC_MODEL)
+    with trace.stage("embedding"):
+        # Тысячи чанков кодируются в потоке, чтобы не блокировать event loop для остальных запросов
+        semantic_matrix = await asyncio.to_thread(get_semantic_matrix, all_texts)
     
-    # Сразу считаем AI-вероятность для каждого файла один раз
-    for idx, doc in enumerate(processed_docs):
-        doc["embedding"] = all_embeddings[idx]
-        doc["ai"] = await check_ai(doc["text"])
+    # Сразу считаем AI-вероятность для всех файлов параллельно (с кэшем по содержимому)
+    alignments = None
+    if sentence_align:
+        with trace.stage("alignment"):
+            alignments = await get_sentence_alignments(processed_docs)
+
+    with trace.stage("ai"):
+        ai_results = await check_ai_batch(all_texts)
+    for doc, ai in zip(processed_docs, ai_results):
+        doc["ai"] = ai
+        yield {"type": "ai", "name": doc["name"], "ai": ai}
 
     # --- ЭТАП 3: Молниеносное сравнение готовых данных ---
-    results = []
-    for i in range(len(processed_docs)):
-        for j in range(i + 1, len(processed_docs)):
-            d1, d2 = processed_docs[i], processed_docs[j]
-            
-            # Лексика (SequenceMatcher)
-            diff = await run_cpu_task(get_diff_html, d1["text"], d2["text"])
-            
-            # Семантика (Косинусное сходство векторов, которые уже в памяти)
-            emb1, emb2 = d1["embedding"], d2["embedding"]
-            cos_sim = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
-            semantic_percent = round(float(cos_sim) * 100, 2)
-
-            # Твоя новая формула весов
-            total_similarity = (diff["lexical_similarity"] * 0.7) + (semantic_percent * 0.3)
-            total_similarity = round(min(max(total_similarity, 0), 100), 2)
-            total_originality = round(100 - total_similarity, 2)
-
-            report_id = str(uuid.uuid4())[:12].upper()
-
-            # Формируем результат
-            res_entry = {
-                "pair": f"{d1['name']} vs {d2['name']}",
-                "similarity": total_similarity,
-                "originality": total_originality,
-                "semantic_info": {
-                    "dna_score": semantic_percent,
-                    "lexical_score": diff["lexical_similarity"]
-                },
-                "docA": {"name": d1['name'], "html": diff["htmlA"], "ai": d1["ai"]},
-                "docB": {"name": d2['name'], "html": diff["htmlB"], "ai": d2["ai"]},
-                "report_id": report_id
-            }
-            results.append(res_entry)
-
-            # Сохраняем подробный отчет в БД (асинхронно)
-            await reports.insert_one({
-                "report_id": report_id,
-                "docA": res_entry["docA"],
-                "docB": res_entry["docB"],
-                "originality": total_originality,
-                "semantic_dna": semantic_percent,
-                "lexical_match": diff["lexical_similarity"],
-                "timestamp": datetime.datetime.utcnow(),
-                "is_public": True
-            })
+    # Предфильтр MinHash: полный дифф только для пар с заметным пересечением шинглов
+    all_pairs = [(i, j) for i in range(len(processed_docs)) for j in range(i + 1, len(processed_docs))]
+    selected_pairs, jaccard = set(all_pairs), None
+    if config.minhash_enabled and len(processed_docs) >= config.minhash_min_docs:
+        with trace.stage("minhash"):
+            selected_pairs, jaccard = await run_cpu_task(
+                select_pairs_for_diff, all_texts, config.minhash_num_perm,
+                config.minhash_shingle_size, config.minhash_threshold
+            )
+    # Режим подозрительных пар: оценка балла всех пар по готовым матрицам, без диффа
+    suspicious = threshold is not None or top_k is not None
+    output_pairs, estimated_scores = all_pairs, None
+    if suspicious:
+        if jaccard is None:
+            with trace.stage("minhash"):
+                _, jaccard = await run_cpu_task(
+                    select_pairs_for_diff, all_texts, config.minhash_num_perm,
+                    config.minhash_shingle_size, config.minhash_threshold
+                )
+        estimated_scores = estimate_similarity_matrix(semantic_matrix, jaccard, LEXICAL_WEIGHT, SEMANTIC_WEIGHT)
+        # Запас под погрешность оценки: окончательно порог проверяется по баллу после диффа
+        candidate_threshold = threshold - config.suspicious_margin if threshold is not None else None
+        output_pairs = sorted(select_suspicious_pairs(estimated_scores, candidate_threshold, top_k))
+        selected_pairs &= set(output_pairs)
+    BATCH_PAIRS.observe(len(all_pairs))
+    PAIRS.inc(len(selected_pairs), kind="diffed")
+    PAIRS.inc(len(output_pairs) - len(selected_pairs), kind="estimated")
+    PAIRS.inc(len(all_pairs) - len(output_pairs), kind="skipped")
+
+    # В историю идут только сводки пар со ссылкой на report_id; отчеты хранят сжатые отрезки подсветки
+    summaries = []
+    suspicious_edges = []
+    report_writer = BulkWriter(reports, config.report_write_chunk)
+
+    def emit_pair(i: int, j: int, diff: Dict) -> Optional[Dict]:
+        d1, d2 = processed_docs[i], processed_docs[j]
+        # Семантика (готовая матрица близости по чанкам)
+        semantic_percent = round(float(semantic_matrix[i, j]) * 100, 2)
+        alignment = None
+        if alignments is not None:
+            alignment = alignments.get((i, j)) or empty_alignment()
+        res_entry = _build_pair_result(d1, d2, diff, semantic_percent, diff_format, alignment)
+        if suspicious:
+            if threshold is not None and res_entry["similarity"] < threshold:
+                return None
+            suspicious_edges.append((i, j, res_entry["similarity"]))
+        summaries.append(_pair_summary(res_entry))
+
+        # Отчет уходит в буфер и пишется пачкой insert_many параллельно с расчетом
+        report = {
+            "report_id": res_entry["report_id"],
+            # Владелец отчета: исходный PDF (mode=original) отдается только ему
+            "email": email,
+            "docA": {"name": d1["name"], "ai": d1["ai"], "text_hash": d1["doc_hash"], "file_hash": d1["file_hash"],
+                     "spans": pack_runs(diff["runsA"])},
+            "docB": {"name": d2["name"], "ai": d2["ai"], "text_hash": d2["doc_hash"], "file_hash": d2["file_hash"],
+                     "spans": pack_runs(diff["runsB"])},
+            "originality": res_entry["originality"],
+            "semantic_dna": semantic_percent,
+            "lexical_match": diff["lexical_similarity"],
+            "timestamp": datetime.datetime.utcnow(),
+            "is_public": True
+        }
+        if alignment is not None:
+            report["sentence_alignment"] = alignment
+        report_writer.add(report)
+        return {"type": "pair", "result": res_entry}
+
+    # Отсеянные предфильтром пары получают оценочный балл сразу
+    for i, j in output_pairs:
+        if (i, j) not in selected_pairs:
+            diff = get_estimated_diff(
+                len(processed_docs[i]["words"]), len(processed_docs[j]["words"]), float(jaccard[i, j])
+            )
+            event = emit_pair(i, j, diff)
+            if event:
+                yield event
+
+    # Диффы отобранных пар пачками по diff_chunk_size, пачки распределяются по воркерам
+    async def run_chunk(chunk):
+        texts = {idx: all_texts[idx] for pair in chunk for idx in pair}
+        return chunk, await run_cpu_task(diff_pairs, texts, chunk, engine)
+
+    # Время диффа - от запуска пачек до последней готовой пары (вместе с выдачей событий)
+    diff_started = time.perf_counter()
+    chunk_tasks = [run_chunk(chunk) for chunk in chunked(sorted(selected_pairs), config.diff_chunk_size)]
+    for next_chunk in asyncio.as_completed(chunk_tasks):
+        chunk, chunk_result = await next_chunk
+        for (i, j), diff in zip(chunk, chunk_result):
+            event = emit_pair(i, j, diff)
+            if event:
+                yield event
+    trace.add("diff", time.perf_counter() - diff_started)
+
+    with trace.stage("mongo_reports"):
+        await report_writer.close()
+
+    # --- ЭТАП 4: Сверка с архивом прошлых работ (winnowing-отпечатки) ---
+    corpus_matches = []
+    if config.corpus_enabled:
+        corpus_started = time.perf_counter()
+        for doc in processed_docs:
+            doc["fingerprints"] = await run_cpu_task(winnow, doc["text"], config.winnow_k, config.winnow_window)
+        batch_hashes = [doc["doc_hash"] for doc in processed_docs]
+        for doc in processed_docs:
+            matches = await find_similar(
+                doc["fingerprints"], email, batch_hashes,
+                config.corpus_top_k, config.corpus_min_overlap,
+                config.corpus_max_df, config.corpus_query_fingerprints
+            )
+            if matches:
+                corpus_matches.append({"name": doc["name"], "matches": matches})
+        await index_documents(processed_docs, email)
+        trace.add("corpus", time.perf_counter() - corpus_started)
+
+    suspicious_info = {}
+    if suspicious:
+        names = [doc["name"] for doc in processed_docs]
+        # В матрице - оценки до диффа, для подозрительных пар - итоговый балл
+        for i, j, score in suspicious_edges:
+            estimated_scores[i, j] = estimated_scores[j, i] = score
+        # Кластеры - по ребрам не ниже threshold; с одним top_k - только по взаимным соседям,
+        # иначе компоненты связности покрыли бы весь пакет
+        cluster_edges = suspicious_edges
+        if threshold is None:
+            mutual = mutual_top_k_pairs(estimated_scores, top_k)
+            cluster_edges = [edge for edge in suspicious_edges if edge[:2] in mutual]
+        clusters = collusion_clusters(len(processed_docs), cluster_edges)
+        suspicious_info = {
+            "mode": {"threshold": threshold, "top_k": top_k},
+            "clusters": [{**cluster, "documents": [names[idx] for idx in cluster["documents"]]} for cluster in clusters],
+        }
 
     # Сохранение в общую историю
-    await history.insert_one({
-        "email": user["sub"],
-        "timestamp": datetime.datetime.utcnow(),
-        "comparisons": results,
-        "settings_used": u_settings
-    })
-
-    return {"comparisons": sorted(results, key=lambda x: x["similarity"], reverse=True)}
+    with trace.stage("mongo_history"):
+        history_entry = await history.insert_one({
+            "email": email,
+            "timestamp": datetime.datetime.utcnow(),
+            "comparisons": summaries,
+            "corpus_matches": corpus_matches,
+            "settings_used": u_settings,
+            **suspicious_info
+        })
+    trace.finish(documents=len(processed_docs), pairs=len(all_pairs), diffed=len(selected_pairs))
+
+    summary = {
+        "type": "summary",
+        "documents": len(processed_docs),
+        "total_pairs": len(all_pairs),
+        "diffed_pairs": len(selected_pairs),
+        "corpus_matches": corpus_matches,
+        "history_id": str(history_entry.inserted_id)
+    }
+    if suspicious:
+        summary.update(suspicious_info)
+        summary["reported_pairs"] = len(summaries)
+        summary["similarity_matrix"] = {"documents": names, "scores": upper_triangle(estimated_scores)}
+    yield summary
+
+
+DIFF_FORMATS = ("html", "spans")
+
+
+async def _prepare_batch(files: List[UploadFile], engine: Optional[str], user: Dict, profile: Optional[Dict],
+                         diff_format: str = "html", sentence_align: bool = False,
+                         threshold: Optional[float] = None, top_k: Optional[int] = None):
+    """Общая проверка запроса; файлы сбрасываются во временные файлы до того, как ответ начнет стримиться."""
+    if len(files) < 2:
+        return None, JSONResponse({"error": "Загрузите хотя бы 2 файла"}, 400)
+
+    if engine and engine not in LEXICAL_ENGINES:
+        return None, JSONResponse({"error": f"Неизвестный лексический движок: {engine}"}, 400)
+
+    if diff_format not in DIFF_FORMATS:
+        return None, JSONResponse({"error": f"Неизвестный формат диффа: {diff_format}"}, 400)
+
+    if threshold is not None and not 0 <= threshold <= 100:
+        return None, JSONResponse({"error": "threshold - балл сходства от 0 до 100"}, 400)
+
+    if top_k is not None and top_k < 1:
+        return None, JSONResponse({"error": "top_k должен быть не меньше 1"}, 400)
+
+    u_settings, active_rules, custom_regex = _load_filter_settings(profile)
+    uploads = []
+    try:
+        with timed("upload"):
+            for file in files:
+                uploads.append((file.filename, await spool_upload(file)))
+    except ArchiveLimitError as e:
+        remove_uploads(uploads)
+        return None, JSONResponse({"error": str(e)}, 400)
+    return (uploads, engine, user["sub"], u_settings, active_rules, custom_regex, diff_format, sentence_align,
+            threshold, top_k), None
+
+
+@router.post("/compare-batch")
+async def compare_batch(
+    files: List[UploadFile] = File(...), 
+    engine: Optional[str] = Form(None),
+    diff_format: str = Form("html"),
+    sentence_align: bool = Form(False),
+    threshold: Optional[float] = Form(None),
+    top_k: Optional[int] = Form(None),
+    user=Depends(jwt_auth_handler),
+    profile=Depends(current_user)
+):
+    args, error = await _prepare_batch(files, engine, user, profile, diff_format, sentence_align, threshold, top_k)
+    if error:
+        return error
+
+    results, documents, corpus_matches, suspicious_info = [], [], [], {}
+    try:
+        async for event in compare_batch_events(*args):
+            if event["type"] == "error":
+                return JSONResponse({"error": event["error"]}, 400)
+            if event["type"] == "pair":
+                results.append(event["result"])
+            elif event["type"] == "document" and diff_format == "spans":
+                documents.append({key: event[key] for key in ("name", "text_hash", "text")})
+            elif event["type"] == "summary":
+                corpus_matches = event["corpus_matches"]
+                suspicious_info = {
+                    key: event[key] for key in ("mode", "clusters", "similarity_matrix") if key in event
+                }
+    finally:
+        remove_uploads(args[0])
+
+    response = {
+        "comparisons": sorted(results, key=lambda x: x["similarity"], reverse=True),
+        "corpus_matches": corpus_matches
+    }
+    if diff_format == "spans":
+        response["documents"] = documents
+    response.update(suspicious_info)
+    return response
+
+
+@router.post("/compare-batch/stream")
+async def compare_batch_stream(
+    files: List[UploadFile] = File(...),
+    engine: Optional[str] = Form(None),
+    diff_format: str = Form("html"),
+    sentence_align: bool = Form(False),
+    threshold: Optional[float] = Form(None),
+    top_k: Optional[int] = Form(None),
+    user=Depends(jwt_auth_handler),
+    profile=Depends(current_user)
+):
+    """Потоковый compare-batch: NDJSON, по одному событию на строку, пары - по мере готовности."""
+    args, error = await _prepare_batch(files, engine, user, profile, diff_format, sentence_align, threshold, top_k)
+    if error:
+        return error
+
+    async def ndjson():
+        try:
+            async for event in compare_batch_events(*args):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+        finally:
+            remove_uploads(args[0])
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+async def process_job(job: Dict) -> Dict:
+    """Исполнитель фоновой задачи: тот же конвейер, прогресс пишется в документ задачи."""
+    job_id = job["job_id"]
+    params = job.get("params", {})
+    u_settings, active_rules, custom_regex = _load_filter_settings({"settings": params.get("settings", {})})
+    uploads = load_job_uploads(job)
+
+    documents, pairs_done = 0, 0
+    # События задачи наружу не уходят, поэтому HTML пар не рендерим (формат "spans")
+    async for event in compare_batch_events(
+        uploads, params.get("engine"), job["email"], u_settings, active_rules, custom_regex, "spans",
+        params.get("sentence_align", False), params.get("threshold"), params.get("top_k")
+    ):
+        if event["type"] == "error":
+            raise RuntimeError(event["error"])
+        if event["type"] == "document":
+            documents += 1
+        elif event["type"] == "pair":
+            if pairs_done == 0:
+                await job_queue.update_progress(
+                    job_id, documents=documents, total_pairs=documents * (documents - 1) // 2
+                )
+            pairs_done += 1
+            if pairs_done % config.job_progress_every == 0:
+                await job_queue.update_progress(job_id, pairs_done=pairs_done)
+        elif event["type"] == "summary":
+            await job_queue.update_progress(
+                job_id, documents=event["documents"], pairs_done=pairs_done, total_pairs=event["total_pairs"]
+            )
+            return {"history_id": event["history_id"]}
+    return {}
+
+
+def _job_status(job: Dict) -> Dict:
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "progress": job.get("progress", {}),
+        "files": len(job.get("files", [])),
+        "error": job.get("error"),
+        "created_at": job["created_at"].isoformat(),
+        "started_at": job["started_at"].isoformat() if job.get("started_at") else None,
+        "finished_at": job["finished_at"].isoformat() if job.get("finished_at") else None,
+    }
+
+
+@router.post("/jobs")
+async def submit_compare_job(
+    files: List[UploadFile] = File(...),
+    engine: Optional[str] = Form(None),
+    sentence_align: bool = Form(False),
+    threshold: Optional[float] = Form(None),
+    top_k: Optional[int] = Form(None),
+    user=Depends(jwt_auth_handler),
+    profile=Depends(current_user)
+):
+    """Ставит большой пакет в фоновую очередь и сразу возвращает id задачи."""
+    args, error = await _prepare_batch(files, engine, user, profile, threshold=threshold, top_k=top_k)
+    if error:
+        return error
+    uploads, engine, email, u_settings = args[:4]
+    job_id = await job_queue.submit(
+        email, uploads,
+        {"engine": engine, "settings": u_settings, "sentence_align": sentence_align, "threshold": threshold,
+         "top_k": top_k}
+    )
+    return JSONResponse({"job_id": job_id, "status": "queued"}, 202)
+
+
+@router.get("/jobs")
+async def list_compare_jobs(user=Depends(jwt_auth_handler)):
+    cursor = jobs.find({"email": user["sub"]}).sort("created_at", -1).limit(50)
+    return [_job_status(job) async for job in cursor]
+
+
+@router.get("/jobs/{job_id}")
+async def get_compare_job(job_id: str, user=Depends(jwt_auth_handler)):
+    job = await jobs.find_one({"job_id": job_id, "email": user["sub"]})
+    if not job:
+        return JSONResponse({"error": "Задача не найдена"}, 404)
+    return _job_status(job)
+
+
+@router.get("/jobs/{job_id}/results")
+async def get_compare_job_results(job_id: str, user=Depends(jwt_auth_handler)):
+    job = await jobs.find_one({"job_id": job_id, "email": user["sub"]})
+    if not job:
+        return JSONResponse({"error": "Задача не найдена"}, 404)
+    if job["status"] != "done":
+        return JSONResponse({"error": "Задача еще не завершена", "status": job["status"]}, 409)
+
+    entry = await history.find_one({"_id": ObjectId(job["history_id"])})
+    if not entry:
+        return JSONResponse({"error": "Результаты задачи удалены"}, 404)
+    comparisons = await _hydrate_comparisons(entry.get("comparisons", []))
+    return {
+        "comparisons": sorted(comparisons, key=lambda x: x["similarity"], reverse=True),
+        "corpus_matches": anonymize_matches(entry.get("corpus_matches", [])),
+        **{key: entry[key] for key in ("mode", "clusters") if key in entry}
+    }
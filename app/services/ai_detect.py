@@ -0,0 +1,45 @@
+from typing import Dict, List
+
+import config
+from app.services.models import model_registry, AI_DETECTOR
+from app.services.workers import map_in_batches
+from app.services.lru import LRUCache, content_key
+
+
+def score_text(text: str) -> Dict:
+    # Детектор создается один раз на процесс и переиспользуется между вызовами
+    detector = model_registry.get(AI_DETECTOR)
+    label, score = detector.detector.score_text(text)
+    percent = round(score * 100, 2)
+    percent = min(max(percent, 0), 100)
+    return {
+        "label": "AI" if label == 'AI' else "Human",
+        "score": percent,
+        "isAI": label == 'AI'
+    }
+
+
+def score_texts(texts: List[str]) -> List[Dict]:
+    """Пакетная оценка: одна задача пула на пачку текстов."""
+    return [score_text(text) for text in texts]
+
+
+# Результаты AI-детектора по хэшу текста
+ai_cache = LRUCache(config.ai_cache_entries)
+
+
+async def check_ai_batch(texts: List[str]) -> List[Dict]:
+    """Оценка AI для всех текстов сразу: кэш по содержимому, промахи - параллельно на CPU-пуле."""
+    keys = [content_key(text) for text in texts]
+    results = [ai_cache.get(key) for key in keys]
+    missing = [idx for idx, result in enumerate(results) if result is None]
+    if missing:
+        scored = await map_in_batches(score_texts, [texts[idx] for idx in missing], config.ai_batch_size)
+        for idx, result in zip(missing, scored):
+            ai_cache.put(keys[idx], result)
+            results[idx] = result
+    return [dict(result) for result in results]
+
+
+async def check_ai(text: str) -> Dict:
+    return (await check_ai_batch([text]))[0]
@@ -0,0 +1,149 @@
+import heapq
+import re
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.embeddings import embedding_cache
+
+# Предложение: (текст, первое слово, слово за последним) в индексах слов документа
+Sentence = Tuple[str, int, int]
+
+_SENTENCE_END = re.compile(r'[.!?…]+["»\')\]]*$')
+_KAZAKH_LETTERS = set("әғқңөұүһі")
+_LATIN = re.compile(r'[a-z]')
+
+
+def split_sentences(text: str, min_words: int = 5, max_words: int = 80) -> List[Sentence]:
+    """Делит текст на предложения по знакам конца; позиции - в тех же индексах слов, что и дифф.
+
+    Короткие предложения (заголовки, подписи) пропускаются, слишком длинные режутся на куски.
+    """
+    sentences: List[Sentence] = []
+    words = text.split()
+    start = 0
+    for idx, word in enumerate(words):
+        if idx + 1 - start >= max_words or _SENTENCE_END.search(word) or idx == len(words) - 1:
+            if idx + 1 - start >= min_words:
+                sentences.append((" ".join(words[start:idx + 1]), start, idx + 1))
+            start = idx + 1
+    return sentences
+
+
+def guess_language(sentence: str) -> str:
+    """Грубое определение языка: казахские буквы -> kk, латиница -> en, иначе ru."""
+    letters = set(sentence)
+    if letters & _KAZAKH_LETTERS:
+        return "kk"
+    if _LATIN.search(sentence) and not re.search(r'[а-яё]', sentence):
+        return "en"
+    return "ru"
+
+
+def encode_sentences(model, model_name: str, sentences: List[str], batch_size: int = 32) -> np.ndarray:
+    """L2-нормированные эмбеддинги предложений пачками (через общий кэш эмбеддингов)."""
+    if not sentences:
+        return np.empty((0, 0), dtype=np.float32)
+    embeddings = np.asarray(
+        embedding_cache.encode(model, model_name, sentences, batch_size=batch_size), dtype=np.float32
+    )
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def align_sentences(
+    embeddings: np.ndarray,
+    doc_ids: np.ndarray,
+    threshold: float,
+    top_k: int = 3,
+    block_bytes: int = 64 * 1024 ** 2,
+) -> np.ndarray:
+    """Пары предложений из разных документов с косинусом >= threshold.
+
+    Индекс - сама матрица эмбеддингов батча: строки обрабатываются блоками,
+    размер блока подбирается так, чтобы матрица косинусов блока укладывалась в
+    block_bytes. Для каждого предложения берутся top_k лучших соседей из других
+    документов среди прошедших порог, без циклов Python по парам. Возвращает массив
+    строк [индекс A, индекс B, косинус] с индексом A < индекса B, без повторов.
+    """
+    total = len(embeddings)
+    if total < 2:
+        return np.empty((0, 3), dtype=np.float64)
+    block_rows = max(1, block_bytes // (4 * total))
+    rows_found, cols_found, scores_found = [], [], []
+
+    for start in range(0, total, block_rows):
+        end = min(start + block_rows, total)
+        sims = embeddings[start:end] @ embeddings.T
+        # Предложения того же документа не считаются заимствованием
+        sims[doc_ids[start:end, None] == doc_ids[None, :]] = -np.inf
+        # Кандидатов выше порога обычно мало: top_k выбираем только среди них
+        hit_rows, hit_cols = np.nonzero(sims >= threshold)
+        hit_scores = sims[hit_rows, hit_cols]
+        order = np.lexsort((-hit_scores, hit_rows))
+        hit_rows, hit_cols, hit_scores = hit_rows[order], hit_cols[order], hit_scores[order]
+        # Ранг кандидата внутри своей строки: позиция минус начало группы строки
+        row_starts = np.searchsorted(hit_rows, hit_rows, side="left")
+        keep = np.arange(len(hit_rows)) - row_starts < top_k
+        rows_found.append(hit_rows[keep] + start)
+        cols_found.append(hit_cols[keep])
+        scores_found.append(hit_scores[keep])
+
+    rows = np.concatenate(rows_found)
+    cols = np.concatenate(cols_found)
+    scores = np.concatenate(scores_found)
+    if not len(rows):
+        return np.empty((0, 3), dtype=np.float64)
+    # Пара могла найтись с обеих сторон - оставляем одну, упорядоченную
+    first, second = np.minimum(rows, cols), np.maximum(rows, cols)
+    _, unique_idx = np.unique(first * total + second, return_index=True)
+    return np.column_stack([first[unique_idx], second[unique_idx], scores[unique_idx]])
+
+
+def empty_alignment() -> Dict:
+    return {"count": 0, "cross_lingual": 0, "coverage_a": 0.0, "coverage_b": 0.0, "pairs": []}
+
+
+def group_alignments(
+    matches: np.ndarray,
+    sentences: List[Sentence],
+    doc_ids: np.ndarray,
+    doc_words: List[int],
+    max_per_pair: int = 200,
+) -> Dict[Tuple[int, int], Dict]:
+    """Раскладывает найденные пары предложений по парам документов (i < j)."""
+    grouped: Dict[Tuple[int, int], List] = {}
+    for a, b, score in matches:
+        a, b = int(a), int(b)
+        doc_a, doc_b = int(doc_ids[a]), int(doc_ids[b])
+        if doc_a > doc_b:
+            a, b, doc_a, doc_b = b, a, doc_b, doc_a
+        grouped.setdefault((doc_a, doc_b), []).append((a, b, float(score)))
+
+    result = {}
+    for (doc_a, doc_b), items in grouped.items():
+        covered_a = sum(sentences[a][2] - sentences[a][1] for a in {item[0] for item in items})
+        covered_b = sum(sentences[b][2] - sentences[b][1] for b in {item[1] for item in items})
+        languages = [(guess_language(sentences[a][0]), guess_language(sentences[b][0])) for a, b, _ in items]
+        cross_lingual = sum(lang_a != lang_b for lang_a, lang_b in languages)
+        # В ответ - max_per_pair самых близких пар, уже они упорядочены по позиции в документе A
+        shown = heapq.nlargest(max_per_pair, range(len(items)), key=lambda idx: items[idx][2])
+        shown.sort(key=lambda idx: sentences[items[idx][0]][1])
+        pairs = []
+        for idx in shown:
+            a, b, score = items[idx]
+            pairs.append({
+                "a": [sentences[a][1], sentences[a][2]],
+                "b": [sentences[b][1], sentences[b][2]],
+                "score": round(score * 100, 2),
+                "languages": list(languages[idx]),
+            })
+        result[(doc_a, doc_b)] = {
+            "count": len(items),
+            "cross_lingual": cross_lingual,
+            "coverage_a": round(100 * covered_a / max(doc_words[doc_a], 1), 2),
+            "coverage_b": round(100 * covered_b / max(doc_words[doc_b], 1), 2),
+            "pairs": pairs,
+        }
+    return result
@@ -0,0 +1,94 @@
+import asyncio
+import base64
+import datetime
+import hashlib
+import logging
+import uuid
+from typing import Dict, Optional, Tuple
+
+import fitz
+from bson import Binary
+
+import config
+from app.database.db import users, avatars
+
+logger = logging.getLogger("uvicorn.error")
+
+ORIGINAL = "original"
+AVATAR_TYPES = ("image/jpeg", "image/png")
+
+
+def default_variant() -> str:
+    return str(max(config.avatar_sizes)) if config.avatar_sizes else ORIGINAL
+
+
+def avatar_url(avatar_id: Optional[str]) -> Optional[str]:
+    # id меняется при каждой загрузке - по этому адресу файл можно кэшировать бессрочно
+    return f"/auth/avatar/{avatar_id}" if avatar_id else None
+
+
+def _encode(pix: fitz.Pixmap) -> Tuple[str, bytes]:
+    # Прозрачность сохраняем только в PNG, остальное сжимаем в JPEG
+    if pix.alpha:
+        return "image/png", pix.tobytes("png")
+    return "image/jpeg", pix.tobytes("jpeg", jpg_quality=config.avatar_jpeg_quality)
+
+
+def build_variants(contents: bytes, content_type: str) -> Dict[str, Tuple[str, bytes]]:
+    """Исходник и уменьшенные копии {вариант: (тип, байты)}; ValueError, если это не картинка."""
+    try:
+        pix = fitz.Pixmap(contents)
+    except Exception as e:
+        raise ValueError(f"Not an image: {e}")
+    if pix.colorspace and pix.colorspace.n not in (1, 3):
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+
+    variants = {ORIGINAL: (content_type, contents)}
+    longest = max(pix.width, pix.height)
+    for size in config.avatar_sizes:
+        if longest <= size:
+            scaled = pix
+        else:
+            scale = size / longest
+            scaled = fitz.Pixmap(pix, max(1, round(pix.width * scale)), max(1, round(pix.height * scale)))
+        variants[str(size)] = _encode(scaled)
+    return variants
+
+
+async def save_avatar(email: str, contents: bytes, content_type: str) -> str:
+    """Кладет аватар с копиями в коллекцию avatars; в документе пользователя остается только avatar_id."""
+    variants = await asyncio.to_thread(build_variants, contents, content_type)
+    avatar_id = uuid.uuid4().hex
+    await avatars.insert_one({
+        "avatar_id": avatar_id,
+        "email": email,
+        "created_at": datetime.datetime.utcnow(),
+        "variants": {
+            name: {"content_type": kind, "data": Binary(data), "etag": hashlib.sha1(data).hexdigest()}
+            for name, (kind, data) in variants.items()
+        },
+    })
+    await users.update_one({"email": email}, {"$set": {"avatar_id": avatar_id}, "$unset": {"avatar": ""}})
+    await avatars.delete_many({"email": email, "avatar_id": {"$ne": avatar_id}})
+    return avatar_id
+
+
+async def load_avatar(avatar_id: str, variant: str) -> Optional[Dict]:
+    """Один вариант аватара {content_type, data, etag}; остальные копии не читаются."""
+    entry = await avatars.find_one({"avatar_id": avatar_id}, {f"variants.{variant}": 1})
+    if not entry:
+        return None
+    return entry.get("variants", {}).get(variant)
+
+
+async def migrate_inline_avatars():
+    """Переносит аватары, хранившиеся строкой data URI в users, в коллекцию avatars."""
+    async for user in users.find({"avatar": {"$exists": True}}, {"email": 1, "avatar": 1}):
+        avatar = user.get("avatar") or ""
+        try:
+            header, encoded = avatar.split(",", 1)
+            content_type = header[len("data:"):].split(";", 1)[0]
+            await save_avatar(user["email"], base64.b64decode(encoded), content_type)
+        except Exception as e:
+            logger.warning("Avatar of %s was not migrated: %s", user.get("email"), e)
+            await users.update_one({"_id": user["_id"]}, {"$unset": {"avatar": ""}})
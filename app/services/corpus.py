@@ -0,0 +1,151 @@
+import datetime
+import hashlib
+import logging
+import zlib
+from collections import Counter
+from typing import Dict, List
+
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from app.database.db import corpus, fingerprint_df
+
+logger = logging.getLogger("uvicorn.error")
+
+
+def winnow(text: str, k: int = 5, window: int = 8) -> List[int]:
+    """Отпечатки документа по алгоритму winnowing: минимум хэшей k-грамм слов в каждом окне."""
+    words = text.split()
+    if len(words) < k:
+        return [zlib.crc32(" ".join(words).encode("utf-8"))] if words else []
+    hashes = [zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)]
+    if len(hashes) <= window:
+        return sorted({min(hashes)})
+
+    selected = set()
+    last_pos = -1
+    for start in range(len(hashes) - window + 1):
+        # Берем самый правый минимум окна, как в оригинальной схеме winnowing
+        win = hashes[start:start + window]
+        min_hash = min(win)
+        pos = start + window - 1 - win[::-1].index(min_hash)
+        if pos != last_pos:
+            selected.add(min_hash)
+            last_pos = pos
+    return sorted(selected)
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+async def find_similar(
+    fingerprints: List[int],
+    email: str,
+    exclude_hashes: List[str],
+    top_k: int = 5,
+    min_overlap: float = 0.05,
+    max_df: int = 0,
+    max_fingerprints: int = 0,
+) -> List[Dict]:
+    """Топ-k ранее проиндексированных документов с наибольшей долей общих отпечатков.
+
+    Имя совпавшей работы отдается только владельцу (own=True); чужие работы архива
+    анонимны - видны лишь дата и доля общих отпечатков.
+
+    Отпечатки, встречающиеся больше чем в max_df работах архива (шаблоны, титульные листы),
+    отбрасываются; из оставшихся в запрос идут max_fingerprints наименьших хэшей - выборка
+    одинаковая для всех документов, поэтому доля общих отпечатков остается сопоставимой.
+    """
+    if max_df and fingerprints:
+        frequent = fingerprint_df.find({"_id": {"$in": fingerprints}, "df": {"$gt": max_df}}, {"_id": 1})
+        stop_list = {entry["_id"] async for entry in frequent}
+        fingerprints = [fp for fp in fingerprints if fp not in stop_list]
+    if max_fingerprints:
+        fingerprints = sorted(fingerprints)[:max_fingerprints]
+    if not fingerprints:
+        return []
+    pipeline = [
+        {"$match": {
+            "fingerprints": {"$in": fingerprints},
+            # Повторная загрузка тех же файлов тем же пользователем не считается заимствованием
+            "$nor": [{"email": email, "doc_hash": {"$in": exclude_hashes}}],
+        }},
+        {"$project": {
+            "name": 1,
+            "email": 1,
+            "timestamp": 1,
+            "shared": {"$size": {"$setIntersection": ["$fingerprints", fingerprints]}},
+        }},
+        {"$sort": {"shared": -1}},
+        {"$limit": top_k},
+    ]
+    matches = []
+    async for entry in corpus.aggregate(pipeline):
+        overlap = entry["shared"] / len(fingerprints)
+        if overlap < min_overlap:
+            continue
+        own = entry.get("email") == email
+        matches.append({
+            "name": entry.get("name") if own else None,
+            "own": own,
+            "timestamp": entry["timestamp"].isoformat() if entry.get("timestamp") else None,
+            "shared_fingerprints": entry["shared"],
+            "overlap": round(overlap * 100, 2),
+        })
+    return matches
+
+
+def anonymize_matches(corpus_matches: List[Dict]) -> List[Dict]:
+    """Сохраненные совпадения с архивом без имен чужих работ (записи до появления поля own)."""
+    return [
+        {**doc, "matches": [
+            match if match.get("own") else {**match, "name": None, "own": False}
+            for match in doc.get("matches", [])
+        ]}
+        for doc in corpus_matches
+    ]
+
+
+async def index_documents(docs: List[Dict], email: str):
+    """Добавляет документы пакета в корпус (идемпотентно по хэшу текста) и обновляет df отпечатков."""
+    docs = [doc for doc in docs if doc["fingerprints"]]
+    if not docs:
+        return
+    ops = [
+        UpdateOne(
+            {"doc_hash": doc["doc_hash"]},
+            {"$setOnInsert": {
+                "doc_hash": doc["doc_hash"],
+                "name": doc["name"],
+                "email": email,
+                "fingerprints": doc["fingerprints"],
+                "timestamp": datetime.datetime.utcnow(),
+            }},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    result = await corpus.bulk_write(ops, ordered=False)
+    # df растет только для впервые добавленных документов - повторная загрузка счетчики не меняет
+    counts = Counter(fp for index in result.upserted_ids for fp in docs[index]["fingerprints"])
+    if counts:
+        await fingerprint_df.bulk_write(
+            [UpdateOne({"_id": fp}, {"$inc": {"df": count}}, upsert=True) for fp, count in counts.items()],
+            ordered=False,
+        )
+
+
+async def backfill_fingerprint_df():
+    """Однократно считает df отпечатков по корпусу, накопленному до появления счетчиков."""
+    try:
+        if await fingerprint_df.estimated_document_count() or not await corpus.estimated_document_count():
+            return
+        pipeline = [
+            {"$unwind": "$fingerprints"},
+            {"$group": {"_id": "$fingerprints", "df": {"$sum": 1}}},
+            {"$merge": {"into": fingerprint_df.name}},
+        ]
+        await corpus.aggregate(pipeline, allowDiskUse=True).to_list(None)
+    except PyMongoError as e:
+        logger.warning("Fingerprint df backfill failed: %s", e)
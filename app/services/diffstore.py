@@ -0,0 +1,82 @@
+import datetime
+import zlib
+from typing import Dict, Iterable, List
+
+import numpy as np
+from pymongo import UpdateOne
+
+from app.database.db import texts
+from app.services.lexical import Run, render_runs
+
+# Порядок важен: индекс тега хранится в упакованном массиве
+SPAN_TAGS = ['diff-match', 'diff-removed', 'diff-changed', 'diff-added']
+_TAG_CODES = {tag: code for code, tag in enumerate(SPAN_TAGS)}
+# Формат хранения фиксирован: uint32 little-endian, как писал array('I') на x86 - старые отчеты читаются
+_SPAN_DTYPE = np.dtype('<u4')
+
+
+def pack_runs(runs: List[Run]) -> bytes:
+    """Упаковывает отрезки подсветки в zlib-сжатый массив uint32 LE: [тег, начало, длина, ...]."""
+    values = np.array(
+        [(_TAG_CODES[tag], start, end - start) for tag, start, end in runs], dtype=_SPAN_DTYPE
+    )
+    return zlib.compress(values.tobytes())
+
+
+def unpack_runs(blob: bytes) -> List[Run]:
+    values = np.frombuffer(zlib.decompress(blob), dtype=_SPAN_DTYPE).reshape(-1, 3).tolist()
+    return [(SPAN_TAGS[code], start, start + length) for code, start, length in values]
+
+
+def matched_fragments(words: List[str], runs: List[Run]) -> List[str]:
+    return [" ".join(words[start:end]) for tag, start, end in runs if tag == 'diff-match']
+
+
+async def save_texts(docs: Iterable[Dict]):
+    """Сохраняет отфильтрованный текст каждого документа один раз (по хэшу), сжатым."""
+    ops = [
+        UpdateOne(
+            {"text_hash": doc["doc_hash"]},
+            {"$setOnInsert": {
+                "text_hash": doc["doc_hash"],
+                "text": zlib.compress(doc["text"].encode("utf-8")),
+                "created_at": datetime.datetime.utcnow(),
+            }},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    if ops:
+        await texts.bulk_write(ops, ordered=False)
+
+
+async def load_words(text_hashes: Iterable[str]) -> Dict[str, List[str]]:
+    unique = list(set(text_hashes))
+    words: Dict[str, List[str]] = {}
+    async for entry in texts.find({"text_hash": {"$in": unique}}):
+        words[entry["text_hash"]] = zlib.decompress(entry["text"]).decode("utf-8").split()
+    return words
+
+
+def render_side(side: Dict, words_by_hash: Dict[str, List[str]]) -> Dict:
+    """Компактную сторону отчета (text_hash + spans) превращает в прежний вид с html."""
+    if "spans" not in side:
+        return side
+    words = words_by_hash.get(side.get("text_hash"), [])
+    rendered = {key: value for key, value in side.items() if key not in ("spans", "text_hash")}
+    rendered["html"] = render_runs(words, unpack_runs(side["spans"]))
+    return rendered
+
+
+async def render_reports(reports: List[Dict]) -> List[Dict]:
+    """HTML по требованию для пачки отчетов: тексты догружаются одним запросом."""
+    hashes = [
+        side["text_hash"] for report in reports for side in (report.get("docA", {}), report.get("docB", {}))
+        if "spans" in side
+    ]
+    words_by_hash = await load_words(hashes) if hashes else {}
+    return [
+        {**report, "docA": render_side(report.get("docA", {}), words_by_hash),
+         "docB": render_side(report.get("docB", {}), words_by_hash)}
+        for report in reports
+    ]
@@ -0,0 +1,223 @@
+import hashlib
+import io
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import config
+from app.services.filestore import DiskStore
+from app.services.metrics import (
+    registry, GaugeCallback, EMBEDDING_BATCH_TOKENS, EMBEDDING_BATCH_SECONDS, EMBEDDING_BATCH_RSS_GROWTH,
+    current_rss_bytes
+)
+
+logger = logging.getLogger("uvicorn.error")
+
+
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+
+def embedding_key(text: str, model_name: str) -> str:
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+def pack_vector(vector: np.ndarray, storage_dtype: str) -> np.ndarray:
+    """Компактное хранение вектора: float16 (вдвое меньше) или int8 (вчетверо, + 4 байта масштаба).
+
+    int8 - симметричное квантование по максимуму модуля; масштаб float32 дописан
+    в конец массива, поэтому записанный файл .npy описывает себя сам.
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    if storage_dtype == "float16":
+        return vector.astype(np.float16)
+    if storage_dtype == "int8":
+        scale = np.float32(np.abs(vector).max() / 127.0) or np.float32(1.0)
+        quantized = np.round(vector / scale).astype(np.int8)
+        return np.concatenate([quantized, np.array([scale], dtype=np.float32).view(np.int8)])
+    return vector
+
+
+def unpack_vector(stored: np.ndarray) -> np.ndarray:
+    if stored.dtype == np.int8:
+        scale = stored[-4:].view(np.float32)[0]
+        return stored[:-4].astype(np.float32) * scale
+    return stored.astype(np.float32)
+
+
+def estimate_tokens(text: str, max_tokens: int) -> int:
+    # +2 - служебные [CLS]/[SEP]; длиннее max_seq_length модель вход все равно обрезает
+    return min(int(len(text.split()) * config.embedding_tokens_per_word) + 2, max_tokens)
+
+
+def plan_batches(lengths: List[int], token_budget: int, max_batch: int) -> List[List[int]]:
+    """Индексы текстов, разложенные по пакетам: по возрастанию длины, число текстов в пакете
+    на длину самого длинного (паддинг до него) не больше token_budget.
+
+    Короткие тексты не дополняются до длинных, а размер тензора пакета ограничен
+    бюджетом, а не числом текстов в загрузке.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for idx in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        # Отсортировано по возрастанию: самый длинный в пакете - добавляемый
+        if current and ((len(current) + 1) * lengths[idx] > token_budget or len(current) >= max_batch):
+            batches.append(current)
+            current = []
+        current.append(idx)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def encode_batched(model, texts: List[str], max_batch: int, **encode_kwargs) -> List[np.ndarray]:
+    """model.encode пакетами из plan_batches; векторы возвращаются в исходном порядке texts."""
+    max_tokens = getattr(model, "max_seq_length", None) or 512
+    lengths = [estimate_tokens(text, max_tokens) for text in texts]
+    vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+    for batch in plan_batches(lengths, config.embedding_token_budget, max_batch):
+        # ru_maxrss только растет и не показывает вклад пакета - сравниваем текущий RSS до и после
+        rss_before = current_rss_bytes()
+        started = time.perf_counter()
+        encoded = model.encode([texts[idx] for idx in batch], batch_size=len(batch), **encode_kwargs)
+        seconds = time.perf_counter() - started
+        rss_after = current_rss_bytes()
+        padded = len(batch) * max(lengths[idx] for idx in batch)
+        EMBEDDING_BATCH_TOKENS.observe(padded)
+        EMBEDDING_BATCH_SECONDS.observe(seconds)
+        if rss_before is not None and rss_after is not None:
+            EMBEDDING_BATCH_RSS_GROWTH.observe(max(rss_after - rss_before, 0))
+            logger.debug("Embedding batch: %d texts, %d padded tokens, %.3fs, RSS %d MB (%+d MB)",
+                         len(batch), padded, seconds, rss_after // 1024 ** 2, (rss_after - rss_before) // 1024 ** 2)
+        for idx, vector in zip(batch, encoded):
+            vectors[idx] = vector
+    return vectors
+
+
+class EmbeddingCache:
+    """Двухуровневый кэш эмбеддингов: LRU в памяти процесса + файлы .npy на диске.
+
+    Оба уровня ограничены по размеру в байтах; при переполнении вытесняются
+    давно не использованные записи.
+    """
+
+    def __init__(self, memory_bytes: int, disk_dir: Optional[str], disk_bytes: int, storage_dtype: str = "float32"):
+        if storage_dtype not in STORAGE_DTYPES:
+            raise ValueError(f"Unknown embedding storage dtype: {storage_dtype}")
+        self.storage_dtype = storage_dtype
+        self.memory_bytes = memory_bytes
+        self.disk = DiskStore(disk_dir, disk_bytes, ".npy")
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    # --- память ---
+
+    def _memory_get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+            return vector
+
+    def _memory_put(self, key: str, vector: np.ndarray):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return
+            self._memory[key] = vector
+            self._memory_used += vector.nbytes
+            while self._memory_used > self.memory_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_used -= evicted.nbytes
+                self.counters["evictions"] += 1
+
+    # --- диск: файлы .npy в DiskStore (лимит по байтам, вытеснение по давности) ---
+
+    def _disk_get(self, key: str) -> Optional[np.ndarray]:
+        path = self.disk.get_path(key)
+        if path is None:
+            return None
+        try:
+            return np.load(path)
+        except (OSError, ValueError):
+            return None
+
+    def _disk_put(self, key: str, vector: np.ndarray):
+        if not self.disk.enabled:
+            return
+        buffer = io.BytesIO()
+        np.save(buffer, vector)
+        self.disk.put_bytes(key, buffer.getvalue())
+
+    # --- публичный API ---
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        stored = self._memory_get(key)
+        if stored is not None:
+            self.counters["memory_hits"] += 1
+            return unpack_vector(stored)
+        stored = self._disk_get(key)
+        if stored is not None:
+            self.counters["disk_hits"] += 1
+            self._memory_put(key, stored)
+            return unpack_vector(stored)
+        self.counters["misses"] += 1
+        return None
+
+    def put(self, key: str, vector: np.ndarray) -> np.ndarray:
+        """Сохраняет вектор в формате storage_dtype; возвращает его так, как его потом вернет get."""
+        stored = pack_vector(vector, self.storage_dtype)
+        self._memory_put(key, stored)
+        self._disk_put(key, stored)
+        return unpack_vector(stored)
+
+    def encode(self, model, model_name: str, texts: List[str], **encode_kwargs) -> np.ndarray:
+        """Аналог model.encode(texts): кодирует только тексты, которых нет в кэше."""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        keys = [embedding_key(text, model_name) for text in texts]
+        vectors: List[Optional[np.ndarray]] = [self.get(key) for key in keys]
+        missing = [idx for idx, vector in enumerate(vectors) if vector is None]
+        if missing:
+            max_batch = encode_kwargs.pop("batch_size", config.semantic_batch_size)
+            encoded = encode_batched(model, [texts[idx] for idx in missing], max_batch, **encode_kwargs)
+            for idx, vector in zip(missing, encoded):
+                # Промах и попадание дают одинаковые значения - результат не зависит от состояния кэша
+                vectors[idx] = self.put(keys[idx], vector)
+        return np.stack(vectors)
+
+    def stats(self) -> Dict:
+        lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+        hits = lookups - self.counters["misses"]
+        return {
+            **self.counters,
+            "evictions": self.counters["evictions"] + self.disk.counters["evictions"],
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_used,
+            "memory_limit_bytes": self.memory_bytes,
+            "disk_bytes": self.disk.used_bytes,
+            "disk_limit_bytes": self.disk.max_bytes,
+            "storage_dtype": self.storage_dtype,
+        }
+
+
+embedding_cache = EmbeddingCache(
+    memory_bytes=config.embedding_cache_memory_bytes,
+    disk_dir=config.embedding_cache_dir,
+    disk_bytes=config.embedding_cache_disk_bytes,
+    storage_dtype=config.embedding_storage_dtype,
+)
+
+registry.register(GaugeCallback(
+    "qazzerep_embedding_cache", "Embedding cache counters and sizes.",
+    lambda: {
+        (("field", key),): value for key, value in embedding_cache.stats().items()
+        if isinstance(value, (int, float))
+    }
+))
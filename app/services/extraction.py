@@ -0,0 +1,222 @@
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import zipfile
+from typing import List, Optional, Tuple
+
+import fitz
+from docx import Document
+
+import config
+
+logger = logging.getLogger("uvicorn.error")
+
+try:
+    import rarfile  # type: ignore
+except ImportError:  # безопасный фолбэк, если rarfile не установлен
+    rarfile = None
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt')
+ARCHIVE_EXTENSIONS = ('.zip', '.rar')
+
+# Элемент плана извлечения: (путь к файлу на диске, имя загрузки, имя внутри архива или None)
+ExtractionItem = Tuple[str, str, Optional[str]]
+
+
+class ArchiveLimitError(ValueError):
+    """Архив нарушает ограничения (число файлов, объем, степень сжатия) - похоже на zip-бомбу."""
+
+
+def extract_text_from_file(content: bytes, filename: str) -> str:
+    """Текст DOCX/TXT из байтов; PDF читается постранично через extract_pdf_pages."""
+    if filename.lower().endswith('.docx'):
+        try:
+            doc = Document(io.BytesIO(content))
+            return " ".join([para.text for para in doc.paragraphs])
+        except Exception:
+            logger.warning("Failed to read DOCX %s", filename, exc_info=True)
+            return ""
+
+    elif filename.lower().endswith('.txt'):
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            return content.decode('cp1251', errors='ignore')
+    return ""
+
+
+def file_digest(path: str) -> str:
+    """sha1 исходного файла, читается кусками - ключ кэша извлеченного текста."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(config.upload_chunk_bytes), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pdf_page_count(path: str) -> int:
+    with fitz.open(path) as doc:
+        return doc.page_count
+
+
+def extract_pdf_pages(path: str, start: int, end: int) -> List[str]:
+    """Текст страниц [start, end); у каждого вызова свой дескриптор fitz, поэтому диапазоны можно раздать по процессам."""
+    with fitz.open(path) as doc:
+        return [doc[page_no].get_text() for page_no in range(start, min(end, doc.page_count))]
+
+
+def extract_pages_from_path(path: str, filename: str) -> List[str]:
+    """Текст файла постранично; у DOCX и TXT страниц нет - весь текст считается одной страницей.
+
+    Ошибки чтения не глотаются: вызывающий код логирует их и пропускает файл.
+    """
+    name_lower = filename.lower()
+    if name_lower.endswith('.pdf'):
+        return extract_pdf_pages(path, 0, pdf_page_count(path))
+
+    elif name_lower.endswith('.docx'):
+        doc = Document(path)
+        return [" ".join([para.text for para in doc.paragraphs])]
+
+    elif name_lower.endswith('.txt'):
+        with open(path, 'rb') as f:
+            return [extract_text_from_file(f.read(), filename)]
+    return []
+
+
+async def spool_upload(file, directory: Optional[str] = None) -> str:
+    """Копирует загрузку во временный файл кусками upload_chunk_bytes, не держа ее в памяти целиком."""
+    suffix = os.path.splitext(file.filename or "")[1]
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    total = 0
+    try:
+        with os.fdopen(fd, "wb") as dst:
+            while True:
+                chunk = await file.read(config.upload_chunk_bytes)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > config.upload_max_bytes:
+                    raise ArchiveLimitError(f"Файл {file.filename} больше {config.upload_max_bytes} байт")
+                dst.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def _open_archive(path: str, filename: str):
+    if filename.lower().endswith('.zip'):
+        return zipfile.ZipFile(path)
+    if filename.lower().endswith('.rar') and rarfile is not None:
+        return rarfile.RarFile(path)  # type: ignore[attr-defined]
+    return None
+
+
+def _archive_members(archive) -> List[Tuple[str, int, int]]:
+    """(имя, распакованный размер, сжатый размер) для поддерживаемых файлов архива."""
+    members = []
+    for info in archive.infolist():
+        is_dir = info.is_dir() if hasattr(info, "is_dir") else info.isdir()
+        if is_dir or not info.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            continue
+        members.append((info.filename, info.file_size, info.compress_size))
+    return members
+
+
+def plan_extraction(path: str, filename: str) -> List[ExtractionItem]:
+    """Раскладывает загрузку на независимые элементы извлечения; архивы проверяет по лимитам."""
+    if not filename.lower().endswith(ARCHIVE_EXTENSIONS):
+        return [(path, filename, None)]
+
+    try:
+        archive = _open_archive(path, filename)
+    except Exception:
+        return []
+    if archive is None:
+        return []
+
+    with archive:
+        members = _archive_members(archive)
+    if len(members) > config.archive_max_members:
+        raise ArchiveLimitError(f"В архиве {filename} больше {config.archive_max_members} файлов")
+    total = sum(size for _, size, _ in members)
+    if total > config.archive_max_total_bytes:
+        raise ArchiveLimitError(f"Распакованный объем архива {filename} превышает лимит")
+    for name, size, compressed in members:
+        if size > config.archive_max_member_bytes:
+            raise ArchiveLimitError(f"Файл {name} в архиве {filename} превышает лимит размера")
+        if size and size > max(compressed, 1) * config.archive_max_ratio:
+            raise ArchiveLimitError(f"Подозрительная степень сжатия у {name} в архиве {filename}")
+    return [(path, filename, name) for name, size, _ in members if size]
+
+
+def _copy_member(archive, member: str, dst, remaining: int) -> int:
+    """Потоковое чтение элемента архива кусками; возвращает число прочитанных байт.
+
+    remaining - сколько байт еще можно распаковать из всего архива. Превышение общего
+    объема или archive_max_member_bytes - ArchiveLimitError, как и при проверке заголовков.
+    """
+    copied = 0
+    with archive.open(member) as src:
+        while True:
+            chunk = src.read(config.upload_chunk_bytes)
+            if not chunk:
+                return copied
+            copied += len(chunk)
+            if copied > remaining:
+                raise ArchiveLimitError(f"Фактический распакованный объем архива превышает лимит ({member})")
+            if copied > config.archive_max_member_bytes:
+                raise ArchiveLimitError(f"Файл {member} в архиве превышает лимит размера")
+            dst.write(chunk)
+
+
+def materialize_members(path: str, filename: str, members: List[str]) -> List[Optional[str]]:
+    """Распаковывает элементы архива по очереди во временные файлы; None - элемент не читается.
+
+    Заголовкам архива не доверяем: размер каждого элемента, общий объем и степень сжатия
+    проверяются по фактически прочитанным байтам против archive_max_member_bytes,
+    archive_max_total_bytes и размера архива на диске. Политика та же, что в plan_extraction:
+    нарушение лимита отклоняет весь архив (ArchiveLimitError).
+    """
+    budget = min(config.archive_max_total_bytes, max(os.path.getsize(path), 1) * config.archive_max_ratio)
+    total = 0
+    paths: List[Optional[str]] = []
+    try:
+        with _open_archive(path, filename) as archive:
+            for member in members:
+                fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(member)[1])
+                paths.append(tmp_path)
+                try:
+                    with os.fdopen(fd, "wb") as dst:
+                        total += _copy_member(archive, member, dst, budget - total)
+                except ArchiveLimitError:
+                    raise
+                except Exception:
+                    # Битый элемент пропускаем, остальные файлы архива читаются дальше
+                    os.remove(tmp_path)
+                    paths[-1] = None
+    except Exception:
+        remove_files(paths)
+        raise
+    return paths
+
+
+def remove_files(paths: List[Optional[str]]):
+    for path in paths:
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def remove_uploads(uploads: List[Tuple[str, str]]):
+    for _, path in uploads:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
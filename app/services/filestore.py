@@ -0,0 +1,115 @@
+import os
+import shutil
+import threading
+from typing import List, Optional
+
+_TMP_SUFFIX = ".tmp"
+
+
+class DiskStore:
+    """Файлы по ключу в каталоге на диске с лимитом по байтам и вытеснением давно не использованных."""
+
+    def __init__(self, directory: Optional[str], max_bytes: int, suffix: str = ""):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._used: Optional[int] = None
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    @property
+    def used_bytes(self) -> Optional[int]:
+        """Занятый объем; None, пока в хранилище ничего не записывали."""
+        return self._used
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{self.suffix}")
+
+    def _files(self) -> List[os.DirEntry]:
+        files = []
+        if not os.path.isdir(self.directory):
+            return files
+        for sub in os.scandir(self.directory):
+            if sub.is_dir():
+                # Недописанные временные файлы (в том числе брошенные упавшим процессом) не считаются
+                files.extend(
+                    entry for entry in os.scandir(sub.path)
+                    if entry.name.endswith(self.suffix) and not entry.name.endswith(_TMP_SUFFIX)
+                )
+        return files
+
+    def get_path(self, key: str) -> Optional[str]:
+        """Путь к файлу, если он есть; время доступа обновляется для вытеснения по давности."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.counters["misses"] += 1
+            return None
+        self.counters["hits"] += 1
+        return path
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put_bytes(self, key: str, data: bytes):
+        self._store(key, lambda tmp_path: _write_bytes(tmp_path, data))
+
+    def put_file(self, key: str, source: str):
+        self._store(key, lambda tmp_path: shutil.copyfile(source, tmp_path))
+
+    def _store(self, key: str, write):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}{_TMP_SUFFIX}"
+        write(tmp_path)
+        with self._lock:
+            # Перезапись ключа заменяет файл: в учете старый размер вычитается
+            try:
+                replaced = os.path.getsize(path)
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._used is None:
+                self._used = sum(entry.stat().st_size for entry in self._files())
+            else:
+                self._used += os.path.getsize(path) - replaced
+            if self._used > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Удаляем самые старые по mtime файлы, пока не освободим 10% лимита
+        entries = sorted(self._files(), key=lambda e: e.stat().st_mtime)
+        target = self.max_bytes * 0.9
+        used = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if used <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                used -= size
+                self.counters["evictions"] += 1
+            except OSError:
+                continue
+        self._used = used
+
+
+def _write_bytes(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
@@ -0,0 +1,107 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import config
+from app.services.lru import LRUCache, content_key
+from app.services.models import model_registry, SPACY_MODEL
+
+FILTER_RULES = {
+    "gost": r'(?is)\n(Список литературы|Библиография|Пайдаланылған әдебиеттер).*$',
+    "apa": r'(?is)\n(References|Bibliography).*$',
+    "tables": r'(?i)(Таблица|Table|Кесте|Схема|Рисунок)\s+\d+.*?\n',
+    "titles": r'(?is)^.*?(Министерство|УДК|МРНТИ|Дипломная работа|Thesis|Work|Проект).*?\n\n',
+    "quotes": r'["«\'](.*?)["»\']'
+}
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Компоненты spaCy, которые не нужны для лемм
+_UNUSED_PIPES = {"parser", "ner", "textcat", "textcat_multilabel", "entity_linker", "entity_ruler", "senter"}
+
+_lemma_cache = LRUCache(config.lemma_cache_entries)
+
+
+class CompiledFilters:
+    """Предкомпилированный набор правил.
+
+    Шаблоны применяются по одному в порядке правил пользователя: следующее правило
+    видит текст после предыдущего (например, "tables" не должен съесть перевод
+    строки, нужный "gost"), поэтому в одно регулярное выражение они не склеиваются.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = [re.compile(p) for p in patterns]
+
+    def apply(self, text: str) -> str:
+        text = unicodedata.normalize('NFKC', text)
+        for pattern in self.patterns:
+            text = pattern.sub('', text)
+        text = text.lower()
+        return _WHITESPACE.sub(' ', text).strip()
+
+
+def _valid_pattern(pattern: str) -> bool:
+    try:
+        re.compile(pattern)
+        return True
+    except re.error:
+        return False
+
+
+@lru_cache(maxsize=256)
+def compile_filters(active_rules: Tuple[str, ...], custom_regex: str = "") -> CompiledFilters:
+    """Компилирует правила один раз на набор настроек пользователя (кэш по настройкам)."""
+    patterns = [FILTER_RULES[rule_key] for rule_key in active_rules if rule_key in FILTER_RULES]
+    if custom_regex:
+        lines = [line.split('//')[0].strip() for line in custom_regex.split('\n')]
+        # Некорректные пользовательские шаблоны пропускаются, остальные продолжают работать
+        patterns.extend(p for p in lines if p and len(p) > 1 and _valid_pattern(p))
+    return CompiledFilters(patterns)
+
+
+def lemmatize_texts(texts: List[str]) -> List[str]:
+    """Лемматизация через spaCy (двуязычность KK/RU, если модель доступна) пачкой через nlp.pipe."""
+    # spaCy грузится лениво и один раз на процесс (в т.ч. в каждом воркере пула)
+    nlp = model_registry.get(SPACY_MODEL)
+    if nlp is None:
+        return texts
+
+    results = list(texts)
+    keys = [content_key(text) for text in texts]
+    pending = []
+    for idx, text in enumerate(texts):
+        cached = _lemma_cache.get(keys[idx])
+        if cached is not None:
+            results[idx] = cached
+        elif text:
+            pending.append(idx)
+    if not pending:
+        return results
+
+    disabled = [name for name in nlp.pipe_names if name in _UNUSED_PIPES]
+    try:
+        docs = nlp.pipe((texts[idx] for idx in pending), disable=disabled, batch_size=config.spacy_batch_size)
+        for idx, doc in zip(pending, docs):
+            results[idx] = " ".join(tok.lemma_ or tok.text for tok in doc)
+            _lemma_cache.put(keys[idx], results[idx])
+    except Exception:
+        # Например, текст длиннее nlp.max_length - оставляем без лемматизации, как раньше
+        for idx in pending:
+            try:
+                results[idx] = " ".join(tok.lemma_ or tok.text for tok in nlp(texts[idx], disable=disabled))
+                _lemma_cache.put(keys[idx], results[idx])
+            except Exception:
+                results[idx] = texts[idx]
+    return results
+
+
+def filter_texts(texts: List[str], active_rules: List[str], custom_regex: Optional[str] = None) -> List[str]:
+    """Пакетная фильтрация: одна задача пула на пачку текстов, леммы - одним проходом nlp.pipe."""
+    compiled = compile_filters(tuple(active_rules), custom_regex or "")
+    return lemmatize_texts([compiled.apply(text) for text in texts])
+
+
+def apply_smart_filters(text: str, active_rules: List[str], custom_regex: Optional[str] = None) -> str:
+    return filter_texts([text], active_rules, custom_regex)[0]
@@ -0,0 +1,118 @@
+import asyncio
+import datetime
+import json
+import logging
+import os
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import config
+from app.database.db import extracted
+from app.services.extraction import (
+    plan_extraction, materialize_members, remove_files, file_digest, pdf_page_count, extract_pdf_pages,
+    extract_pages_from_path, ExtractionItem
+)
+from app.services.filestore import DiskStore
+from app.services.workers import run_cpu_task
+
+logger = logging.getLogger("uvicorn.error")
+
+# Меняется при изменении логики извлечения - старые записи кэша перестают совпадать
+EXTRACTOR_VERSION = 1
+
+# Исходные PDF для подсветки совпадений в оригинале (экспорт отчета mode=original)
+original_store = DiskStore(config.original_pdf_dir, config.original_pdf_bytes, ".pdf")
+
+
+async def load_pages(file_hash: str) -> Optional[List[str]]:
+    """Постраничный текст файла из кэша (ключ - sha1 исходного файла) или None."""
+    entry = await extracted.find_one({"file_hash": file_hash, "version": EXTRACTOR_VERSION}, {"pages": 1})
+    if entry is None:
+        return None
+    return json.loads(zlib.decompress(entry["pages"]).decode("utf-8"))
+
+
+async def store_pages(file_hash: str, pages: List[str]):
+    await extracted.update_one(
+        {"file_hash": file_hash},
+        {"$set": {
+            "file_hash": file_hash,
+            "version": EXTRACTOR_VERSION,
+            "pages": zlib.compress(json.dumps(pages, ensure_ascii=False).encode("utf-8")),
+            "page_count": len(pages),
+            "created_at": datetime.datetime.utcnow(),
+        }},
+        upsert=True,
+    )
+
+
+async def _extract_pages(path: str, filename: str) -> List[str]:
+    """Большие PDF режутся на диапазоны страниц, каждый диапазон - отдельная задача пула.
+
+    Имеет смысл только с пулом процессов: MuPDF не отпускает GIL, а потоки не дают выигрыша.
+    """
+    if filename.lower().endswith('.pdf') and config.cpu_executor == "process":
+        page_count = await run_cpu_task(pdf_page_count, path)
+        if page_count >= config.pdf_parallel_min_pages:
+            step = config.pdf_pages_per_task
+            ranges = await asyncio.gather(*(
+                run_cpu_task(extract_pdf_pages, path, start, start + step) for start in range(0, page_count, step)
+            ))
+            return [page for chunk in ranges for page in chunk]
+    return await run_cpu_task(extract_pages_from_path, path, filename)
+
+
+async def _extract_item(source: str, filename: str, member: Optional[str], use_cache: bool = True) -> Optional[Dict]:
+    """source - файл на диске: сама загрузка или уже распакованный элемент архива member."""
+    name = filename if member is None else f"{filename}::{member}"
+    try:
+        file_hash = await run_cpu_task(file_digest, source)
+        pages = await load_pages(file_hash) if use_cache else None
+        if pages is None:
+            pages = await _extract_pages(source, member or filename)
+            if use_cache:
+                await store_pages(file_hash, pages)
+        if use_cache and config.original_pdf_enabled and original_store.enabled \
+                and (member or filename).lower().endswith('.pdf') and original_store.get_path(file_hash) is None:
+            await asyncio.to_thread(original_store.put_file, file_hash, source)
+    except Exception as e:
+        logger.warning("Text extraction failed for %s: %s", name, e)
+        return None
+
+    text = " ".join(pages)
+    if not text.strip():
+        return None
+    return {"name": name, "text": text, "pages": pages, "file_hash": file_hash}
+
+
+async def extract_uploads(uploads: List[Tuple[str, str]], use_cache: bool = True) -> List[Dict]:
+    """Извлекает документы из загрузок (имя, путь): архивы раскрываются, тексты берутся из кэша.
+
+    Каждый документ хранит постраничный текст (pages) и file_hash, по которому
+    страницы можно достать из кэша повторно без извлечения. use_cache=False - всегда извлекать
+    заново, без обращения к MongoDB (бенчмарки). ArchiveLimitError пробрасывается.
+    """
+    plans = await asyncio.gather(*(run_cpu_task(plan_extraction, path, filename) for filename, path in uploads))
+    docs = await asyncio.gather(*(_extract_plan(plan, use_cache) for plan in plans))
+    return [doc for chunk in docs for doc in chunk if doc]
+
+
+async def _extract_plan(plan: List[ExtractionItem], use_cache: bool) -> List[Optional[Dict]]:
+    """Элементы одного архива распаковываются одной задачей (общий лимит объема), текст извлекается параллельно."""
+    members = [member for _, _, member in plan if member is not None]
+    if not members:
+        return await asyncio.gather(*(_extract_item(*item, use_cache) for item in plan))
+
+    path, filename, _ = plan[0]
+    temp_paths = await run_cpu_task(materialize_members, path, filename, members)
+    try:
+        for member, temp_path in zip(members, temp_paths):
+            if temp_path is None:
+                logger.warning("Skipping %s::%s: member is unreadable",
+                               filename, member)
+        return await asyncio.gather(*(
+            _extract_item(temp_path, filename, member, use_cache)
+            for member, temp_path in zip(members, temp_paths) if temp_path
+        ))
+    finally:
+        await asyncio.to_thread(remove_files, temp_paths)
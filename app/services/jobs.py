@@ -0,0 +1,224 @@
+import asyncio
+import datetime
+import logging
+import os
+import shutil
+import socket
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+
+import config
+from app.database.db import jobs
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class JobQueue:
+    """Очередь фоновых задач сравнения: состояние в MongoDB, исполнители - локальные asyncio-воркеры.
+
+    Параллелизм ограничен числом воркеров и лимитом задач на пользователя; среди
+    ожидающих пользователей первым обслуживается тот, кого дольше всех не обслуживали.
+    Захваченная задача принадлежит процессу (owner) и арендована до lease_until: процесс
+    продлевает аренду, пока жив, а в очередь возвращаются только задачи с истекшей арендой.
+    """
+
+    def __init__(self, workers: int, max_per_user: int, spool_dir: str, poll_seconds: float,
+                 lease_seconds: float = 60.0, heartbeat_seconds: float = 15.0,
+                 backoff_max_seconds: float = 30.0, fairness_entries: int = 10000):
+        self.workers = workers
+        self.max_per_user = max_per_user
+        self.spool_dir = spool_dir
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.fairness_entries = fairness_entries
+        # Уникален для каждого процесса и каждого запуска очереди (--reload, несколько воркеров uvicorn)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handler: Optional[Callable[[Dict], Awaitable[Optional[Dict]]]] = None
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._last_served: "OrderedDict[str, float]" = OrderedDict()
+        # Задачи, которые выполняются сейчас: аренда продлевается только им
+        self._running: set = set()
+        # Проверка лимита и захват задачи - одна критическая секция для всех воркеров процесса
+        self._claim_lock = asyncio.Lock()
+
+    async def start(self, handler: Callable[[Dict], Awaitable[Optional[Dict]]]):
+        """handler(job) выполняет задачу; возвращенный словарь дописывается в документ задачи."""
+        self._handler = handler
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, email: str, uploads: List[Tuple[str, str]], params: Dict) -> str:
+        """uploads - (имя, путь к временному файлу); файлы переносятся в каталог задачи без чтения в память."""
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.spool_dir, job_id)
+        os.makedirs(job_dir, exist_ok=True)
+        files = []
+        for idx, (filename, temp_path) in enumerate(uploads):
+            path = os.path.join(job_dir, f"{idx:05d}")
+            shutil.move(temp_path, path)
+            files.append({"name": filename, "path": path})
+
+        await jobs.insert_one({
+            "job_id": job_id,
+            "email": email,
+            "status": "queued",
+            "params": params,
+            "files": files,
+            "progress": {"documents": 0, "pairs_done": 0, "total_pairs": None},
+            "created_at": datetime.datetime.utcnow(),
+        })
+        self._wakeup.set()
+        return job_id
+
+    async def update_progress(self, job_id: str, **progress):
+        await jobs.update_one(
+            {"job_id": job_id},
+            {"$set": {f"progress.{key}": value for key, value in progress.items()}}
+        )
+
+    def _lease_until(self) -> datetime.datetime:
+        return datetime.datetime.utcnow() + datetime.timedelta(seconds=self.lease_seconds)
+
+    async def requeue_expired(self) -> int:
+        """Возвращает в очередь задачи, чей владелец перестал продлевать аренду (процесс упал или перезапущен)."""
+        result = await jobs.update_many(
+            {"status": "running", "$or": [
+                {"lease_until": {"$lt": datetime.datetime.utcnow()}},
+                # Задачи, захваченные до появления аренды
+                {"lease_until": {"$exists": False}},
+            ]},
+            {"$set": {"status": "queued"}, "$unset": {"owner": "", "lease_until": ""}},
+        )
+        if result.modified_count:
+            logger.warning("Requeued %d jobs with an expired lease", result.modified_count)
+        return result.modified_count
+
+    async def renew_leases(self):
+        if not self._running:
+            return
+        await jobs.update_many(
+            {"job_id": {"$in": list(self._running)}, "status": "running", "owner": self.owner},
+            {"$set": {"lease_until": self._lease_until()}},
+        )
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self.renew_leases()
+            except PyMongoError as e:
+                logger.warning("Job lease renewal failed: %s", e)
+
+    async def _claim_next(self) -> Optional[Dict]:
+        # Без блокировки два воркера между aggregate и захватом видят пользователя
+        # свободным и оба берут его задачи сверх max_per_user
+        async with self._claim_lock:
+            await self.requeue_expired()
+            return await self._claim_next_locked()
+
+    def _mark_served(self, email: str):
+        # Забытый пользователь получает приоритет 0.0 - как и давно не обслуженный, порядок не ломается
+        self._last_served[email] = datetime.datetime.utcnow().timestamp()
+        self._last_served.move_to_end(email)
+        while len(self._last_served) > self.fairness_entries:
+            self._last_served.popitem(last=False)
+
+    async def _claim_next_locked(self) -> Optional[Dict]:
+        busy = await jobs.aggregate([
+            {"$match": {"status": "running"}},
+            {"$group": {"_id": "$email", "running": {"$sum": 1}}},
+        ]).to_list(None)
+        saturated = [entry["_id"] for entry in busy if entry["running"] >= self.max_per_user]
+        waiting = await jobs.distinct("email", {"status": "queued", "email": {"$nin": saturated}})
+        for email in sorted(waiting, key=lambda e: self._last_served.get(e, 0.0)):
+            job = await jobs.find_one_and_update(
+                {"status": "queued", "email": email},
+                {"$set": {
+                    "status": "running",
+                    "started_at": datetime.datetime.utcnow(),
+                    "owner": self.owner,
+                    "lease_until": self._lease_until(),
+                }},
+                sort=[("created_at", 1)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if job:
+                self._mark_served(email)
+                return job
+        return None
+
+    async def _run(self, job: Dict):
+        self._running.add(job["job_id"])
+        try:
+            try:
+                result = await self._handler(job)
+                update = {"status": "done", **(result or {})}
+            except Exception as e:
+                update = {"status": "failed", "error": str(e)}
+            update["finished_at"] = datetime.datetime.utcnow()
+            # Если аренду успели отдать другому процессу, его результат не затираем
+            finished = await jobs.update_one(
+                {"job_id": job["job_id"], "owner": self.owner},
+                {"$set": update, "$unset": {"owner": "", "lease_until": ""}},
+            )
+        finally:
+            # Не удалось записать итог - аренда истечет, и задачу подхватит очередь
+            self._running.discard(job["job_id"])
+        if finished.matched_count:
+            shutil.rmtree(os.path.join(self.spool_dir, job["job_id"]), ignore_errors=True)
+        else:
+            logger.warning("Job %s lease was lost before it finished; result discarded", job["job_id"])
+
+    async def _worker(self):
+        backoff = self.poll_seconds
+        while True:
+            try:
+                job = await self._claim_next()
+                if job is not None:
+                    await self._run(job)
+                backoff = self.poll_seconds
+            except Exception:
+                # Например, переключение реплики MongoDB: воркер не должен умирать вместе с запросом
+                logger.exception("Job worker error, retrying in %.1fs", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.backoff_max_seconds)
+                continue
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                # Освободился слот пользователя - будим остальных воркеров
+                self._wakeup.set()
+
+
+def load_job_uploads(job: Dict) -> List[Tuple[str, str]]:
+    return [(entry["name"], entry["path"]) for entry in job["files"]]
+
+
+job_queue = JobQueue(
+    workers=config.job_workers,
+    max_per_user=config.job_max_per_user,
+    spool_dir=config.job_spool_dir,
+    poll_seconds=config.job_poll_seconds,
+    lease_seconds=config.job_lease_seconds,
+    heartbeat_seconds=config.job_heartbeat_seconds,
+    backoff_max_seconds=config.job_backoff_max_seconds,
+    fairness_entries=config.job_fairness_entries,
+)
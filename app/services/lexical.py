@@ -0,0 +1,163 @@
+import heapq
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Tuple
+
+import config
+from app.services.minhash import jaccard_to_ratio
+
+# Отрезок подсветки: (css-тег, начало, конец) в индексах слов документа
+Run = Tuple[str, int, int]
+EngineResult = Tuple[List[Run], List[Run], float]
+
+
+def sequence_matcher_runs(words_a: List[str], words_b: List[str]) -> EngineResult:
+    """Эталонный движок: одно упорядоченное выравнивание difflib.SequenceMatcher."""
+    s = SequenceMatcher(None, words_a, words_b)
+    runs_a: List[Run] = []
+    runs_b: List[Run] = []
+    for tag, i1, i2, j1, j2 in s.get_opcodes():
+        if tag == 'equal':
+            runs_a.append(('diff-match', i1, i2))
+            runs_b.append(('diff-match', j1, j2))
+        elif tag == 'replace':
+            runs_a.append(('diff-removed', i1, i2))
+            runs_b.append(('diff-changed', j1, j2))
+        elif tag == 'insert':
+            runs_b.append(('diff-added', j1, j2))
+        elif tag == 'delete':
+            runs_a.append(('diff-removed', i1, i2))
+    return runs_a, runs_b, s.ratio()
+
+
+def _encode_tokens(words_a: List[str], words_b: List[str]) -> Tuple[List[int], List[int]]:
+    vocab: Dict[str, int] = {}
+    ids_a = [vocab.setdefault(w, len(vocab)) for w in words_a]
+    ids_b = [vocab.setdefault(w, len(vocab)) for w in words_b]
+    return ids_a, ids_b
+
+
+def _mask_to_runs(mask: List[bool], match_tag: str, other_tag: str) -> List[Run]:
+    runs: List[Run] = []
+    start = 0
+    for idx in range(1, len(mask) + 1):
+        if idx == len(mask) or mask[idx] != mask[start]:
+            runs.append((match_tag if mask[start] else other_tag, start, idx))
+            start = idx
+    return runs
+
+
+def greedy_tiling_runs(
+    words_a: List[str],
+    words_b: List[str],
+    min_match: int = 3,
+    max_positions: int = 64,
+) -> EngineResult:
+    """Жадное покрытие плитками (GST) по хэшам k-грамм: находит и переставленные фрагменты.
+
+    Кандидаты - левомаксимальные совпадения, найденные через индекс k-грамм документа B;
+    затем плитки укладываются от самых длинных к коротким без перекрытий. k-граммы,
+    встречающиеся в B чаще max_positions раз (штампы), не индексируются вовсе: совпадение
+    все равно продлевается через них пословно, но начинается с ближайшей редкой k-граммы.
+    """
+    ids_a, ids_b = _encode_tokens(words_a, words_b)
+    len_a, len_b = len(ids_a), len(ids_b)
+    k = min_match
+    marked_a = [False] * len_a
+    marked_b = [False] * len_b
+
+    index: Dict[Tuple[int, ...], List[int]] = {}
+    for j in range(len_b - k + 1):
+        index.setdefault(tuple(ids_b[j:j + k]), []).append(j)
+    # Частые k-граммы выбрасываем целиком, а не обрезаем список позиций: иначе
+    # пропуск нелевомаксимальных совпадений ниже терял бы целые скопированные куски
+    index = {gram: positions for gram, positions in index.items() if len(positions) <= max_positions}
+
+    heap: List[Tuple[int, int, int]] = []
+    for i in range(len_a - k + 1):
+        positions = index.get(tuple(ids_a[i:i + k]))
+        if not positions:
+            continue
+        # k-грамма на (i-1, j-1) совпадает, если совпали первые слова; пропускаем только
+        # когда она сама есть в индексе, то есть совпадение будет найдено с нее
+        prev_indexed = i > 0 and tuple(ids_a[i - 1:i - 1 + k]) in index
+        for j in positions:
+            if prev_indexed and j > 0 and ids_a[i - 1] == ids_b[j - 1]:
+                continue  # не левомаксимальное: уже покрыто совпадением, начатым раньше
+            length = k
+            while i + length < len_a and j + length < len_b and ids_a[i + length] == ids_b[j + length]:
+                length += 1
+            heap.append((-length, i, j))
+    heapq.heapify(heap)
+
+    matched = 0
+    while heap:
+        neg_length, i, j = heapq.heappop(heap)
+        length = -neg_length
+        free = [not marked_a[i + t] and not marked_b[j + t] for t in range(length)]
+        if all(free):
+            for t in range(length):
+                marked_a[i + t] = True
+                marked_b[j + t] = True
+            matched += length
+            continue
+        # Частично перекрытую плитку режем на свободные куски и возвращаем в очередь
+        start = None
+        for t in range(length + 1):
+            if t < length and free[t]:
+                if start is None:
+                    start = t
+            elif start is not None:
+                if t - start >= k:
+                    heapq.heappush(heap, (-(t - start), i + start, j + start))
+                start = None
+
+    total = len_a + len_b
+    ratio = 2.0 * matched / total if total else 1.0
+    runs_a = _mask_to_runs(marked_a, 'diff-match', 'diff-removed')
+    runs_b = _mask_to_runs(marked_b, 'diff-match', 'diff-added')
+    return runs_a, runs_b, ratio
+
+
+ENGINES: Dict[str, Callable[[List[str], List[str]], EngineResult]] = {
+    "sequence": sequence_matcher_runs,
+    "tiling": greedy_tiling_runs,
+}
+
+
+def render_runs(words: List[str], runs: List[Run]) -> str:
+    return " ".join(f"<span class='{tag}'>{' '.join(words[start:end])}</span>" for tag, start, end in runs)
+
+
+def get_diff_runs(text_a: str, text_b: str, engine: Optional[str] = None) -> Dict:
+    """Компактный результат диффа: отрезки подсветки в индексах слов вместо HTML."""
+    runs_a, runs_b, ratio = ENGINES[engine or config.lexical_engine](text_a.split(), text_b.split())
+    return {
+        "runsA": runs_a,
+        "runsB": runs_b,
+        "lexical_similarity": round(ratio * 100, 2)
+    }
+
+
+def get_diff_html(text_a: str, text_b: str, engine: Optional[str] = None) -> Dict:
+    words_a, words_b = text_a.split(), text_b.split()
+    runs_a, runs_b, ratio = ENGINES[engine or config.lexical_engine](words_a, words_b)
+    return {
+        "htmlA": render_runs(words_a, runs_a),
+        "htmlB": render_runs(words_b, runs_b),
+        "lexical_similarity": round(ratio * 100, 2)
+    }
+
+
+def get_estimated_diff(len_a: int, len_b: int, jaccard: float) -> Dict:
+    """Дешевый результат для пар, отсеянных MinHash-предфильтром: без совпадений, балл по оценке Жаккара."""
+    return {
+        "runsA": [('diff-removed', 0, len_a)] if len_a else [],
+        "runsB": [('diff-added', 0, len_b)] if len_b else [],
+        "lexical_similarity": round(jaccard_to_ratio(jaccard) * 100, 2),
+        "estimated": True
+    }
+
+
+def diff_pairs(texts: Dict[int, str], pairs: List[Tuple[int, int]], engine: Optional[str] = None) -> List[Dict]:
+    """Дифф для пачки пар; в воркер передаются только тексты, нужные этой пачке."""
+    return [get_diff_runs(texts[i], texts[j], engine) for i, j in pairs]
@@ -0,0 +1,224 @@
+import bisect
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import config
+
+logger = logging.getLogger("uvicorn.error")
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name, self.help = name, help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами: observe - бинарный поиск и пара сложений под локом."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name, self.help = name, help_text
+        self.buckets = sorted(buckets)
+        self._counts: Dict[LabelKey, List[int]] = {}
+        self._sums: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[idx] += 1
+            self._sums[key] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, counts in sorted(self._counts.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + [float("inf")], counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_value(bound)
+                    lines.append(f"{self.name}_bucket{_format_labels(key, [('le', le)])} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(self._sums[key])}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class GaugeCallback:
+    """Значения считываются в момент запроса /metrics (например, счетчики кэшей)."""
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], Dict[LabelKey, float]]):
+        self.name, self.help = name, help_text
+        self._read = read
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        try:
+            values = self._read()
+        except Exception as e:
+            logger.warning("Metric %s failed: %s", self.name, e)
+            return lines
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self._metrics for line in metric.render()) + "\n"
+
+
+registry = MetricsRegistry()
+
+_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+STAGE_SECONDS = registry.register(Histogram(
+    "qazzerep_stage_seconds", "Wall time of compare-batch pipeline stages.", _SECONDS_BUCKETS
+))
+PIPELINE_SECONDS = registry.register(Histogram(
+    "qazzerep_pipeline_seconds", "Wall time of a whole pipeline run.", _SECONDS_BUCKETS
+))
+PIPELINE_RUNS = registry.register(Counter(
+    "qazzerep_pipeline_runs_total", "Pipeline runs by outcome."
+))
+DOCUMENTS = registry.register(Counter(
+    "qazzerep_documents_total", "Documents processed by compare-batch."
+))
+PAIRS = registry.register(Counter(
+    "qazzerep_pairs_total", "Compared pairs by kind (diffed or estimated by the MinHash prefilter)."
+))
+DOCUMENT_WORDS = registry.register(Histogram(
+    "qazzerep_document_words", "Filtered document size in words.",
+    (100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+))
+BATCH_DOCUMENTS = registry.register(Histogram(
+    "qazzerep_batch_documents", "Documents per compare-batch run.", (2, 5, 10, 25, 50, 100, 200, 500, 1000)
+))
+BATCH_PAIRS = registry.register(Histogram(
+    "qazzerep_batch_pairs", "Pairs per compare-batch run.", (1, 10, 50, 100, 500, 1000, 5000, 20000, 100000, 500000)
+))
+REPORT_REQUESTS = registry.register(Counter(
+    "qazzerep_report_requests_total", "Public report lookups by format and result."
+))
+EMBEDDING_BATCH_TOKENS = registry.register(Histogram(
+    "qazzerep_embedding_batch_tokens", "Padded tokens per embedding encode batch.",
+    (256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+))
+EMBEDDING_BATCH_SECONDS = registry.register(Histogram(
+    "qazzerep_embedding_batch_seconds", "Wall time of one embedding encode batch.", _SECONDS_BUCKETS
+))
+EMBEDDING_BATCH_RSS_GROWTH = registry.register(Histogram(
+    "qazzerep_embedding_batch_rss_growth_bytes", "Growth of current process RSS over one embedding encode batch.",
+    tuple(mb * 1024 ** 2 for mb in (1, 4, 16, 64, 256, 1024, 4096))
+))
+registry.register(GaugeCallback(
+    "qazzerep_process_rss_bytes", "Current resident set size of the process.",
+    lambda: {(): current_rss_bytes() or 0}
+))
+registry.register(GaugeCallback(
+    "qazzerep_process_peak_rss_bytes", "Peak resident set size of the process.",
+    lambda: {(): peak_rss_bytes()}
+))
+
+
+def peak_rss_bytes() -> int:
+    """Пиковый RSS процесса за все время работы (ru_maxrss: КБ в Linux, байты в macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Текущий RSS процесса из /proc/self/statm (второе поле - резидентные страницы); None вне Linux."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class Trace:
+    """Тайминги этапов одного запуска конвейера: пишутся в гистограммы и, по желанию, одной строкой в лог."""
+
+    def __init__(self, pipeline: str):
+        self.pipeline = pipeline
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        STAGE_SECONDS.observe(seconds, stage=stage)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def finish(self, outcome: str = "ok", **info):
+        total = time.perf_counter() - self.started
+        PIPELINE_SECONDS.observe(total, pipeline=self.pipeline)
+        PIPELINE_RUNS.inc(pipeline=self.pipeline, outcome=outcome)
+        if config.metrics_log_traces:
+            stages = " ".join(f"{name}={seconds:.3f}s" for name, seconds in self.stages.items())
+            details = " ".join(f"{key}={value}" for key, value in info.items())
+            logger.info("%s %s total=%.3fs %s %s", self.pipeline, outcome, total, stages, details)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Этап вне трассы конкретного запуска (например, прием файлов до старта конвейера)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage=stage)
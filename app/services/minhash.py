@@ -0,0 +1,81 @@
+import zlib
+from typing import List, Set, Tuple
+
+import numpy as np
+
+# Простое число чуть больше 2^32: (a * x + b) для 32-битных x, a, b помещается в uint64
+_MERSENNE_LIKE_PRIME = np.uint64((1 << 32) + 15)
+_CHUNK = 8192
+
+
+def shingle_hashes(text: str, k: int = 5) -> np.ndarray:
+    """Возвращает уникальные 32-битные хэши словесных k-шинглов текста."""
+    words = text.split()
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    if len(words) < k:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + k]) for i in range(len(words) - k + 1)]
+    # crc32 стабилен между процессами (в отличие от hash()), что важно для воркеров
+    hashes: Set[int] = {zlib.crc32(g.encode("utf-8")) for g in grams}
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+class MinHasher:
+    """Генератор MinHash-сигнатур с фиксированным набором хэш-перестановок."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        signature = np.full(self.num_perm, _MERSENNE_LIKE_PRIME, dtype=np.uint64)
+        # (num_perm, chunk) -> минимум по шинглам; чанки ограничивают память на длинных работах
+        for start in range(0, hashes.size, _CHUNK):
+            chunk = hashes[start:start + _CHUNK]
+            permuted = (np.outer(self.a, chunk) + self.b[:, None]) % _MERSENNE_LIKE_PRIME
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+
+def estimate_jaccard_matrix(signatures: np.ndarray) -> np.ndarray:
+    """Оценка Жаккара для всех пар документов (n x n) по матрице сигнатур."""
+    n = len(signatures)
+    matrix = np.eye(n, dtype=np.float32)
+    for i in range(n - 1):
+        row = (signatures[i + 1:] == signatures[i]).mean(axis=1)
+        matrix[i, i + 1:] = row
+        matrix[i + 1:, i] = row
+    return matrix
+
+
+def jaccard_to_ratio(jaccard: float) -> float:
+    """Переводит Жаккара в коэффициент Дайса, близкий по смыслу к SequenceMatcher.ratio()."""
+    if jaccard <= 0:
+        return 0.0
+    return 2 * jaccard / (1 + jaccard)
+
+
+def select_pairs_for_diff(
+    texts: List[str],
+    num_perm: int = 128,
+    shingle_size: int = 5,
+    threshold: float = 0.05,
+) -> Tuple[Set[Tuple[int, int]], np.ndarray]:
+    """Отбирает пары для полного диффа и возвращает матрицу оценок Жаккара для остальных.
+
+    Пары отбираются прямо по плотной матрице: сравнение сигнатур векторное и на порядки
+    дешевле диффа, а оценка Жаккара для всех пар нужна под оценочный балл.
+    """
+    hasher = MinHasher(num_perm=num_perm)
+    signatures = np.stack([hasher.signature(shingle_hashes(t, shingle_size)) for t in texts])
+    jaccard = estimate_jaccard_matrix(signatures)
+    rows, cols = np.nonzero(np.triu(jaccard >= threshold, k=1))
+    return set(zip(rows.tolist(), cols.tolist())), jaccard
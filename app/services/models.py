@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import config
+
+logger = logging.getLogger("uvicorn.error")
+
+# Имена ресурсов реестра
+SEMANTIC_MODEL = "labse"
+SPACY_MODEL = "spacy"
+AI_DETECTOR = "zippy"
+
+SEMANTIC_MODEL_NAME = 'sentence-transformers/LaBSE'
+
+# Бэкенды LaBSE на CPU: исходный torch, динамическое int8-квантование линейных слоев, ONNX Runtime
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx")
+
+
+def semantic_cache_name(backend: str = None) -> str:
+    """Имя модели для ключей кэша эмбеддингов: векторы разных бэкендов не смешиваются."""
+    backend = backend or config.embedding_backend
+    return SEMANTIC_MODEL_NAME if backend == "torch" else f"{SEMANTIC_MODEL_NAME}#{backend}"
+
+
+def load_semantic_model(backend: str):
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend: {backend}")
+    # Импорт torch/sentence-transformers сам по себе занимает секунды - только по требованию
+    from sentence_transformers import SentenceTransformer
+    if backend == "onnx":
+        # Нужны optimum и onnxruntime; file_name выбирает, например, квантованный model_qint8_*.onnx
+        model_kwargs = {"file_name": config.embedding_onnx_file} if config.embedding_onnx_file else {}
+        return SentenceTransformer(SEMANTIC_MODEL_NAME, backend="onnx", model_kwargs=model_kwargs)
+    # При первом запуске скачается около 1.8 ГБ весов модели
+    model = SentenceTransformer(SEMANTIC_MODEL_NAME)
+    if backend == "torch-int8":
+        import torch
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+def _load_labse():
+    return load_semantic_model(config.embedding_backend)
+
+
+def _load_spacy():
+    try:
+        import spacy  # type: ignore
+    except ImportError:
+        return None
+    # Пытаемся загрузить казахскую или мульти-языковую модель, если она установлена
+    for model_name in ["kk_core_news_sm", "kk_core_news_md", "xx_sent_ud_sm"]:
+        try:
+            return spacy.load(model_name)
+        except Exception:
+            continue
+    return None
+
+
+def _load_zippy():
+    import zippy
+    return zippy.Zippy(zippy.CompressionEngine.BROTLI)
+
+
+class ModelRegistry:
+    """Реестр тяжелых NLP-ресурсов: каждый грузится один раз на процесс, при первом обращении."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Any] = {}
+        self._info: Dict[str, Dict] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        self._loaders[name] = loader
+        self._locks[name] = threading.Lock()
+        self._info[name] = {"loaded": False, "available": None, "load_seconds": None, "error": None}
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._values
+
+    def get(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        with self._locks[name]:
+            if name not in self._values:
+                started = time.perf_counter()
+                try:
+                    self._values[name] = self._loaders[name]()
+                except Exception as e:
+                    self._info[name]["error"] = str(e)
+                    raise
+                elapsed = round(time.perf_counter() - started, 2)
+                self._info[name].update({
+                    "loaded": True,
+                    "available": self._values[name] is not None,
+                    "load_seconds": elapsed,
+                    "error": None
+                })
+                logger.info("Model '%s' loaded in %.2fs", name, elapsed)
+        return self._values[name]
+
+    async def aget(self, name: str) -> Any:
+        """Как get(), но загрузка идет в потоке, не блокируя event loop."""
+        if name in self._values:
+            return self._values[name]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get, name)
+
+    async def warm_up(self, names: List[str]):
+        for name in names:
+            try:
+                await self.aget(name)
+            except Exception as e:
+                logger.warning("Warm-up of '%s' failed: %s", name, e)
+
+    def status(self) -> Dict[str, Dict]:
+        return {name: dict(info) for name, info in self._info.items()}
+
+
+model_registry = ModelRegistry()
+model_registry.register(SEMANTIC_MODEL, _load_labse)
+model_registry.register(SPACY_MODEL, _load_spacy)
+model_registry.register(AI_DETECTOR, _load_zippy)
@@ -0,0 +1,165 @@
+import hashlib
+import re
+from typing import Dict, List, Optional
+
+import fitz
+
+import config
+from app.services.filestore import DiskStore
+from app.services.lru import LRUCache
+
+# Меняется при изменении верстки - закэшированные PDF перестают совпадать по версии
+PDF_LAYOUT_VERSION = 2
+
+PAGE_WIDTH, PAGE_HEIGHT = fitz.paper_size("a4")
+MARGIN = 40
+FONT_SIZE = 10
+LINE_HEIGHT = FONT_SIZE * 1.4
+# Окно поиска фрагмента на страницах оригинала, в словах
+SEARCH_WINDOW_WORDS = 6
+
+_WHITESPACE = re.compile(r'\s+')
+_font = None
+
+
+def _get_font() -> fitz.Font:
+    # Встроенный "cjk" содержит кириллицу (включая казахские буквы), в отличие от helv
+    global _font
+    if _font is None:
+        _font = fitz.Font("cjk")
+    return _font
+
+
+def report_version(report: Dict, mode: str, side: str) -> str:
+    """Версия содержимого отчета: ключ кэша PDF и ETag ответа."""
+    digest = hashlib.sha1(f"{PDF_LAYOUT_VERSION}|{mode}|{side}|{report.get('report_id')}".encode("utf-8"))
+    for key in ("originality", "semantic_dna", "lexical_match"):
+        digest.update(f"|{report.get(key)}".encode("utf-8"))
+    for doc_key in ("docA", "docB"):
+        doc = report.get(doc_key, {})
+        digest.update(f"|{doc.get('name')}|{doc.get('text_hash')}|{doc.get('file_hash')}".encode("utf-8"))
+        content = doc.get("spans") or doc.get("html", "").encode("utf-8")
+        digest.update(bytes(content))
+    return digest.hexdigest()
+
+
+def _wrap(text: str, width: float) -> List[str]:
+    font = _get_font()
+    lines: List[str] = []
+    current = ""
+    for word in text.split(" "):
+        candidate = f"{current} {word}" if current else word
+        if font.text_length(candidate, fontsize=FONT_SIZE) <= width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        # Слово длиннее строки режем посимвольно
+        while font.text_length(word, fontsize=FONT_SIZE) > width and len(word) > 1:
+            cut = len(word)
+            while cut > 1 and font.text_length(word[:cut], fontsize=FONT_SIZE) > width:
+                cut -= 1
+            lines.append(word[:cut])
+            word = word[cut:]
+        current = word
+    lines.append(current)
+    return lines
+
+
+def build_report_pdf(report: Dict, matches_a: List[str], matches_b: List[str]) -> bytes:
+    """Отчет с найденными фрагментами; текст переносится по строкам и страницам без обрезки."""
+    doc_a, doc_b = report.get("docA", {}), report.get("docB", {})
+    paragraphs = [
+        f"Report ID: {report.get('report_id', '')}",
+        f"Originality: {report.get('originality', 0)}%",
+        f"Semantic: {report.get('semantic_dna', 0)}%   Lexical: {report.get('lexical_match', 0)}%",
+        "",
+    ]
+    for title, doc, matches in (("A", doc_a, matches_a), ("B", doc_b, matches_b)):
+        paragraphs.append(f"Document {title} ({doc.get('name', '')}) matched fragments:")
+        if matches:
+            paragraphs.extend(f"  [{idx}] {frag}" for idx, frag in enumerate(matches, 1))
+        else:
+            paragraphs.append("  (no highlighted overlaps)")
+        paragraphs.append("")
+
+    width = PAGE_WIDTH - 2 * MARGIN
+    lines = [line for paragraph in paragraphs for line in _wrap(paragraph, width)]
+    per_page = int((PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT)
+
+    pdf = fitz.open()
+    font = _get_font()
+    for start in range(0, len(lines), per_page):
+        page = pdf.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        writer = fitz.TextWriter(page.rect)
+        for offset, line in enumerate(lines[start:start + per_page]):
+            if line:
+                writer.append((MARGIN, MARGIN + FONT_SIZE + offset * LINE_HEIGHT), line, font=font, fontsize=FONT_SIZE)
+        writer.write_text(page)
+        page.insert_text(
+            (PAGE_WIDTH - MARGIN - 40, PAGE_HEIGHT - MARGIN / 2),
+            f"{start // per_page + 1}/{(len(lines) - 1) // per_page + 1}", fontsize=8
+        )
+    # Встраиваем только использованные глифы: полный "cjk" весит несколько мегабайт
+    pdf.subset_fonts()
+    data = pdf.tobytes(garbage=3, deflate=True)
+    pdf.close()
+    return data
+
+
+def _search_windows(fragment: str) -> List[str]:
+    words = fragment.split()
+    return [
+        " ".join(words[start:start + SEARCH_WINDOW_WORDS])
+        for start in range(0, max(len(words) - SEARCH_WINDOW_WORDS, 0) + 1, SEARCH_WINDOW_WORDS)
+    ]
+
+
+def highlight_original(path: str, fragments: List[str], min_words: int = 3) -> bytes:
+    """Подсвечивает совпавшие фрагменты прямо на страницах исходного PDF.
+
+    Фрагменты берутся из отфильтрованного текста, поэтому ищутся окнами по
+    SEARCH_WINDOW_WORDS слов; окна, не найденные дословно (после лемматизации
+    или удаления цитат), просто пропускаются.
+    """
+    windows = [window for fragment in fragments if len(fragment.split()) >= min_words
+               for window in _search_windows(fragment)]
+    with fitz.open(path) as pdf:
+        # Дешевая проверка по тексту страницы, прежде чем звать search_for
+        page_texts = [_WHITESPACE.sub(" ", page.get_text()).lower() for page in pdf]
+        for window in dict.fromkeys(windows):
+            needle = window.lower()
+            for page_no, page_text in enumerate(page_texts):
+                if needle not in page_text:
+                    continue
+                page = pdf[page_no]
+                for quad in page.search_for(window, quads=True):
+                    page.add_highlight_annot(quad)
+        return pdf.tobytes(garbage=3, deflate=True)
+
+
+class ReportPdfCache:
+    """Готовые PDF отчетов: LRU в памяти на несколько штук + файлы на диске с лимитом по байтам."""
+
+    def __init__(self, memory_entries: int, directory: Optional[str], max_bytes: int):
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskStore(directory, max_bytes, ".pdf")
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self.memory.get(key)
+        if data is None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        self.memory.put(key, data)
+        self.disk.put_bytes(key, data)
+
+
+pdf_cache = ReportPdfCache(
+    memory_entries=config.report_pdf_cache_entries,
+    directory=config.report_pdf_cache_dir,
+    max_bytes=config.report_pdf_cache_bytes,
+)
@@ -0,0 +1,64 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from app.services.embeddings import embedding_cache
+
+
+def chunk_text(text: str, chunk_words: int = 150, overlap: int = 30) -> List[str]:
+    """Режет текст на перекрывающиеся окна слов, чтобы модель видела весь документ, а не первую страницу."""
+    words = text.split()
+    if len(words) <= chunk_words:
+        return [" ".join(words)]
+    step = max(chunk_words - overlap, 1)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start:start + chunk_words]))
+        if start + chunk_words >= len(words):
+            break
+    return chunks
+
+
+def encode_chunked(
+    model,
+    model_name: str,
+    texts: List[str],
+    chunk_words: int = 150,
+    overlap: int = 30,
+    batch_size: int = 32,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Кодирует чанки всех документов; возвращает L2-нормированные векторы и смещения документов."""
+    chunks: List[str] = []
+    offsets = []
+    for text in texts:
+        offsets.append(len(chunks))
+        chunks.extend(chunk_text(text, chunk_words, overlap))
+    embeddings = embedding_cache.encode(model, model_name, chunks, batch_size=batch_size)
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms, np.asarray(offsets, dtype=np.int64)
+
+
+def similarity_matrix(embeddings: np.ndarray, offsets: np.ndarray, block_bytes: int = 64 * 1024 ** 2) -> np.ndarray:
+    """Матрица семантической близости документов (n x n) по чанкам.
+
+    Для каждого чанка документа A берется лучший косинус среди чанков документа B,
+    затем максимумы усредняются по A; итог симметризуется. Косинусы считаются одним
+    матричным умножением на блок строк, без попарных циклов в Python; число строк
+    блока подбирается так, чтобы матрица косинусов блока укладывалась в block_bytes.
+    """
+    n_docs = len(offsets)
+    total = len(embeddings)
+    block_rows = max(1, block_bytes // (embeddings.dtype.itemsize * max(total, 1)))
+    # best[c, d] - максимальный косинус чанка c с чанками документа d
+    best = np.empty((total, n_docs), dtype=np.float32)
+    for start in range(0, total, block_rows):
+        sims = embeddings[start:start + block_rows] @ embeddings.T
+        best[start:start + block_rows] = np.maximum.reduceat(sims, offsets, axis=1)
+
+    counts = np.diff(np.append(offsets, total)).astype(np.float32)
+    directed = np.add.reduceat(best, offsets, axis=0) / counts[:, None]
+    matrix = (directed + directed.T) / 2
+    np.fill_diagonal(matrix, 1.0)
+    return np.clip(matrix, 0.0, 1.0)
@@ -0,0 +1,30 @@
+import asyncio
+from typing import Dict, List
+
+
+class BulkWriter:
+    """Буфер вставок: документы уходят пачками insert_many(ordered=False) в фоновых задачах,
+    так что запись в MongoDB идет параллельно с оставшимися вычислениями.
+    """
+
+    def __init__(self, collection, chunk_size: int):
+        self.collection = collection
+        self.chunk_size = max(chunk_size, 1)
+        self._buffer: List[Dict] = []
+        self._pending: List[asyncio.Task] = []
+
+    def add(self, document: Dict):
+        self._buffer.append(document)
+        if len(self._buffer) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._pending.append(asyncio.create_task(self.collection.insert_many(batch, ordered=False)))
+
+    async def close(self):
+        """Дописывает остаток буфера и дожидается всех вставок (ошибки пробрасываются)."""
+        self._flush()
+        pending, self._pending = self._pending, []
+        await asyncio.gather(*pending)
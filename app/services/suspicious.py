@@ -0,0 +1,89 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+def estimate_similarity_matrix(semantic: np.ndarray, jaccard: np.ndarray,
+                               lexical_weight: float, semantic_weight: float) -> np.ndarray:
+    """Оценка итогового балла всех пар (в %) до диффа: лексика - Дайс по MinHash-оценке Жаккара."""
+    lexical = 2 * jaccard / (1 + jaccard)
+    scores = (lexical * lexical_weight + semantic * semantic_weight) * 100
+    return np.clip(scores, 0, 100).astype(np.float32)
+
+
+def _top_k_mask(masked: np.ndarray, top_k: int) -> np.ndarray:
+    """in_top[i, j] - документ j входит в top_k соседей документа i."""
+    n = len(masked)
+    k = min(top_k, n - 1)
+    nearest = np.argpartition(-masked, k - 1, axis=1)[:, :k]
+    in_top = np.zeros((n, n), dtype=bool)
+    np.put_along_axis(in_top, nearest, True, axis=1)
+    return in_top
+
+
+def _masked_scores(scores: np.ndarray) -> np.ndarray:
+    masked = scores.astype(np.float32, copy=True)
+    np.fill_diagonal(masked, -np.inf)
+    return masked
+
+
+def select_suspicious_pairs(scores: np.ndarray, threshold: Optional[float],
+                            top_k: Optional[int]) -> Set[Tuple[int, int]]:
+    """Пары (i < j) с оценкой не ниже threshold и/или входящие в top_k соседей хотя бы одного из документов."""
+    n = len(scores)
+    if n < 2:
+        return set()
+    masked = _masked_scores(scores)
+    keep = np.ones((n, n), dtype=bool)
+    if top_k:
+        in_top = _top_k_mask(masked, top_k)
+        keep &= in_top | in_top.T
+    if threshold is not None:
+        keep &= masked >= threshold
+    rows, cols = np.nonzero(np.triu(keep, k=1))
+    return set(zip(rows.tolist(), cols.tolist()))
+
+
+def mutual_top_k_pairs(scores: np.ndarray, top_k: int) -> Set[Tuple[int, int]]:
+    """Пары (i < j), где каждый документ входит в top_k соседей другого.
+
+    Ребра кластеров без threshold: у каждого документа есть top_k соседей, и связность по
+    всем выбранным парам склеила бы весь пакет; взаимные соседи - только плотные группы.
+    """
+    n = len(scores)
+    if n < 2 or not top_k:
+        return set()
+    in_top = _top_k_mask(_masked_scores(scores), top_k)
+    rows, cols = np.nonzero(np.triu(in_top & in_top.T, k=1))
+    return set(zip(rows.tolist(), cols.tolist()))
+
+
+def collusion_clusters(n_docs: int, edges: List[Tuple[int, int, float]]) -> List[Dict]:
+    """Компоненты связности графа подозрительных пар (union-find), от крупных к мелким."""
+    parent = list(range(n_docs))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j, _ in edges:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, Dict] = {}
+    for i, j, score in edges:
+        cluster = clusters.setdefault(find(i), {"documents": set(), "pairs": 0, "max_similarity": 0.0})
+        cluster["documents"].update((i, j))
+        cluster["pairs"] += 1
+        cluster["max_similarity"] = max(cluster["max_similarity"], score)
+    result = [{**cluster, "documents": sorted(cluster["documents"])} for cluster in clusters.values()]
+    return sorted(result, key=lambda c: (-len(c["documents"]), -c["max_similarity"]))
+
+
+def upper_triangle(matrix: np.ndarray, decimals: int = 1) -> List[float]:
+    """Компактная матрица: верхний треугольник без диагонали построчно - пары (0,1), (0,2), ..., (1,2), ..."""
+    rows, cols = np.triu_indices(len(matrix), k=1)
+    return np.round(matrix[rows, cols].astype(np.float64), decimals).tolist()
@@ -0,0 +1,95 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from fastapi import Depends, Request
+
+import config
+from app.database.db import users
+from app.services.auth import jwt_auth_handler
+from app.services.metrics import registry, GaugeCallback
+
+# Поля профиля, которые читают горячие пути: /auth/me и настройки фильтров
+PROFILE_FIELDS = {"_id": 0, "email": 1, "display_name": 1, "avatar_id": 1, "settings": 1}
+
+
+class UserProfileCache:
+    """Профили пользователей в памяти процесса на ttl секунд, LRU по числу записей.
+
+    Изменяющие эндпоинты вызывают invalidate; в других воркерах uvicorn запись
+    устаревает не дольше чем через ttl.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Растет при каждой инвалидации: чтение, начатое до нее, не попадет в кэш
+        self._generation = 0
+        self.counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, email: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry[0] < time.monotonic():
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(email)
+            self.counters["hits"] += 1
+            return entry[1]
+
+    def put(self, email: str, profile: Dict, generation: int):
+        with self._lock:
+            if generation != self._generation or self.ttl <= 0:
+                return
+            self._entries[email] = (time.monotonic() + self.ttl, profile)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: str):
+        with self._lock:
+            self._entries.pop(email, None)
+            self._generation += 1
+            self.counters["invalidations"] += 1
+
+    def stats(self) -> Dict:
+        return {**self.counters, "entries": len(self._entries)}
+
+
+profile_cache = UserProfileCache(config.user_cache_entries, config.user_cache_ttl_seconds)
+
+
+async def load_profile(email: str) -> Optional[Dict]:
+    """Профиль пользователя (PROFILE_FIELDS) из кэша или MongoDB; возвращается копия, ее можно менять."""
+    profile = profile_cache.get(email)
+    if profile is None:
+        generation = profile_cache.generation()
+        profile = await users.find_one({"email": email}, PROFILE_FIELDS)
+        if profile is None:
+            return None
+        profile_cache.put(email, profile, generation)
+    return copy.deepcopy(profile)
+
+
+def invalidate_profile(email: str):
+    profile_cache.invalidate(email)
+
+
+async def current_user(request: Request, user_data=Depends(jwt_auth_handler)) -> Optional[Dict]:
+    """Зависимость FastAPI: профиль текущего пользователя, один раз за запрос."""
+    if not hasattr(request.state, "user_profile"):
+        request.state.user_profile = await load_profile(user_data["sub"])
+    return request.state.user_profile
+
+
+registry.register(GaugeCallback(
+    "qazzerep_user_cache", "User profile cache counters.",
+    lambda: {(("field", key),): value for key, value in profile_cache.stats().items()}
+))
@@ -0,0 +1,39 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Sequence
+
+import config
+
+_executor = None
+
+
+def get_executor() -> Executor:
+    """Пул для CPU-этапов: потоки (по умолчанию) или процессы, чтобы обойти GIL."""
+    global _executor
+    if _executor is None:
+        if config.cpu_executor == "process":
+            _executor = ProcessPoolExecutor(
+                max_workers=config.cpu_workers,
+                mp_context=multiprocessing.get_context(config.cpu_mp_context),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=config.cpu_workers)
+    return _executor
+
+
+async def run_cpu_task(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), func, *args)
+
+
+def chunked(items: Sequence, size: int) -> List[Sequence]:
+    size = max(size, 1)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+async def map_in_batches(func: Callable, items: Sequence, batch_size: int, *args) -> List:
+    """Запускает func(batch, *args) -> list по пачкам параллельно и склеивает ответы по порядку."""
+    batches = chunked(items, batch_size)
+    results = await asyncio.gather(*(run_cpu_task(func, batch, *args) for batch in batches))
+    return [item for batch in results for item in batch]
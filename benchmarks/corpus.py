@@ -0,0 +1,140 @@
+"""Генератор синтетического корпуса (RU/KK/EN) с контролируемыми заимствованиями."""
+import json
+import os
+import random
+import zipfile
+from typing import Dict, List, Tuple
+
+import fitz
+from docx import Document
+
+VOCABULARY = {
+    "ru": (
+        "исследование анализ данные система метод результат процесс развитие модель работа "
+        "значение условие структура показатель задача решение подход влияние оценка часть "
+        "образование студент университет экономика управление государство общество история "
+        "технология информация проект основной важный новый современный научный социальный "
+        "рассматривать определять позволять являться использовать представлять обеспечивать "
+        "также однако поэтому например именно кроме следовательно является было будет"
+    ).split(),
+    "kk": (
+        "зерттеу талдау деректер жүйе әдіс нәтиже үдеріс даму модель жұмыс мағына шарт "
+        "құрылым көрсеткіш міндет шешім тәсіл әсер бағалау бөлім білім студент университет "
+        "экономика басқару мемлекет қоғам тарих технология ақпарат жоба негізгі маңызды жаңа "
+        "заманауи ғылыми әлеуметтік қарастыру анықтау мүмкіндік болып пайдалану ұсыну "
+        "қамтамасыз сонымен қатар алайда сондықтан мысалы атап айтқанда сонда болды болады"
+    ).split(),
+    "en": (
+        "research analysis data system method result process development model work value "
+        "condition structure indicator task solution approach impact assessment part education "
+        "student university economy management state society history technology information "
+        "project main important new modern scientific social consider determine allow become "
+        "use represent provide also however therefore example namely besides thus was will be"
+    ).split(),
+}
+
+FORMATS = ("txt", "docx", "pdf")
+_PDF_WORDS_PER_PAGE = 300
+
+
+def _sentence(rng: random.Random, language: str) -> str:
+    words = [rng.choice(VOCABULARY[language]) for _ in range(rng.randint(8, 16))]
+    # Редкие "термины" делают тексты различимыми, а не только перестановками словаря
+    words.insert(rng.randrange(len(words)), f"{language}{rng.randint(0, 5000)}")
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, language: str, sentences: int) -> List[str]:
+    # Примерно каждое пятое предложение - на другом языке, как в реальных двуязычных работах
+    other = [lang for lang in VOCABULARY if lang != language]
+    return [
+        _sentence(rng, language if rng.random() > 0.2 else rng.choice(other))
+        for _ in range(sentences)
+    ]
+
+
+def _write_txt(path: str, sentences: List[str]):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(sentences))
+
+
+def _write_docx(path: str, sentences: List[str]):
+    doc = Document()
+    for start in range(0, len(sentences), 5):
+        doc.add_paragraph(" ".join(sentences[start:start + 5]))
+    doc.save(path)
+
+
+def _write_pdf(path: str, sentences: List[str]):
+    # Встроенный шрифт "cjk" содержит кириллицу, включая казахские буквы
+    font = fitz.Font("cjk")
+    doc = fitz.open()
+    words = " ".join(sentences).split()
+    for start in range(0, len(words), _PDF_WORDS_PER_PAGE):
+        page = doc.new_page()
+        writer = fitz.TextWriter(page.rect)
+        writer.fill_textbox(
+            page.rect + (50, 50, -50, -50), " ".join(words[start:start + _PDF_WORDS_PER_PAGE]),
+            font=font, fontsize=9
+        )
+        writer.write_text(page)
+    doc.save(path)
+    doc.close()
+
+
+_WRITERS = {"txt": _write_txt, "docx": _write_docx, "pdf": _write_pdf}
+
+
+def generate_corpus(
+    out_dir: str,
+    n_docs: int,
+    sentences_per_doc: int = 120,
+    overlap: float = 0.3,
+    copy_share: float = 0.4,
+    zip_share: float = 0.2,
+    seed: int = 42,
+) -> Tuple[List[Tuple[str, str]], Dict]:
+    """Создает n_docs документов в out_dir и возвращает загрузки (имя, путь) и манифест.
+
+    Доля copy_share документов копирует overlap своих предложений из одного из
+    "источников" (подряд идущим блоком); zip_share документов упаковывается в один ZIP.
+    Манифест хранит язык, формат и источник каждого документа - ожидаемые пары.
+    """
+    rng = random.Random(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    languages = list(VOCABULARY)
+    n_sources = max(2, n_docs // 5)
+    sources = [_paragraphs(rng, languages[idx % len(languages)], sentences_per_doc) for idx in range(n_sources)]
+
+    manifest = {"seed": seed, "overlap": overlap, "documents": []}
+    files = []
+    for idx in range(n_docs):
+        language = languages[idx % len(languages)]
+        sentences = _paragraphs(rng, language, sentences_per_doc)
+        source = None
+        if rng.random() < copy_share:
+            source = rng.randrange(n_sources)
+            block = int(sentences_per_doc * overlap)
+            start = rng.randrange(sentences_per_doc - block + 1)
+            sentences[start:start + block] = sources[source][start:start + block]
+
+        fmt = FORMATS[idx % len(FORMATS)]
+        name = f"doc{idx:04d}_{language}.{fmt}"
+        path = os.path.join(out_dir, name)
+        _WRITERS[fmt](path, sentences)
+        files.append((name, path))
+        manifest["documents"].append({"name": name, "language": language, "format": fmt, "source": source})
+
+    # Часть документов уходит в архив, как при загрузке работ всей группы одним файлом
+    zipped = files[:int(n_docs * zip_share)]
+    uploads = files[len(zipped):]
+    if zipped:
+        archive_path = os.path.join(out_dir, "group.zip")
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, path in zipped:
+                archive.write(path, name)
+        uploads.insert(0, ("group.zip", archive_path))
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return uploads, manifest
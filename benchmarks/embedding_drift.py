@@ -0,0 +1,143 @@
+"""Дрейф оценок и пропускная способность бэкенда эмбеддингов относительно эталона.
+
+    python -m benchmarks.embedding_drift --backend torch-int8
+    python -m benchmarks.embedding_drift --backend onnx --storage-dtype int8 --docs 20
+
+Сравниваются косинусы векторов эталона и кандидата и итоговая матрица
+семантической близости документов (в процентных пунктах, как в отчетах).
+Отдельно считается дрейф от формата хранения в кэше (float16/int8).
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+import numpy as np
+
+import config
+
+# Дрейф меряется на свежих векторах: дисковый кэш не читаем и не засоряем
+config.embedding_cache_dir = None
+
+from app.services.embeddings import pack_vector, unpack_vector, STORAGE_DTYPES  # noqa: E402
+from app.services.ingest import extract_uploads  # noqa: E402
+from app.services.models import load_semantic_model, EMBEDDING_BACKENDS  # noqa: E402
+from app.services.semantic import chunk_text, similarity_matrix  # noqa: E402
+from benchmarks.corpus import generate_corpus  # noqa: E402
+from benchmarks.stubs import StubEmbeddingModel  # noqa: E402
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def encode_timed(model, chunks: List[str], batch_size: int):
+    started = time.perf_counter()
+    vectors = np.asarray(model.encode(chunks, batch_size=batch_size), dtype=np.float32)
+    return vectors, time.perf_counter() - started
+
+
+def _drift_stats(reference: np.ndarray, candidate: np.ndarray, offsets: np.ndarray) -> Dict:
+    """Косинус векторов эталон/кандидат и разница матриц близости документов в п.п."""
+    cosines = np.sum(_normalize(reference) * _normalize(candidate), axis=1)
+    scores_ref = similarity_matrix(_normalize(reference), offsets)
+    scores_new = similarity_matrix(_normalize(candidate), offsets)
+    upper = np.triu_indices(len(offsets), k=1)
+    delta = np.abs(scores_ref[upper] - scores_new[upper]) * 100
+    if not len(delta):
+        delta = np.zeros(1)
+    return {
+        "vector_cosine_mean": round(float(cosines.mean()), 6),
+        "vector_cosine_min": round(float(cosines.min()), 6),
+        "score_drift_mean_pp": round(float(delta.mean()), 4),
+        "score_drift_p95_pp": round(float(np.percentile(delta, 95)), 4),
+        "score_drift_max_pp": round(float(delta.max()), 4),
+    }
+
+
+async def load_chunks(n_docs: int, sentences: int, seed: int):
+    with tempfile.TemporaryDirectory(prefix="drift-") as corpus_dir:
+        uploads, _ = generate_corpus(corpus_dir, n_docs, sentences, 0.3, seed=seed)
+        docs = await extract_uploads(uploads, use_cache=False)
+    chunks: List[str] = []
+    offsets = []
+    for doc in docs:
+        offsets.append(len(chunks))
+        chunks.extend(chunk_text(doc["text"], config.semantic_chunk_words, config.semantic_chunk_overlap))
+    return chunks, np.asarray(offsets, dtype=np.int64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", default=config.embedding_backend, choices=EMBEDDING_BACKENDS)
+    parser.add_argument("--reference", default="torch", choices=EMBEDDING_BACKENDS)
+    parser.add_argument("--storage-dtype", default=config.embedding_storage_dtype, choices=STORAGE_DTYPES)
+    parser.add_argument("--docs", type=int, default=10)
+    parser.add_argument("--sentences", type=int, default=120, help="предложений в документе")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--offline", action="store_true", help="заглушка вместо LaBSE (проверка только хранения)")
+    parser.add_argument("--output", help="путь к JSON с результатами")
+    args = parser.parse_args()
+
+    chunks, offsets = asyncio.run(load_chunks(args.docs, args.sentences, args.seed))
+    batch_size = config.semantic_batch_size
+
+    if args.offline:
+        reference_model = candidate_model = StubEmbeddingModel()
+    else:
+        reference_model = load_semantic_model(args.reference)
+        candidate_model = load_semantic_model(args.backend)
+    # Прогрев: первый вызов включает ленивую инициализацию графа/сессии
+    reference_model.encode(chunks[:batch_size], batch_size=batch_size)
+    candidate_model.encode(chunks[:batch_size], batch_size=batch_size)
+    reference, reference_seconds = encode_timed(reference_model, chunks, batch_size)
+    candidate, candidate_seconds = encode_timed(candidate_model, chunks, batch_size)
+
+    stored = np.stack([unpack_vector(pack_vector(vector, args.storage_dtype)) for vector in candidate])
+    packed_bytes = pack_vector(candidate[0], args.storage_dtype).nbytes
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "args": vars(args),
+            "documents": len(offsets),
+            "chunks": len(chunks),
+            "dimensions": int(candidate.shape[1]),
+        },
+        "throughput": {
+            "reference_chunks_per_s": round(len(chunks) / reference_seconds, 2),
+            "candidate_chunks_per_s": round(len(chunks) / candidate_seconds, 2),
+            "speedup": round(reference_seconds / candidate_seconds, 3),
+        },
+        "backend_drift": _drift_stats(reference, candidate, offsets),
+        "storage_drift": _drift_stats(candidate, stored, offsets),
+        "storage": {
+            "bytes_per_vector": packed_bytes,
+            "float32_bytes_per_vector": int(candidate.shape[1]) * 4,
+        },
+    }
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"drift-{datetime.datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{args.reference} -> {args.backend}: x{report['throughput']['speedup']} speed")
+    for section in ("backend_drift", "storage_drift"):
+        stats = report[section]
+        print(f"  {section:<14} cosine {stats['vector_cosine_mean']:.6f}  "
+              f"score drift mean {stats['score_drift_mean_pp']:.3f} p95 {stats['score_drift_p95_pp']:.3f} "
+              f"max {stats['score_drift_max_pp']:.3f} pp")
+    print(f"  storage        {packed_bytes} B/vector ({args.storage_dtype})")
+    print(f"\nSaved: {output}")
+
+
+if __name__ == "__main__":
+    main()
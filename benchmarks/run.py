@@ -0,0 +1,242 @@
+"""Бенчмарк конвейера сравнения по этапам на синтетическом корпусе.
+
+    python -m benchmarks.run --scales 10 50 200 --offline
+    python -m benchmarks.run --scales 50 --compare benchmarks/results/old.json
+
+Результаты пишутся в JSON (по умолчанию benchmarks/results/bench-<время>.json).
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Dict, List
+
+import config
+
+# Бенчмарк не должен ни читать, ни засорять дисковый кэш эмбеддингов
+config.embedding_cache_dir = None
+
+from app.services import ai_detect  # noqa: E402
+from app.services.filters import filter_texts  # noqa: E402
+from app.services.ingest import extract_uploads  # noqa: E402
+from app.services.lexical import diff_pairs, render_runs  # noqa: E402
+from app.services.lru import LRUCache  # noqa: E402
+from app.services.metrics import peak_rss_bytes  # noqa: E402
+from app.services.minhash import select_pairs_for_diff  # noqa: E402
+from app.services.models import model_registry, SEMANTIC_MODEL  # noqa: E402
+from app.services.semantic import encode_chunked, similarity_matrix  # noqa: E402
+from app.services.workers import run_cpu_task, map_in_batches, chunked  # noqa: E402
+from benchmarks.corpus import generate_corpus  # noqa: E402
+from benchmarks.stubs import install_stubs  # noqa: E402
+
+BENCH_RULES = ["gost", "apa", "tables", "quotes"]
+BENCH_EMAIL = "benchmark@localhost"
+
+CONFIG_KEYS = (
+    "cpu_executor", "cpu_workers", "cpu_batch_size", "diff_chunk_size", "lexical_engine",
+    "minhash_enabled", "minhash_min_docs", "minhash_num_perm", "minhash_threshold",
+    "semantic_chunk_words", "semantic_chunk_overlap", "semantic_batch_size", "embedding_token_budget",
+)
+
+
+async def run_stages(uploads, engine: str) -> Dict:
+    """Один прогон всех этапов без MongoDB; кэши текстов, эмбеддингов и AI не используются."""
+    timings: Dict[str, float] = {}
+
+    def lap(stage: str, started: float):
+        timings[stage] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    raw_docs = await extract_uploads(uploads, use_cache=False)
+    lap("extract", started)
+
+    started = time.perf_counter()
+    texts = await map_in_batches(filter_texts, [doc["text"] for doc in raw_docs], config.cpu_batch_size, BENCH_RULES, "")
+    texts = [text for text in texts if text]
+    lap("filter", started)
+
+    started = time.perf_counter()
+    model = await model_registry.aget(SEMANTIC_MODEL)
+    # Уникальное имя модели - ключи кэша эмбеддингов не совпадают между прогонами
+    embeddings, offsets = encode_chunked(
+        model, f"benchmark/{uuid.uuid4().hex}", texts,
+        config.semantic_chunk_words, config.semantic_chunk_overlap, config.semantic_batch_size
+    )
+    similarity_matrix(embeddings, offsets)
+    lap("semantic", started)
+
+    started = time.perf_counter()
+    ai_detect.ai_cache = LRUCache(config.ai_cache_entries)
+    await ai_detect.check_ai_batch(texts)
+    lap("ai", started)
+
+    started = time.perf_counter()
+    all_pairs = [(i, j) for i in range(len(texts)) for j in range(i + 1, len(texts))]
+    selected = set(all_pairs)
+    if config.minhash_enabled and len(texts) >= config.minhash_min_docs:
+        selected, _ = await run_cpu_task(
+            select_pairs_for_diff, texts, config.minhash_num_perm,
+            config.minhash_shingle_size, config.minhash_threshold
+        )
+    lap("minhash", started)
+
+    started = time.perf_counter()
+    chunks = chunked(sorted(selected), config.diff_chunk_size)
+    results = await asyncio.gather(*(
+        run_cpu_task(diff_pairs, {idx: texts[idx] for pair in chunk for idx in pair}, chunk, engine)
+        for chunk in chunks
+    ))
+    lap("diff", started)
+
+    started = time.perf_counter()
+    words = [text.split() for text in texts]
+    for chunk, diffs in zip(chunks, results):
+        for (i, j), diff in zip(chunk, diffs):
+            render_runs(words[i], diff["runsA"])
+            render_runs(words[j], diff["runsB"])
+    lap("render", started)
+
+    timings["total"] = sum(timings.values())
+    return {"timings": timings, "documents": len(texts), "pairs": len(all_pairs), "diffed_pairs": len(selected)}
+
+
+async def run_batch(uploads, engine: str) -> Dict:
+    """Полный compare_batch_events (нужна MongoDB); записи бенчмарка после прогона удаляются."""
+    from app.database.db import history, reports, corpus
+    from app.routers.handlers.text import compare_batch_events
+
+    report_ids: List[str] = []
+    first_pair = None
+    started = time.perf_counter()
+    async for event in compare_batch_events(uploads, engine, BENCH_EMAIL, {}, BENCH_RULES, "", "spans"):
+        if event["type"] == "error":
+            raise RuntimeError(event["error"])
+        if event["type"] == "pair":
+            first_pair = first_pair or time.perf_counter() - started
+            report_ids.append(event["result"]["report_id"])
+    elapsed = time.perf_counter() - started
+
+    await reports.delete_many({"report_id": {"$in": report_ids}})
+    await history.delete_many({"email": BENCH_EMAIL})
+    await corpus.delete_many({"email": BENCH_EMAIL})
+    return {"batch": elapsed, "first_pair": first_pair or elapsed}
+
+
+def summarize(samples: List[float]) -> Dict:
+    return {
+        "median": round(statistics.median(samples), 4),
+        "min": round(min(samples), 4),
+        "max": round(max(samples), 4),
+        "runs": [round(sample, 4) for sample in samples],
+    }
+
+
+async def bench_scale(n_docs: int, args) -> Dict:
+    with tempfile.TemporaryDirectory(prefix="bench-") as corpus_dir:
+        uploads, manifest = generate_corpus(
+            corpus_dir, n_docs, args.sentences, args.overlap, seed=args.seed
+        )
+        samples: Dict[str, List[float]] = {}
+        counts = {}
+        for _ in range(args.repeat):
+            result = await run_stages(uploads, args.engine)
+            counts = {key: result[key] for key in ("documents", "pairs", "diffed_pairs")}
+            for stage, seconds in result["timings"].items():
+                samples.setdefault(stage, []).append(seconds)
+            if args.mongo:
+                # Первый прогон холодный: далее тексты берутся из кэша extracted
+                for stage, seconds in (await run_batch(uploads, args.engine)).items():
+                    samples.setdefault(stage, []).append(seconds)
+
+        formats = {}
+        for doc in manifest["documents"]:
+            formats[doc["format"]] = formats.get(doc["format"], 0) + 1
+        return {
+            "scale": n_docs,
+            **counts,
+            "formats": formats,
+            "stages": {stage: summarize(values) for stage, values in samples.items()},
+            # Пик RSS процесса к концу масштаба (монотонно растет между масштабами)
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+
+async def run_all(args) -> List[Dict]:
+    # Один event loop на все масштабы: клиент motor привязывается к первому loop
+    return [await bench_scale(n_docs, args) for n_docs in args.scales]
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def print_report(results: List[Dict], baseline: Dict = None):
+    base = {entry["scale"]: entry["stages"] for entry in (baseline or {}).get("results", [])}
+    for entry in results:
+        print(f"\n{entry['scale']} docs: {entry['documents']} texts, {entry['diffed_pairs']}/{entry['pairs']} pairs diffed")
+        for stage, stats in entry["stages"].items():
+            line = f"  {stage:<10} {stats['median']:>9.4f}s"
+            old = base.get(entry["scale"], {}).get(stage)
+            if old and stats["median"]:
+                line += f"   baseline {old['median']:.4f}s  x{old['median'] / stats['median']:.2f}"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sentences", type=int, default=120, help="предложений в документе")
+    parser.add_argument("--overlap", type=float, default=0.3, help="доля заимствованных предложений")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--engine", default=config.lexical_engine)
+    parser.add_argument("--offline", action="store_true", help="заглушка вместо LaBSE (без скачивания модели)")
+    parser.add_argument("--mongo", action="store_true", help="также мерить полный compare-batch (нужна MongoDB)")
+    parser.add_argument("--output", help="путь к JSON с результатами")
+    parser.add_argument("--compare", help="JSON прошлого прогона для сравнения медиан")
+    args = parser.parse_args()
+
+    stubs = install_stubs(embeddings=args.offline)
+    results = asyncio.run(run_all(args))
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "stubs": stubs,
+            "args": vars(args),
+            "config": {key: getattr(config, key) for key in CONFIG_KEYS},
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"bench-{datetime.datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    print(f"\nSaved: {output}")
+
+
+if __name__ == "__main__":
+    main()
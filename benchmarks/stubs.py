@@ -0,0 +1,50 @@
+"""Легкие заглушки моделей для офлайн-бенчмарка: без скачивания LaBSE и без zippy."""
+import zlib
+from typing import List, Tuple
+
+import numpy as np
+
+from app.services.models import model_registry, SEMANTIC_MODEL, AI_DETECTOR
+
+
+class StubEmbeddingModel:
+    """Hashing trick по словам: детерминированные векторы, близкие для текстов с общими словами."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def encode(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, zlib.crc32(word.encode("utf-8")) % self.dim] += 1.0
+        return vectors
+
+
+class _StubScorer:
+    def score_text(self, text: str) -> Tuple[str, float]:
+        # Степень сжатия как грубый суррогат "предсказуемости" текста
+        raw = text.encode("utf-8")
+        ratio = len(zlib.compress(raw)) / max(len(raw), 1)
+        return ("AI" if ratio < 0.3 else "Human"), 1.0 - ratio
+
+
+class StubAIDetector:
+    """Повторяет интерфейс zippy.Zippy, который использует ai_detect.score_text."""
+
+    def __init__(self):
+        self.detector = _StubScorer()
+
+
+def install_stubs(embeddings: bool = True) -> List[str]:
+    """Подменяет загрузчики в реестре моделей; возвращает имена подмененных ресурсов."""
+    installed = []
+    if embeddings:
+        model_registry.register(SEMANTIC_MODEL, StubEmbeddingModel)
+        installed.append(SEMANTIC_MODEL)
+    try:
+        import zippy  # noqa: F401
+    except ImportError:
+        model_registry.register(AI_DETECTOR, StubAIDetector)
+        installed.append(AI_DETECTOR)
+    return installed
@@ -1,2 +1,129 @@
 jwt_secret = "test_hackathon"
 jwt_expire_seconds = 3600
+
+# Предфильтр пар в compare-batch: MinHash-оценка Жаккара по словесным шинглам для всех пар сразу.
+# Индекса LSH нет: при пороге 0.05 полосы с r > 1 теряют пары, а плотная матрица n x n нужна все равно -
+# по ней считается оценочный балл пар без диффа
+minhash_enabled = True
+minhash_min_docs = 10      # для маленьких пакетов полный дифф считается для всех пар
+minhash_num_perm = 128
+minhash_shingle_size = 5
+minhash_threshold = 0.05   # оценка Жаккара, ниже которой пара получает только оценочный балл
+
+# Лексический движок по умолчанию: "sequence" (эталонный SequenceMatcher) или "tiling" (жадное покрытие
+# плитками: находит переставленные абзацы, но не всегда быстрее SequenceMatcher)
+lexical_engine = "sequence"
+
+# Архив прошлых работ: winnowing-отпечатки k-грамм слов в коллекции corpus
+corpus_enabled = True
+winnow_k = 5
+winnow_window = 8
+corpus_top_k = 5
+corpus_min_overlap = 0.05  # минимальная доля общих отпечатков для попадания в выдачу
+corpus_max_df = 50  # отпечаток из большего числа работ архива - шаблонный текст, в поиске не участвует
+corpus_query_fingerprints = 256  # в запрос к архиву идут не больше стольких отпечатков (наименьшие хэши)
+
+# Кэш эмбеддингов LaBSE по хэшу отфильтрованного текста и имени модели
+embedding_cache_memory_bytes = 256 * 1024 * 1024
+embedding_cache_dir = ".cache/embeddings"   # None - только кэш в памяти
+embedding_cache_disk_bytes = 2 * 1024 * 1024 * 1024
+
+# Бэкенд LaBSE: "torch", "torch-int8" (динамическое квантование) или "onnx" (нужны optimum + onnxruntime)
+embedding_backend = "torch"
+embedding_onnx_file = None   # например "onnx/model_qint8_avx512_vnni.onnx"; None - model.onnx
+# Хранение векторов в кэше эмбеддингов (память и диск): "float32", "float16" или "int8"
+embedding_storage_dtype = "float16"
+
+# Семантика по перекрывающимся чанкам (LaBSE обрезает длинный вход)
+semantic_chunk_words = 150
+semantic_chunk_overlap = 30
+semantic_batch_size = 32   # наибольшее число текстов в пакете кодирования
+semantic_block_bytes = 64 * 1024 ** 2   # память на блок матрицы косинусов чанков
+# Пакеты LaBSE собираются из текстов близкой длины: токенов с учетом паддинга на пакет не больше бюджета
+embedding_token_budget = 8192
+embedding_tokens_per_word = 1.5   # оценка длины в токенах без запуска токенизатора
+
+# Выравнивание предложений (sentence_align): переводные заимствования между RU/KK/EN
+align_min_words = 5
+align_max_words = 80
+align_threshold = 0.8        # косинус LaBSE, начиная с которого предложения считаются парой
+align_top_k = 3              # соседей из других документов на каждое предложение
+align_block_bytes = 64 * 1024 ** 2   # память на блок матрицы косинусов
+align_max_pairs = 200        # пар предложений в ответе на пару документов
+
+# Исполнитель CPU-этапов (извлечение, фильтры, дифф): "thread" или "process"
+cpu_executor = "thread"
+cpu_workers = 4
+cpu_mp_context = "forkserver"  # fork после старта потоков torch/motor/прогрева может зависнуть на чужих блокировках
+cpu_batch_size = 8         # текстов на одну задачу фильтрации
+diff_chunk_size = 16       # пар на одну задачу диффа
+
+# Фоновая очередь больших пакетов (/documents/jobs)
+job_workers = 2
+job_max_per_user = 1       # одновременно выполняемых задач одного пользователя
+job_spool_dir = ".cache/jobs"
+job_poll_seconds = 2.0
+job_lease_seconds = 60.0   # задача без продления аренды столько секунд считается брошенной и возвращается в очередь
+job_heartbeat_seconds = 15.0  # как часто процесс продлевает аренду своих задач
+job_backoff_max_seconds = 30.0  # пауза воркера после ошибки MongoDB растет до этого значения
+job_fairness_entries = 10000  # сколько пользователей помнит очередь для справедливого порядка
+job_progress_every = 10    # как часто (в парах) обновлять прогресс в MongoDB
+
+# Модели, которые прогреваются в фоне после старта (пустой список - только ленивая загрузка)
+models_warmup = ["labse", "spacy"]
+
+# Размер пачки insert_many для отчетов compare-batch
+report_write_chunk = 200
+
+# AI-детектор (zippy): размер пачки на задачу пула и кэш результатов по хэшу текста
+ai_batch_size = 4
+ai_cache_entries = 10000
+
+# Фильтры: пачка nlp.pipe и кэш лемматизированных текстов по хэшу
+spacy_batch_size = 16
+lemma_cache_entries = 2000
+
+# PDF от pdf_parallel_min_pages страниц извлекаются диапазонами по pdf_pages_per_task
+# параллельно (только при cpu_executor = "process"); тексты кэшируются по хэшу файла
+pdf_parallel_min_pages = 40
+pdf_pages_per_task = 20
+
+# PDF отчетов: кэш готовых файлов по report_id и версии содержимого
+report_pdf_cache_entries = 32
+report_pdf_cache_dir = ".cache/report_pdf"
+report_pdf_cache_bytes = 512 * 1024 ** 2
+# Подсветка прямо в исходном PDF (экспорт mode=original) - только по явному включению: оригинал
+# содержит титульные листы и другие части, которые фильтры убирают из сравнения. Выключено - исходники
+# не сохраняются; включено - файл отдается только автору проверки по его токену
+original_pdf_enabled = False
+# Исходные PDF (по хэшу файла); None - не хранить
+original_pdf_dir = ".cache/originals"
+original_pdf_bytes = 5 * 1024 ** 3
+
+# Загрузки и архивы: файлы сбрасываются на диск кусками, архивы проверяются до распаковки
+upload_chunk_bytes = 1024 * 1024
+upload_max_bytes = 2 * 1024 ** 3
+archive_max_members = 500
+archive_max_member_bytes = 100 * 1024 ** 2
+archive_max_total_bytes = 1024 ** 3
+archive_max_ratio = 100
+
+# Метрики: GET /metrics в формате Prometheus; сводка этапов каждого запуска в лог
+metrics_enabled = True
+metrics_log_traces = False
+
+# Аватары: отдельная коллекция avatars, уменьшенные копии по длинной стороне (в пикселях)
+avatar_max_bytes = 2 * 1024 * 1024
+avatar_sizes = (256, 64)
+avatar_jpeg_quality = 85
+
+# Кэш профилей пользователей (настройки фильтров, /auth/me) в памяти процесса
+user_cache_entries = 10000
+user_cache_ttl_seconds = 30   # 0 - без кэша
+
+# История проверок: размер страницы GET /documents/history (курсор - next_cursor из ответа)
+history_page_size = 20
+history_page_max = 100
+
+# Режим подозрительных пар (threshold/top_k): пары с оценкой до диффа ниже порога на столько п.п. еще проверяются диффом
+suspicious_margin = 10
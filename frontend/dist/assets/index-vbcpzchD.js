@@ -4181,7 +4181,7 @@ No matching component was found for:
         .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(0,0,0,0.1); border-radius: 10px; }
         .dark .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.05); }
         ::selection { background: var(--foreground); color: var(--background); }
-      `})]})};function Rme(){var r;const t=R.useRef(),e=R.useRef(),n=R.useMemo(()=>{const o=new Float32Array(10125);let a=0;for(let l=0;l<15;l++)for(let u=0;u<15;u++)for(let c=0;c<15;c++)o[a++]=(l/15-.5)*3,o[a++]=(u/15-.5)*3,o[a++]=(c/15-.5)*3;return o},[]);return BS(i=>{const s=i.clock.getElapsedTime();t.current.rotation.y=s*.2,t.current.rotation.x=s*.1,e.current&&(e.current.position.y=Math.sin(s*1.5)*1.5)}),E.jsxs("group",{children:[E.jsx(UW,{ref:t,positions:n,stride:3,children:E.jsx(FW,{transparent:!0,color:"#3b82f6",size:.04,sizeAttenuation:!0,depthWrite:!1,blending:Om})}),E.jsxs("mesh",{ref:e,children:[E.jsx("boxGeometry",{args:[4,.02,4]}),E.jsx("meshBasicMaterial",{color:"#60a5fa",transparent:!0,opacity:.5})]}),E.jsxs("mesh",{"position-y":(r=e.current)==null?void 0:r.position.y,children:[E.jsx("boxGeometry",{args:[4.2,.1,4.2]}),E.jsx("meshBasicMaterial",{color:"#3b82f6",transparent:!0,opacity:.1})]})]})}function Nme(){return E.jsxs("div",{className:"fixed inset-0 z-[999] bg-white dark:bg-zinc-950 flex flex-col items-center justify-center overflow-hidden",children:[E.jsx("div",{className:"w-full h-[60vh]",children:E.jsxs(DW,{camera:{position:[0,2,8],fov:35},children:[E.jsx("ambientLight",{intensity:.5}),E.jsx(Rme,{})]})}),E.jsx("div",{className:"relative flex flex-col items-center -mt-20",children:E.jsxs("div",{className:"flex items-center gap-3 mb-2",children:[E.jsx("div",{className:"w-12 h-12 bg-black dark:bg-white rounded-2xl flex items-center justify-center shadow-2xl",children:E.jsx("span",{className:"text-white dark:text-black font-black text-xl italic",children:"Q"})}),E.jsxs("div",{className:"flex flex-col",children:[E.jsx("span",{className:"text-2xl font-bold tracking-tighter italic leading-none",children:"QazZerep"}),E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.4em] text-blue-500 mt-1 opacity-80",children:"System Analysis"})]})]})})]})}function $F({options:t,activeValue:e,onChange:n,type:r="text",small:i=!1}){const s=t.findIndex(o=>o.value===e);return E.jsxs("div",{className:"relative flex bg-black/5 dark:bg-white/5 backdrop-blur-md border border-black/5 dark:border-white/5 p-1 rounded-2xl w-full select-none shadow-inner",children:[E.jsx("div",{className:"absolute top-1 bottom-1 bg-white dark:bg-zinc-800 shadow-md rounded-xl transition-all duration-500 ease-[cubic-bezier(0.23,1,0.32,1)] z-0",style:{width:`calc(${100/t.length}% - 4px)`,left:`calc(${s*100/t.length}% + 2px)`}}),t.map(o=>E.jsx("button",{onClick:()=>n(o.value),className:`relative z-10 flex-1 flex items-center justify-center transition-all duration-500 ${i?"py-1.5":"py-2.5"} ${e===o.value?"text-black dark:text-white":"text-muted-foreground opacity-60"}`,children:r==="icon"?o.icon:E.jsx("span",{className:`font-black tracking-widest uppercase leading-none ${i?"text-[8px]":"text-[10px]"}`,children:o.label})},o.value))]})}function _p({active:t,icon:e,label:n,onClick:r}){return E.jsxs("button",{onClick:r,className:`flex items-center gap-3 px-5 py-3 rounded-2xl transition-all ${t?"bg-foreground/5 text-foreground font-bold shadow-sm":"text-muted-foreground hover:text-foreground opacity-70 hover:opacity-100"}`,children:[E.jsx("span",{className:t?"text-foreground":"opacity-40",children:e}),E.jsx("span",{className:"text-[13px] tracking-tight",children:n})]})}function Ime(){var $,G,Z;const{theme:t,setTheme:e}=Mse(),{t:n,i18n:r}=Hc(),[i,s]=R.useState([]),[o,a]=R.useState(null),[l,u]=R.useState(!1),[c,f]=R.useState("new"),[d,m]=R.useState([]),[g,x]=R.useState(!1),[y,v]=R.useState(!1),[S,w]=R.useState(null),[M,A]=R.useState(!0),[C,N]=R.useState(!1),[L,P]=R.useState(""),[I,k]=R.useState(""),[U,V]=R.useState(!1);R.useEffect(()=>{const re=setTimeout(()=>A(!1),2500);return()=>clearTimeout(re)},[]),R.useEffect(()=>{c==="history"&&X()},[c]),R.useEffect(()=>{var xe,Oe;if(!S){P(""),k("");return}const re=qe=>{if(!qe)return"";const ae=document.createElement("div");return ae.innerHTML=qe,ae.textContent||ae.innerText||""};P(re((xe=S.docA)==null?void 0:xe.html)),k(re((Oe=S.docB)==null?void 0:Oe.html))},[S]);const X=async()=>{try{const re=await li.get("/documents/history");m(re.data)}catch{console.error("Archive error")}},Y=async()=>{if(!(!d.length||!window.confirm(n("dash.clear_confirm"))))try{N(!0),await li.delete("/documents/history"),m([])}catch(xe){console.error("Clear history error",xe)}finally{N(!1)}},K=async()=>{if(i.length<2)return;u(!0);const re=new FormData;i.forEach(qe=>re.append("files",qe));const xe=li.post("/documents/compare-batch",re),Oe=new Promise(qe=>setTimeout(qe,2200));try{const[qe]=await Promise.all([xe,Oe]);a(qe.data)}catch{console.error("Server error")}finally{u(!1)}},q=async()=>{var re,xe;if(!(!L.trim()||!I.trim()||!S))try{V(!0);const Oe=await li.post("/documents/recalculate",{text_a:L,text_b:I,name_a:(re=S.docA)==null?void 0:re.name,name_b:(xe=S.docB)==null?void 0:xe.name}),qe={...S,similarity:Oe.data.similarity,originality:Oe.data.originality,semantic_info:Oe.data.semantic_info,docA:Oe.data.docA,docB:Oe.data.docB};w(qe)}catch(Oe){console.error("Recalc error",Oe)}finally{V(!1)}},F=()=>{const re=`${window.location.origin}/verify/${S.report_id}`;navigator.clipboard.writeText(re),v(!0),setTimeout(()=>v(!1),2e3)};return M?E.jsx(Nme,{}):E.jsxs("div",{className:"flex flex-col md:flex-row h-screen bg-background text-foreground font-sans overflow-hidden transition-colors duration-500",children:[l&&E.jsx(Ame,{t:n}),E.jsxs("aside",{className:"fixed bottom-0 left-0 w-full z-[100] md:relative md:w-64 md:h-full bg-card md:bg-background border-t md:border-t-0 md:border-r border-border flex md:flex-col",children:[E.jsxs("div",{className:"hidden md:flex p-8 items-center gap-3",children:[E.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg",children:E.jsx($o,{size:18,className:"text-background"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]}),E.jsxs("nav",{className:"flex-1 flex md:flex-col justify-around md:justify-start p-3 gap-2",children:[E.jsx(_p,{active:c==="new",icon:E.jsx(TQ,{size:18}),label:n("nav.check"),onClick:()=>f("new")}),E.jsx(_p,{active:c==="history",icon:E.jsx(fT,{size:18}),label:n("nav.history"),onClick:()=>f("history")}),E.jsx("div",{className:"hidden md:block my-4 border-t border-border/50 mx-4"}),E.jsx(_p,{active:c==="roadmap",icon:E.jsx(yV,{size:18}),label:n("nav.roadmap")||"Roadmap",onClick:()=>f("roadmap")}),E.jsx(_p,{active:c==="team",icon:E.jsx(UQ,{size:18}),label:n("nav.team"),onClick:()=>f("team")}),E.jsx(_p,{active:g,icon:E.jsx(JP,{size:18}),label:n("nav.account"),onClick:()=>x(!0)}),E.jsxs("div",{className:"hidden md:flex flex-col mt-auto gap-6 p-5 border-t border-border/20 bg-black/[0.02] dark:bg-white/[0.02] rounded-t-3xl",children:[E.jsxs("div",{className:"space-y-3",children:[E.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.language")}),E.jsx($F,{small:!0,activeValue:r.language,onChange:re=>r.changeLanguage(re),options:[{value:"rus",label:"RU"},{value:"kaz",label:"KZ"},{value:"eng",label:"EN"}]})]}),E.jsxs("div",{className:"space-y-3",children:[E.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.theme")}),E.jsx($F,{small:!0,activeValue:t,onChange:re=>e(re),type:"icon",options:[{value:"light",icon:E.jsx(FQ,{size:12})},{value:"dark",icon:E.jsx(LQ,{size:12})},{value:"system",icon:E.jsx(OQ,{size:12})}]})]})]})]})]}),g&&E.jsx(Pme,{onClose:()=>x(!1)}),E.jsxs("main",{className:"flex-1 flex flex-col relative overflow-y-auto custom-scrollbar",children:[E.jsxs("div",{className:"p-6 md:p-16 max-w-6xl mx-auto w-full flex-1",children:[(c==="new"||c==="history")&&E.jsxs("header",{className:"mb-8 animate-in fade-in duration-500",children:[E.jsx("h1",{className:"text-3xl font-medium tracking-tight italic",children:n(c==="new"?"dash.title_new":"dash.title_history")}),E.jsx("p",{className:"text-muted-foreground text-sm mt-2 font-light opacity-60",children:n(c==="new"?"dash.subtitle_new":"dash.subtitle_history")})]}),c==="new"&&E.jsxs("div",{className:"space-y-6 animate-in fade-in slide-in-from-bottom-4 duration-700",children:[!o&&!l&&E.jsx(E.Fragment,{children:E.jsxs("div",{className:"grid grid-cols-1 xl:grid-cols-[minmax(0,2.2fr)_minmax(0,1.5fr)] gap-6 items-stretch",children:[E.jsxs("div",{className:"bg-card border border-border rounded-[28px] p-5 md:p-7 shadow-xl flex flex-col gap-5 h-full",children:[E.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-10 h-10 rounded-2xl bg-foreground/5 flex items-center justify-center",children:E.jsx(_L,{size:20,className:"text-foreground"})}),E.jsxs("div",{children:[E.jsx("h2",{className:"text-[16px] md:text-[18px] font-medium tracking-tight",children:n("upload.title")}),E.jsx("p",{className:"text-[11px] text-muted-foreground mt-1",children:n("upload.formats")})]})]}),E.jsxs("div",{className:"flex flex-wrap gap-2 text-[9px] text-muted-foreground/90",children:[E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 1 · Upload"}),E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 2 · Analyze"}),E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 3 · Report"})]})]}),E.jsxs("div",{className:"mt-1.5 flex-1 flex",children:[E.jsx("input",{type:"file",multiple:!0,onChange:re=>s(Array.from(re.target.files)),className:"hidden",id:"file-up"}),E.jsx("label",{htmlFor:"file-up",className:"block border-2 border-dashed border-border/80 rounded-[26px] px-6 py-6 md:px-8 md:py-8 text-center cursor-pointer hover:border-foreground/40 hover:bg-foreground/[0.01] transition-colors min-h-[180px] md:min-h-[210px] flex-1 flex items-center justify-center",children:E.jsxs("div",{className:"flex flex-col items-center gap-2 max-w-md mx-auto",children:[E.jsx("div",{className:"w-14 h-14 bg-foreground/5 rounded-2xl flex items-center justify-center",children:E.jsx(_L,{size:26,className:"text-foreground"})}),E.jsx("p",{className:"text-[13px] font-medium tracking-tight mb-0.5",children:n("dash.title_new")}),E.jsx("p",{className:"text-[11px] text-muted-foreground",children:n("dash.subtitle_new")})]})})]}),i.length>0&&E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-4 pt-2 border-t border-border/40 mt-4",children:[E.jsxs("span",{className:"text-[10px] text-muted-foreground uppercase tracking-[0.25em]",children:[n("upload.selected"),": ",i.length]}),E.jsx("button",{onClick:K,className:"px-10 py-3 bg-foreground text-background font-black text-[10px] uppercase tracking-[0.3em] rounded-full hover:opacity-90 active:scale-95 transition-all shadow-lg",children:n("upload.btn_start")})]})]}),E.jsxs("div",{className:"space-y-4",children:[E.jsx(Dme,{t:n,history:d}),E.jsx(Ume,{t:n})]})]})}),o&&!l&&E.jsxs("div",{className:"grid grid-cols-1 gap-4",children:[o.comparisons.map((re,xe)=>E.jsx(Ome,{item:re,onClick:()=>w(re)},xe)),E.jsx("button",{onClick:()=>{a(null),s([])},className:"py-6 text-[10px] font-black uppercase tracking-[0.3em] text-muted-foreground hover:text-foreground transition-all",children:n("dash.btn_reset")})]})]}),c==="history"&&E.jsxs("div",{className:"space-y-4 animate-in fade-in duration-500",children:[E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-3",children:[E.jsxs("span",{className:"text-[10px] font-black uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(fT,{size:14,className:"opacity-70"}),n("dash.history_label")," · ",d.length]}),E.jsxs("button",{onClick:Y,disabled:!d.length||C,className:"inline-flex items-center gap-2 self-start md:self-auto px-4 py-2 rounded-full border border-border text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground hover:text-red-500 hover:border-red-500/60 hover:bg-red-500/5 transition-all disabled:opacity-40 disabled:hover:text-muted-foreground disabled:hover:border-border",children:[E.jsx(_V,{size:12}),n(C?"dash.clearing":"dash.clear_history")]})]}),E.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:d.length>0?d.map((re,xe)=>E.jsx(Lme,{session:re,onSelect:w},xe)):E.jsx("div",{className:"col-span-full py-20 text-center opacity-30 italic",children:"No records found"})})]}),c==="roadmap"&&E.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:E.jsx(Cme,{})}),c==="team"&&E.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:E.jsx(Fme,{})})]}),E.jsx(Tme,{})]}),S&&E.jsxs("div",{className:"fixed inset-0 z-[110] bg-background flex flex-col animate-in slide-in-from-bottom duration-500",children:[E.jsxs("header",{className:"flex items-center justify-between px-8 py-6 border-b border-border bg-background/80 backdrop-blur-xl",children:[E.jsxs("div",{className:"flex items-center gap-6",children:[E.jsx("h2",{className:"text-2xl font-medium tracking-tighter italic text-foreground",children:n("report.title")}),E.jsxs("div",{className:`px-4 py-1 rounded-full text-[10px] font-black tracking-widest uppercase ${S.originality<50?"bg-red-500/10 text-red-500":"bg-emerald-500/10 text-emerald-500"}`,children:[S.originality,"% ",n("report.match_label")]})]}),E.jsx("button",{onClick:()=>w(null),className:"p-3 hover:bg-foreground/5 rounded-full text-foreground transition-colors",children:E.jsx(SV,{size:24})})]}),E.jsx("div",{className:"flex-1 overflow-y-auto p-6 md:p-12 custom-scrollbar bg-background",children:E.jsxs("div",{className:"max-w-7xl mx-auto space-y-10",children:[E.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-8",children:[E.jsx(XF,{doc:S.docA,title:n("report.source_a"),t:n}),E.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-8 flex flex-col items-center justify-center shadow-xl",children:[E.jsxs("div",{className:"relative mb-8 cursor-pointer group",onClick:F,children:[E.jsx("div",{className:"bg-white p-4 rounded-3xl shadow-lg transition-transform group-hover:scale-105",children:E.jsx(R2,{value:`${window.location.origin}/verify/${S.report_id}`,size:120,level:"H",fgColor:"#000"})}),y&&E.jsxs("div",{className:"absolute inset-0 bg-background/95 rounded-3xl flex flex-col items-center justify-center border border-border animate-in zoom-in duration-200",children:[E.jsx(KP,{size:32,className:"text-emerald-500 mb-2"}),E.jsx("span",{className:"text-[10px] font-black uppercase tracking-widest text-foreground",children:n("report.copied")})]})]}),E.jsxs("button",{onClick:F,className:"text-[9px] font-mono text-muted-foreground hover:text-foreground flex items-center gap-3 bg-foreground/5 px-5 py-2.5 rounded-full uppercase tracking-tighter transition-all",children:[E.jsx(pV,{size:12})," ",($=S.report_id)==null?void 0:$.substring(0,16),"..."]})]}),E.jsx(XF,{doc:S.docB,title:n("report.target_b"),t:n})]}),E.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-10",children:[E.jsx(qF,{doc:S.docA}),E.jsx(qF,{doc:S.docB})]}),E.jsx("div",{className:"mt-8 grid grid-cols-1 lg:grid-cols-[minmax(0,2fr)_minmax(0,1.4fr)] gap-8 items-start",children:E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-6 md:p-8 space-y-4",children:[E.jsx("div",{className:"flex items-center justify-between gap-3 mb-2",children:E.jsxs("div",{children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic block mb-1",children:n("report.recalc_title")}),E.jsx("p",{className:"text-[11px] text-muted-foreground max-w-xl",children:n("report.recalc_subtitle")})]})}),E.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4 text-[12px]",children:[E.jsxs("div",{className:"flex flex-col gap-2",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground",children:(G=S.docA)==null?void 0:G.name}),E.jsx("textarea",{className:"w-full h-40 bg-background border border-border rounded-2xl p-3 font-mono text-[11px] custom-scrollbar outline-none focus:border-foreground/20",value:L,onChange:re=>P(re.target.value),spellCheck:"false"})]}),E.jsxs("div",{className:"flex flex-col gap-2",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground",children:(Z=S.docB)==null?void 0:Z.name}),E.jsx("textarea",{className:"w-full h-40 bg-background border border-border rounded-2xl p-3 font-mono text-[11px] custom-scrollbar outline-none focus:border-foreground/20",value:I,onChange:re=>k(re.target.value),spellCheck:"false"})]})]}),E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-3 mt-4",children:[E.jsx("p",{className:"text-[10px] text-muted-foreground max-w-xl",children:n("report.recalc_hint")}),E.jsx("button",{onClick:q,disabled:U||!L.trim()||!I.trim(),className:"inline-flex items-center justify-center gap-2 px-6 py-3 rounded-full bg-foreground text-background text-[10px] font-black uppercase tracking-[0.25em] shadow-lg hover:opacity-90 active:scale-95 transition-all disabled:opacity-40",children:U?E.jsxs(E.Fragment,{children:[E.jsx(Ra,{size:12,className:"animate-spin"}),n("report.recalc_btn_loading")]}):E.jsxs(E.Fragment,{children:[E.jsx(DQ,{size:12}),n("report.recalc_btn")]})})]})]})})]})})]}),E.jsx("style",{children:`
+      `})]})};function Rme(){var r;const t=R.useRef(),e=R.useRef(),n=R.useMemo(()=>{const o=new Float32Array(10125);let a=0;for(let l=0;l<15;l++)for(let u=0;u<15;u++)for(let c=0;c<15;c++)o[a++]=(l/15-.5)*3,o[a++]=(u/15-.5)*3,o[a++]=(c/15-.5)*3;return o},[]);return BS(i=>{const s=i.clock.getElapsedTime();t.current.rotation.y=s*.2,t.current.rotation.x=s*.1,e.current&&(e.current.position.y=Math.sin(s*1.5)*1.5)}),E.jsxs("group",{children:[E.jsx(UW,{ref:t,positions:n,stride:3,children:E.jsx(FW,{transparent:!0,color:"#3b82f6",size:.04,sizeAttenuation:!0,depthWrite:!1,blending:Om})}),E.jsxs("mesh",{ref:e,children:[E.jsx("boxGeometry",{args:[4,.02,4]}),E.jsx("meshBasicMaterial",{color:"#60a5fa",transparent:!0,opacity:.5})]}),E.jsxs("mesh",{"position-y":(r=e.current)==null?void 0:r.position.y,children:[E.jsx("boxGeometry",{args:[4.2,.1,4.2]}),E.jsx("meshBasicMaterial",{color:"#3b82f6",transparent:!0,opacity:.1})]})]})}function Nme(){return E.jsxs("div",{className:"fixed inset-0 z-[999] bg-white dark:bg-zinc-950 flex flex-col items-center justify-center overflow-hidden",children:[E.jsx("div",{className:"w-full h-[60vh]",children:E.jsxs(DW,{camera:{position:[0,2,8],fov:35},children:[E.jsx("ambientLight",{intensity:.5}),E.jsx(Rme,{})]})}),E.jsx("div",{className:"relative flex flex-col items-center -mt-20",children:E.jsxs("div",{className:"flex items-center gap-3 mb-2",children:[E.jsx("div",{className:"w-12 h-12 bg-black dark:bg-white rounded-2xl flex items-center justify-center shadow-2xl",children:E.jsx("span",{className:"text-white dark:text-black font-black text-xl italic",children:"Q"})}),E.jsxs("div",{className:"flex flex-col",children:[E.jsx("span",{className:"text-2xl font-bold tracking-tighter italic leading-none",children:"QazZerep"}),E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.4em] text-blue-500 mt-1 opacity-80",children:"System Analysis"})]})]})})]})}function $F({options:t,activeValue:e,onChange:n,type:r="text",small:i=!1}){const s=t.findIndex(o=>o.value===e);return E.jsxs("div",{className:"relative flex bg-black/5 dark:bg-white/5 backdrop-blur-md border border-black/5 dark:border-white/5 p-1 rounded-2xl w-full select-none shadow-inner",children:[E.jsx("div",{className:"absolute top-1 bottom-1 bg-white dark:bg-zinc-800 shadow-md rounded-xl transition-all duration-500 ease-[cubic-bezier(0.23,1,0.32,1)] z-0",style:{width:`calc(${100/t.length}% - 4px)`,left:`calc(${s*100/t.length}% + 2px)`}}),t.map(o=>E.jsx("button",{onClick:()=>n(o.value),className:`relative z-10 flex-1 flex items-center justify-center transition-all duration-500 ${i?"py-1.5":"py-2.5"} ${e===o.value?"text-black dark:text-white":"text-muted-foreground opacity-60"}`,children:r==="icon"?o.icon:E.jsx("span",{className:`font-black tracking-widest uppercase leading-none ${i?"text-[8px]":"text-[10px]"}`,children:o.label})},o.value))]})}function _p({active:t,icon:e,label:n,onClick:r}){return E.jsxs("button",{onClick:r,className:`flex items-center gap-3 px-5 py-3 rounded-2xl transition-all ${t?"bg-foreground/5 text-foreground font-bold shadow-sm":"text-muted-foreground hover:text-foreground opacity-70 hover:opacity-100"}`,children:[E.jsx("span",{className:t?"text-foreground":"opacity-40",children:e}),E.jsx("span",{className:"text-[13px] tracking-tight",children:n})]})}function Ime(){var $,G,Z;const{theme:t,setTheme:e}=Mse(),{t:n,i18n:r}=Hc(),[i,s]=R.useState([]),[o,a]=R.useState(null),[l,u]=R.useState(!1),[c,f]=R.useState("new"),[d,m]=R.useState([]),[g,x]=R.useState(!1),[y,v]=R.useState(!1),[S,w]=R.useState(null),[M,A]=R.useState(!0),[C,N]=R.useState(!1),[L,P]=R.useState(""),[I,k]=R.useState(""),[U,V]=R.useState(!1),[qzCur,qzSetCur]=R.useState(null),[qzMoreL,qzSetMoreL]=R.useState(!1),[qzErr,qzSetErr]=R.useState(null);R.useEffect(()=>{const re=setTimeout(()=>A(!1),2500);return()=>clearTimeout(re)},[]),R.useEffect(()=>{c==="history"&&X()},[c]),R.useEffect(()=>{var xe,Oe;if(!S){P(""),k("");return}const re=qe=>{if(!qe)return"";const ae=document.createElement("div");return ae.innerHTML=qe,ae.textContent||ae.innerText||""};P(re((xe=S.docA)==null?void 0:xe.html)),k(re((Oe=S.docB)==null?void 0:Oe.html))},[S]);const X=async(qzC=null)=>{try{const re=await li.get("/documents/history",{params:qzC?{cursor:qzC}:{}});m(qzP=>qzC?[...qzP,...re.data.items]:re.data.items),qzSetCur(re.data.next_cursor)}catch{console.error("Archive error")}},qzMore=async()=>{if(qzCur){qzSetMoreL(!0);try{await X(qzCur)}finally{qzSetMoreL(!1)}}},qzSelect=async re=>{var qzA;if(qzSetErr(null),((qzA=re.docA)==null?void 0:qzA.html)!==void 0||!re.report_id){w(re);return}try{const xe=await li.get(`/reports/${re.report_id}`);w({...re,docA:xe.data.docA,docB:xe.data.docB})}catch(xe){console.error("Report error",xe),qzSetErr(re.report_id)}},Y=async()=>{if(!(!d.length||!window.confirm(n("dash.clear_confirm"))))try{N(!0),await li.delete("/documents/history"),m([]),qzSetCur(null)}catch(xe){console.error("Clear history error",xe)}finally{N(!1)}},K=async()=>{if(i.length<2)return;u(!0);const re=new FormData;i.forEach(qe=>re.append("files",qe));const xe=li.post("/documents/compare-batch",re),Oe=new Promise(qe=>setTimeout(qe,2200));try{const[qe]=await Promise.all([xe,Oe]);a(qe.data)}catch{console.error("Server error")}finally{u(!1)}},q=async()=>{var re,xe;if(!(!L.trim()||!I.trim()||!S))try{V(!0);const Oe=await li.post("/documents/recalculate",{text_a:L,text_b:I,name_a:(re=S.docA)==null?void 0:re.name,name_b:(xe=S.docB)==null?void 0:xe.name}),qe={...S,similarity:Oe.data.similarity,originality:Oe.data.originality,semantic_info:Oe.data.semantic_info,docA:Oe.data.docA,docB:Oe.data.docB};w(qe)}catch(Oe){console.error("Recalc error",Oe)}finally{V(!1)}},F=()=>{const re=`${window.location.origin}/verify/${S.report_id}`;navigator.clipboard.writeText(re),v(!0),setTimeout(()=>v(!1),2e3)};return M?E.jsx(Nme,{}):E.jsxs("div",{className:"flex flex-col md:flex-row h-screen bg-background text-foreground font-sans overflow-hidden transition-colors duration-500",children:[l&&E.jsx(Ame,{t:n}),E.jsxs("aside",{className:"fixed bottom-0 left-0 w-full z-[100] md:relative md:w-64 md:h-full bg-card md:bg-background border-t md:border-t-0 md:border-r border-border flex md:flex-col",children:[E.jsxs("div",{className:"hidden md:flex p-8 items-center gap-3",children:[E.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg",children:E.jsx($o,{size:18,className:"text-background"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]}),E.jsxs("nav",{className:"flex-1 flex md:flex-col justify-around md:justify-start p-3 gap-2",children:[E.jsx(_p,{active:c==="new",icon:E.jsx(TQ,{size:18}),label:n("nav.check"),onClick:()=>f("new")}),E.jsx(_p,{active:c==="history",icon:E.jsx(fT,{size:18}),label:n("nav.history"),onClick:()=>f("history")}),E.jsx("div",{className:"hidden md:block my-4 border-t border-border/50 mx-4"}),E.jsx(_p,{active:c==="roadmap",icon:E.jsx(yV,{size:18}),label:n("nav.roadmap")||"Roadmap",onClick:()=>f("roadmap")}),E.jsx(_p,{active:c==="team",icon:E.jsx(UQ,{size:18}),label:n("nav.team"),onClick:()=>f("team")}),E.jsx(_p,{active:g,icon:E.jsx(JP,{size:18}),label:n("nav.account"),onClick:()=>x(!0)}),E.jsxs("div",{className:"hidden md:flex flex-col mt-auto gap-6 p-5 border-t border-border/20 bg-black/[0.02] dark:bg-white/[0.02] rounded-t-3xl",children:[E.jsxs("div",{className:"space-y-3",children:[E.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.language")}),E.jsx($F,{small:!0,activeValue:r.language,onChange:re=>r.changeLanguage(re),options:[{value:"rus",label:"RU"},{value:"kaz",label:"KZ"},{value:"eng",label:"EN"}]})]}),E.jsxs("div",{className:"space-y-3",children:[E.jsx("span",{className:"text-[8px] font-black uppercase tracking-[0.3em] text-muted-foreground/50 px-1 italic",children:n("settings.theme")}),E.jsx($F,{small:!0,activeValue:t,onChange:re=>e(re),type:"icon",options:[{value:"light",icon:E.jsx(FQ,{size:12})},{value:"dark",icon:E.jsx(LQ,{size:12})},{value:"system",icon:E.jsx(OQ,{size:12})}]})]})]})]})]}),g&&E.jsx(Pme,{onClose:()=>x(!1)}),E.jsxs("main",{className:"flex-1 flex flex-col relative overflow-y-auto custom-scrollbar",children:[E.jsxs("div",{className:"p-6 md:p-16 max-w-6xl mx-auto w-full flex-1",children:[(c==="new"||c==="history")&&E.jsxs("header",{className:"mb-8 animate-in fade-in duration-500",children:[E.jsx("h1",{className:"text-3xl font-medium tracking-tight italic",children:n(c==="new"?"dash.title_new":"dash.title_history")}),E.jsx("p",{className:"text-muted-foreground text-sm mt-2 font-light opacity-60",children:n(c==="new"?"dash.subtitle_new":"dash.subtitle_history")})]}),c==="new"&&E.jsxs("div",{className:"space-y-6 animate-in fade-in slide-in-from-bottom-4 duration-700",children:[!o&&!l&&E.jsx(E.Fragment,{children:E.jsxs("div",{className:"grid grid-cols-1 xl:grid-cols-[minmax(0,2.2fr)_minmax(0,1.5fr)] gap-6 items-stretch",children:[E.jsxs("div",{className:"bg-card border border-border rounded-[28px] p-5 md:p-7 shadow-xl flex flex-col gap-5 h-full",children:[E.jsxs("div",{className:"flex flex-wrap items-center justify-between gap-3",children:[E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-10 h-10 rounded-2xl bg-foreground/5 flex items-center justify-center",children:E.jsx(_L,{size:20,className:"text-foreground"})}),E.jsxs("div",{children:[E.jsx("h2",{className:"text-[16px] md:text-[18px] font-medium tracking-tight",children:n("upload.title")}),E.jsx("p",{className:"text-[11px] text-muted-foreground mt-1",children:n("upload.formats")})]})]}),E.jsxs("div",{className:"flex flex-wrap gap-2 text-[9px] text-muted-foreground/90",children:[E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 1 · Upload"}),E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 2 · Analyze"}),E.jsx("span",{className:"px-3 py-1 rounded-full bg-background border border-border/60 uppercase tracking-[0.25em]",children:"Step 3 · Report"})]})]}),E.jsxs("div",{className:"mt-1.5 flex-1 flex",children:[E.jsx("input",{type:"file",multiple:!0,onChange:re=>s(Array.from(re.target.files)),className:"hidden",id:"file-up"}),E.jsx("label",{htmlFor:"file-up",className:"block border-2 border-dashed border-border/80 rounded-[26px] px-6 py-6 md:px-8 md:py-8 text-center cursor-pointer hover:border-foreground/40 hover:bg-foreground/[0.01] transition-colors min-h-[180px] md:min-h-[210px] flex-1 flex items-center justify-center",children:E.jsxs("div",{className:"flex flex-col items-center gap-2 max-w-md mx-auto",children:[E.jsx("div",{className:"w-14 h-14 bg-foreground/5 rounded-2xl flex items-center justify-center",children:E.jsx(_L,{size:26,className:"text-foreground"})}),E.jsx("p",{className:"text-[13px] font-medium tracking-tight mb-0.5",children:n("dash.title_new")}),E.jsx("p",{className:"text-[11px] text-muted-foreground",children:n("dash.subtitle_new")})]})})]}),i.length>0&&E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-4 pt-2 border-t border-border/40 mt-4",children:[E.jsxs("span",{className:"text-[10px] text-muted-foreground uppercase tracking-[0.25em]",children:[n("upload.selected"),": ",i.length]}),E.jsx("button",{onClick:K,className:"px-10 py-3 bg-foreground text-background font-black text-[10px] uppercase tracking-[0.3em] rounded-full hover:opacity-90 active:scale-95 transition-all shadow-lg",children:n("upload.btn_start")})]})]}),E.jsxs("div",{className:"space-y-4",children:[E.jsx(Dme,{t:n,history:d}),E.jsx(Ume,{t:n})]})]})}),o&&!l&&E.jsxs("div",{className:"grid grid-cols-1 gap-4",children:[o.comparisons.map((re,xe)=>E.jsx(Ome,{item:re,onClick:()=>w(re)},xe)),E.jsx("button",{onClick:()=>{a(null),s([])},className:"py-6 text-[10px] font-black uppercase tracking-[0.3em] text-muted-foreground hover:text-foreground transition-all",children:n("dash.btn_reset")})]})]}),c==="history"&&E.jsxs("div",{className:"space-y-4 animate-in fade-in duration-500",children:[E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-3",children:[E.jsxs("span",{className:"text-[10px] font-black uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(fT,{size:14,className:"opacity-70"}),n("dash.history_label")," · ",d.length]}),E.jsxs("button",{onClick:Y,disabled:!d.length||C,className:"inline-flex items-center gap-2 self-start md:self-auto px-4 py-2 rounded-full border border-border text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground hover:text-red-500 hover:border-red-500/60 hover:bg-red-500/5 transition-all disabled:opacity-40 disabled:hover:text-muted-foreground disabled:hover:border-border",children:[E.jsx(_V,{size:12}),n(C?"dash.clearing":"dash.clear_history")]})]}),qzErr&&E.jsxs("div",{className:"px-6 py-4 rounded-3xl border border-red-500/30 bg-red-500/5 text-[11px] text-red-500 flex justify-between items-center gap-4",children:[E.jsxs("span",{children:[n("dash.report_unavailable")," (",qzErr,")"]}),E.jsx("button",{onClick:()=>qzSetErr(null),className:"text-[9px] font-black uppercase tracking-[0.25em] opacity-60 hover:opacity-100",children:"✕"})]}),E.jsx("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-6",children:d.length>0?d.map((re,xe)=>E.jsx(Lme,{session:re,onSelect:qzSelect},re.id||xe)):E.jsx("div",{className:"col-span-full py-20 text-center opacity-30 italic",children:"No records found"})}),qzCur&&E.jsx("div",{className:"flex justify-center pt-4",children:E.jsx("button",{onClick:qzMore,disabled:qzMoreL,className:"px-8 py-3 rounded-full border border-border text-[10px] font-black uppercase tracking-[0.25em] text-muted-foreground hover:text-foreground hover:border-foreground/40 transition-all disabled:opacity-40",children:n(qzMoreL?"dash.loading_more":"dash.load_more")})})]}),c==="roadmap"&&E.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:E.jsx(Cme,{})}),c==="team"&&E.jsx("div",{className:"animate-in fade-in slide-in-from-bottom-4 duration-700",children:E.jsx(Fme,{})})]}),E.jsx(Tme,{})]}),S&&E.jsxs("div",{className:"fixed inset-0 z-[110] bg-background flex flex-col animate-in slide-in-from-bottom duration-500",children:[E.jsxs("header",{className:"flex items-center justify-between px-8 py-6 border-b border-border bg-background/80 backdrop-blur-xl",children:[E.jsxs("div",{className:"flex items-center gap-6",children:[E.jsx("h2",{className:"text-2xl font-medium tracking-tighter italic text-foreground",children:n("report.title")}),E.jsxs("div",{className:`px-4 py-1 rounded-full text-[10px] font-black tracking-widest uppercase ${S.originality<50?"bg-red-500/10 text-red-500":"bg-emerald-500/10 text-emerald-500"}`,children:[S.originality,"% ",n("report.match_label")]})]}),E.jsx("button",{onClick:()=>w(null),className:"p-3 hover:bg-foreground/5 rounded-full text-foreground transition-colors",children:E.jsx(SV,{size:24})})]}),E.jsx("div",{className:"flex-1 overflow-y-auto p-6 md:p-12 custom-scrollbar bg-background",children:E.jsxs("div",{className:"max-w-7xl mx-auto space-y-10",children:[E.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-8",children:[E.jsx(XF,{doc:S.docA,title:n("report.source_a"),t:n}),E.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-8 flex flex-col items-center justify-center shadow-xl",children:[E.jsxs("div",{className:"relative mb-8 cursor-pointer group",onClick:F,children:[E.jsx("div",{className:"bg-white p-4 rounded-3xl shadow-lg transition-transform group-hover:scale-105",children:E.jsx(R2,{value:`${window.location.origin}/verify/${S.report_id}`,size:120,level:"H",fgColor:"#000"})}),y&&E.jsxs("div",{className:"absolute inset-0 bg-background/95 rounded-3xl flex flex-col items-center justify-center border border-border animate-in zoom-in duration-200",children:[E.jsx(KP,{size:32,className:"text-emerald-500 mb-2"}),E.jsx("span",{className:"text-[10px] font-black uppercase tracking-widest text-foreground",children:n("report.copied")})]})]}),E.jsxs("button",{onClick:F,className:"text-[9px] font-mono text-muted-foreground hover:text-foreground flex items-center gap-3 bg-foreground/5 px-5 py-2.5 rounded-full uppercase tracking-tighter transition-all",children:[E.jsx(pV,{size:12})," ",($=S.report_id)==null?void 0:$.substring(0,16),"..."]})]}),E.jsx(XF,{doc:S.docB,title:n("report.target_b"),t:n})]}),E.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-10",children:[E.jsx(qF,{doc:S.docA}),E.jsx(qF,{doc:S.docB})]}),E.jsx("div",{className:"mt-8 grid grid-cols-1 lg:grid-cols-[minmax(0,2fr)_minmax(0,1.4fr)] gap-8 items-start",children:E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-6 md:p-8 space-y-4",children:[E.jsx("div",{className:"flex items-center justify-between gap-3 mb-2",children:E.jsxs("div",{children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic block mb-1",children:n("report.recalc_title")}),E.jsx("p",{className:"text-[11px] text-muted-foreground max-w-xl",children:n("report.recalc_subtitle")})]})}),E.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4 text-[12px]",children:[E.jsxs("div",{className:"flex flex-col gap-2",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground",children:(G=S.docA)==null?void 0:G.name}),E.jsx("textarea",{className:"w-full h-40 bg-background border border-border rounded-2xl p-3 font-mono text-[11px] custom-scrollbar outline-none focus:border-foreground/20",value:L,onChange:re=>P(re.target.value),spellCheck:"false"})]}),E.jsxs("div",{className:"flex flex-col gap-2",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground",children:(Z=S.docB)==null?void 0:Z.name}),E.jsx("textarea",{className:"w-full h-40 bg-background border border-border rounded-2xl p-3 font-mono text-[11px] custom-scrollbar outline-none focus:border-foreground/20",value:I,onChange:re=>k(re.target.value),spellCheck:"false"})]})]}),E.jsxs("div",{className:"flex flex-col md:flex-row md:items-center md:justify-between gap-3 mt-4",children:[E.jsx("p",{className:"text-[10px] text-muted-foreground max-w-xl",children:n("report.recalc_hint")}),E.jsx("button",{onClick:q,disabled:U||!L.trim()||!I.trim(),className:"inline-flex items-center justify-center gap-2 px-6 py-3 rounded-full bg-foreground text-background text-[10px] font-black uppercase tracking-[0.25em] shadow-lg hover:opacity-90 active:scale-95 transition-all disabled:opacity-40",children:U?E.jsxs(E.Fragment,{children:[E.jsx(Ra,{size:12,className:"animate-spin"}),n("report.recalc_btn_loading")]}):E.jsxs(E.Fragment,{children:[E.jsx(DQ,{size:12}),n("report.recalc_btn")]})})]})]})})]})})]}),E.jsx("style",{children:`
                 .custom-scrollbar::-webkit-scrollbar { width: 4px; }
                 .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(0,0,0,0.1); border-radius: 10px; }
                 .dark .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.1); }
@@ -4189,7 +4189,7 @@ No matching component was found for:
                 .team-gradient { position:absolute; inset:-40%; background:radial-gradient(circle at 0% 0%, rgba(59,130,246,0.4), transparent 55%), radial-gradient(circle at 100% 100%, rgba(129,140,248,0.4), transparent 55%); opacity:0.65; filter:blur(10px); animation:teamBeam 26s linear infinite alternate; }
                 @keyframes teamBeam { 0% { transform:translate3d(-10%,0,0); } 50% { transform:translate3d(10%,4%,0); } 100% { transform:translate3d(-6%,-3%,0); } }
                 ::selection { background: #3b82f6; color: #fff; }
-            `})]})}function Ome({item:t,onClick:e}){var n;return E.jsxs("div",{onClick:e,className:"p-6 bg-card border border-border rounded-[32px] flex items-center justify-between hover:border-foreground/20 transition-all cursor-pointer group shadow-sm",children:[E.jsxs("div",{className:"flex items-center gap-5",children:[E.jsx("div",{className:"w-12 h-12 rounded-2xl bg-foreground/5 border border-border flex items-center justify-center group-hover:scale-110 transition-transform",children:E.jsx(ZP,{size:20,className:"text-muted-foreground"})}),E.jsxs("div",{children:[E.jsx("p",{className:"text-[15px] font-medium tracking-tight text-foreground",children:t.pair}),E.jsxs("p",{className:"text-[10px] text-muted-foreground font-mono opacity-60 mt-1 uppercase",children:["ID: ",(n=t.report_id)==null?void 0:n.substring(0,8)]})]})]}),E.jsxs("div",{className:"flex items-center gap-8",children:[E.jsxs("span",{className:`text-xl font-bold tracking-tighter ${t.originality<50?"text-red-500":"text-emerald-500"}`,children:[t.originality,"%"]}),E.jsx(hV,{className:"text-muted-foreground group-hover:text-foreground group-hover:translate-x-1 transition-all",size:20})]})]})}function Lme({session:t,onSelect:e}){return E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-8 hover:border-foreground/20 transition-all group",children:[E.jsxs("div",{className:"flex items-center gap-3 mb-8 opacity-40 group-hover:opacity-100 transition-opacity",children:[E.jsx(_Q,{size:14,className:"text-foreground"}),E.jsx("span",{className:"text-[10px] font-black uppercase tracking-[0.2em] text-foreground",children:new Date(t.timestamp).toLocaleDateString()})]}),E.jsx("div",{className:"space-y-4",children:t.comparisons.map((n,r)=>E.jsxs("div",{onClick:()=>e(n),className:"flex justify-between items-center cursor-pointer border-b border-border/50 pb-3 last:border-0 hover:translate-x-1 transition-transform",children:[E.jsx("span",{className:"text-[13px] text-muted-foreground hover:text-foreground transition-colors truncate pr-6",children:n.pair}),E.jsxs("span",{className:`text-[13px] font-black ${n.originality<50?"text-red-500":"text-emerald-500"}`,children:[n.originality,"%"]})]},r))})]})}function XF({doc:t,title:e,t:n}){const r=t.ai.score>60;return E.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-10 shadow-xl transition-all hover:scale-[1.02]",children:[E.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-[0.4em] opacity-40 italic",children:e}),E.jsx("h3",{className:"text-xl font-medium mt-3 truncate text-foreground",children:t.name}),E.jsxs("div",{className:"mt-12",children:[E.jsxs("div",{className:"flex justify-between items-end mb-4",children:[E.jsx("span",{className:"text-[10px] text-muted-foreground font-black uppercase tracking-widest",children:n("report.ai_prob")}),E.jsxs("span",{className:`text-2xl font-black italic ${r?"text-red-500":"text-emerald-500"}`,children:[t.ai.score,"%"]})]}),E.jsx("div",{className:"h-1.5 w-full bg-foreground/5 rounded-full overflow-hidden",children:E.jsx("div",{className:`h-full transition-all duration-1000 ${r?"bg-red-500":"bg-emerald-500"}`,style:{width:`${t.ai.score}%`}})})]})]})}function qF({doc:t}){return E.jsxs("div",{className:"flex flex-col bg-card border border-border rounded-[40px] overflow-hidden shadow-xl",children:[E.jsxs("div",{className:"px-8 py-5 border-b border-border flex justify-between items-center bg-foreground/[0.02]",children:[E.jsx("span",{className:"text-[10px] font-black text-muted-foreground uppercase tracking-widest truncate max-w-[300px] italic opacity-60",children:t.name}),E.jsx(Ra,{size:14,className:"text-blue-500 animate-pulse"})]}),E.jsx("div",{className:"p-10 text-[15px] text-foreground/80 leading-[1.8] max-h-[600px] overflow-y-auto custom-scrollbar font-light tracking-tight",dangerouslySetInnerHTML:{__html:t.html}})]})}function Dme({t,history:e}){const n=Array.isArray(e)&&e.length>0;let r=null,i=0;if(n){const o=[...e].sort((a,l)=>new Date(l.timestamp)-new Date(a.timestamp))[0];r=new Date(o.timestamp).toLocaleString(),i=e.reduce((a,l)=>a+(l.total_pairs||0),0)}return E.jsx("div",{className:"bg-card border border-border rounded-[28px] p-6 md:p-7 flex flex-col justify-between shadow-xl",children:E.jsxs("div",{className:"space-y-6",children:[E.jsxs("div",{children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic mb-2 block",children:t("dash.insights_title")}),E.jsx("h3",{className:"text-lg font-medium tracking-tight text-foreground",children:t(n?"dash.insights_last_run":"dash.insights_empty")})]}),E.jsxs("div",{className:"grid grid-cols-2 gap-4 text-[11px]",children:[E.jsxs("div",{className:"rounded-2xl bg-foreground/5 border border-border px-4 py-3 flex flex-col gap-1",children:[E.jsxs("span",{className:"text-[9px] uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(fT,{size:11}),t("dash.insights_last_run")]}),E.jsx("span",{className:"text-[12px] font-medium mt-1",children:n?r:"—"})]}),E.jsxs("div",{className:"rounded-2xl bg-foreground/5 border border-border px-4 py-3 flex flex-col gap-1",children:[E.jsxs("span",{className:"text-[9px] uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(Ra,{size:11}),t("dash.insights_total_docs")]}),E.jsx("span",{className:"text-[20px] font-black tracking-tight",children:n?i:0})]})]}),E.jsxs("div",{className:"mt-2 p-4 rounded-2xl border border-border bg-foreground/[0.02]",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground mb-2 block",children:t("dash.insights_tip_title")}),E.jsxs("ul",{className:"space-y-1.5 text-[11px] text-muted-foreground leading-relaxed",children:[E.jsxs("li",{children:["• ",t("dash.insights_tip_1")]}),E.jsxs("li",{children:["• ",t("dash.insights_tip_2")]}),E.jsxs("li",{children:["• ",t("dash.insights_tip_3")]})]})]})]})})}const kme=[{id:"ramir",name:"Ramir",roleKey:"core_architect"},{id:"ramadan",name:"Ramadan",roleKey:"product",telegram:"@brjxjxjd",avatar:Ese}];function Fme(){const{t}=Hc();return E.jsxs("div",{className:"max-w-6xl mx-auto",children:[E.jsxs("section",{className:"text-center mb-8",children:[E.jsx("h1",{className:"text-3xl md:text-4xl font-black italic tracking-tighter uppercase mb-2",children:t("team.title")}),E.jsx("p",{className:"text-[12px] md:text-sm text-muted-foreground max-w-2xl mx-auto leading-relaxed",children:t("team.subtitle")})]}),E.jsxs("div",{className:"relative overflow-hidden rounded-[32px] border border-border bg-card/80 backdrop-blur-xl shadow-[0_22px_80px_rgba(15,23,42,0.45)]",children:[E.jsx("div",{className:"team-gradient pointer-events-none"}),E.jsx("div",{className:"divide-y divide-border/50",children:kme.map((e,n)=>E.jsxs("div",{className:"relative flex flex-col sm:flex-row items-center sm:items-stretch gap-5 px-6 md:px-10 py-6 md:py-7 group",children:[E.jsxs("div",{className:"flex items-center gap-4 sm:w-1/3",children:[E.jsxs("div",{className:"relative",children:[E.jsx("div",{className:"w-16 h-16 md:w-20 md:h-20 rounded-[24px] bg-gradient-to-tr from-blue-500 to-indigo-500 flex items-center justify-center text-xl md:text-2xl font-black tracking-tighter text-white shadow-[0_0_40px_rgba(59,130,246,0.45)] group-hover:scale-[1.03] group-hover:shadow-[0_0_55px_rgba(59,130,246,0.7)] overflow-hidden transition-transform duration-400",children:e.avatar?E.jsx("img",{src:e.avatar,alt:e.name,className:"w-full h-full object-cover"}):e.name.split(" ").map(r=>r[0]).join("")}),E.jsx("div",{className:"absolute inset-0 rounded-[32px] border border-blue-400/20 group-hover:border-blue-400/50 transition-colors duration-500"})]}),E.jsxs("div",{children:[E.jsx("p",{className:"text-sm font-semibold text-foreground",children:e.name}),E.jsx("p",{className:"text-[10px] text-muted-foreground uppercase tracking-[0.25em] mt-1",children:t(`team.roles.${e.roleKey}`)})]})]}),E.jsxs("div",{className:"flex-1 flex flex-col sm:flex-row sm:items-center justify-between gap-3 mt-2 sm:mt-0",children:[E.jsx("p",{className:"text-[11px] text-muted-foreground leading-relaxed max-w-xl",children:t(`team.descriptions.${e.id}`)}),E.jsx("div",{className:"flex justify-end sm:items-center sm:justify-center min-w-[120px] text-muted-foreground",children:e.telegram&&E.jsxs("a",{href:`https://t.me/${e.telegram.replace("@","")}`,target:"_blank",rel:"noreferrer",className:"px-4 py-1.5 rounded-full bg-foreground/5 hover:bg-foreground/10 hover:text-foreground transition-colors text-[11px] font-mono flex items-center gap-2",children:[E.jsx("span",{className:"w-1.5 h-1.5 rounded-full bg-emerald-400 animate-pulse"}),e.telegram]})})]})]},n))})]})]})}function Ume({t}){return E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-6 md:p-7 shadow-xl",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic mb-3 block",children:"QazZerep · 2026 Core"}),E.jsx("h3",{className:"text-[15px] font-medium tracking-tight text-foreground mb-3",children:"QazZerep — система сверки оригинальности документов"}),E.jsx("p",{className:"text-[11px] text-muted-foreground leading-relaxed mb-4",children:"Платформа собирает локальные архивы, открытые источники и внутренние базы, чтобы находить пересечения между студенческими и научными работами."}),E.jsxs("ul",{className:"space-y-1.5 text-[11px] text-muted-foreground/90",children:[E.jsx("li",{children:"• Асинхронный FastAPI-бэкенд, оптимизированный под батч-сравнения."}),E.jsx("li",{children:"• Поддержка PDF, DOCX, TXT, ZIP и RAR в одном окне загрузки."}),E.jsx("li",{children:"• Публичные проверки по ссылке (Verify) + PDF-отчёты для преподавателей."})]})]})}function zme(){const[t,e]=R.useState([]),n=_g();R.useEffect(()=>{r()},[]);const r=async()=>{try{const s=await li.get("/documents/admin/all-docs");e(s.data.data)}catch{console.error("Admin access error")}},i=async s=>{window.confirm("Удалить этот объект из глобальной базы?")&&(await li.delete(`/documents/delete/${s}`),r())};return E.jsx("div",{className:"min-h-screen bg-[#050505] text-slate-400 p-8 font-sans",children:E.jsxs("div",{className:"max-w-6xl mx-auto",children:[E.jsxs("header",{className:"flex justify-between items-center mb-12",children:[E.jsxs("div",{className:"flex items-center gap-4",children:[E.jsx("button",{onClick:()=>n("/"),className:"p-3 bg-white/5 rounded-xl hover:bg-white/10 transition-all",children:E.jsx(YP,{className:"text-white"})}),E.jsxs("div",{children:[E.jsx("h1",{className:"text-2xl font-bold text-white tracking-tight",children:"Root Terminal"}),E.jsx("p",{className:"text-[10px] text-red-500 font-black uppercase tracking-[0.3em]",children:"Global System Administration"})]})]}),E.jsx("div",{className:"flex gap-4",children:E.jsxs("div",{className:"px-6 py-3 bg-red-500/10 border border-red-500/20 rounded-2xl flex items-center gap-3",children:[E.jsx(Ra,{className:"text-red-500 animate-pulse"}),E.jsx("span",{className:"text-[11px] font-bold text-red-500 uppercase tracking-widest",children:"Core Secured"})]})})]}),E.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-12",children:[{label:"Total Clusters",val:t.length,icon:E.jsx(mV,{})},{label:"System Load",val:"12%",icon:E.jsx(Ra,{})},{label:"Storage Ready",val:"Active",icon:E.jsx(CQ,{})}].map((s,o)=>E.jsxs("div",{className:"bg-white/[0.02] border border-white/5 p-6 rounded-3xl group hover:border-red-500/30 transition-all",children:[E.jsx("div",{className:"text-slate-600 mb-4 group-hover:text-red-500 transition-colors",children:s.icon}),E.jsx("p",{className:"text-3xl font-bold text-white mb-1",children:s.val}),E.jsx("p",{className:"text-[10px] uppercase font-black text-slate-700 tracking-widest",children:s.label})]},o))}),E.jsxs("div",{className:"space-y-4",children:[E.jsx("p",{className:"text-[10px] font-bold text-slate-600 uppercase tracking-[0.2em] mb-6 px-4",children:"Global Data Nodes"}),t.map(s=>E.jsxs("div",{className:"group flex items-center justify-between p-6 bg-[#0A0A0A] border border-white/5 rounded-3xl hover:bg-white/[0.02] transition-all",children:[E.jsxs("div",{className:"flex items-center gap-6",children:[E.jsx("div",{className:"w-12 h-12 rounded-2xl bg-white/5 flex items-center justify-center text-slate-500 group-hover:text-red-500 transition-colors",children:E.jsx(Eg,{})}),E.jsxs("div",{children:[E.jsxs("p",{className:"text-sm font-mono text-slate-300",children:["NODE_",s.id.slice(-8).toUpperCase()]}),E.jsxs("p",{className:"text-[10px] text-slate-600 uppercase mt-1",children:["Owner: ",E.jsx("span",{className:"text-emerald-500",children:s.owner})]})]})]}),E.jsxs("div",{className:"flex items-center gap-12",children:[E.jsxs("div",{className:"text-right hidden sm:block",children:[E.jsx("p",{className:"text-white font-bold",children:s.hash_count}),E.jsx("p",{className:"text-[9px] text-slate-700 uppercase font-bold",children:"Signatures"})]}),E.jsx("button",{onClick:()=>i(s.id),className:"w-12 h-12 flex items-center justify-center bg-red-500/10 text-red-500 rounded-2xl hover:bg-red-500 hover:text-white transition-all shadow-lg hover:shadow-red-500/20",children:E.jsx(_V,{})})]})]},s.id))]})]})})}const Bme=()=>{const{slug:t}=Oj(),e=_g(),{t:n}=Hc(),i={documentation:{icon:E.jsx(xV,{size:24}),cat:"architecture",key:"doc",color:"blue"},"knowledge-base":{icon:E.jsx(mV,{size:24}),cat:"methodology",key:"base",color:"indigo"},privacy:{icon:E.jsx(hT,{size:24}),cat:"privacy",key:"priv",color:"emerald"},terms:{icon:E.jsx(ZP,{size:24}),cat:"legal",key:"terms",color:"zinc"},cookie:{icon:E.jsx(Ra,{size:24}),cat:"technical",key:"cookie",color:"amber"},help:{icon:E.jsx(PQ,{size:24}),cat:"manual",key:"help",color:"sky"},contacts:{icon:E.jsx(AQ,{size:24}),cat:"channels",key:"contacts",color:"violet"}}[t]||{icon:E.jsx(vQ,{size:24}),cat:"error",key:"404"},s=n(`info.content.${i.key}.items`,{returnObjects:!0})||[];return E.jsxs("div",{className:"min-h-screen bg-background text-foreground font-sans selection:bg-white selection:text-black overflow-x-hidden",children:[E.jsxs("div",{className:"fixed top-0 left-1/2 -translate-x-1/2 w-full h-full -z-10 pointer-events-none overflow-hidden",children:[E.jsx("div",{className:"absolute top-[-10%] left-[-10%] w-[40%] h-[40%] bg-blue-500/10 blur-[120px] rounded-full animate-pulse"}),E.jsx("div",{className:"absolute bottom-[-10%] right-[-10%] w-[30%] h-[30%] bg-indigo-500/10 blur-[100px] rounded-full"})]}),E.jsx("nav",{className:"sticky top-0 z-[100] bg-background/50 backdrop-blur-2xl border-b border-white/5",children:E.jsxs("div",{className:"max-w-7xl mx-auto px-6 h-20 flex items-center justify-between",children:[E.jsxs("button",{onClick:()=>e(-1),className:"group flex items-center gap-3 text-[10px] font-black uppercase tracking-[0.2em] text-muted-foreground hover:text-foreground transition-all",children:[E.jsx("div",{className:"p-2 rounded-full bg-white/5 group-hover:bg-white/10 transition-colors",children:E.jsx(YP,{size:14})}),n("info.back")]}),E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg shadow-white/5",children:E.jsx($o,{size:16,className:"text-background"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tighter italic hidden sm:block",children:"QazZerep"})]}),E.jsxs("div",{className:"flex items-center gap-2",children:[E.jsx("div",{className:"w-2 h-2 rounded-full bg-emerald-500 animate-pulse shadow-[0_0_10px_rgba(16,185,129,0.5)]"}),E.jsx("span",{className:"text-[9px] font-black uppercase tracking-widest opacity-40",children:"System Live"})]})]})}),E.jsxs("main",{className:"max-w-5xl mx-auto px-6 pt-16 pb-32",children:[E.jsxs("header",{className:"mb-24 relative",children:[E.jsxs("div",{className:"inline-flex items-center gap-2 px-3 py-1 rounded-full bg-white/5 border border-white/10 mb-8 animate-in fade-in slide-in-from-bottom-2 duration-500",children:[E.jsx("span",{className:"w-1 h-1 rounded-full bg-blue-500"}),E.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-widest italic",children:n(`info.categories.${i.cat}`)})]}),E.jsxs("div",{className:"flex flex-col md:flex-row md:items-end justify-between gap-8",children:[E.jsxs("div",{className:"max-w-2xl animate-in fade-in slide-in-from-left-4 duration-700",children:[E.jsx("h1",{className:"text-5xl md:text-8xl font-medium tracking-[ -0.04em] italic uppercase leading-[0.9]",children:n(`info.pages.${i.key}.title`)}),E.jsx("p",{className:"mt-8 text-lg md:text-xl text-muted-foreground font-light leading-relaxed opacity-60",children:n("info.version_desc")})]}),E.jsx("div",{className:"hidden lg:block animate-in zoom-in duration-1000",children:E.jsxs("div",{className:"w-32 h-32 bg-white/[0.02] border border-white/5 rounded-[40px] flex items-center justify-center relative",children:[E.jsx("div",{className:"absolute inset-0 bg-gradient-to-tr from-blue-500/20 to-transparent blur-2xl opacity-50"}),E.jsx("div",{className:"relative text-foreground opacity-80",children:i.icon})]})})]})]}),E.jsx("div",{className:"grid grid-cols-1 gap-6",children:Array.isArray(s)&&s.map((o,a)=>E.jsxs("div",{className:"group relative p-[1px] rounded-[32px] overflow-hidden transition-all duration-500 hover:scale-[1.01]",children:[E.jsx("div",{className:"absolute inset-0 bg-gradient-to-r from-blue-500/0 via-white/10 to-indigo-500/0 opacity-0 group-hover:opacity-100 transition-opacity duration-500"}),E.jsxs("div",{className:"relative p-8 md:p-12 bg-[#0c0c0c]/80 backdrop-blur-md rounded-[31px] border border-white/5 flex flex-col md:flex-row gap-8 md:gap-20",children:[E.jsxs("div",{className:"md:w-1/3",children:[E.jsxs("div",{className:"flex items-center gap-3 mb-4",children:[E.jsxs("span",{className:"text-[10px] font-mono text-blue-500 font-bold tracking-tighter",children:["[",(a+1).toString().padStart(2,"0"),"]"]}),E.jsx("div",{className:"h-[1px] w-8 bg-blue-500/30"})]}),E.jsx("h3",{className:"text-xl font-medium tracking-tight text-foreground uppercase italic leading-tight",children:o.t})]}),E.jsxs("div",{className:"md:w-2/3 flex justify-between items-start group/text",children:[E.jsx("p",{className:"text-[16px] text-zinc-400 leading-relaxed font-light group-hover:text-zinc-200 transition-colors duration-300",children:o.d}),E.jsx(hV,{className:"shrink-0 mt-1 opacity-0 -translate-x-4 group-hover:opacity-10 group-hover:translate-x-0 transition-all duration-500",size:24})]})]})]},a))}),E.jsxs("footer",{className:"mt-32 pt-12 border-t border-white/5 flex flex-col md:flex-row justify-between items-center gap-8",children:[E.jsxs("div",{className:"flex flex-col gap-1",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.5em] text-muted-foreground italic",children:n("info.copyright")}),E.jsx("span",{className:"text-[9px] font-medium text-muted-foreground/30 uppercase tracking-widest",children:"Platform Version 2.0.4-stable"})]}),E.jsxs("div",{className:"flex items-center gap-8",children:[E.jsx("div",{className:"flex -space-x-2",children:[Eg,dT,hT].map((o,a)=>E.jsx("div",{className:"w-10 h-10 rounded-full bg-white/5 border border-white/10 flex items-center justify-center text-muted-foreground hover:text-foreground transition-colors cursor-help",children:E.jsx(o,{size:14})},a))}),E.jsx("button",{onClick:()=>window.scrollTo({top:0,behavior:"smooth"}),className:"w-12 h-12 rounded-full border border-white/5 flex items-center justify-center hover:bg-white/5 transition-all",children:E.jsx($o,{size:14,className:"rotate-180"})})]})]})]}),E.jsx("style",{children:`
+            `})]})}function Ome({item:t,onClick:e}){var n;return E.jsxs("div",{onClick:e,className:"p-6 bg-card border border-border rounded-[32px] flex items-center justify-between hover:border-foreground/20 transition-all cursor-pointer group shadow-sm",children:[E.jsxs("div",{className:"flex items-center gap-5",children:[E.jsx("div",{className:"w-12 h-12 rounded-2xl bg-foreground/5 border border-border flex items-center justify-center group-hover:scale-110 transition-transform",children:E.jsx(ZP,{size:20,className:"text-muted-foreground"})}),E.jsxs("div",{children:[E.jsx("p",{className:"text-[15px] font-medium tracking-tight text-foreground",children:t.pair}),E.jsxs("p",{className:"text-[10px] text-muted-foreground font-mono opacity-60 mt-1 uppercase",children:["ID: ",(n=t.report_id)==null?void 0:n.substring(0,8)]})]})]}),E.jsxs("div",{className:"flex items-center gap-8",children:[E.jsxs("span",{className:`text-xl font-bold tracking-tighter ${t.originality<50?"text-red-500":"text-emerald-500"}`,children:[t.originality,"%"]}),E.jsx(hV,{className:"text-muted-foreground group-hover:text-foreground group-hover:translate-x-1 transition-all",size:20})]})]})}function Lme({session:t,onSelect:e}){return E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-8 hover:border-foreground/20 transition-all group",children:[E.jsxs("div",{className:"flex items-center gap-3 mb-8 opacity-40 group-hover:opacity-100 transition-opacity",children:[E.jsx(_Q,{size:14,className:"text-foreground"}),E.jsx("span",{className:"text-[10px] font-black uppercase tracking-[0.2em] text-foreground",children:new Date(t.timestamp).toLocaleDateString()})]}),E.jsx("div",{className:"space-y-4",children:t.comparisons.map((n,r)=>E.jsxs("div",{onClick:()=>e(n),className:"flex justify-between items-center cursor-pointer border-b border-border/50 pb-3 last:border-0 hover:translate-x-1 transition-transform",children:[E.jsx("span",{className:"text-[13px] text-muted-foreground hover:text-foreground transition-colors truncate pr-6",children:n.pair}),E.jsxs("span",{className:`text-[13px] font-black ${n.originality<50?"text-red-500":"text-emerald-500"}`,children:[n.originality,"%"]})]},r))})]})}function XF({doc:t,title:e,t:n}){var qzS;const qzScore=(qzS=t==null?void 0:t.ai)!=null&&qzS.score!=null?qzS.score:0,r=qzScore>60;return E.jsxs("div",{className:"bg-card border border-border rounded-[40px] p-10 shadow-xl transition-all hover:scale-[1.02]",children:[E.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-[0.4em] opacity-40 italic",children:e}),E.jsx("h3",{className:"text-xl font-medium mt-3 truncate text-foreground",children:t==null?void 0:t.name}),E.jsxs("div",{className:"mt-12",children:[E.jsxs("div",{className:"flex justify-between items-end mb-4",children:[E.jsx("span",{className:"text-[10px] text-muted-foreground font-black uppercase tracking-widest",children:n("report.ai_prob")}),E.jsxs("span",{className:`text-2xl font-black italic ${r?"text-red-500":"text-emerald-500"}`,children:[qzScore,"%"]})]}),E.jsx("div",{className:"h-1.5 w-full bg-foreground/5 rounded-full overflow-hidden",children:E.jsx("div",{className:`h-full transition-all duration-1000 ${r?"bg-red-500":"bg-emerald-500"}`,style:{width:`${qzScore}%`}})})]})]})}function qF({doc:t}){return E.jsxs("div",{className:"flex flex-col bg-card border border-border rounded-[40px] overflow-hidden shadow-xl",children:[E.jsxs("div",{className:"px-8 py-5 border-b border-border flex justify-between items-center bg-foreground/[0.02]",children:[E.jsx("span",{className:"text-[10px] font-black text-muted-foreground uppercase tracking-widest truncate max-w-[300px] italic opacity-60",children:t.name}),E.jsx(Ra,{size:14,className:"text-blue-500 animate-pulse"})]}),E.jsx("div",{className:"p-10 text-[15px] text-foreground/80 leading-[1.8] max-h-[600px] overflow-y-auto custom-scrollbar font-light tracking-tight",dangerouslySetInnerHTML:{__html:t.html}})]})}function Dme({t,history:e}){const n=Array.isArray(e)&&e.length>0;let r=null,i=0;if(n){const o=[...e].sort((a,l)=>new Date(l.timestamp)-new Date(a.timestamp))[0];r=new Date(o.timestamp).toLocaleString(),i=e.reduce((a,l)=>a+(l.total_pairs||0),0)}return E.jsx("div",{className:"bg-card border border-border rounded-[28px] p-6 md:p-7 flex flex-col justify-between shadow-xl",children:E.jsxs("div",{className:"space-y-6",children:[E.jsxs("div",{children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic mb-2 block",children:t("dash.insights_title")}),E.jsx("h3",{className:"text-lg font-medium tracking-tight text-foreground",children:t(n?"dash.insights_last_run":"dash.insights_empty")})]}),E.jsxs("div",{className:"grid grid-cols-2 gap-4 text-[11px]",children:[E.jsxs("div",{className:"rounded-2xl bg-foreground/5 border border-border px-4 py-3 flex flex-col gap-1",children:[E.jsxs("span",{className:"text-[9px] uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(fT,{size:11}),t("dash.insights_last_run")]}),E.jsx("span",{className:"text-[12px] font-medium mt-1",children:n?r:"—"})]}),E.jsxs("div",{className:"rounded-2xl bg-foreground/5 border border-border px-4 py-3 flex flex-col gap-1",children:[E.jsxs("span",{className:"text-[9px] uppercase tracking-[0.25em] text-muted-foreground flex items-center gap-2",children:[E.jsx(Ra,{size:11}),t("dash.insights_total_docs")]}),E.jsx("span",{className:"text-[20px] font-black tracking-tight",children:n?i:0})]})]}),E.jsxs("div",{className:"mt-2 p-4 rounded-2xl border border-border bg-foreground/[0.02]",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground mb-2 block",children:t("dash.insights_tip_title")}),E.jsxs("ul",{className:"space-y-1.5 text-[11px] text-muted-foreground leading-relaxed",children:[E.jsxs("li",{children:["• ",t("dash.insights_tip_1")]}),E.jsxs("li",{children:["• ",t("dash.insights_tip_2")]}),E.jsxs("li",{children:["• ",t("dash.insights_tip_3")]})]})]})]})})}const kme=[{id:"ramir",name:"Ramir",roleKey:"core_architect"},{id:"ramadan",name:"Ramadan",roleKey:"product",telegram:"@brjxjxjd",avatar:Ese}];function Fme(){const{t}=Hc();return E.jsxs("div",{className:"max-w-6xl mx-auto",children:[E.jsxs("section",{className:"text-center mb-8",children:[E.jsx("h1",{className:"text-3xl md:text-4xl font-black italic tracking-tighter uppercase mb-2",children:t("team.title")}),E.jsx("p",{className:"text-[12px] md:text-sm text-muted-foreground max-w-2xl mx-auto leading-relaxed",children:t("team.subtitle")})]}),E.jsxs("div",{className:"relative overflow-hidden rounded-[32px] border border-border bg-card/80 backdrop-blur-xl shadow-[0_22px_80px_rgba(15,23,42,0.45)]",children:[E.jsx("div",{className:"team-gradient pointer-events-none"}),E.jsx("div",{className:"divide-y divide-border/50",children:kme.map((e,n)=>E.jsxs("div",{className:"relative flex flex-col sm:flex-row items-center sm:items-stretch gap-5 px-6 md:px-10 py-6 md:py-7 group",children:[E.jsxs("div",{className:"flex items-center gap-4 sm:w-1/3",children:[E.jsxs("div",{className:"relative",children:[E.jsx("div",{className:"w-16 h-16 md:w-20 md:h-20 rounded-[24px] bg-gradient-to-tr from-blue-500 to-indigo-500 flex items-center justify-center text-xl md:text-2xl font-black tracking-tighter text-white shadow-[0_0_40px_rgba(59,130,246,0.45)] group-hover:scale-[1.03] group-hover:shadow-[0_0_55px_rgba(59,130,246,0.7)] overflow-hidden transition-transform duration-400",children:e.avatar?E.jsx("img",{src:e.avatar,alt:e.name,className:"w-full h-full object-cover"}):e.name.split(" ").map(r=>r[0]).join("")}),E.jsx("div",{className:"absolute inset-0 rounded-[32px] border border-blue-400/20 group-hover:border-blue-400/50 transition-colors duration-500"})]}),E.jsxs("div",{children:[E.jsx("p",{className:"text-sm font-semibold text-foreground",children:e.name}),E.jsx("p",{className:"text-[10px] text-muted-foreground uppercase tracking-[0.25em] mt-1",children:t(`team.roles.${e.roleKey}`)})]})]}),E.jsxs("div",{className:"flex-1 flex flex-col sm:flex-row sm:items-center justify-between gap-3 mt-2 sm:mt-0",children:[E.jsx("p",{className:"text-[11px] text-muted-foreground leading-relaxed max-w-xl",children:t(`team.descriptions.${e.id}`)}),E.jsx("div",{className:"flex justify-end sm:items-center sm:justify-center min-w-[120px] text-muted-foreground",children:e.telegram&&E.jsxs("a",{href:`https://t.me/${e.telegram.replace("@","")}`,target:"_blank",rel:"noreferrer",className:"px-4 py-1.5 rounded-full bg-foreground/5 hover:bg-foreground/10 hover:text-foreground transition-colors text-[11px] font-mono flex items-center gap-2",children:[E.jsx("span",{className:"w-1.5 h-1.5 rounded-full bg-emerald-400 animate-pulse"}),e.telegram]})})]})]},n))})]})]})}function Ume({t}){return E.jsxs("div",{className:"bg-card border border-border rounded-[32px] p-6 md:p-7 shadow-xl",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.3em] text-muted-foreground italic mb-3 block",children:"QazZerep · 2026 Core"}),E.jsx("h3",{className:"text-[15px] font-medium tracking-tight text-foreground mb-3",children:"QazZerep — система сверки оригинальности документов"}),E.jsx("p",{className:"text-[11px] text-muted-foreground leading-relaxed mb-4",children:"Платформа собирает локальные архивы, открытые источники и внутренние базы, чтобы находить пересечения между студенческими и научными работами."}),E.jsxs("ul",{className:"space-y-1.5 text-[11px] text-muted-foreground/90",children:[E.jsx("li",{children:"• Асинхронный FastAPI-бэкенд, оптимизированный под батч-сравнения."}),E.jsx("li",{children:"• Поддержка PDF, DOCX, TXT, ZIP и RAR в одном окне загрузки."}),E.jsx("li",{children:"• Публичные проверки по ссылке (Verify) + PDF-отчёты для преподавателей."})]})]})}function zme(){const[t,e]=R.useState([]),n=_g();R.useEffect(()=>{r()},[]);const r=async()=>{try{const s=await li.get("/documents/admin/all-docs");e(s.data.data)}catch{console.error("Admin access error")}},i=async s=>{window.confirm("Удалить этот объект из глобальной базы?")&&(await li.delete(`/documents/delete/${s}`),r())};return E.jsx("div",{className:"min-h-screen bg-[#050505] text-slate-400 p-8 font-sans",children:E.jsxs("div",{className:"max-w-6xl mx-auto",children:[E.jsxs("header",{className:"flex justify-between items-center mb-12",children:[E.jsxs("div",{className:"flex items-center gap-4",children:[E.jsx("button",{onClick:()=>n("/"),className:"p-3 bg-white/5 rounded-xl hover:bg-white/10 transition-all",children:E.jsx(YP,{className:"text-white"})}),E.jsxs("div",{children:[E.jsx("h1",{className:"text-2xl font-bold text-white tracking-tight",children:"Root Terminal"}),E.jsx("p",{className:"text-[10px] text-red-500 font-black uppercase tracking-[0.3em]",children:"Global System Administration"})]})]}),E.jsx("div",{className:"flex gap-4",children:E.jsxs("div",{className:"px-6 py-3 bg-red-500/10 border border-red-500/20 rounded-2xl flex items-center gap-3",children:[E.jsx(Ra,{className:"text-red-500 animate-pulse"}),E.jsx("span",{className:"text-[11px] font-bold text-red-500 uppercase tracking-widest",children:"Core Secured"})]})})]}),E.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6 mb-12",children:[{label:"Total Clusters",val:t.length,icon:E.jsx(mV,{})},{label:"System Load",val:"12%",icon:E.jsx(Ra,{})},{label:"Storage Ready",val:"Active",icon:E.jsx(CQ,{})}].map((s,o)=>E.jsxs("div",{className:"bg-white/[0.02] border border-white/5 p-6 rounded-3xl group hover:border-red-500/30 transition-all",children:[E.jsx("div",{className:"text-slate-600 mb-4 group-hover:text-red-500 transition-colors",children:s.icon}),E.jsx("p",{className:"text-3xl font-bold text-white mb-1",children:s.val}),E.jsx("p",{className:"text-[10px] uppercase font-black text-slate-700 tracking-widest",children:s.label})]},o))}),E.jsxs("div",{className:"space-y-4",children:[E.jsx("p",{className:"text-[10px] font-bold text-slate-600 uppercase tracking-[0.2em] mb-6 px-4",children:"Global Data Nodes"}),t.map(s=>E.jsxs("div",{className:"group flex items-center justify-between p-6 bg-[#0A0A0A] border border-white/5 rounded-3xl hover:bg-white/[0.02] transition-all",children:[E.jsxs("div",{className:"flex items-center gap-6",children:[E.jsx("div",{className:"w-12 h-12 rounded-2xl bg-white/5 flex items-center justify-center text-slate-500 group-hover:text-red-500 transition-colors",children:E.jsx(Eg,{})}),E.jsxs("div",{children:[E.jsxs("p",{className:"text-sm font-mono text-slate-300",children:["NODE_",s.id.slice(-8).toUpperCase()]}),E.jsxs("p",{className:"text-[10px] text-slate-600 uppercase mt-1",children:["Owner: ",E.jsx("span",{className:"text-emerald-500",children:s.owner})]})]})]}),E.jsxs("div",{className:"flex items-center gap-12",children:[E.jsxs("div",{className:"text-right hidden sm:block",children:[E.jsx("p",{className:"text-white font-bold",children:s.hash_count}),E.jsx("p",{className:"text-[9px] text-slate-700 uppercase font-bold",children:"Signatures"})]}),E.jsx("button",{onClick:()=>i(s.id),className:"w-12 h-12 flex items-center justify-center bg-red-500/10 text-red-500 rounded-2xl hover:bg-red-500 hover:text-white transition-all shadow-lg hover:shadow-red-500/20",children:E.jsx(_V,{})})]})]},s.id))]})]})})}const Bme=()=>{const{slug:t}=Oj(),e=_g(),{t:n}=Hc(),i={documentation:{icon:E.jsx(xV,{size:24}),cat:"architecture",key:"doc",color:"blue"},"knowledge-base":{icon:E.jsx(mV,{size:24}),cat:"methodology",key:"base",color:"indigo"},privacy:{icon:E.jsx(hT,{size:24}),cat:"privacy",key:"priv",color:"emerald"},terms:{icon:E.jsx(ZP,{size:24}),cat:"legal",key:"terms",color:"zinc"},cookie:{icon:E.jsx(Ra,{size:24}),cat:"technical",key:"cookie",color:"amber"},help:{icon:E.jsx(PQ,{size:24}),cat:"manual",key:"help",color:"sky"},contacts:{icon:E.jsx(AQ,{size:24}),cat:"channels",key:"contacts",color:"violet"}}[t]||{icon:E.jsx(vQ,{size:24}),cat:"error",key:"404"},s=n(`info.content.${i.key}.items`,{returnObjects:!0})||[];return E.jsxs("div",{className:"min-h-screen bg-background text-foreground font-sans selection:bg-white selection:text-black overflow-x-hidden",children:[E.jsxs("div",{className:"fixed top-0 left-1/2 -translate-x-1/2 w-full h-full -z-10 pointer-events-none overflow-hidden",children:[E.jsx("div",{className:"absolute top-[-10%] left-[-10%] w-[40%] h-[40%] bg-blue-500/10 blur-[120px] rounded-full animate-pulse"}),E.jsx("div",{className:"absolute bottom-[-10%] right-[-10%] w-[30%] h-[30%] bg-indigo-500/10 blur-[100px] rounded-full"})]}),E.jsx("nav",{className:"sticky top-0 z-[100] bg-background/50 backdrop-blur-2xl border-b border-white/5",children:E.jsxs("div",{className:"max-w-7xl mx-auto px-6 h-20 flex items-center justify-between",children:[E.jsxs("button",{onClick:()=>e(-1),className:"group flex items-center gap-3 text-[10px] font-black uppercase tracking-[0.2em] text-muted-foreground hover:text-foreground transition-all",children:[E.jsx("div",{className:"p-2 rounded-full bg-white/5 group-hover:bg-white/10 transition-colors",children:E.jsx(YP,{size:14})}),n("info.back")]}),E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-8 h-8 bg-foreground rounded-lg flex items-center justify-center shadow-lg shadow-white/5",children:E.jsx($o,{size:16,className:"text-background"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tighter italic hidden sm:block",children:"QazZerep"})]}),E.jsxs("div",{className:"flex items-center gap-2",children:[E.jsx("div",{className:"w-2 h-2 rounded-full bg-emerald-500 animate-pulse shadow-[0_0_10px_rgba(16,185,129,0.5)]"}),E.jsx("span",{className:"text-[9px] font-black uppercase tracking-widest opacity-40",children:"System Live"})]})]})}),E.jsxs("main",{className:"max-w-5xl mx-auto px-6 pt-16 pb-32",children:[E.jsxs("header",{className:"mb-24 relative",children:[E.jsxs("div",{className:"inline-flex items-center gap-2 px-3 py-1 rounded-full bg-white/5 border border-white/10 mb-8 animate-in fade-in slide-in-from-bottom-2 duration-500",children:[E.jsx("span",{className:"w-1 h-1 rounded-full bg-blue-500"}),E.jsx("span",{className:"text-[9px] font-black text-muted-foreground uppercase tracking-widest italic",children:n(`info.categories.${i.cat}`)})]}),E.jsxs("div",{className:"flex flex-col md:flex-row md:items-end justify-between gap-8",children:[E.jsxs("div",{className:"max-w-2xl animate-in fade-in slide-in-from-left-4 duration-700",children:[E.jsx("h1",{className:"text-5xl md:text-8xl font-medium tracking-[ -0.04em] italic uppercase leading-[0.9]",children:n(`info.pages.${i.key}.title`)}),E.jsx("p",{className:"mt-8 text-lg md:text-xl text-muted-foreground font-light leading-relaxed opacity-60",children:n("info.version_desc")})]}),E.jsx("div",{className:"hidden lg:block animate-in zoom-in duration-1000",children:E.jsxs("div",{className:"w-32 h-32 bg-white/[0.02] border border-white/5 rounded-[40px] flex items-center justify-center relative",children:[E.jsx("div",{className:"absolute inset-0 bg-gradient-to-tr from-blue-500/20 to-transparent blur-2xl opacity-50"}),E.jsx("div",{className:"relative text-foreground opacity-80",children:i.icon})]})})]})]}),E.jsx("div",{className:"grid grid-cols-1 gap-6",children:Array.isArray(s)&&s.map((o,a)=>E.jsxs("div",{className:"group relative p-[1px] rounded-[32px] overflow-hidden transition-all duration-500 hover:scale-[1.01]",children:[E.jsx("div",{className:"absolute inset-0 bg-gradient-to-r from-blue-500/0 via-white/10 to-indigo-500/0 opacity-0 group-hover:opacity-100 transition-opacity duration-500"}),E.jsxs("div",{className:"relative p-8 md:p-12 bg-[#0c0c0c]/80 backdrop-blur-md rounded-[31px] border border-white/5 flex flex-col md:flex-row gap-8 md:gap-20",children:[E.jsxs("div",{className:"md:w-1/3",children:[E.jsxs("div",{className:"flex items-center gap-3 mb-4",children:[E.jsxs("span",{className:"text-[10px] font-mono text-blue-500 font-bold tracking-tighter",children:["[",(a+1).toString().padStart(2,"0"),"]"]}),E.jsx("div",{className:"h-[1px] w-8 bg-blue-500/30"})]}),E.jsx("h3",{className:"text-xl font-medium tracking-tight text-foreground uppercase italic leading-tight",children:o.t})]}),E.jsxs("div",{className:"md:w-2/3 flex justify-between items-start group/text",children:[E.jsx("p",{className:"text-[16px] text-zinc-400 leading-relaxed font-light group-hover:text-zinc-200 transition-colors duration-300",children:o.d}),E.jsx(hV,{className:"shrink-0 mt-1 opacity-0 -translate-x-4 group-hover:opacity-10 group-hover:translate-x-0 transition-all duration-500",size:24})]})]})]},a))}),E.jsxs("footer",{className:"mt-32 pt-12 border-t border-white/5 flex flex-col md:flex-row justify-between items-center gap-8",children:[E.jsxs("div",{className:"flex flex-col gap-1",children:[E.jsx("span",{className:"text-[9px] font-black uppercase tracking-[0.5em] text-muted-foreground italic",children:n("info.copyright")}),E.jsx("span",{className:"text-[9px] font-medium text-muted-foreground/30 uppercase tracking-widest",children:"Platform Version 2.0.4-stable"})]}),E.jsxs("div",{className:"flex items-center gap-8",children:[E.jsx("div",{className:"flex -space-x-2",children:[Eg,dT,hT].map((o,a)=>E.jsx("div",{className:"w-10 h-10 rounded-full bg-white/5 border border-white/10 flex items-center justify-center text-muted-foreground hover:text-foreground transition-colors cursor-help",children:E.jsx(o,{size:14})},a))}),E.jsx("button",{onClick:()=>window.scrollTo({top:0,behavior:"smooth"}),className:"w-12 h-12 rounded-full border border-white/5 flex items-center justify-center hover:bg-white/5 transition-all",children:E.jsx($o,{size:14,className:"rotate-180"})})]})]})]}),E.jsx("style",{children:`
         .custom-scrollbar::-webkit-scrollbar { width: 4px; }
         .custom-scrollbar::-webkit-scrollbar-thumb { background: rgba(255,255,255,0.1); border-radius: 10px; }
         
@@ -4276,4 +4276,4 @@ No matching component was found for:
                 main > div {
                     animation: fade-in-up 0.8s cubic-bezier(0.16, 1, 0.3, 1) forwards;
                 }
-            `})]})}function lB({label:t,icon:e,active:n=!1}){return E.jsxs("div",{className:`flex items-center gap-2 px-4 py-1.5 rounded-full border text-[9px] font-black uppercase tracking-widest transition-all ${n?"bg-blue-500/10 border-blue-500/20 text-blue-500":"bg-white/5 border-white/10 text-zinc-500"}`,children:[e,t]})}const aCe=[{name:"Operator One",roleKey:"core_architect",email:"operator.one@example.com"},{name:"Operator Two",roleKey:"ml_engineer",email:"operator.two@example.com"},{name:"Operator Three",roleKey:"frontend",email:"operator.three@example.com"}];function lCe(){const t=_g(),{t:e}=Hc();return E.jsx("div",{className:"min-h-screen bg-[#050505] text-zinc-200 font-sans",children:E.jsxs("div",{className:"max-w-6xl mx-auto px-6 py-10",children:[E.jsxs("header",{className:"flex items-center justify-between mb-12",children:[E.jsxs("button",{onClick:()=>t(-1),className:"flex items-center gap-2 text-[10px] font-black uppercase tracking-[0.25em] text-zinc-500 hover:text-white transition-colors",children:[E.jsx("span",{className:"p-2 rounded-full bg-white/5 hover:bg-white/10",children:E.jsx(YP,{size:14})}),"Back"]}),E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-9 h-9 bg-white rounded-xl flex items-center justify-center",children:E.jsx($o,{size:18,className:"text-black"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]})]}),E.jsxs("section",{className:"text-center mb-16",children:[E.jsx("h1",{className:"text-4xl md:text-5xl font-black italic tracking-tighter uppercase mb-3",children:e("team.title")}),E.jsx("p",{className:"text-[12px] md:text-sm text-zinc-500 max-w-2xl mx-auto leading-relaxed",children:e("team.subtitle")}),E.jsx("div",{className:"mt-6 h-1 w-20 bg-blue-500 mx-auto rounded-full shadow-[0_0_15px_rgba(59,130,246,0.5)]"})]}),E.jsx("main",{className:"grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8",children:aCe.map((n,r)=>E.jsxs("div",{className:"relative bg-white/[0.02] border border-white/5 rounded-[32px] p-6 flex flex-col items-center text-center gap-4 hover:border-white/15 transition-all overflow-hidden",children:[E.jsx("div",{className:"absolute -top-10 -right-10 w-24 h-24 bg-blue-500/10 blur-3xl rounded-full"}),E.jsx("div",{className:"w-24 h-24 rounded-[28px] bg-gradient-to-tr from-blue-500 to-indigo-500 flex items-center justify-center text-3xl font-black tracking-tighter text-white shadow-[0_0_40px_rgba(59,130,246,0.4)] mb-2 relative z-10",children:n.name.split(" ").map(i=>i[0]).join("")}),E.jsxs("div",{className:"relative z-10",children:[E.jsx("p",{className:"text-sm font-semibold text-white",children:n.name}),E.jsx("p",{className:"text-[10px] text-zinc-500 uppercase tracking-[0.25em] mt-1",children:e(`team.roles.${n.roleKey}`)})]}),E.jsxs("div",{className:"flex items-center justify-center gap-3 mt-2 text-zinc-500 relative z-10",children:[E.jsx("a",{href:`mailto:${n.email}`,className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(vV,{size:14})}),E.jsx("button",{className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(EQ,{size:14})}),E.jsx("button",{className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(NQ,{size:14})})]}),E.jsx("p",{className:"text-[10px] text-zinc-600 mt-4 leading-relaxed relative z-10",children:e("team.note")})]},r))})]})})}function uB({children:t,adminOnly:e=!1}){const{token:n,user:r}=cV();return n?e&&(r==null?void 0:r.sub)!=="admin@qazzerep.kz"?E.jsx(JO,{to:"/"}):t:E.jsx(JO,{to:"/login"})}function uCe(){return E.jsx(uQ,{children:E.jsxs(bZ,{children:[E.jsx(Hu,{path:"/login",element:E.jsx(Nie,{})}),E.jsx(Hu,{path:"/team",element:E.jsx(lCe,{})}),E.jsx(Hu,{path:"/:slug",element:E.jsx(Bme,{})}),E.jsx(Hu,{path:"/verify/:reportId",element:E.jsx(oCe,{})}),E.jsx(Hu,{path:"/",element:E.jsx(uB,{children:E.jsx(Ime,{})})}),E.jsx(Hu,{path:"/admin",element:E.jsx(uB,{adminOnly:!0,children:E.jsx(zme,{})})})]})})}const{slice:cCe,forEach:fCe}=[];function dCe(t){return fCe.call(cCe.call(arguments,1),e=>{if(e)for(const n in e)t[n]===void 0&&(t[n]=e[n])}),t}function hCe(t){return typeof t!="string"?!1:[/<\s*script.*?>/i,/<\s*\/\s*script\s*>/i,/<\s*img.*?on\w+\s*=/i,/<\s*\w+\s*on\w+\s*=.*?>/i,/javascript\s*:/i,/vbscript\s*:/i,/expression\s*\(/i,/eval\s*\(/i,/alert\s*\(/i,/document\.cookie/i,/document\.write\s*\(/i,/window\.location/i,/innerHTML/i].some(n=>n.test(t))}const cB=/^[\u0009\u0020-\u007e\u0080-\u00ff]+$/,pCe=function(t,e){const r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{path:"/"},i=encodeURIComponent(e);let s=`${t}=${i}`;if(r.maxAge>0){const o=r.maxAge-0;if(Number.isNaN(o))throw new Error("maxAge should be a Number");s+=`; Max-Age=${Math.floor(o)}`}if(r.domain){if(!cB.test(r.domain))throw new TypeError("option domain is invalid");s+=`; Domain=${r.domain}`}if(r.path){if(!cB.test(r.path))throw new TypeError("option path is invalid");s+=`; Path=${r.path}`}if(r.expires){if(typeof r.expires.toUTCString!="function")throw new TypeError("option expires is invalid");s+=`; Expires=${r.expires.toUTCString()}`}if(r.httpOnly&&(s+="; HttpOnly"),r.secure&&(s+="; Secure"),r.sameSite)switch(typeof r.sameSite=="string"?r.sameSite.toLowerCase():r.sameSite){case!0:s+="; SameSite=Strict";break;case"lax":s+="; SameSite=Lax";break;case"strict":s+="; SameSite=Strict";break;case"none":s+="; SameSite=None";break;default:throw new TypeError("option sameSite is invalid")}return r.partitioned&&(s+="; Partitioned"),s},fB={create(t,e,n,r){let i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:{path:"/",sameSite:"strict"};n&&(i.expires=new Date,i.expires.setTime(i.expires.getTime()+n*60*1e3)),r&&(i.domain=r),document.cookie=pCe(t,e,i)},read(t){const e=`${t}=`,n=document.cookie.split(";");for(let r=0;r<n.length;r++){let i=n[r];for(;i.charAt(0)===" ";)i=i.substring(1,i.length);if(i.indexOf(e)===0)return i.substring(e.length,i.length)}return null},remove(t,e){this.create(t,"",-1,e)}};var mCe={name:"cookie",lookup(t){let{lookupCookie:e}=t;if(e&&typeof document<"u")return fB.read(e)||void 0},cacheUserLanguage(t,e){let{lookupCookie:n,cookieMinutes:r,cookieDomain:i,cookieOptions:s}=e;n&&typeof document<"u"&&fB.create(n,t,r,i,s)}},gCe={name:"querystring",lookup(t){var r;let{lookupQuerystring:e}=t,n;if(typeof window<"u"){let{search:i}=window.location;!window.location.search&&((r=window.location.hash)==null?void 0:r.indexOf("?"))>-1&&(i=window.location.hash.substring(window.location.hash.indexOf("?")));const o=i.substring(1).split("&");for(let a=0;a<o.length;a++){const l=o[a].indexOf("=");l>0&&o[a].substring(0,l)===e&&(n=o[a].substring(l+1))}}return n}},vCe={name:"hash",lookup(t){var i;let{lookupHash:e,lookupFromHashIndex:n}=t,r;if(typeof window<"u"){const{hash:s}=window.location;if(s&&s.length>2){const o=s.substring(1);if(e){const a=o.split("&");for(let l=0;l<a.length;l++){const u=a[l].indexOf("=");u>0&&a[l].substring(0,u)===e&&(r=a[l].substring(u+1))}}if(r)return r;if(!r&&n>-1){const a=s.match(/\/([a-zA-Z-]*)/g);return Array.isArray(a)?(i=a[typeof n=="number"?n:0])==null?void 0:i.replace("/",""):void 0}}}return r}};let jf=null;const dB=()=>{if(jf!==null)return jf;try{if(jf=typeof window<"u"&&window.localStorage!==null,!jf)return!1;const t="i18next.translate.boo";window.localStorage.setItem(t,"foo"),window.localStorage.removeItem(t)}catch{jf=!1}return jf};var yCe={name:"localStorage",lookup(t){let{lookupLocalStorage:e}=t;if(e&&dB())return window.localStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupLocalStorage:n}=e;n&&dB()&&window.localStorage.setItem(n,t)}};let Vf=null;const hB=()=>{if(Vf!==null)return Vf;try{if(Vf=typeof window<"u"&&window.sessionStorage!==null,!Vf)return!1;const t="i18next.translate.boo";window.sessionStorage.setItem(t,"foo"),window.sessionStorage.removeItem(t)}catch{Vf=!1}return Vf};var xCe={name:"sessionStorage",lookup(t){let{lookupSessionStorage:e}=t;if(e&&hB())return window.sessionStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupSessionStorage:n}=e;n&&hB()&&window.sessionStorage.setItem(n,t)}},_Ce={name:"navigator",lookup(t){const e=[];if(typeof navigator<"u"){const{languages:n,userLanguage:r,language:i}=navigator;if(n)for(let s=0;s<n.length;s++)e.push(n[s]);r&&e.push(r),i&&e.push(i)}return e.length>0?e:void 0}},SCe={name:"htmlTag",lookup(t){let{htmlTag:e}=t,n;const r=e||(typeof document<"u"?document.documentElement:null);return r&&typeof r.getAttribute=="function"&&(n=r.getAttribute("lang")),n}},wCe={name:"path",lookup(t){var i;let{lookupFromPathIndex:e}=t;if(typeof window>"u")return;const n=window.location.pathname.match(/\/([a-zA-Z-]*)/g);return Array.isArray(n)?(i=n[typeof e=="number"?e:0])==null?void 0:i.replace("/",""):void 0}},bCe={name:"subdomain",lookup(t){var i,s;let{lookupFromSubdomainIndex:e}=t;const n=typeof e=="number"?e+1:1,r=typeof window<"u"&&((s=(i=window.location)==null?void 0:i.hostname)==null?void 0:s.match(/^(\w{2,5})\.(([a-z0-9-]{1,63}\.[a-z]{2,6})|localhost)/i));if(r)return r[n]}};let mX=!1;try{document.cookie,mX=!0}catch{}const gX=["querystring","cookie","localStorage","sessionStorage","navigator","htmlTag"];mX||gX.splice(1,1);const MCe=()=>({order:gX,lookupQuerystring:"lng",lookupCookie:"i18next",lookupLocalStorage:"i18nextLng",lookupSessionStorage:"i18nextLng",caches:["localStorage"],excludeCacheFor:["cimode"],convertDetectedLanguage:t=>t});class vX{constructor(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};this.type="languageDetector",this.detectors={},this.init(e,n)}init(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{languageUtils:{}},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};this.services=e,this.options=dCe(n,this.options||{},MCe()),typeof this.options.convertDetectedLanguage=="string"&&this.options.convertDetectedLanguage.indexOf("15897")>-1&&(this.options.convertDetectedLanguage=i=>i.replace("-","_")),this.options.lookupFromUrlIndex&&(this.options.lookupFromPathIndex=this.options.lookupFromUrlIndex),this.i18nOptions=r,this.addDetector(mCe),this.addDetector(gCe),this.addDetector(yCe),this.addDetector(xCe),this.addDetector(_Ce),this.addDetector(SCe),this.addDetector(wCe),this.addDetector(bCe),this.addDetector(vCe)}addDetector(e){return this.detectors[e.name]=e,this}detect(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:this.options.order,n=[];return e.forEach(r=>{if(this.detectors[r]){let i=this.detectors[r].lookup(this.options);i&&typeof i=="string"&&(i=[i]),i&&(n=n.concat(i))}}),n=n.filter(r=>r!=null&&!hCe(r)).map(r=>this.options.convertDetectedLanguage(r)),this.services&&this.services.languageUtils&&this.services.languageUtils.getBestMatchFromCodes?n:n.length>0?n[0]:null}cacheUserLanguage(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:this.options.caches;n&&(this.options.excludeCacheFor&&this.options.excludeCacheFor.indexOf(e)>-1||n.forEach(r=>{this.detectors[r]&&this.detectors[r].cacheUserLanguage(e,this.options)}))}}vX.type="languageDetector";yi.use(vX).use(use).init({resources:{rus:{translation:{roadmap:{title:"Планы развития",year:"2026",active_status:"В разработке",q1:{title:"Фундамент и AI Ядро",items:["Запуск нейронного ядра QazZerep v2.0","Интеграция с локальными базами данных","Обновление 3D-интерфейса"]},q2:{title:"Мультиформатный анализ",items:["Поддержка анализа видео и аудио","Расширение языковых моделей (KZ, RU, EN, TR)","API для корпоративных клиентов"]},q3:{title:"Глобальная связность",items:["Запуск мобильного приложения","Blockchain-верификация отчетов","Коллаборация с вузами РК"]},q4:{title:"Автономная экосистема",items:["Self-learning AI (дообучение)","Прогноз академических трендов","Глобальный поиск по архивам"]}},auth:{login_title:"Авторизация",login_btn:"Вход в систему",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Нет доступа?",create_id:"Создать ID узла",error_invalid:"ACCESS_DENIED: НЕВЕРНЫЕ ДАННЫЕ"},nav:{check:"Проверка",history:"История",account:"Аккаунт",roadmap:"Планы 2026",team:"Команда"},settings:{language:"Язык системы",theme:"Тема оформления"},dash:{title_new:"Сверка документов",subtitle_new:"Интеллектуальный анализ сходства текстов",title_history:"Архив проверок",subtitle_history:"История ваших предыдущих анализов",btn_reset:"Сбросить и начать заново",clear_history:"Очистить историю",clearing:"Очистка...",clear_confirm:"Удалить всю историю проверок? Это действие нельзя отменить.",history_label:"Сессий в архиве",insights_title:"Сводка по проверкам",insights_last_run:"Последняя проверка",insights_total_docs:"Документов проверено",insights_empty:"Пока нет ни одной проверки",insights_tip_title:"Как читать проценты",insights_tip_1:"80–100% — безопасная зона, текст выглядит оригинальным.",insights_tip_2:"50–80% — зона внимания, пройдитесь по совпадениям вручную.",insights_tip_3:"Меньше 50% — высокая зона риска, нужен детальный разбор."},upload:{title:"Перетащите файлы сюда",formats:"PDF, DOCX, TXT, ZIP и RAR",selected:"Выбрано",btn_start:"Запустить анализ"},team:{title:"Команда ядра",subtitle:"Люди, которые собирают и поддерживают QazZerep.",roles:{core_architect:"Фуллстек / backend",product:"Идея, презентации и документация"},descriptions:{ramir:"Ramir отвечает за backend и весь интерфейс QazZerep — от дашборда до публичных страниц.",ramadan:"Ramadan — автор идеи QazZerep, собирает требования, готовит презентации и документацию проекта."},note:"Здесь пока заглушки — позже вы сможете подставить реальные фото и ссылки."},report:{title:"Отчет анализа",match_label:"Сходство",source_a:"Источник А",target_b:"Источник Б",ai_prob:"Вероятность ИИ",copied:"Скопировано",recalc_title:"Пересчет уникальности",recalc_subtitle:"Отредактируйте фрагменты текста и заново пересчитайте коэффициент без повторной загрузки файлов.",recalc_btn:"Пересчитать",recalc_btn_loading:"Пересчет...",recalc_hint:"Изменения не сохраняются в историю — это быстрый черновой режим для подстройки формулировок."},profile:{title:"Настройки узла",save_btn:"Сохранить",syncing:"Синхронизация",config_synced:"КОНФИГ_СИНХРОНИЗИРОВАН",upload_failed:"ОШИБКА_ЗАГРУЗКИ",avatar_updated:"АВАТАР_ОБНОВЛЕН",public_name:"Публичное имя",contact_email:"Контактный Email",node_active:"Узел активен",cloud_sync:"Синхронизация с облачным ядром активна",detectors:"Детекторы заимствований",ignore_quotes:"Игнорировать цитаты",smart_quotes:"Умное распознавание цитат",change_pass:"Сменить пароль",logout:"Выйти из системы",rules:{gost:"Литература (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Таблицы и графики",titles:"Титульный лист"}},footer:{description:"Автоматизированная система интеллектуальной сверки протоколов и документации.",engine_name:"Движок Интеллект-Сверки",sections:{nav:{title:"Навигатор"},legal:{title:"Правовой узел"},support:{title:"Поддержка"}}},info:{back:"Назад",version_desc:"Подробные спецификации и регламенты работы платформы QazZerep версии 2.4.0.",copyright:"© 2026 Инфраструктура Ядра",categories:{architecture:"Системная Архитектура",methodology:"Методология Данных",privacy:"Конфиденциальность",legal:"Юридическая База",technical:"Техническая Сессия",manual:"Руководство",channels:"Прямые Каналы"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро использует высокопроизводительную библиотеку fitz для прямого доступа к бинарным структурам PDF. Текст извлекается в виде потока байтов, минуя сохранение на диск."},{t:"Динамический K-Shingling",d:"Алгоритм разбивает текст на пересекающиеся последовательности. Параметр k=3..9 позволяет системе находить не только прямое копирование, но и умный рерайт."},{t:"MD5 Fingerprinting",d:"Генерация 128-битных отпечатков сегментов. Позволяет сравнивать документы через сопоставление цифровых сигнатур в RAM."},{t:"Индекс Сходства Жаккара",d:"Математическая модель расчета пересечения множеств хешей, обеспечивающая эталонную точность вычисления уникальности."},{t:"Batch Cross-Check (O(n²))",d:"Пакетная сверка всех загруженных файлов между собой для выявления скрытых сетей передачи работ."},{t:"Asynchronous FastAPI Backend",d:"Асинхронность на базе Python asyncio поддерживает стабильный пинг даже при анализе тяжелых массивов данных."},{t:"Neural Highlight Engine",d:"Визуализация через CSS-движок: .diff-match подсвечивает плагиат, а .diff-rewrite отмечает зоны обфускации."},{t:"RAM-Only Processing",d:"Вычисления происходят в волатильной памяти. После сессии объекты уничтожаются, не оставляя следов на диске."}]},base:{items:[{t:"Локальный Архив ВУЗов",d:"Централизованная база всех загруженных работ студентов РК для выявления горизонтального плагиата."},{t:"Open Access Crawling",d:"Индексация репозиториев arXiv.org, Google Scholar и ResearchGate для поиска в научных публикациях."},{t:"KazNet Deep Index",d:"Собственный робот QazBot индексирует гос. порталы и архивы диссертаций на казахском и русском языках."},{t:"Cross-Language Mapping",d:"Технология перевода сегментов текста для поиска заимствований с английского языка на казахский/русский."},{t:"GitHub & Code Analysis",d:"Анализ программного кода (50+ языков) для проверки технических работ на плагиат из репозиториев."},{t:"AI Content Patterns",d:"Статистический анализ текстов на наличие признаков генерации нейросетями (GPT-4, Claude)."}]},priv:{items:[{t:"Суверенитет Данных РК",d:"Все серверные мощности расположены в сертифицированных дата-центрах на территории Республики Казахстан."},{t:"Шифрование AES-GCM-256",d:"Каналы передачи данных защищены военным стандартом шифрования. Ваши документы недоступны для перехвата."},{t:"Stateless Архитектура",d:"Система не сохраняет историю загрузок без требования пользователя. Каждый акт проверки эфемерный."},{t:"JWT-Авторизация",d:"Доступ защищен токенами с ограниченным временем жизни, что предотвращает угон сессий."},{t:"ISO 27001 Compliance",d:"Внутренние процессы управления данными соответствуют международным стандартам безопасности."},{t:"Право на Забвение",d:"Пользователь может в один клик удалить все свои следы, включая хешированные отпечатки работ."}]},terms:{items:[{t:"Акцепт Соглашения",d:"Использование сервиса означает принятие условий. Ответственность за интерпретацию результатов лежит на пользователе."},{t:"Интеллектуальная Собственность",d:"Алгоритмы принадлежат QazZerep. Пользователь сохраняет права на загружаемый контент."},{t:"Добросовестное Использование",d:"Запрещается использование ботов для обхода ограничений системы или проведения атак."},{t:"Ограничение Ответственности",d:"Система предоставляет вероятностную оценку. Мы не гарантируем 100% выявление всех форм нейро-обфускации."}]},cookie:{items:[{t:"Session Persistence",d:"Используем технические куки для JWT-авторизации, чтобы не вводить пароль при обновлении."},{t:"Security Tokens",d:"Анти-фрод файлы помогают идентифицировать подозрительную активность и защищать аккаунт."},{t:"Zero Third-Party Tracking",d:"Мы не используем маркетинговые куки. Ваша активность не передается рекламным сетям."},{t:"LocalStorage Usage",d:"Данные о прогрессе анализа могут временно храниться в браузере для восстановления сессии."}]},help:{items:[{t:"Инструкция по загрузке",d:"Рекомендуется PDF с текстовым слоем. Для сканов работает модуль Anti-OCR."},{t:"Интерпретация отчета",d:"80%+ — норма. Ниже 50% — критическая зона, требующая ручной проверки."},{t:"Технические лимиты",d:"Максимальный размер файла — 50MB. Для Big Data свяжитесь с отделом интеграции."}]},contacts:{items:[{t:"Telegram Support",d:"Оперативная связь: @brjxjxjd (Ответ в течение 5 минут)."},{t:"Phone Hotline",d:"Горячая линия для экстренных вопросов: +7 (777) 123-45-67 (24/7)."}]}}}}},kaz:{translation:{roadmap:{title:"Даму жоспары",year:"2026",active_status:"Әзірлеу үстінде",q1:{title:"Іргетас және AI Ядросы",items:["QazZerep v2.0 нейрондық ядросын іске қосу","Жергілікті деректер базаларымен интеграция","3D интерфейсін жаңарту"]},q2:{title:"Мультиформатты талдау",items:["Бейне және аудио талдауды қолдау","Тілдік модельдерді кеңейту (KZ, RU, EN, TR)","Корпоративтік клиенттерге арналған API"]},q3:{title:"Жаһандық байланыс",items:["Мобильді қолданбаны іске қосу","Есептерді Blockchain арқылы тексеру","ҚР жоғары оқу орындарымен ынтымақтастық"]},q4:{title:"Автономды экожүйе",items:["Self-learning AI (өзін-өзі оқыту)","Академиялық трендтерді болжау","Мұрағаттар бойынша жаһандық іздеу"]}},auth:{login_title:"Авторизация",login_btn:"Жүйеге кіру",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Кіру мүмкін емес пе?",create_id:"Түйін ID-ін жасау",error_invalid:"ACCESS_DENIED: ҚАТЕ ДЕРЕКТЕР"},nav:{check:"Тексеру",history:"Тарих",account:"Аккаунт",roadmap:"Даму жоспары",team:"Топ"},settings:{language:"Жүйе тілі",theme:"Интерфейс тақырыбы"},dash:{title_new:"Құжаттарды салыстыру",subtitle_new:"Мәтіндердің ұқсастығын интеллектуалды талдау",title_history:"Тексерулер мұрағаты",subtitle_history:"Алдыңғы талдауларыңыздың тарихы",btn_reset:"Тазалау және қайта бастау",clear_history:"Тарихты тазалау",clearing:"Тазаланып жатыр...",clear_confirm:"Барлық тексеру тарихын жоямыз ба? Бұл әрекетті болдырмауға болмайды.",history_label:"Мұрағат сессиялары",insights_title:"Тексеру сводкасы",insights_last_run:"Соңғы тексеру",insights_total_docs:"Тексерілген құжаттар",insights_empty:"Әзірге бірде-бір тексеру жоқ",insights_tip_title:"Проценттерді оқу",insights_tip_1:"80–100% — қауіпсіз аймақ, мәтін түпнұсқаға ұқсас.",insights_tip_2:"50–80% — назар аймағы, сәйкестіктерді қолмен қарап шығыңыз.",insights_tip_3:"50%-дан төмен — жоғары тәуекел аймағы, деталды талдау қажет."},upload:{title:"Файлдарды осы жерге сүйреңіз",formats:"PDF, DOCX, TXT, ZIP және RAR",selected:"Таңдалды",btn_start:"Талдауды бастау"},team:{title:"Ядро командасы",subtitle:"QazZerep платформасын құратын және қолдайтын адамдар.",roles:{core_architect:"Fullstack / backend",product:"Идея, презентациялар және құжаттама"},descriptions:{ramir:"Ramir QazZerep платформасының backend бөлігі мен интерфейсін — дашбордтан бастап жалпы беттерге дейін жасайды.",ramadan:"Ramadan — QazZerep идеясының авторы, талаптарды жинайды, презентациялар мен жобаның құжаттамасын дайындайды."},note:"Қазір мұнда плейсхолдерлер — кейін нақты фотоларды және сілтемелерді қоса аласыз."},report:{title:"Талдау есебі",match_label:"Ұқсастық",source_a:"А дереккөзі",target_b:"Б дереккөзі",ai_prob:"ИИ ықтималдығы",copied:"Көшірілді",recalc_title:"Уникалдылықты қайта есептеу",recalc_subtitle:"Мәтін үзінділерін түзетіп, файлдарды қайта жүктемей коэффициентті қайта есептеңіз.",recalc_btn:"Қайта есептеу",recalc_btn_loading:"Қайта есептелуде...",recalc_hint:"Өзгерістер мұрағатта сақталмайды — бұл тек формулировканы жедел түзетуге арналған режим."},profile:{title:"Түйін параметрлері",save_btn:"Сақтау",syncing:"Синхрондау",config_synced:"КОНФИГ_СИНХРОНДАЛДЫ",upload_failed:"ЖҮКТЕУ_ҚАТАСЫ",avatar_updated:"АВАТАР_ЖАҢАРТЫЛДЫ",public_name:"Жалпыға ортақ есім",contact_email:"Байланыс Email-ы",node_active:"Түйін белсенді",cloud_sync:"Бұлтты ядромен синхрондау белсенді",detectors:"Ұқсастық детекторы",ignore_quotes:"Дәйексөздерді елемеу",smart_quotes:"Дәйексөздерді ақылды тану",change_pass:"Құпия сөзді өзгерту",logout:"Жүйеден шығу",rules:{gost:"Әдебиет (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Кестелер",titles:"Титул парағы"}},footer:{description:"Хаттамалар мен құжаттарды интеллектуалды салыстырудың автоматтандырылған жүйесі.",engine_name:"Интеллект-Салыстыру Жүйесі",sections:{nav:{title:"Навигатор"},legal:{title:"Құқықтық орталық"},support:{title:"Қолдау"}}},info:{back:"Артқа",version_desc:"QazZerep 2.4.0 платформасының егжей-тегжейлі сипаттамалары мен жұмыс ережелері.",copyright:"© 2026 Ядролық Инфрақұрылым",categories:{architecture:"Жүйе Архитектурасы",methodology:"Деректер Әдістемесі",privacy:"Құпиялылық",legal:"Құқықтық Негіз",technical:"Техникалық Сессия",manual:"Нұсқаулық",channels:"Тікелей Арналар"},pages:{doc:{title:"Құжаттама"},base:{title:"Жалпы Индекс"},priv:{title:"Қауіпсіздік Хаттамасы"},terms:{title:"Пайдалану Шарттары"},cookie:{title:"Cookie Саясаты"},help:{title:"Көмек Орталығы"},contacts:{title:"Байланыс Түйіндері"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро PDF бинарлық құрылымдарына тікелей қол жеткізу үшін жоғары өнімді fitz кітапханасын пайдаланады. Мәтін байт ағыны түрінде алынады."},{t:"Динамикалық K-Shingling",d:"Алгоритм мәтінді ақылды рерайтты іздеу үшін қиылысатын тізбектерге бөледі."},{t:"MD5 Fingerprinting",d:"RAM-дағы сандық қолтаңбаларды салыстыру үшін сегменттердің 128 биттік таңбаларын жасау."},{t:"Жаккар ұқсастық индексі",d:"Бірегейлікті есептеудің эталондық дәлдігін қамтамасыз ететін хэш жиындарының қиылысуын есептеудің математикалық моделі."},{t:"Batch Cross-Check",d:"Жұмыстарды берудің жасырын желілерін анықтау үшін барлық жүктелген файлдарды өзара пакеттік салыстыру."},{t:"RAM-Only Processing",d:"Есептеулер тұрақсыз жадта жүреді. Сессиядан кейін нысандар ізсіз жойылады."}]},base:{items:[{t:"ЖОО-лардың жергілікті мұрағаты",d:"Көлденең плагиатты анықтау үшін ҚР студенттерінің барлық жүктелген жұмыстарының орталықтандырылған базасы."},{t:"Open Access Crawling",d:"Ғылыми жарияланымдардан іздеу үшін arXiv.org, Google Scholar және ResearchGate репозиторийлерін индекстеу."},{t:"KazNet Deep Index",d:"Жеке QazBot роботы мемлекеттік порталдарды және қазақ/орыс тілдеріндегі диссертациялар мұрағатын индекстейді."},{t:"Cross-Language Mapping",d:"Ағылшын тілінен қазақ/орыс тілдеріне аударылған мәтін үзінділерін іздеу технологиясы."}]}}}}},eng:{translation:{roadmap:{title:"Project Roadmap",year:"2026",active_status:"Active Development",q1:{title:"Foundation & AI Core",items:["QazZerep v2.0 Neural Core Launch","Local Database Integration","3D Interface Update"]},q2:{title:"Multi-Format Analysis",items:["Video & Audio Analysis Support","LLM Expansion (KZ, RU, EN, TR)","Enterprise API Access"]},q3:{title:"Global Connectivity",items:["Mobile App Launch (iOS/Android)","Blockchain Report Verification","University Partnerships in RK"]},q4:{title:"Autonomous Ecosystem",items:["Self-learning AI Implementation","Academic Trend Prediction","Global Archive Search"]}},auth:{login_title:"Authorization",login_btn:"Login to System",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"No access?",create_id:"Create Node ID",error_invalid:"ACCESS_DENIED: INVALID CREDENTIALS"},nav:{check:"Verification",history:"History",account:"Account",roadmap:"Roadmap",team:"Team"},settings:{language:"System Language",theme:"Visual Theme"},dash:{title_new:"Document Sync",subtitle_new:"Intelligent text similarity analysis",title_history:"Audit Archive",subtitle_history:"History of your previous scans",btn_reset:"Reset Core",clear_history:"Clear history",clearing:"Clearing...",clear_confirm:"Delete your entire scan history? This action cannot be undone.",history_label:"Sessions in archive",insights_title:"Scan summary",insights_last_run:"Last scan",insights_total_docs:"Documents checked",insights_empty:"No scans have been run yet",insights_tip_title:"How to read scores",insights_tip_1:"80–100% — safe zone, text looks original.",insights_tip_2:"50–80% — pay attention, review highlighted overlaps.",insights_tip_3:"Below 50% — high‑risk zone, manual review required."},upload:{title:"Drop layers here",formats:"Supports PDF, DOCX, TXT, ZIP and RAR",selected:"Active",btn_start:"Execute Analysis"},team:{title:"Core Team",subtitle:"People behind the QazZerep verification engine.",roles:{core_architect:"Fullstack & backend",product:"Idea, decks & documentation"},descriptions:{ramir:"Ramir builds the backend and the entire QazZerep interface — from the dashboard to public pages.",ramadan:"Ramadan is the originator of the QazZerep idea, curating vision, presentations and project documentation."},note:"These are placeholder avatars — later you can replace them with real photos and links."},report:{title:"Analysis Report",match_label:"Similarity",source_a:"Source A",target_b:"Source B",ai_prob:"AI Probability",copied:"Copied",recalc_title:"Recalculate uniqueness",recalc_subtitle:"Tweak the text fragments and recompute the score without re-uploading files.",recalc_btn:"Recalculate",recalc_btn_loading:"Recalculating...",recalc_hint:"Changes are not stored in history — this is a quick what-if mode for tuning wording."},profile:{title:"Node Settings",save_btn:"Save Config",syncing:"Syncing",config_synced:"CONFIG_SYNCED",upload_failed:"UPLOAD_FAILED",avatar_updated:"AVATAR_UPDATED",public_name:"Public Name",contact_email:"Contact Email",node_active:"Node Active",cloud_sync:"Cloud Core Sync Active",detectors:"Detectors",ignore_quotes:"Ignore Quotes",smart_quotes:"Smart Quotes",change_pass:"Password",logout:"Logout",rules:{gost:"GOST Lit",apa:"APA/MLA",tables:"Tables",titles:"Titles"}},footer:{description:"Automated system for intelligent reconciliation of protocols and documentation.",engine_name:"Intellect-Sverka Engine",sections:{nav:{title:"Navigator"},legal:{title:"Legal Node"},support:{title:"Support"}}},info:{back:"Return",version_desc:"Detailed specifications and operational protocols for QazZerep v2.4.0.",copyright:"© 2026 Core Infrastructure",categories:{architecture:"System Architecture",methodology:"Data Methodology",privacy:"Data Privacy",legal:"Legal Framework",technical:"Technical Session",manual:"User Manual",channels:"Direct Channels"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Core uses high-performance fitz library for direct access to PDF binary structures. Text is extracted as byte stream."},{t:"Dynamic K-Shingling",d:"Algorithm splits text into overlapping sequences to detect smart rewriting."},{t:"MD5 Fingerprinting",d:"128-bit segment hashing for digital signature matching in RAM."},{t:"Jaccard Similarity Index",d:"Mathematical model for calculating hash set intersections, ensuring reference uniqueness accuracy."},{t:"Asynchronous FastAPI Backend",d:"Asynchrony based on Python asyncio supports stable ping even when analyzing heavy data arrays."},{t:"RAM-Only Processing",d:"Computations occur in volatile memory. Objects are destroyed post-session."}]},base:{items:[{t:"Local University Archive",d:"Centralized database of all uploaded works by RK students to detect horizontal plagiarism."},{t:"Open Access Crawling",d:"Indexing of arXiv.org, Google Scholar, and ResearchGate repositories for search in scientific publications."},{t:"KazNet Deep Index",d:"Proprietary QazBot robot indexes government portals and dissertation archives."},{t:"AI Content Patterns",d:"Statistical analysis of texts for signs of generation by neural networks (GPT-4, Claude)."}]}}}}}},fallbackLng:"rus",interpolation:{escapeValue:!1}});fA.createRoot(document.getElementById("root")).render(E.jsx(sn.StrictMode,{children:E.jsx(RZ,{children:E.jsx(uCe,{})})}));
+            `})]})}function lB({label:t,icon:e,active:n=!1}){return E.jsxs("div",{className:`flex items-center gap-2 px-4 py-1.5 rounded-full border text-[9px] font-black uppercase tracking-widest transition-all ${n?"bg-blue-500/10 border-blue-500/20 text-blue-500":"bg-white/5 border-white/10 text-zinc-500"}`,children:[e,t]})}const aCe=[{name:"Operator One",roleKey:"core_architect",email:"operator.one@example.com"},{name:"Operator Two",roleKey:"ml_engineer",email:"operator.two@example.com"},{name:"Operator Three",roleKey:"frontend",email:"operator.three@example.com"}];function lCe(){const t=_g(),{t:e}=Hc();return E.jsx("div",{className:"min-h-screen bg-[#050505] text-zinc-200 font-sans",children:E.jsxs("div",{className:"max-w-6xl mx-auto px-6 py-10",children:[E.jsxs("header",{className:"flex items-center justify-between mb-12",children:[E.jsxs("button",{onClick:()=>t(-1),className:"flex items-center gap-2 text-[10px] font-black uppercase tracking-[0.25em] text-zinc-500 hover:text-white transition-colors",children:[E.jsx("span",{className:"p-2 rounded-full bg-white/5 hover:bg-white/10",children:E.jsx(YP,{size:14})}),"Back"]}),E.jsxs("div",{className:"flex items-center gap-3",children:[E.jsx("div",{className:"w-9 h-9 bg-white rounded-xl flex items-center justify-center",children:E.jsx($o,{size:18,className:"text-black"})}),E.jsx("span",{className:"font-semibold text-lg tracking-tight italic",children:"QazZerep"})]})]}),E.jsxs("section",{className:"text-center mb-16",children:[E.jsx("h1",{className:"text-4xl md:text-5xl font-black italic tracking-tighter uppercase mb-3",children:e("team.title")}),E.jsx("p",{className:"text-[12px] md:text-sm text-zinc-500 max-w-2xl mx-auto leading-relaxed",children:e("team.subtitle")}),E.jsx("div",{className:"mt-6 h-1 w-20 bg-blue-500 mx-auto rounded-full shadow-[0_0_15px_rgba(59,130,246,0.5)]"})]}),E.jsx("main",{className:"grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-8",children:aCe.map((n,r)=>E.jsxs("div",{className:"relative bg-white/[0.02] border border-white/5 rounded-[32px] p-6 flex flex-col items-center text-center gap-4 hover:border-white/15 transition-all overflow-hidden",children:[E.jsx("div",{className:"absolute -top-10 -right-10 w-24 h-24 bg-blue-500/10 blur-3xl rounded-full"}),E.jsx("div",{className:"w-24 h-24 rounded-[28px] bg-gradient-to-tr from-blue-500 to-indigo-500 flex items-center justify-center text-3xl font-black tracking-tighter text-white shadow-[0_0_40px_rgba(59,130,246,0.4)] mb-2 relative z-10",children:n.name.split(" ").map(i=>i[0]).join("")}),E.jsxs("div",{className:"relative z-10",children:[E.jsx("p",{className:"text-sm font-semibold text-white",children:n.name}),E.jsx("p",{className:"text-[10px] text-zinc-500 uppercase tracking-[0.25em] mt-1",children:e(`team.roles.${n.roleKey}`)})]}),E.jsxs("div",{className:"flex items-center justify-center gap-3 mt-2 text-zinc-500 relative z-10",children:[E.jsx("a",{href:`mailto:${n.email}`,className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(vV,{size:14})}),E.jsx("button",{className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(EQ,{size:14})}),E.jsx("button",{className:"p-2 rounded-full hover:bg-white/10 hover:text-white transition-colors",children:E.jsx(NQ,{size:14})})]}),E.jsx("p",{className:"text-[10px] text-zinc-600 mt-4 leading-relaxed relative z-10",children:e("team.note")})]},r))})]})})}function uB({children:t,adminOnly:e=!1}){const{token:n,user:r}=cV();return n?e&&(r==null?void 0:r.sub)!=="admin@qazzerep.kz"?E.jsx(JO,{to:"/"}):t:E.jsx(JO,{to:"/login"})}function uCe(){return E.jsx(uQ,{children:E.jsxs(bZ,{children:[E.jsx(Hu,{path:"/login",element:E.jsx(Nie,{})}),E.jsx(Hu,{path:"/team",element:E.jsx(lCe,{})}),E.jsx(Hu,{path:"/:slug",element:E.jsx(Bme,{})}),E.jsx(Hu,{path:"/verify/:reportId",element:E.jsx(oCe,{})}),E.jsx(Hu,{path:"/",element:E.jsx(uB,{children:E.jsx(Ime,{})})}),E.jsx(Hu,{path:"/admin",element:E.jsx(uB,{adminOnly:!0,children:E.jsx(zme,{})})})]})})}const{slice:cCe,forEach:fCe}=[];function dCe(t){return fCe.call(cCe.call(arguments,1),e=>{if(e)for(const n in e)t[n]===void 0&&(t[n]=e[n])}),t}function hCe(t){return typeof t!="string"?!1:[/<\s*script.*?>/i,/<\s*\/\s*script\s*>/i,/<\s*img.*?on\w+\s*=/i,/<\s*\w+\s*on\w+\s*=.*?>/i,/javascript\s*:/i,/vbscript\s*:/i,/expression\s*\(/i,/eval\s*\(/i,/alert\s*\(/i,/document\.cookie/i,/document\.write\s*\(/i,/window\.location/i,/innerHTML/i].some(n=>n.test(t))}const cB=/^[\u0009\u0020-\u007e\u0080-\u00ff]+$/,pCe=function(t,e){const r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{path:"/"},i=encodeURIComponent(e);let s=`${t}=${i}`;if(r.maxAge>0){const o=r.maxAge-0;if(Number.isNaN(o))throw new Error("maxAge should be a Number");s+=`; Max-Age=${Math.floor(o)}`}if(r.domain){if(!cB.test(r.domain))throw new TypeError("option domain is invalid");s+=`; Domain=${r.domain}`}if(r.path){if(!cB.test(r.path))throw new TypeError("option path is invalid");s+=`; Path=${r.path}`}if(r.expires){if(typeof r.expires.toUTCString!="function")throw new TypeError("option expires is invalid");s+=`; Expires=${r.expires.toUTCString()}`}if(r.httpOnly&&(s+="; HttpOnly"),r.secure&&(s+="; Secure"),r.sameSite)switch(typeof r.sameSite=="string"?r.sameSite.toLowerCase():r.sameSite){case!0:s+="; SameSite=Strict";break;case"lax":s+="; SameSite=Lax";break;case"strict":s+="; SameSite=Strict";break;case"none":s+="; SameSite=None";break;default:throw new TypeError("option sameSite is invalid")}return r.partitioned&&(s+="; Partitioned"),s},fB={create(t,e,n,r){let i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:{path:"/",sameSite:"strict"};n&&(i.expires=new Date,i.expires.setTime(i.expires.getTime()+n*60*1e3)),r&&(i.domain=r),document.cookie=pCe(t,e,i)},read(t){const e=`${t}=`,n=document.cookie.split(";");for(let r=0;r<n.length;r++){let i=n[r];for(;i.charAt(0)===" ";)i=i.substring(1,i.length);if(i.indexOf(e)===0)return i.substring(e.length,i.length)}return null},remove(t,e){this.create(t,"",-1,e)}};var mCe={name:"cookie",lookup(t){let{lookupCookie:e}=t;if(e&&typeof document<"u")return fB.read(e)||void 0},cacheUserLanguage(t,e){let{lookupCookie:n,cookieMinutes:r,cookieDomain:i,cookieOptions:s}=e;n&&typeof document<"u"&&fB.create(n,t,r,i,s)}},gCe={name:"querystring",lookup(t){var r;let{lookupQuerystring:e}=t,n;if(typeof window<"u"){let{search:i}=window.location;!window.location.search&&((r=window.location.hash)==null?void 0:r.indexOf("?"))>-1&&(i=window.location.hash.substring(window.location.hash.indexOf("?")));const o=i.substring(1).split("&");for(let a=0;a<o.length;a++){const l=o[a].indexOf("=");l>0&&o[a].substring(0,l)===e&&(n=o[a].substring(l+1))}}return n}},vCe={name:"hash",lookup(t){var i;let{lookupHash:e,lookupFromHashIndex:n}=t,r;if(typeof window<"u"){const{hash:s}=window.location;if(s&&s.length>2){const o=s.substring(1);if(e){const a=o.split("&");for(let l=0;l<a.length;l++){const u=a[l].indexOf("=");u>0&&a[l].substring(0,u)===e&&(r=a[l].substring(u+1))}}if(r)return r;if(!r&&n>-1){const a=s.match(/\/([a-zA-Z-]*)/g);return Array.isArray(a)?(i=a[typeof n=="number"?n:0])==null?void 0:i.replace("/",""):void 0}}}return r}};let jf=null;const dB=()=>{if(jf!==null)return jf;try{if(jf=typeof window<"u"&&window.localStorage!==null,!jf)return!1;const t="i18next.translate.boo";window.localStorage.setItem(t,"foo"),window.localStorage.removeItem(t)}catch{jf=!1}return jf};var yCe={name:"localStorage",lookup(t){let{lookupLocalStorage:e}=t;if(e&&dB())return window.localStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupLocalStorage:n}=e;n&&dB()&&window.localStorage.setItem(n,t)}};let Vf=null;const hB=()=>{if(Vf!==null)return Vf;try{if(Vf=typeof window<"u"&&window.sessionStorage!==null,!Vf)return!1;const t="i18next.translate.boo";window.sessionStorage.setItem(t,"foo"),window.sessionStorage.removeItem(t)}catch{Vf=!1}return Vf};var xCe={name:"sessionStorage",lookup(t){let{lookupSessionStorage:e}=t;if(e&&hB())return window.sessionStorage.getItem(e)||void 0},cacheUserLanguage(t,e){let{lookupSessionStorage:n}=e;n&&hB()&&window.sessionStorage.setItem(n,t)}},_Ce={name:"navigator",lookup(t){const e=[];if(typeof navigator<"u"){const{languages:n,userLanguage:r,language:i}=navigator;if(n)for(let s=0;s<n.length;s++)e.push(n[s]);r&&e.push(r),i&&e.push(i)}return e.length>0?e:void 0}},SCe={name:"htmlTag",lookup(t){let{htmlTag:e}=t,n;const r=e||(typeof document<"u"?document.documentElement:null);return r&&typeof r.getAttribute=="function"&&(n=r.getAttribute("lang")),n}},wCe={name:"path",lookup(t){var i;let{lookupFromPathIndex:e}=t;if(typeof window>"u")return;const n=window.location.pathname.match(/\/([a-zA-Z-]*)/g);return Array.isArray(n)?(i=n[typeof e=="number"?e:0])==null?void 0:i.replace("/",""):void 0}},bCe={name:"subdomain",lookup(t){var i,s;let{lookupFromSubdomainIndex:e}=t;const n=typeof e=="number"?e+1:1,r=typeof window<"u"&&((s=(i=window.location)==null?void 0:i.hostname)==null?void 0:s.match(/^(\w{2,5})\.(([a-z0-9-]{1,63}\.[a-z]{2,6})|localhost)/i));if(r)return r[n]}};let mX=!1;try{document.cookie,mX=!0}catch{}const gX=["querystring","cookie","localStorage","sessionStorage","navigator","htmlTag"];mX||gX.splice(1,1);const MCe=()=>({order:gX,lookupQuerystring:"lng",lookupCookie:"i18next",lookupLocalStorage:"i18nextLng",lookupSessionStorage:"i18nextLng",caches:["localStorage"],excludeCacheFor:["cimode"],convertDetectedLanguage:t=>t});class vX{constructor(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};this.type="languageDetector",this.detectors={},this.init(e,n)}init(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{languageUtils:{}},n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{};this.services=e,this.options=dCe(n,this.options||{},MCe()),typeof this.options.convertDetectedLanguage=="string"&&this.options.convertDetectedLanguage.indexOf("15897")>-1&&(this.options.convertDetectedLanguage=i=>i.replace("-","_")),this.options.lookupFromUrlIndex&&(this.options.lookupFromPathIndex=this.options.lookupFromUrlIndex),this.i18nOptions=r,this.addDetector(mCe),this.addDetector(gCe),this.addDetector(yCe),this.addDetector(xCe),this.addDetector(_Ce),this.addDetector(SCe),this.addDetector(wCe),this.addDetector(bCe),this.addDetector(vCe)}addDetector(e){return this.detectors[e.name]=e,this}detect(){let e=arguments.length>0&&arguments[0]!==void 0?arguments[0]:this.options.order,n=[];return e.forEach(r=>{if(this.detectors[r]){let i=this.detectors[r].lookup(this.options);i&&typeof i=="string"&&(i=[i]),i&&(n=n.concat(i))}}),n=n.filter(r=>r!=null&&!hCe(r)).map(r=>this.options.convertDetectedLanguage(r)),this.services&&this.services.languageUtils&&this.services.languageUtils.getBestMatchFromCodes?n:n.length>0?n[0]:null}cacheUserLanguage(e){let n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:this.options.caches;n&&(this.options.excludeCacheFor&&this.options.excludeCacheFor.indexOf(e)>-1||n.forEach(r=>{this.detectors[r]&&this.detectors[r].cacheUserLanguage(e,this.options)}))}}vX.type="languageDetector";yi.use(vX).use(use).init({resources:{rus:{translation:{roadmap:{title:"Планы развития",year:"2026",active_status:"В разработке",q1:{title:"Фундамент и AI Ядро",items:["Запуск нейронного ядра QazZerep v2.0","Интеграция с локальными базами данных","Обновление 3D-интерфейса"]},q2:{title:"Мультиформатный анализ",items:["Поддержка анализа видео и аудио","Расширение языковых моделей (KZ, RU, EN, TR)","API для корпоративных клиентов"]},q3:{title:"Глобальная связность",items:["Запуск мобильного приложения","Blockchain-верификация отчетов","Коллаборация с вузами РК"]},q4:{title:"Автономная экосистема",items:["Self-learning AI (дообучение)","Прогноз академических трендов","Глобальный поиск по архивам"]}},auth:{login_title:"Авторизация",login_btn:"Вход в систему",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Нет доступа?",create_id:"Создать ID узла",error_invalid:"ACCESS_DENIED: НЕВЕРНЫЕ ДАННЫЕ"},nav:{check:"Проверка",history:"История",account:"Аккаунт",roadmap:"Планы 2026",team:"Команда"},settings:{language:"Язык системы",theme:"Тема оформления"},dash:{title_new:"Сверка документов",subtitle_new:"Интеллектуальный анализ сходства текстов",title_history:"Архив проверок",subtitle_history:"История ваших предыдущих анализов",btn_reset:"Сбросить и начать заново",clear_history:"Очистить историю",clearing:"Очистка...",load_more:"Показать еще",loading_more:"Загрузка...",report_unavailable:"Не удалось загрузить отчет, попробуйте позже",clear_confirm:"Удалить всю историю проверок? Это действие нельзя отменить.",history_label:"Сессий в архиве",insights_title:"Сводка по проверкам",insights_last_run:"Последняя проверка",insights_total_docs:"Документов проверено",insights_empty:"Пока нет ни одной проверки",insights_tip_title:"Как читать проценты",insights_tip_1:"80–100% — безопасная зона, текст выглядит оригинальным.",insights_tip_2:"50–80% — зона внимания, пройдитесь по совпадениям вручную.",insights_tip_3:"Меньше 50% — высокая зона риска, нужен детальный разбор."},upload:{title:"Перетащите файлы сюда",formats:"PDF, DOCX, TXT, ZIP и RAR",selected:"Выбрано",btn_start:"Запустить анализ"},team:{title:"Команда ядра",subtitle:"Люди, которые собирают и поддерживают QazZerep.",roles:{core_architect:"Фуллстек / backend",product:"Идея, презентации и документация"},descriptions:{ramir:"Ramir отвечает за backend и весь интерфейс QazZerep — от дашборда до публичных страниц.",ramadan:"Ramadan — автор идеи QazZerep, собирает требования, готовит презентации и документацию проекта."},note:"Здесь пока заглушки — позже вы сможете подставить реальные фото и ссылки."},report:{title:"Отчет анализа",match_label:"Сходство",source_a:"Источник А",target_b:"Источник Б",ai_prob:"Вероятность ИИ",copied:"Скопировано",recalc_title:"Пересчет уникальности",recalc_subtitle:"Отредактируйте фрагменты текста и заново пересчитайте коэффициент без повторной загрузки файлов.",recalc_btn:"Пересчитать",recalc_btn_loading:"Пересчет...",recalc_hint:"Изменения не сохраняются в историю — это быстрый черновой режим для подстройки формулировок."},profile:{title:"Настройки узла",save_btn:"Сохранить",syncing:"Синхронизация",config_synced:"КОНФИГ_СИНХРОНИЗИРОВАН",upload_failed:"ОШИБКА_ЗАГРУЗКИ",avatar_updated:"АВАТАР_ОБНОВЛЕН",public_name:"Публичное имя",contact_email:"Контактный Email",node_active:"Узел активен",cloud_sync:"Синхронизация с облачным ядром активна",detectors:"Детекторы заимствований",ignore_quotes:"Игнорировать цитаты",smart_quotes:"Умное распознавание цитат",change_pass:"Сменить пароль",logout:"Выйти из системы",rules:{gost:"Литература (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Таблицы и графики",titles:"Титульный лист"}},footer:{description:"Автоматизированная система интеллектуальной сверки протоколов и документации.",engine_name:"Движок Интеллект-Сверки",sections:{nav:{title:"Навигатор"},legal:{title:"Правовой узел"},support:{title:"Поддержка"}}},info:{back:"Назад",version_desc:"Подробные спецификации и регламенты работы платформы QazZerep версии 2.4.0.",copyright:"© 2026 Инфраструктура Ядра",categories:{architecture:"Системная Архитектура",methodology:"Методология Данных",privacy:"Конфиденциальность",legal:"Юридическая База",technical:"Техническая Сессия",manual:"Руководство",channels:"Прямые Каналы"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро использует высокопроизводительную библиотеку fitz для прямого доступа к бинарным структурам PDF. Текст извлекается в виде потока байтов, минуя сохранение на диск."},{t:"Динамический K-Shingling",d:"Алгоритм разбивает текст на пересекающиеся последовательности. Параметр k=3..9 позволяет системе находить не только прямое копирование, но и умный рерайт."},{t:"MD5 Fingerprinting",d:"Генерация 128-битных отпечатков сегментов. Позволяет сравнивать документы через сопоставление цифровых сигнатур в RAM."},{t:"Индекс Сходства Жаккара",d:"Математическая модель расчета пересечения множеств хешей, обеспечивающая эталонную точность вычисления уникальности."},{t:"Batch Cross-Check (O(n²))",d:"Пакетная сверка всех загруженных файлов между собой для выявления скрытых сетей передачи работ."},{t:"Asynchronous FastAPI Backend",d:"Асинхронность на базе Python asyncio поддерживает стабильный пинг даже при анализе тяжелых массивов данных."},{t:"Neural Highlight Engine",d:"Визуализация через CSS-движок: .diff-match подсвечивает плагиат, а .diff-rewrite отмечает зоны обфускации."},{t:"RAM-Only Processing",d:"Вычисления происходят в волатильной памяти. После сессии объекты уничтожаются, не оставляя следов на диске."}]},base:{items:[{t:"Локальный Архив ВУЗов",d:"Централизованная база всех загруженных работ студентов РК для выявления горизонтального плагиата."},{t:"Open Access Crawling",d:"Индексация репозиториев arXiv.org, Google Scholar и ResearchGate для поиска в научных публикациях."},{t:"KazNet Deep Index",d:"Собственный робот QazBot индексирует гос. порталы и архивы диссертаций на казахском и русском языках."},{t:"Cross-Language Mapping",d:"Технология перевода сегментов текста для поиска заимствований с английского языка на казахский/русский."},{t:"GitHub & Code Analysis",d:"Анализ программного кода (50+ языков) для проверки технических работ на плагиат из репозиториев."},{t:"AI Content Patterns",d:"Статистический анализ текстов на наличие признаков генерации нейросетями (GPT-4, Claude)."}]},priv:{items:[{t:"Суверенитет Данных РК",d:"Все серверные мощности расположены в сертифицированных дата-центрах на территории Республики Казахстан."},{t:"Шифрование AES-GCM-256",d:"Каналы передачи данных защищены военным стандартом шифрования. Ваши документы недоступны для перехвата."},{t:"Stateless Архитектура",d:"Система не сохраняет историю загрузок без требования пользователя. Каждый акт проверки эфемерный."},{t:"JWT-Авторизация",d:"Доступ защищен токенами с ограниченным временем жизни, что предотвращает угон сессий."},{t:"ISO 27001 Compliance",d:"Внутренние процессы управления данными соответствуют международным стандартам безопасности."},{t:"Право на Забвение",d:"Пользователь может в один клик удалить все свои следы, включая хешированные отпечатки работ."}]},terms:{items:[{t:"Акцепт Соглашения",d:"Использование сервиса означает принятие условий. Ответственность за интерпретацию результатов лежит на пользователе."},{t:"Интеллектуальная Собственность",d:"Алгоритмы принадлежат QazZerep. Пользователь сохраняет права на загружаемый контент."},{t:"Добросовестное Использование",d:"Запрещается использование ботов для обхода ограничений системы или проведения атак."},{t:"Ограничение Ответственности",d:"Система предоставляет вероятностную оценку. Мы не гарантируем 100% выявление всех форм нейро-обфускации."}]},cookie:{items:[{t:"Session Persistence",d:"Используем технические куки для JWT-авторизации, чтобы не вводить пароль при обновлении."},{t:"Security Tokens",d:"Анти-фрод файлы помогают идентифицировать подозрительную активность и защищать аккаунт."},{t:"Zero Third-Party Tracking",d:"Мы не используем маркетинговые куки. Ваша активность не передается рекламным сетям."},{t:"LocalStorage Usage",d:"Данные о прогрессе анализа могут временно храниться в браузере для восстановления сессии."}]},help:{items:[{t:"Инструкция по загрузке",d:"Рекомендуется PDF с текстовым слоем. Для сканов работает модуль Anti-OCR."},{t:"Интерпретация отчета",d:"80%+ — норма. Ниже 50% — критическая зона, требующая ручной проверки."},{t:"Технические лимиты",d:"Максимальный размер файла — 50MB. Для Big Data свяжитесь с отделом интеграции."}]},contacts:{items:[{t:"Telegram Support",d:"Оперативная связь: @brjxjxjd (Ответ в течение 5 минут)."},{t:"Phone Hotline",d:"Горячая линия для экстренных вопросов: +7 (777) 123-45-67 (24/7)."}]}}}}},kaz:{translation:{roadmap:{title:"Даму жоспары",year:"2026",active_status:"Әзірлеу үстінде",q1:{title:"Іргетас және AI Ядросы",items:["QazZerep v2.0 нейрондық ядросын іске қосу","Жергілікті деректер базаларымен интеграция","3D интерфейсін жаңарту"]},q2:{title:"Мультиформатты талдау",items:["Бейне және аудио талдауды қолдау","Тілдік модельдерді кеңейту (KZ, RU, EN, TR)","Корпоративтік клиенттерге арналған API"]},q3:{title:"Жаһандық байланыс",items:["Мобильді қолданбаны іске қосу","Есептерді Blockchain арқылы тексеру","ҚР жоғары оқу орындарымен ынтымақтастық"]},q4:{title:"Автономды экожүйе",items:["Self-learning AI (өзін-өзі оқыту)","Академиялық трендтерді болжау","Мұрағаттар бойынша жаһандық іздеу"]}},auth:{login_title:"Авторизация",login_btn:"Жүйеге кіру",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"Кіру мүмкін емес пе?",create_id:"Түйін ID-ін жасау",error_invalid:"ACCESS_DENIED: ҚАТЕ ДЕРЕКТЕР"},nav:{check:"Тексеру",history:"Тарих",account:"Аккаунт",roadmap:"Даму жоспары",team:"Топ"},settings:{language:"Жүйе тілі",theme:"Интерфейс тақырыбы"},dash:{title_new:"Құжаттарды салыстыру",subtitle_new:"Мәтіндердің ұқсастығын интеллектуалды талдау",title_history:"Тексерулер мұрағаты",subtitle_history:"Алдыңғы талдауларыңыздың тарихы",btn_reset:"Тазалау және қайта бастау",clear_history:"Тарихты тазалау",clearing:"Тазаланып жатыр...",load_more:"Тағы көрсету",loading_more:"Жүктелуде...",report_unavailable:"Есепті жүктеу мүмкін болмады, кейінірек қайталаңыз",clear_confirm:"Барлық тексеру тарихын жоямыз ба? Бұл әрекетті болдырмауға болмайды.",history_label:"Мұрағат сессиялары",insights_title:"Тексеру сводкасы",insights_last_run:"Соңғы тексеру",insights_total_docs:"Тексерілген құжаттар",insights_empty:"Әзірге бірде-бір тексеру жоқ",insights_tip_title:"Проценттерді оқу",insights_tip_1:"80–100% — қауіпсіз аймақ, мәтін түпнұсқаға ұқсас.",insights_tip_2:"50–80% — назар аймағы, сәйкестіктерді қолмен қарап шығыңыз.",insights_tip_3:"50%-дан төмен — жоғары тәуекел аймағы, деталды талдау қажет."},upload:{title:"Файлдарды осы жерге сүйреңіз",formats:"PDF, DOCX, TXT, ZIP және RAR",selected:"Таңдалды",btn_start:"Талдауды бастау"},team:{title:"Ядро командасы",subtitle:"QazZerep платформасын құратын және қолдайтын адамдар.",roles:{core_architect:"Fullstack / backend",product:"Идея, презентациялар және құжаттама"},descriptions:{ramir:"Ramir QazZerep платформасының backend бөлігі мен интерфейсін — дашбордтан бастап жалпы беттерге дейін жасайды.",ramadan:"Ramadan — QazZerep идеясының авторы, талаптарды жинайды, презентациялар мен жобаның құжаттамасын дайындайды."},note:"Қазір мұнда плейсхолдерлер — кейін нақты фотоларды және сілтемелерді қоса аласыз."},report:{title:"Талдау есебі",match_label:"Ұқсастық",source_a:"А дереккөзі",target_b:"Б дереккөзі",ai_prob:"ИИ ықтималдығы",copied:"Көшірілді",recalc_title:"Уникалдылықты қайта есептеу",recalc_subtitle:"Мәтін үзінділерін түзетіп, файлдарды қайта жүктемей коэффициентті қайта есептеңіз.",recalc_btn:"Қайта есептеу",recalc_btn_loading:"Қайта есептелуде...",recalc_hint:"Өзгерістер мұрағатта сақталмайды — бұл тек формулировканы жедел түзетуге арналған режим."},profile:{title:"Түйін параметрлері",save_btn:"Сақтау",syncing:"Синхрондау",config_synced:"КОНФИГ_СИНХРОНДАЛДЫ",upload_failed:"ЖҮКТЕУ_ҚАТАСЫ",avatar_updated:"АВАТАР_ЖАҢАРТЫЛДЫ",public_name:"Жалпыға ортақ есім",contact_email:"Байланыс Email-ы",node_active:"Түйін белсенді",cloud_sync:"Бұлтты ядромен синхрондау белсенді",detectors:"Ұқсастық детекторы",ignore_quotes:"Дәйексөздерді елемеу",smart_quotes:"Дәйексөздерді ақылды тану",change_pass:"Құпия сөзді өзгерту",logout:"Жүйеден шығу",rules:{gost:"Әдебиет (ГОСТ)",apa:"Библиография (APA/MLA)",tables:"Кестелер",titles:"Титул парағы"}},footer:{description:"Хаттамалар мен құжаттарды интеллектуалды салыстырудың автоматтандырылған жүйесі.",engine_name:"Интеллект-Салыстыру Жүйесі",sections:{nav:{title:"Навигатор"},legal:{title:"Құқықтық орталық"},support:{title:"Қолдау"}}},info:{back:"Артқа",version_desc:"QazZerep 2.4.0 платформасының егжей-тегжейлі сипаттамалары мен жұмыс ережелері.",copyright:"© 2026 Ядролық Инфрақұрылым",categories:{architecture:"Жүйе Архитектурасы",methodology:"Деректер Әдістемесі",privacy:"Құпиялылық",legal:"Құқықтық Негіз",technical:"Техникалық Сессия",manual:"Нұсқаулық",channels:"Тікелей Арналар"},pages:{doc:{title:"Құжаттама"},base:{title:"Жалпы Индекс"},priv:{title:"Қауіпсіздік Хаттамасы"},terms:{title:"Пайдалану Шарттары"},cookie:{title:"Cookie Саясаты"},help:{title:"Көмек Орталығы"},contacts:{title:"Байланыс Түйіндері"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Ядро PDF бинарлық құрылымдарына тікелей қол жеткізу үшін жоғары өнімді fitz кітапханасын пайдаланады. Мәтін байт ағыны түрінде алынады."},{t:"Динамикалық K-Shingling",d:"Алгоритм мәтінді ақылды рерайтты іздеу үшін қиылысатын тізбектерге бөледі."},{t:"MD5 Fingerprinting",d:"RAM-дағы сандық қолтаңбаларды салыстыру үшін сегменттердің 128 биттік таңбаларын жасау."},{t:"Жаккар ұқсастық индексі",d:"Бірегейлікті есептеудің эталондық дәлдігін қамтамасыз ететін хэш жиындарының қиылысуын есептеудің математикалық моделі."},{t:"Batch Cross-Check",d:"Жұмыстарды берудің жасырын желілерін анықтау үшін барлық жүктелген файлдарды өзара пакеттік салыстыру."},{t:"RAM-Only Processing",d:"Есептеулер тұрақсыз жадта жүреді. Сессиядан кейін нысандар ізсіз жойылады."}]},base:{items:[{t:"ЖОО-лардың жергілікті мұрағаты",d:"Көлденең плагиатты анықтау үшін ҚР студенттерінің барлық жүктелген жұмыстарының орталықтандырылған базасы."},{t:"Open Access Crawling",d:"Ғылыми жарияланымдардан іздеу үшін arXiv.org, Google Scholar және ResearchGate репозиторийлерін индекстеу."},{t:"KazNet Deep Index",d:"Жеке QazBot роботы мемлекеттік порталдарды және қазақ/орыс тілдеріндегі диссертациялар мұрағатын индекстейді."},{t:"Cross-Language Mapping",d:"Ағылшын тілінен қазақ/орыс тілдеріне аударылған мәтін үзінділерін іздеу технологиясы."}]}}}}},eng:{translation:{roadmap:{title:"Project Roadmap",year:"2026",active_status:"Active Development",q1:{title:"Foundation & AI Core",items:["QazZerep v2.0 Neural Core Launch","Local Database Integration","3D Interface Update"]},q2:{title:"Multi-Format Analysis",items:["Video & Audio Analysis Support","LLM Expansion (KZ, RU, EN, TR)","Enterprise API Access"]},q3:{title:"Global Connectivity",items:["Mobile App Launch (iOS/Android)","Blockchain Report Verification","University Partnerships in RK"]},q4:{title:"Autonomous Ecosystem",items:["Self-learning AI Implementation","Academic Trend Prediction","Global Archive Search"]}},auth:{login_title:"Authorization",login_btn:"Login to System",email_label:"System Email",pass_label:"Access Key",terminal_version:"Secure Terminal v2.4",no_account:"No access?",create_id:"Create Node ID",error_invalid:"ACCESS_DENIED: INVALID CREDENTIALS"},nav:{check:"Verification",history:"History",account:"Account",roadmap:"Roadmap",team:"Team"},settings:{language:"System Language",theme:"Visual Theme"},dash:{title_new:"Document Sync",subtitle_new:"Intelligent text similarity analysis",title_history:"Audit Archive",subtitle_history:"History of your previous scans",btn_reset:"Reset Core",clear_history:"Clear history",clearing:"Clearing...",load_more:"Load more",loading_more:"Loading...",report_unavailable:"Could not load the report, please try again later",clear_confirm:"Delete your entire scan history? This action cannot be undone.",history_label:"Sessions in archive",insights_title:"Scan summary",insights_last_run:"Last scan",insights_total_docs:"Documents checked",insights_empty:"No scans have been run yet",insights_tip_title:"How to read scores",insights_tip_1:"80–100% — safe zone, text looks original.",insights_tip_2:"50–80% — pay attention, review highlighted overlaps.",insights_tip_3:"Below 50% — high‑risk zone, manual review required."},upload:{title:"Drop layers here",formats:"Supports PDF, DOCX, TXT, ZIP and RAR",selected:"Active",btn_start:"Execute Analysis"},team:{title:"Core Team",subtitle:"People behind the QazZerep verification engine.",roles:{core_architect:"Fullstack & backend",product:"Idea, decks & documentation"},descriptions:{ramir:"Ramir builds the backend and the entire QazZerep interface — from the dashboard to public pages.",ramadan:"Ramadan is the originator of the QazZerep idea, curating vision, presentations and project documentation."},note:"These are placeholder avatars — later you can replace them with real photos and links."},report:{title:"Analysis Report",match_label:"Similarity",source_a:"Source A",target_b:"Source B",ai_prob:"AI Probability",copied:"Copied",recalc_title:"Recalculate uniqueness",recalc_subtitle:"Tweak the text fragments and recompute the score without re-uploading files.",recalc_btn:"Recalculate",recalc_btn_loading:"Recalculating...",recalc_hint:"Changes are not stored in history — this is a quick what-if mode for tuning wording."},profile:{title:"Node Settings",save_btn:"Save Config",syncing:"Syncing",config_synced:"CONFIG_SYNCED",upload_failed:"UPLOAD_FAILED",avatar_updated:"AVATAR_UPDATED",public_name:"Public Name",contact_email:"Contact Email",node_active:"Node Active",cloud_sync:"Cloud Core Sync Active",detectors:"Detectors",ignore_quotes:"Ignore Quotes",smart_quotes:"Smart Quotes",change_pass:"Password",logout:"Logout",rules:{gost:"GOST Lit",apa:"APA/MLA",tables:"Tables",titles:"Titles"}},footer:{description:"Automated system for intelligent reconciliation of protocols and documentation.",engine_name:"Intellect-Sverka Engine",sections:{nav:{title:"Navigator"},legal:{title:"Legal Node"},support:{title:"Support"}}},info:{back:"Return",version_desc:"Detailed specifications and operational protocols for QazZerep v2.4.0.",copyright:"© 2026 Core Infrastructure",categories:{architecture:"System Architecture",methodology:"Data Methodology",privacy:"Data Privacy",legal:"Legal Framework",technical:"Technical Session",manual:"User Manual",channels:"Direct Channels"},pages:{doc:{title:"Documentation"},base:{title:"Global Index"},priv:{title:"Security Protocol"},terms:{title:"Terms of Use"},cookie:{title:"Cookie Policy"},help:{title:"Support Center"},contacts:{title:"Contact Nodes"}},content:{doc:{items:[{t:"PyMuPDF (fitz) Stream Engine",d:"Core uses high-performance fitz library for direct access to PDF binary structures. Text is extracted as byte stream."},{t:"Dynamic K-Shingling",d:"Algorithm splits text into overlapping sequences to detect smart rewriting."},{t:"MD5 Fingerprinting",d:"128-bit segment hashing for digital signature matching in RAM."},{t:"Jaccard Similarity Index",d:"Mathematical model for calculating hash set intersections, ensuring reference uniqueness accuracy."},{t:"Asynchronous FastAPI Backend",d:"Asynchrony based on Python asyncio supports stable ping even when analyzing heavy data arrays."},{t:"RAM-Only Processing",d:"Computations occur in volatile memory. Objects are destroyed post-session."}]},base:{items:[{t:"Local University Archive",d:"Centralized database of all uploaded works by RK students to detect horizontal plagiarism."},{t:"Open Access Crawling",d:"Indexing of arXiv.org, Google Scholar, and ResearchGate repositories for search in scientific publications."},{t:"KazNet Deep Index",d:"Proprietary QazBot robot indexes government portals and dissertation archives."},{t:"AI Content Patterns",d:"Statistical analysis of texts for signs of generation by neural networks (GPT-4, Claude)."}]}}}}}},fallbackLng:"rus",interpolation:{escapeValue:!1}});fA.createRoot(document.getElementById("root")).render(E.jsx(sn.StrictMode,{children:E.jsx(RZ,{children:E.jsx(uCe,{})})}));
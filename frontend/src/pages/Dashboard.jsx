@@ -69,6 +69,9 @@ export default function Dashboard() {
     const [selectedPair, setSelectedPair] = useState(null);
     const [isAppLoading, setIsAppLoading] = useState(true);
     const [isClearingHistory, setIsClearingHistory] = useState(false);
+    const [historyCursor, setHistoryCursor] = useState(null);
+    const [isLoadingMore, setIsLoadingMore] = useState(false);
+    const [reportError, setReportError] = useState(null);
     const [editTextA, setEditTextA] = useState("");
     const [editTextB, setEditTextB] = useState("");
     const [isRecalculating, setIsRecalculating] = useState(false);
@@ -100,13 +103,42 @@ export default function Dashboard() {
         setEditTextB(stripHtml(selectedPair.docB?.html));
     }, [selectedPair]);
 
-    const fetchHistory = async () => {
+    // История приходит страницами: { items, next_cursor }
+    const fetchHistory = async (cursor = null) => {
         try { 
-            const res = await axios.get('/documents/history'); 
-            setHistory(res.data); 
+            const res = await axios.get('/documents/history', { params: cursor ? { cursor } : {} }); 
+            setHistory((prev) => cursor ? [...prev, ...res.data.items] : res.data.items); 
+            setHistoryCursor(res.data.next_cursor); 
         } catch (e) { console.error("Archive error"); }
     };
 
+    const handleLoadMore = async () => {
+        if (!historyCursor) return;
+        setIsLoadingMore(true);
+        try {
+            await fetchHistory(historyCursor);
+        } finally {
+            setIsLoadingMore(false);
+        }
+    };
+
+    // В сводках истории нет подсветки - подгружаем ее из отчета при открытии пары
+    const selectHistoryPair = async (comp) => {
+        setReportError(null);
+        if (comp.docA?.html !== undefined || !comp.report_id) {
+            setSelectedPair(comp);
+            return;
+        }
+        try {
+            const res = await axios.get(`/reports/${comp.report_id}`);
+            setSelectedPair({ ...comp, docA: res.data.docA, docB: res.data.docB });
+        } catch (e) {
+            // Сводку без документов не открываем - показываем ошибку в списке
+            console.error("Report error", e);
+            setReportError(comp.report_id);
+        }
+    };
+
     const handleClearHistory = async () => {
         if (!history.length) return;
         const confirmed = window.confirm(t('dash.clear_confirm'));
@@ -116,6 +148,7 @@ export default function Dashboard() {
             setIsClearingHistory(true);
             await axios.delete('/documents/history');
             setHistory([]);
+            setHistoryCursor(null);
         } catch (e) {
             console.error("Clear history error", e);
         } finally {
@@ -341,13 +374,28 @@ export default function Dashboard() {
                                     {isClearingHistory ? t('dash.clearing') : t('dash.clear_history')}
                                 </button>
                             </div>
+                            {reportError && (
+                                <div className="px-6 py-4 rounded-3xl border border-red-500/30 bg-red-500/5 text-[11px] text-red-500 flex justify-between items-center gap-4">
+                                    <span>{t('dash.report_unavailable')} ({reportError})</span>
+                                    <button onClick={() => setReportError(null)} className="text-[9px] font-black uppercase tracking-[0.25em] opacity-60 hover:opacity-100">✕</button>
+                                </div>
+                            )}
                             <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
                                 {history.length > 0 ? history.map((session, i) => (
-                                    <HistoryCard key={i} session={session} onSelect={setSelectedPair} />
+                                    <HistoryCard key={session.id || i} session={session} onSelect={selectHistoryPair} />
                                 )) : (
                                     <div className="col-span-full py-20 text-center opacity-30 italic">No records found</div>
                                 )}
                             </div>
+                            {historyCursor && (
+                                <button
+                                    onClick={handleLoadMore}
+                                    disabled={isLoadingMore}
+                                    className="w-full py-4 rounded-full border border-border text-[9px] font-black uppercase tracking-[0.25em] text-muted-foreground hover:text-foreground hover:border-foreground/40 transition-all disabled:opacity-40"
+                                >
+                                    {isLoadingMore ? t('dash.loading_more') : t('dash.load_more')}
+                                </button>
+                            )}
                         </div>
                     )}
 
@@ -523,18 +571,19 @@ function HistoryCard({ session, onSelect }) {
 }
 
 function DetailCard({ doc, title, t }) {
-    const isHighRisk = doc.ai.score > 60;
+    const score = doc?.ai?.score ?? 0;
+    const isHighRisk = score > 60;
     return (
         <div className="bg-card border border-border rounded-[40px] p-10 shadow-xl transition-all hover:scale-[1.02]">
             <span className="text-[9px] font-black text-muted-foreground uppercase tracking-[0.4em] opacity-40 italic">{title}</span>
-            <h3 className="text-xl font-medium mt-3 truncate text-foreground">{doc.name}</h3>
+            <h3 className="text-xl font-medium mt-3 truncate text-foreground">{doc?.name}</h3>
             <div className="mt-12">
                 <div className="flex justify-between items-end mb-4">
                     <span className="text-[10px] text-muted-foreground font-black uppercase tracking-widest">{t('report.ai_prob')}</span>
-                    <span className={`text-2xl font-black italic ${isHighRisk ? 'text-red-500' : 'text-emerald-500'}`}>{doc.ai.score}%</span>
+                    <span className={`text-2xl font-black italic ${isHighRisk ? 'text-red-500' : 'text-emerald-500'}`}>{score}%</span>
                 </div>
                 <div className="h-1.5 w-full bg-foreground/5 rounded-full overflow-hidden">
-                    <div className={`h-full transition-all duration-1000 ${isHighRisk ? 'bg-red-500' : 'bg-emerald-500'}`} style={{width: `${doc.ai.score}%`}} />
+                    <div className={`h-full transition-all duration-1000 ${isHighRisk ? 'bg-red-500' : 'bg-emerald-500'}`} style={{width: `${score}%`}} />
                 </div>
             </div>
         </div>
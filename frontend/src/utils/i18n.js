@@ -50,6 +50,9 @@ i18n
             btn_reset: "Сбросить и начать заново",
             clear_history: "Очистить историю",
             clearing: "Очистка...",
+            load_more: "Показать еще",
+            loading_more: "Загрузка...",
+            report_unavailable: "Не удалось загрузить отчет, попробуйте позже",
             clear_confirm: "Удалить всю историю проверок? Это действие нельзя отменить.",
             history_label: "Сессий в архиве",
             insights_title: "Сводка по проверкам",
@@ -248,6 +251,9 @@ i18n
             btn_reset: "Тазалау және қайта бастау",
             clear_history: "Тарихты тазалау",
             clearing: "Тазаланып жатыр...",
+            load_more: "Тағы көрсету",
+            loading_more: "Жүктелуде...",
+            report_unavailable: "Есепті жүктеу мүмкін болмады, кейінірек қайталаңыз",
             clear_confirm: "Барлық тексеру тарихын жоямыз ба? Бұл әрекетті болдырмауға болмайды.",
             history_label: "Мұрағат сессиялары",
             insights_title: "Тексеру сводкасы",
@@ -382,6 +388,9 @@ i18n
             btn_reset: "Reset Core",
             clear_history: "Clear history",
             clearing: "Clearing...",
+            load_more: "Load more",
+            loading_more: "Loading...",
+            report_unavailable: "Could not load the report, please try again later",
             clear_confirm: "Delete your entire scan history? This action cannot be undone.",
             history_label: "Sessions in archive",
             insights_title: "Scan summary",
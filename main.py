@@ -1,11 +1,26 @@
+import time
 
+_import_started = time.perf_counter()
+
+import asyncio
+import logging
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from app.routers import auth
 from app.routers.handlers import text
 from app.routers.handlers import reports
+from app.database.indexes import ensure_indexes
+from app.services.avatars import migrate_inline_avatars
+from app.services.corpus import backfill_fingerprint_df
+from app.services.jobs import job_queue
+from app.services.models import model_registry
+from app.services.metrics import registry as metrics_registry
+import config
+
+logger = logging.getLogger("uvicorn.error")
 
 app = FastAPI()
 app.add_middleware(
@@ -16,6 +31,35 @@ app.add_middleware(
 	allow_headers=["*"]
 )
 
+@app.on_event("startup")
+async def startup():
+	await ensure_indexes()
+	await backfill_fingerprint_df()
+	await migrate_inline_avatars()
+	await job_queue.start(text.process_job)
+	logger.info("Startup completed in %.2fs", time.perf_counter() - _import_started)
+	# Модели догружаются в фоне: auth/отчеты доступны сразу, не дожидаясь LaBSE
+	if config.models_warmup:
+		app.state.warmup_task = asyncio.create_task(model_registry.warm_up(config.models_warmup))
+
+@app.on_event("shutdown")
+async def shutdown():
+	await job_queue.stop()
+
+@app.get("/health/ready")
+async def readiness():
+	"""Готовность к тяжелым запросам: какие модели уже загружены."""
+	models = model_registry.status()
+	ready = all(models[name]["loaded"] for name in config.models_warmup if name in models)
+	return JSONResponse({"ready": ready, "models": models}, status_code=200 if ready else 503)
+
+@app.get("/metrics")
+async def metrics():
+	"""Счетчики и гистограммы этапов в текстовом формате Prometheus."""
+	if not config.metrics_enabled:
+		return JSONResponse({"error": "Метрики отключены"}, 404)
+	return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
 app.include_router(auth.router, prefix="/auth")
 app.include_router(text.router, prefix="/documents")
 app.include_router(reports.router, prefix="/reports")
@@ -0,0 +1,27 @@
+import numpy as np
+
+from app.services.alignment import group_alignments
+
+
+def test_cap_keeps_best_pairs_in_document_order():
+    # Документ 0 - предложения 0..5, документ 1 - 6..11; лучшие пары стоят в конце документа A
+    sentences = [(f"sentence {i} text here", 10 * (i % 6), 10 * (i % 6) + 10) for i in range(12)]
+    doc_ids = np.array([0] * 6 + [1] * 6)
+    scores = [0.81, 0.82, 0.83, 0.97, 0.95, 0.99]
+    matches = np.array([[a, a + 6, score] for a, score in enumerate(scores)])
+
+    grouped = group_alignments(matches, sentences, doc_ids, [60, 60], max_per_pair=3)[(0, 1)]
+    assert grouped["count"] == 6
+    assert [pair["a"][0] for pair in grouped["pairs"]] == [30, 40, 50]
+    assert [pair["score"] for pair in grouped["pairs"]] == [97.0, 95.0, 99.0]
+    # Покрытие считается по всем найденным парам, а не только по показанным
+    assert grouped["coverage_a"] == 100.0
+
+
+def test_pairs_are_oriented_by_document():
+    sentences = [("один два три", 0, 3), ("one two three", 0, 3)]
+    matches = np.array([[1, 0, 0.9]])
+    grouped = group_alignments(matches, sentences, np.array([1, 0]), [3, 3])
+    assert list(grouped) == [(0, 1)]
+    assert grouped[(0, 1)]["pairs"][0]["languages"] == ["en", "ru"]
+    assert grouped[(0, 1)]["cross_lingual"] == 1
@@ -0,0 +1,48 @@
+import asyncio
+import datetime
+
+from app.services import corpus as corpus_module
+from app.services.corpus import anonymize_matches, find_similar
+
+
+class _Corpus:
+    """Архив без MongoDB: aggregate отдает готовые строки после $project."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.pipeline = None
+
+    def aggregate(self, pipeline):
+        self.pipeline = pipeline
+
+        async def rows():
+            for row in self.rows:
+                yield row
+        return rows()
+
+
+def test_foreign_matches_are_anonymous(monkeypatch):
+    stamp = datetime.datetime(2026, 5, 1)
+    archive = _Corpus([
+        {"name": "mine.docx", "email": "a@x", "timestamp": stamp, "shared": 8},
+        {"name": "someone_else.docx", "email": "b@x", "timestamp": stamp, "shared": 6},
+    ])
+    monkeypatch.setattr(corpus_module, "corpus", archive)
+    matches = asyncio.run(find_similar(list(range(10)), "a@x", [], top_k=5, min_overlap=0.05))
+
+    assert [(m["name"], m["own"], m["overlap"]) for m in matches] == [
+        ("mine.docx", True, 80.0), (None, False, 60.0)
+    ]
+    assert all(set(m) == {"name", "own", "timestamp", "shared_fingerprints", "overlap"} for m in matches)
+    assert "doc_hash" not in archive.pipeline[1]["$project"]
+
+
+def test_stored_matches_without_owner_are_scrubbed():
+    stored = [{"name": "upload.pdf", "matches": [
+        {"name": "old_foreign.pdf", "overlap": 40.0},
+        {"name": "mine.pdf", "own": True, "overlap": 30.0},
+    ]}]
+    assert anonymize_matches(stored) == [{"name": "upload.pdf", "matches": [
+        {"name": None, "own": False, "overlap": 40.0},
+        {"name": "mine.pdf", "own": True, "overlap": 30.0},
+    ]}]
@@ -0,0 +1,32 @@
+import struct
+import sys
+import zlib
+from array import array
+
+import pytest
+
+from app.services.diffstore import SPAN_TAGS, matched_fragments, pack_runs, unpack_runs
+
+
+RUNS = [('diff-match', 0, 12), ('diff-removed', 12, 13), ('diff-changed', 40, 2 ** 31), ('diff-added', 7, 7)]
+
+
+def test_round_trip():
+    assert unpack_runs(pack_runs(RUNS)) == RUNS
+    assert unpack_runs(pack_runs([])) == []
+
+
+def test_layout_is_little_endian_uint32():
+    raw = zlib.decompress(pack_runs(RUNS[:2]))
+    assert raw == struct.pack('<6I', 0, 0, 12, 1, 12, 1)
+
+
+@pytest.mark.skipif(sys.byteorder != 'little', reason="старые отчеты писались на little-endian")
+def test_reads_blobs_written_by_native_array():
+    legacy = array('I', [SPAN_TAGS.index('diff-changed'), 5, 3, 0, 9, 1])
+    assert unpack_runs(zlib.compress(legacy.tobytes())) == [('diff-changed', 5, 8), ('diff-match', 9, 10)]
+
+
+def test_matched_fragments():
+    words = "a b c d e f".split()
+    assert matched_fragments(words, [('diff-match', 0, 2), ('diff-added', 2, 4), ('diff-match', 5, 6)]) == ["a b", "f"]
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+import config
+from app.services.embeddings import (
+    EmbeddingCache, encode_batched, estimate_tokens, pack_vector, plan_batches, unpack_vector
+)
+
+
+def _padded(batch, lengths):
+    return len(batch) * max(lengths[idx] for idx in batch)
+
+
+def test_batches_fit_token_budget_and_cover_every_text():
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(3, 200, size=300).tolist()
+    batches = plan_batches(lengths, token_budget=1000, max_batch=32)
+    assert sorted(idx for batch in batches for idx in batch) == list(range(300))
+    assert all(_padded(batch, lengths) <= 1000 and len(batch) <= 32 for batch in batches)
+    # Тексты идут по возрастанию длины: паддинг внутри пакета минимален
+    order = [lengths[idx] for batch in batches for idx in batch]
+    assert order == sorted(order)
+
+
+def test_text_over_budget_gets_own_batch():
+    assert plan_batches([10, 5000, 10], token_budget=100, max_batch=8) == [[0, 2], [1]]
+    assert plan_batches([], token_budget=100, max_batch=8) == []
+
+
+def test_max_batch_caps_short_texts():
+    assert [len(batch) for batch in plan_batches([1] * 10, token_budget=10 ** 6, max_batch=4)] == [4, 4, 2]
+
+
+def test_estimate_tokens_is_capped_by_model_length():
+    assert estimate_tokens("a b c d", 512) == int(4 * config.embedding_tokens_per_word) + 2
+    assert estimate_tokens("word " * 10_000, 512) == 512
+
+
+class _Model:
+    max_seq_length = 512
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, batch_size, **kwargs):
+        self.batches.append(list(texts))
+        return [np.full(2, len(text.split()), dtype=np.float32) for text in texts]
+
+
+def test_encode_batched_keeps_input_order(monkeypatch):
+    monkeypatch.setattr(config, "embedding_token_budget", 40)
+    texts = ["w " * n for n in (20, 1, 9, 3, 15)]
+    model = _Model()
+    vectors = encode_batched(model, texts, max_batch=8)
+    assert [int(v[0]) for v in vectors] == [20, 1, 9, 3, 15]
+    assert len(model.batches) > 1
+
+
+def _vector(seed=0, dim=768):
+    vector = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.mark.parametrize("dtype, nbytes, atol", [("float32", 768 * 4, 0), ("float16", 768 * 2, 1e-3),
+                                                 ("int8", 768 + 4, None)])
+def test_pack_unpack_vector(dtype, nbytes, atol):
+    vector = _vector()
+    stored = pack_vector(vector, dtype)
+    assert stored.nbytes == nbytes
+    restored = unpack_vector(stored)
+    assert restored.dtype == np.float32 and restored.shape == vector.shape
+    # int8: ошибка не больше половины шага квантования
+    tolerance = np.abs(vector).max() / 127 / 2 + 1e-7 if atol is None else atol
+    assert np.abs(restored - vector).max() <= tolerance
+    assert float(restored @ vector) > 0.999
+
+
+def test_int8_zero_vector_and_survives_npy(tmp_path):
+    assert not unpack_vector(pack_vector(np.zeros(8, dtype=np.float32), "int8")).any()
+    cache = EmbeddingCache(1 << 20, str(tmp_path), 1 << 20, "int8")
+    expected = cache.put("key", _vector(1))
+    # Из памяти и с диска (масштаб записан в самом .npy) возвращается одно и то же
+    cache._memory.clear()
+    np.testing.assert_array_equal(cache.get("key"), expected)
+    assert cache.counters["disk_hits"] == 1
+
+
+def test_unknown_storage_dtype():
+    with pytest.raises(ValueError):
+        EmbeddingCache(1 << 20, None, 0, "bfloat16")
@@ -0,0 +1,72 @@
+import os
+import random
+import tempfile
+import zipfile
+
+import pytest
+
+import config
+from app.services.extraction import (
+    ArchiveLimitError, extract_text_from_file, materialize_members, plan_extraction, remove_files
+)
+
+
+def _zip(tmp_path, members):
+    path = str(tmp_path / "upload.zip")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return path
+
+
+def test_total_limit_counts_bytes_of_all_members(tmp_path, monkeypatch):
+    rng = random.Random(0)
+    members = {f"m{i}.txt": rng.randbytes(1000) for i in range(3)}
+    path = _zip(tmp_path, members)
+
+    monkeypatch.setattr(config, "archive_max_total_bytes", 5000)
+    paths = materialize_members(path, "upload.zip", list(members))
+    assert [os.path.getsize(p) for p in paths] == [1000, 1000, 1000]
+    remove_files(paths)
+
+    # Каждый элемент меньше лимита, но вместе они его превышают
+    monkeypatch.setattr(config, "archive_max_total_bytes", 2500)
+    with pytest.raises(ArchiveLimitError):
+        materialize_members(path, "upload.zip", list(members))
+
+
+def test_ratio_checked_against_archive_size(tmp_path):
+    # Размеры из заголовков не используются: сжатие считается по прочитанным байтам
+    members = {f"m{i}.txt": b"a" * 200_000 for i in range(2)}
+    path = _zip(tmp_path, members)
+    with pytest.raises(ArchiveLimitError):
+        materialize_members(path, "upload.zip", list(members))
+
+
+def test_oversized_member_rejects_archive(tmp_path, monkeypatch):
+    # Одна политика: и проверка заголовков, и потоковое чтение отклоняют весь архив
+    rng = random.Random(1)
+    path = _zip(tmp_path, {"small.txt": rng.randbytes(100), "big.txt": rng.randbytes(3000)})
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(spool))
+    monkeypatch.setattr(config, "archive_max_member_bytes", 1000)
+    with pytest.raises(ArchiveLimitError):
+        plan_extraction(path, "upload.zip")
+    with pytest.raises(ArchiveLimitError):
+        materialize_members(path, "upload.zip", ["small.txt", "big.txt"])
+    assert not list(spool.iterdir())
+
+
+def test_broken_member_is_skipped(tmp_path, monkeypatch):
+    path = _zip(tmp_path, {"a.txt": b"first", "b.txt": b"second"})
+    paths = materialize_members(path, "upload.zip", ["a.txt", "missing.txt", "b.txt"])
+    assert paths[1] is None and [open(p, "rb").read() for p in (paths[0], paths[2])] == [b"first", b"second"]
+    remove_files(paths)
+
+
+def test_legacy_text_extraction():
+    assert extract_text_from_file("привет".encode("utf-8"), "a.txt") == "привет"
+    assert extract_text_from_file("привет".encode("cp1251"), "a.TXT") == "привет"
+    assert extract_text_from_file(b"not a docx", "a.docx") == ""
+    assert extract_text_from_file(b"%PDF-1.4", "a.pdf") == ""
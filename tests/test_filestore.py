@@ -0,0 +1,31 @@
+import os
+
+from app.services.filestore import DiskStore
+
+
+def test_overwrite_does_not_inflate_usage(tmp_path):
+    store = DiskStore(str(tmp_path), 10_000)
+    store.put_bytes("aa01", b"x" * 100)
+    for _ in range(20):
+        store.put_bytes("aa02", b"y" * 300)
+    assert store.used_bytes == 400
+    assert store.counters["evictions"] == 0
+    assert store.get("aa01") == b"x" * 100
+
+
+def test_scan_skips_temp_files(tmp_path):
+    # Остаток записи, прерванной падением процесса, не занимает лимит
+    os.makedirs(tmp_path / "aa")
+    (tmp_path / "aa" / "aa01.123.456.tmp").write_bytes(b"z" * 5000)
+    store = DiskStore(str(tmp_path), 10_000)
+    store.put_bytes("aa02", b"y" * 300)
+    assert store.used_bytes == 300
+
+
+def test_evicts_least_recently_used(tmp_path):
+    store = DiskStore(str(tmp_path), 1000)
+    for idx in range(5):
+        store.put_bytes(f"k{idx}", b"v" * 300)
+        os.utime(store.get_path(f"k{idx}"), (idx, idx))
+    assert store.used_bytes <= 900
+    assert store.get("k4") is not None and store.get("k0") is None
@@ -0,0 +1,53 @@
+import itertools
+import re
+import unicodedata
+
+import pytest
+
+from app.services.filters import FILTER_RULES, compile_filters
+
+SAMPLES = [
+    "Intro\nТаблица 1 данные\nСписок литературы\n1. Book",
+    "Министерство образования\nУДК 004\n\nВведение «цитата» текст\nРисунок 2 схема\nReferences\nSmith 2020",
+    "Текст без правил, \"в кавычках\" и 'одинарных'.\nTable 3 values\nBibliography\nDoe",
+    "Кесте 5 деректер\nНегізгі мәтін\nПайдаланылған әдебиеттер\nкітап",
+]
+
+
+def reference_filter(text, active_rules, custom_regex=""):
+    """Поведение до предкомпиляции: re.sub по каждому правилу в порядке настроек."""
+    text = unicodedata.normalize('NFKC', text)
+    for rule_key in active_rules:
+        pattern = FILTER_RULES.get(rule_key)
+        if pattern:
+            text = re.sub(pattern, '', text)
+    for pattern in [line.split('//')[0].strip() for line in custom_regex.split('\n')]:
+        if pattern and len(pattern) > 1:
+            text = re.sub(pattern, '', text)
+    return re.sub(r'\s+', ' ', text.lower()).strip()
+
+
+def _rule_orders():
+    for size in range(1, len(FILTER_RULES) + 1):
+        for combination in itertools.combinations(FILTER_RULES, size):
+            yield from itertools.permutations(combination)
+
+
+@pytest.mark.parametrize("rules", list(_rule_orders()))
+def test_compiled_filters_match_sequential_rules(rules):
+    compiled = compile_filters(tuple(rules))
+    for text in SAMPLES:
+        assert compiled.apply(text) == reference_filter(text, rules)
+
+
+def test_custom_regex_applied_after_rules():
+    custom = r"данные // убрать слово" + "\n" + r"\d+\."
+    compiled = compile_filters(("gost", "tables"), custom)
+    for text in SAMPLES:
+        assert compiled.apply(text) == reference_filter(text, ["gost", "tables"], custom)
+
+
+def test_default_rules_drop_bibliography():
+    compiled = compile_filters(("gost", "tables", "titles"))
+    # "tables" не должен забрать перевод строки перед списком литературы у "gost"
+    assert "литературы" not in compiled.apply(SAMPLES[0])
@@ -0,0 +1,54 @@
+import asyncio
+import datetime
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.routers.handlers import text as text_module
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["history"]
+    monkeypatch.setattr(text_module, "history", collection)
+    return collection
+
+
+def _page(limit, cursor=None, email="a@x"):
+    return asyncio.run(text_module.get_history(limit=limit, cursor=cursor, user={"sub": email}))
+
+
+def test_cursor_walks_all_entries_once(collection):
+    base = datetime.datetime(2026, 3, 1)
+    # Одинаковые timestamp у соседних записей: порядок внутри них задает _id
+    stamps = [base, base, base + datetime.timedelta(minutes=1), base + datetime.timedelta(minutes=2),
+              base + datetime.timedelta(minutes=2), base + datetime.timedelta(minutes=2), base + datetime.timedelta(minutes=3)]
+    entries = [{"email": "a@x", "timestamp": stamp, "comparisons": [{"pair": f"p{i}", "report_id": f"r{i}"}]}
+               for i, stamp in enumerate(stamps)]
+    asyncio.run(collection.insert_many(entries + [{"email": "b@x", "timestamp": base, "comparisons": []}]))
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = _page(3, cursor)
+        pages += 1
+        seen.extend(item["comparisons"][0]["pair"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == 3
+    assert seen == ["p6", "p5", "p4", "p3", "p2", "p1", "p0"]
+
+
+def test_summary_has_no_html_and_exact_last_page(collection):
+    html_entry = {"email": "a@x", "timestamp": datetime.datetime(2026, 3, 1),
+                  "comparisons": [{"pair": "a vs b", "docA": {"html": "<span>x</span>"}, "similarity": 10}]}
+    asyncio.run(collection.insert_one(html_entry))
+    page = _page(1)
+    assert page["next_cursor"] is None and page["items"][0]["total_pairs"] == 1
+    assert "docA" not in page["items"][0]["comparisons"][0]
+
+
+def test_bad_cursor_is_rejected(collection):
+    response = _page(3, "not-a-cursor")
+    assert response.status_code == 400
@@ -0,0 +1,142 @@
+import asyncio
+import datetime
+
+import pytest
+from pymongo.errors import AutoReconnect
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.services import jobs as jobs_module
+from app.services.jobs import JobQueue
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["jobs"]
+    monkeypatch.setattr(jobs_module, "jobs", collection)
+    return collection
+
+
+def _queue(tmp_path, **kwargs):
+    options = {"workers": 1, "max_per_user": 1, "spool_dir": str(tmp_path), "poll_seconds": 0.01}
+    return JobQueue(**{**options, **kwargs})
+
+
+def _job(job_id, email, status="queued", minutes=0, **fields):
+    created = datetime.datetime(2026, 1, 1) + datetime.timedelta(minutes=minutes)
+    return {"job_id": job_id, "email": email, "status": status, "files": [], "created_at": created, **fields}
+
+
+def test_requeue_only_expired_leases(collection, tmp_path):
+    now = datetime.datetime.utcnow()
+    hour = datetime.timedelta(hours=1)
+
+    async def scenario():
+        await collection.insert_many([
+            _job("live", "a", "running", owner="other", lease_until=now + hour),
+            _job("expired", "b", "running", owner="dead", lease_until=now - hour),
+            _job("legacy", "c", "running"),
+        ])
+        requeued = await _queue(tmp_path).requeue_expired()
+        statuses = {job["job_id"]: job async for job in collection.find()}
+        return requeued, statuses
+
+    requeued, statuses = asyncio.run(scenario())
+    assert requeued == 2
+    # Задачу живого процесса не трогаем - иначе она выполнится дважды
+    assert statuses["live"]["status"] == "running" and statuses["live"]["owner"] == "other"
+    assert statuses["expired"]["status"] == "queued" and "owner" not in statuses["expired"]
+    assert statuses["legacy"]["status"] == "queued"
+
+
+def test_claim_respects_limit_and_least_recently_served(collection, tmp_path):
+    queue = _queue(tmp_path)
+
+    async def scenario():
+        await collection.insert_many([
+            _job("a1", "a", minutes=0), _job("a2", "a", minutes=1), _job("b1", "b", minutes=2),
+        ])
+        queue._mark_served("b")
+        first = await queue._claim_next()
+        # У "a" уже выполняется задача - следующей берется задача "b"
+        second = await queue._claim_next()
+        third = await queue._claim_next()
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first["job_id"] == "a1" and first["owner"] == queue.owner and first["lease_until"]
+    assert second["job_id"] == "b1"
+    assert third is None
+
+
+def test_result_of_lost_lease_is_not_written(collection, tmp_path):
+    queue = _queue(tmp_path)
+
+    async def handler(job):
+        # Пока задача выполнялась, аренда истекла и ее забрал другой процесс
+        await collection.update_one({"job_id": job["job_id"]}, {"$set": {"owner": "other"}})
+        return {"history_id": "x"}
+
+    async def scenario():
+        await collection.insert_one(_job("j", "a"))
+        queue._handler = handler
+        await queue._run(await queue._claim_next())
+        return await collection.find_one({"job_id": "j"})
+
+    job = asyncio.run(scenario())
+    assert job["status"] == "running" and job["owner"] == "other" and "history_id" not in job
+
+
+def test_worker_survives_database_errors(collection, tmp_path):
+    queue = _queue(tmp_path)
+    claim = queue._claim_next
+    failures = []
+
+    async def flaky_claim():
+        if not failures:
+            failures.append(1)
+            raise AutoReconnect("primary stepped down")
+        return await claim()
+
+    async def handler(job):
+        return {"history_id": "h"}
+
+    async def scenario():
+        await collection.insert_one(_job("j", "a"))
+        queue._claim_next = flaky_claim
+        await queue.start(handler)
+        for _ in range(200):
+            job = await collection.find_one({"job_id": "j"})
+            if job["status"] == "done":
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    assert failures and job["status"] == "done" and "owner" not in job
+
+
+def test_heartbeat_renews_only_running_jobs(collection, tmp_path):
+    queue = _queue(tmp_path)
+    stale = datetime.datetime.utcnow() - datetime.timedelta(minutes=5)
+
+    async def scenario():
+        await collection.insert_many([
+            _job("mine", "a", "running", owner=queue.owner, lease_until=stale),
+            _job("orphan", "b", "running", owner=queue.owner, lease_until=stale),
+        ])
+        queue._running.add("mine")
+        await queue.renew_leases()
+        return {job["job_id"]: job["lease_until"] async for job in collection.find()}
+
+    leases = asyncio.run(scenario())
+    assert leases["mine"] > datetime.datetime.utcnow()
+    assert leases["orphan"] < datetime.datetime.utcnow()
+
+
+def test_fairness_memory_is_bounded(tmp_path):
+    queue = _queue(tmp_path, fairness_entries=3)
+    for email in "abcde":
+        queue._mark_served(email)
+    assert list(queue._last_served) == ["c", "d", "e"]
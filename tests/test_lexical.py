@@ -0,0 +1,20 @@
+import random
+
+from app.services.lexical import greedy_tiling_runs, sequence_matcher_runs
+
+
+def test_tiling_keeps_copy_after_frequent_kgrams():
+    # Штамп повторяется чаще max_positions раз, за ним - дословная копия A
+    random.seed(0)
+    words_a = [f"w{random.randrange(5000)}" for _ in range(203)]
+    words_b = "в том числе x".split() * 70 + words_a
+    _, runs_b, ratio = greedy_tiling_runs(words_a, words_b)
+    assert ratio == sequence_matcher_runs(words_a, words_b)[2]
+    assert ('diff-match', 280, 280 + len(words_a)) in runs_b
+
+
+def test_tiling_finds_reordered_paragraphs():
+    first, second = [f"a{i}" for i in range(50)], [f"b{i}" for i in range(50)]
+    runs_a, runs_b, ratio = greedy_tiling_runs(first + second, second + first)
+    assert ratio == 1.0
+    assert runs_a == [('diff-match', 0, 100)] and runs_b == [('diff-match', 0, 100)]
@@ -0,0 +1,48 @@
+import tracemalloc
+
+import numpy as np
+
+from app.services.semantic import similarity_matrix
+
+
+def _unblocked(embeddings, offsets):
+    # Эталон: вся матрица косинусов сразу, средние максимумы по парам документов
+    bounds = list(offsets) + [len(embeddings)]
+    sims = embeddings @ embeddings.T
+    n = len(offsets)
+    directed = np.empty((n, n), dtype=np.float32)
+    for a in range(n):
+        for b in range(n):
+            block = sims[bounds[a]:bounds[a + 1], bounds[b]:bounds[b + 1]]
+            directed[a, b] = block.max(axis=1).mean()
+    matrix = (directed + directed.T) / 2
+    np.fill_diagonal(matrix, 1.0)
+    return np.clip(matrix, 0.0, 1.0)
+
+
+def _normalized(rows, dim, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((rows, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_blocked_matches_unblocked():
+    embeddings = _normalized(37, 16)
+    offsets = np.array([0, 5, 6, 20, 31], dtype=np.int64)
+    expected = _unblocked(embeddings, offsets)
+    # Бюджет на 3 строки блока, на одну строку (меньше строки) и без разбиения
+    for block_bytes in (3 * 4 * 37, 1, 1 << 30):
+        np.testing.assert_allclose(similarity_matrix(embeddings, offsets, block_bytes), expected, atol=1e-6)
+
+
+def test_peak_memory_follows_byte_budget():
+    embeddings = _normalized(2000, 8)
+    offsets = np.arange(0, 2000, 100, dtype=np.int64)
+    full = 4 * 2000 * 2000
+    # numpy отчитывается перед tracemalloc: полная матрица косинусов (16 МБ) не должна появляться
+    tracemalloc.start()
+    try:
+        similarity_matrix(embeddings, offsets, block_bytes=full // 20)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < full // 4
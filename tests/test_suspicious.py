@@ -0,0 +1,50 @@
+import numpy as np
+
+from app.services.suspicious import collusion_clusters, mutual_top_k_pairs, select_suspicious_pairs
+
+
+def _scores():
+    # Документы 0-1-2 - плотная группа, 3 ближе всего к 2, 4 почти ни на кого не похож
+    scores = np.array([
+        [100, 90, 85, 10, 5],
+        [90, 100, 80, 20, 5],
+        [85, 80, 100, 60, 5],
+        [10, 20, 60, 100, 30],
+        [5, 5, 5, 30, 100],
+    ], dtype=np.float32)
+    return scores
+
+
+def test_threshold_only():
+    assert select_suspicious_pairs(_scores(), 80, None) == {(0, 1), (0, 2), (1, 2)}
+
+
+def test_top_k_only_keeps_pairs_of_either_side():
+    # top-1: 0->1, 1->0, 2->0, 3->2, 4->3
+    assert select_suspicious_pairs(_scores(), None, 1) == {(0, 1), (0, 2), (2, 3), (3, 4)}
+
+
+def test_threshold_and_top_k_intersect():
+    assert select_suspicious_pairs(_scores(), 50, 1) == {(0, 1), (0, 2), (2, 3)}
+
+
+def test_top_k_larger_than_batch_and_tiny_batches():
+    assert len(select_suspicious_pairs(_scores(), None, 10)) == 10
+    assert select_suspicious_pairs(np.array([[100]], dtype=np.float32), 0, 3) == set()
+
+
+def test_mutual_top_k_pairs():
+    assert mutual_top_k_pairs(_scores(), 1) == {(0, 1)}
+    assert mutual_top_k_pairs(_scores(), 2) == {(0, 1), (0, 2), (1, 2), (3, 4)}
+    assert mutual_top_k_pairs(_scores(), 0) == set()
+
+
+def test_collusion_clusters_components_sorted():
+    edges = [(3, 4, 70.0), (0, 1, 90.0), (1, 2, 60.0), (5, 6, 95.0)]
+    clusters = collusion_clusters(7, edges)
+    assert clusters == [
+        {"documents": [0, 1, 2], "pairs": 2, "max_similarity": 90.0},
+        {"documents": [5, 6], "pairs": 1, "max_similarity": 95.0},
+        {"documents": [3, 4], "pairs": 1, "max_similarity": 70.0},
+    ]
+    assert collusion_clusters(3, []) == []
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.services import users as users_module
+from app.services.users import UserProfileCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(users_module.time, "monotonic", clock)
+    return clock
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = UserProfileCache(max_entries=10, ttl=30)
+    cache.put("a@x", {"email": "a@x"}, cache.generation())
+    clock.now += 29
+    assert cache.get("a@x") == {"email": "a@x"}
+    clock.now += 2
+    assert cache.get("a@x") is None
+    assert cache.counters["hits"] == 1 and cache.counters["misses"] == 1
+
+
+def test_read_started_before_invalidation_is_not_cached(clock):
+    cache = UserProfileCache(max_entries=10, ttl=30)
+    generation = cache.generation()
+    # Пока профиль читался из MongoDB, его изменили - старое значение в кэш не попадает
+    cache.invalidate("a@x")
+    cache.put("a@x", {"display_name": "old"}, generation)
+    assert cache.get("a@x") is None
+    cache.put("a@x", {"display_name": "new"}, cache.generation())
+    assert cache.get("a@x") == {"display_name": "new"}
+
+
+def test_invalidate_drops_entry_and_lru_bound(clock):
+    cache = UserProfileCache(max_entries=2, ttl=30)
+    for email in ("a@x", "b@x"):
+        cache.put(email, {"email": email}, cache.generation())
+    cache.get("a@x")
+    cache.put("c@x", {"email": "c@x"}, cache.generation())
+    assert cache.get("b@x") is None and cache.get("a@x") is not None
+    cache.invalidate("a@x")
+    assert cache.get("a@x") is None and cache.stats()["entries"] == 1
+
+
+def test_zero_ttl_disables_cache(clock):
+    cache = UserProfileCache(max_entries=10, ttl=0)
+    cache.put("a@x", {"email": "a@x"}, cache.generation())
+    assert cache.get("a@x") is None
+
+
+def test_load_profile_returns_copies_and_sees_invalidation(monkeypatch, clock):
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["users"]
+    monkeypatch.setattr(users_module, "users", collection)
+    monkeypatch.setattr(users_module, "profile_cache", UserProfileCache(max_entries=10, ttl=30))
+
+    async def scenario():
+        await collection.insert_one({"email": "a@x", "display_name": "A", "password": "hash"})
+        first = await users_module.load_profile("a@x")
+        first["display_name"] = "mutated"
+        await collection.update_one({"email": "a@x"}, {"$set": {"display_name": "B"}})
+        cached = await users_module.load_profile("a@x")
+        users_module.invalidate_profile("a@x")
+        fresh = await users_module.load_profile("a@x")
+        return first, cached, fresh
+
+    first, cached, fresh = asyncio.run(scenario())
+    assert "password" not in first
+    assert cached["display_name"] == "A"
+    assert fresh["display_name"] == "B"
+    assert asyncio.run(users_module.load_profile("missing@x")) is None